@@ -101,6 +101,8 @@ class DocBroApp:
         """Clean up all services."""
         if self.crawler:
             await self.crawler.cleanup()
+        if self.rag_service:
+            await self.rag_service.cleanup()
         if self.embedding_service:
             await self.embedding_service.cleanup()
         if self.vector_store:
@@ -12,6 +12,7 @@ try:
 except ImportError:
     from pydantic import BaseSettings as PydanticBaseSettings
 
+from src.models.project import ContentExtraction
 from src.models.vector_store_types import VectorStoreProvider
 
 
@@ -51,6 +52,11 @@ class DocBroConfig(PydanticBaseSettings):
     # Crawling configuration
     crawl_depth: int = Field(default=2, ge=1, le=10)
     rate_limit: float = Field(default=2.0, ge=0.1, le=10.0)
+    crawl_concurrency: int = Field(default=4, ge=1, le=64)
+    crawl_use_sitemaps: bool = Field(default=True)
+    crawl_content_extraction: ContentExtraction = Field(default=ContentExtraction.MAIN)
+    crawl_near_duplicate_distance: int = Field(default=3, ge=0, le=16)  # SimHash bits; 0 disables
+    crawl_keep_html: bool = Field(default=True)  # Store raw HTML alongside the text
     max_page_size_mb: float = Field(default=10.0)
     outdated_days: int = Field(default=60)
     max_retries: int = Field(default=3, ge=0, le=10)
@@ -167,6 +167,8 @@ class BatchCrawler:
 
             # Get or create project in DB
             db_project = await db_manager.get_project_by_name(project.project_name)
+            # Recrawls of a known project only download pages that changed
+            refresh = db_project is not None
             if not db_project:
                 # Create project if it doesn't exist
                 db_project = await db_manager.create_project(
@@ -180,7 +182,8 @@ class BatchCrawler:
             session = await crawler.start_crawl(
                 project_id=db_project.id,
                 max_pages=max_pages,
-                rate_limit=rate_limit
+                rate_limit=rate_limit,
+                refresh=refresh
             )
 
             # Wait for completion
@@ -3,21 +3,28 @@
 import asyncio
 import hashlib
 import time
+import uuid
+from datetime import UTC, datetime
 from typing import Any
-from urllib.parse import urljoin, urlparse, urlunparse
+from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 
 import httpx
 from bs4 import BeautifulSoup
-from bs4.element import Comment
 
 from src.core.config import DocBroConfig
 from src.core.lib_logger import get_component_logger
-from src.models import CrawlStatus, PageStatus, Project
+from src.models import ContentExtraction, CrawlStatus, PageStatus, Project
 from src.services.database import DatabaseManager
 
 from ..models.page import Page
 from ..models.session import CrawlSession
+from ..utils.html_parser import HtmlParser, extract_links, extract_text
+from ..utils.simhash import SimHashIndex, format_fingerprint, parse_fingerprint, simhash
+from ..utils.sitemap import SitemapEntry, SitemapReader
+from .frontier import CrawlFrontier
+from .page_buffer import PageBuffer
+from .scheduler import HostScheduler
 
 
 class CrawlerError(Exception):
@@ -25,6 +32,24 @@ class CrawlerError(Exception):
     pass
 
 
+class _CrawlProgress:
+    """Counters shared by the fetch workers of one crawl."""
+
+    def __init__(self, session: CrawlSession):
+        # Resumed sessions continue from their saved counts
+        self.pages_crawled = session.pages_crawled
+        self.pages_errors = session.error_count
+        self.pages_unchanged = session.metadata.get("pages_unchanged", 0)
+        self.pages_near_duplicate = session.metadata.get("pages_near_duplicate", 0)
+        self.text_chars_kept = session.metadata.get("text_chars_kept", 0)
+        self.text_chars_dropped = session.metadata.get("text_chars_dropped", 0)
+        self.current_depth = session.current_depth
+        # Set once max pages or max errors is reached; workers then drain the queue
+        self.stopped = False
+        # First unexpected worker error, re-raised to fail the session
+        self.error: Exception | None = None
+
+
 class DocumentationCrawler:
     """Asynchronous documentation crawler with rate limiting and robots.txt support."""
 
@@ -45,16 +70,33 @@ class DocumentationCrawler:
         self._crawl_queue: asyncio.Queue = asyncio.Queue()
         self._visited_urls: set[str] = set()
         self._content_hashes: set[str] = set()
-        self._domain_last_access: dict[str, float] = {}
 
-        # Robots.txt cache
+        # SimHash fingerprints of the project's pages, for near-duplicates
+        self._near_duplicates = SimHashIndex(self.config.crawl_near_duplicate_distance)
+
+        # Concurrent fetch workers and their per-host politeness scheduler
+        self.concurrency = self.config.crawl_concurrency
+        self._scheduler = HostScheduler(self.config.rate_limit)
+
+        # One parse per page yields its title, text, links and headings
+        self.html_parser = HtmlParser()
+
+        # Robots.txt cache (the locks keep workers from fetching one file twice)
         self._robots_cache: dict[str, RobotFileParser] = {}
+        self._robots_locks: dict[str, asyncio.Lock] = {}
 
         # Session state
         self._current_session: CrawlSession | None = None
         self._is_running = False
         self._stop_requested = False
         self._crawl_task: asyncio.Task | None = None
+        self._frontier: CrawlFrontier | None = None
+        self._page_buffer: PageBuffer | None = None
+        self._refresh = False
+        self._main_content = False
+
+        # Sitemap lastmod of seeded URLs, used to plan refreshes
+        self._sitemap_lastmod: dict[str, datetime] = {}
 
     async def initialize(self) -> None:
         """Initialize crawler."""
@@ -64,7 +106,10 @@ class DocumentationCrawler:
 
         self._client = httpx.AsyncClient(
             timeout=httpx.Timeout(30.0),
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            limits=httpx.Limits(
+                max_connections=max(10, self.concurrency * 2),
+                max_keepalive_connections=max(5, self.concurrency),
+            ),
             follow_redirects=True,
             headers={
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -101,8 +146,9 @@ class DocumentationCrawler:
                 break
         self._visited_urls.clear()
         self._content_hashes.clear()
-        self._domain_last_access.clear()
+        self._scheduler.clear()
         self._robots_cache.clear()
+        self._robots_locks.clear()
 
         self.logger.debug("Crawler cleaned up")
 
@@ -142,9 +188,30 @@ class DocumentationCrawler:
         rate_limit: float = 1.0,
         max_pages: int | None = None,
         progress_display: Any | None = None,
-        error_reporter: Any | None = None
+        error_reporter: Any | None = None,
+        concurrency: int | None = None,
+        refresh: bool = False,
+        use_sitemap: bool | None = None
     ) -> CrawlSession:
-        """Start a new crawl session for a project."""
+        """Start a new crawl session for a project.
+
+        Args:
+            project_id: Project to crawl
+            user_agent: User agent header (defaults to DocBro/1.0)
+            rate_limit: Requests per second allowed per host
+            max_pages: Stop after this many crawled pages
+            progress_display: Optional display updated as pages are crawled
+            error_reporter: Optional collector of page errors
+            concurrency: Fetch workers (defaults to config.crawl_concurrency)
+            refresh: Revalidate already crawled pages with conditional GETs
+                instead of skipping them; pages whose sitemap lastmod predates
+                their last crawl are not requested at all
+            use_sitemap: Seed the frontier from the site's sitemaps
+                (defaults to config.crawl_use_sitemaps)
+
+        Returns:
+            The started crawl session
+        """
         if self._is_running:
             raise CrawlerError("Crawler is already running")
 
@@ -153,7 +220,6 @@ class DocumentationCrawler:
         if not project:
             raise CrawlerError(f"Project {project_id} not found")
 
-
         # Create crawl session
         session = await self.db_manager.create_crawl_session(
             project_id=project_id,
@@ -161,10 +227,43 @@ class DocumentationCrawler:
             user_agent=user_agent or "DocBro/1.0",
             rate_limit=rate_limit
         )
+        if refresh:
+            session.metadata["refresh"] = True
+        session.metadata["content_extraction"] = ContentExtraction(
+            project.content_extraction or self.config.crawl_content_extraction
+        ).value
+        session.start_session()
+
+        if use_sitemap is None:
+            use_sitemap = self.config.crawl_use_sitemaps
+
+        await self._launch(
+            project, session, [(project.source_url, 0, None)], set(), set(),
+            max_pages, progress_display, error_reporter, concurrency,
+            seed_sitemap=use_sitemap
+        )
+        return session
 
+    async def _launch(
+        self,
+        project: Project,
+        session: CrawlSession,
+        queued: list[tuple[str, int, str | None]],
+        visited: set[str],
+        content_hashes: set[str],
+        max_pages: int | None,
+        progress_display: Any | None,
+        error_reporter: Any | None,
+        concurrency: int | None,
+        seed_sitemap: bool = False
+    ) -> None:
+        """Reset crawl state from a frontier and start the crawl task."""
         self._current_session = session
         self._is_running = True
         self._stop_requested = False
+        self.concurrency = concurrency or self.config.crawl_concurrency
+        self._refresh = bool(session.metadata.get("refresh"))
+        self._main_content = session.metadata.get("content_extraction") == ContentExtraction.MAIN
 
         # Initialize crawler
         await self.initialize()
@@ -173,18 +272,37 @@ class DocumentationCrawler:
         self._client.headers["User-Agent"] = session.user_agent
 
         # Clear state and create fresh queue
-        self._visited_urls.clear()
-        self._content_hashes.clear()
-        self._domain_last_access.clear()
+        self._visited_urls = visited
+        self._content_hashes = content_hashes
+        self._near_duplicates = SimHashIndex(self.config.crawl_near_duplicate_distance)
+        if self.config.crawl_near_duplicate_distance:
+            for page_url, fingerprint in await self.db_manager.get_project_simhashes(project.id):
+                self._near_duplicates.add(parse_fingerprint(fingerprint), page_url)
+        self._scheduler = HostScheduler(session.rate_limit)
         self._robots_cache.clear()
+        self._robots_locks.clear()
         self._crawl_queue = asyncio.Queue()
-
-        # Add initial URL to queue BEFORE creating the task
-        await self._crawl_queue.put((project.source_url, 0, None))
-        self.logger.debug(f"Added initial URL to queue: {project.source_url}, queue size: {self._crawl_queue.qsize()}")
+        # Page and session writes are batched; the frontier flushes them
+        # before recording URLs as processed
+        self._page_buffer = PageBuffer(self.db_manager, project.id)
+        self._frontier = CrawlFrontier(
+            self.db_manager, project.id, session.id,
+            before_flush=self._page_buffer.flush
+        )
+        self._sitemap_lastmod = {}
+
+        # Fill the queue BEFORE creating the task
+        for url, depth, parent_url in queued:
+            await self._queue_url(url, depth, parent_url)
+        if seed_sitemap:
+            # Sitemap pages go in one level below the start page
+            seeds = await self._sitemap_seeds(project, session)
+            for entry in seeds:
+                await self._queue_url(entry.url, 1, None)
+            session.metadata["sitemap_urls"] = len(seeds)
+        self.logger.debug(f"Queued {len(queued)} URLs, queue size: {self._crawl_queue.qsize()}")
 
         # Update session status
-        session.start_session()
         await self.db_manager.update_crawl_session(session)
 
         # Now start crawl worker task AFTER queue is set up
@@ -193,12 +311,57 @@ class DocumentationCrawler:
         ))
 
         self.logger.debug("Crawl started", extra={
-            "project_id": project_id,
+            "project_id": project.id,
             "session_id": session.id,
-            "source_url": project.source_url
+            "source_url": project.source_url,
+            "visited": len(visited)
         })
 
-        return session
+    async def _sitemap_seeds(self, project: Project, session: CrawlSession) -> list[SitemapEntry]:
+        """Read the project site's sitemaps (listed in robots.txt, else /sitemap.xml).
+
+        Returns:
+            Entries on the project's host, excluding the start page
+        """
+        parsed = urlparse(project.source_url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        try:
+            # Reading robots.txt also picks up its Sitemap: lines
+            await self.check_robots_allowed(project.source_url, session.user_agent)
+            rp = self._robots_cache.get(f"{origin}/robots.txt")
+            sitemap_urls = (rp.site_maps() if rp else None) or [f"{origin}/sitemap.xml"]
+
+            reader = SitemapReader(self._client, before_request=self._scheduler.acquire)
+            entries = await reader.read(sitemap_urls)
+        except Exception as e:
+            self.logger.debug(f"Sitemap discovery failed for {project.source_url}: {e}")
+            return []
+
+        seeds = [
+            entry for entry in entries
+            if urlparse(entry.url).netloc == parsed.netloc
+            and entry.url != project.source_url
+            and self._is_documentation_url(entry.url)
+        ]
+        self._sitemap_lastmod = {entry.url: entry.lastmod for entry in seeds if entry.lastmod}
+        self.logger.info(f"Seeded {len(seeds)} URLs from sitemaps: {sitemap_urls}")
+        return seeds
+
+    def _unchanged_since_crawl(self, page: Page) -> bool:
+        """Check whether the sitemap says a stored page has not changed since its crawl."""
+        lastmod = self._sitemap_lastmod.get(page.url)
+        if not lastmod or not page.crawled_at:
+            return False
+        crawled_at = page.crawled_at
+        if crawled_at.tzinfo is None:
+            crawled_at = crawled_at.replace(tzinfo=UTC)
+        return lastmod <= crawled_at
+
+    async def _queue_url(self, url: str, depth: int, parent_url: str | None) -> None:
+        """Put a URL on the crawl queue and record it in the frontier."""
+        await self._crawl_queue.put((url, depth, parent_url))
+        if self._frontier:
+            await self._frontier.add(url, depth, parent_url)
 
     async def _crawl_worker(
         self,
@@ -208,219 +371,50 @@ class DocumentationCrawler:
         progress_display: Any | None = None,
         error_reporter: Any | None = None
     ) -> None:
-        """Main crawl worker loop."""
+        """Run the fetch workers until the frontier is drained or the crawl stops."""
+        progress = _CrawlProgress(session)
+        self._page_buffer.start()
         try:
-            pages_crawled = 0
-            pages_errors = 0
-            current_depth = 0
-            self.logger.info(f"Starting crawl worker loop, initial queue size: {self._crawl_queue.qsize()}, max_depth: {project.crawl_depth}")
-
-            while not self._stop_requested:
-                if max_pages and pages_crawled >= max_pages:
-                    self.logger.info(f"Maximum pages reached: {pages_crawled} >= {max_pages}")
-                    break
-
-                try:
-                    self.logger.debug(f"Attempting to get from queue, current size: {self._crawl_queue.qsize()}")
-                    # Get next URL from queue with timeout
-                    # Use a longer timeout to ensure we wait for pages to be processed
-                    # This prevents premature stopping when pages are still being fetched
-                    timeout_seconds = 60.0 if current_depth < project.crawl_depth else 30.0
-
-                    url, depth, parent_url = await asyncio.wait_for(
-                        self._crawl_queue.get(),
-                        timeout=timeout_seconds
-                    )
-                    self.logger.info(f"Got URL from queue: {url}, depth: {depth}, visited_urls: {len(self._visited_urls)}")
-
-                    # Update progress with current depth and counts
-                    if depth != current_depth:
-                        current_depth = depth
-                        # Update session current_depth in database
-                        session.update_progress(
-                            current_depth=current_depth,
-                            current_url=url,
-                            queue_size=self._crawl_queue.qsize()
-                        )
-                        await self.db_manager.update_crawl_session(session)
-
-                    # Update progress display if available
-                    if progress_display:
-                        progress_display.update(
-                            depth=depth,
-                            pages=pages_crawled,
-                            errors=pages_errors,
-                            queue=self._crawl_queue.qsize(),
-                            url=url
-                        )
-                except TimeoutError:
-                    # Check if we should really stop
-                    # If we haven't exceeded max depth and we have crawled pages, we might still be processing
-                    if current_depth < project.crawl_depth and pages_crawled > 0:
-                        # Give it more time - pages might still be processing
-                        self.logger.info(f"Queue empty but still at depth {current_depth}/{project.crawl_depth}, waiting for more URLs...")
-                        await asyncio.sleep(10.0)  # Wait longer for pages to be processed
-                        # Check queue again
-                        if self._crawl_queue.qsize() > 0:
-                            self.logger.info(f"Queue refilled with {self._crawl_queue.qsize()} URLs, continuing...")
-                            continue
-
-                    # No more URLs to process
-                    self.logger.info(f"Queue timeout - stopping crawl. Final depth: {current_depth}, Queue size: {self._crawl_queue.qsize()}")
-                    break
-
-                # Skip if already visited
-                if url in self._visited_urls:
-                    self.logger.info(f"Skipping already visited URL: {url} (visited: {self._visited_urls})")
-                    continue
-
-                # Skip if depth exceeded
-                if depth > project.crawl_depth:
-                    self.logger.info(f"Skipping URL due to depth {depth} > {project.crawl_depth}: {url}")
-                    continue
-
-                # Skip asset files - focus on documentation content
-                if not self._is_documentation_url(url):
-                    self.logger.debug(f"Skipping asset URL during processing: {url}")
-                    continue
-
-                # Check robots.txt
-                self.logger.debug(f"Checking robots.txt for URL: {url}")
-                robots_allowed = await self.check_robots_allowed(url, session.user_agent)
-                self.logger.debug(f"Robots.txt check result for {url}: {robots_allowed}")
-                if not robots_allowed:
-                    self.logger.debug(f"Robots.txt disallows URL: {url}")
-                    continue
-                self.logger.debug(f"Robots.txt allows URL: {url}")
-
-                # Apply rate limiting
-                await self._apply_rate_limit(url, session.rate_limit)
-
-                # Check if page already exists
-                page = await self.db_manager.get_page_by_url(project.id, url)
-                if page:
-                    # Page already exists, skip if it's not in a retryable state
-                    if page.status not in [PageStatus.DISCOVERED, PageStatus.FAILED, PageStatus.CRAWLING]:
-                        self.logger.debug(f"Page already processed, skipping: {url}")
-                        continue
-                    # Update session_id for retry
-                    page.session_id = session.id
-                else:
-                    # Create new page record
-                    page = await self.db_manager.create_page(
-                        project_id=project.id,
-                        session_id=session.id,
-                        url=url,
-                        crawl_depth=depth,
-                        parent_url=parent_url
-                    )
-
-                # Mark page as being crawled
-                page.mark_crawling()
-                await self.db_manager.update_page(page)
-
-                # Crawl the page
-                crawl_result = await self.crawl_page(url)
-
-                if crawl_result and not crawl_result.get("error"):
-                    # Update page with content
-                    page.update_content(
-                        title=crawl_result.get("title"),
-                        content_html=crawl_result.get("content_html"),
-                        content_text=crawl_result.get("content_text"),
-                        mime_type=crawl_result.get("mime_type", "text/html"),
-                        charset=crawl_result.get("charset", "utf-8")
-                    )
-
-                    # Check for duplicate content
-                    if page.content_hash in self._content_hashes:
-                        page.mark_skipped("Duplicate content")
-                    else:
-                        self._content_hashes.add(page.content_hash)
-                        page.mark_crawled(
-                            response_code=crawl_result.get("status_code", 200),
-                            response_time_ms=crawl_result.get("response_time_ms", 0)
-                        )
-
-                        # Extract and queue links
-                        links = crawl_result.get("links", [])
-                        page.outbound_links = links
-                        page.categorize_links(urlparse(project.source_url).netloc)
-
-                        # Queue internal links
-                        self.logger.info(f"Found {len(page.internal_links)} internal links on {url} (current depth: {depth})")
-                        queued_count = 0
-                        for link in page.internal_links:
-                            if link not in self._visited_urls:
-                                # Skip asset files - focus on documentation content
-                                if not self._is_documentation_url(link):
-                                    self.logger.debug(f"Skipping asset URL: {link}")
-                                    continue
-
-                                new_depth = depth + 1
-                                if new_depth <= project.crawl_depth:
-                                    self.logger.debug(f"Queueing link: {link} at depth {new_depth}")
-                                    await self._crawl_queue.put((link, new_depth, url))
-                                    queued_count += 1
-                                else:
-                                    self.logger.debug(f"Skipping link (would be depth {new_depth} > {project.crawl_depth}): {link}")
-                            else:
-                                self.logger.debug(f"Skipping already visited link: {link}")
-
-                        self.logger.info(f"Queued {queued_count} new links from {url}")
-
-                        pages_crawled += 1
-
-                        # Update progress display after successful crawl
-                        if progress_display:
-                            progress_display.update(
-                                depth=depth,
-                                pages=pages_crawled,
-                                errors=pages_errors,
-                                queue=self._crawl_queue.qsize(),
-                                url=url
-                            )
-                else:
-                    # Handle crawl error
-                    error_msg = crawl_result.get("error") if crawl_result else "Unknown error"
-                    page.mark_failed(error_msg)
-                    pages_errors += 1
-
-                    if error_reporter:
-                        error_reporter.add_error(url, error_msg, depth)
-
-                    if session.increment_error_count():
-                        self.logger.debug("Max errors reached, stopping crawl", extra={
-                            "session_id": session.id,
-                            "error_count": session.error_count
-                        })
-                        break
-
-                # Mark URL as visited after processing (successful or failed)
-                self._visited_urls.add(url)
-                self.logger.debug(f"Marked URL as visited: {url}")
-
-                # Update page in database
-                await self.db_manager.update_page(page)
-
-                # Update session progress with current metrics
-                session.update_progress(
-                    pages_discovered=len(self._visited_urls),
-                    pages_crawled=pages_crawled,
-                    pages_failed=session.error_count,
-                    current_depth=current_depth,
-                    current_url=url,
-                    queue_size=self._crawl_queue.qsize()
-                )
+            self.logger.info(f"Starting {self.concurrency} crawl workers, initial queue size: {self._crawl_queue.qsize()}, max_depth: {project.crawl_depth}")
+
+            workers = [
+                asyncio.create_task(self._fetch_worker(
+                    project, session, progress, max_pages, progress_display, error_reporter
+                ))
+                for _ in range(self.concurrency)
+            ]
+            try:
+                # Every queued URL is marked done once processed or skipped
+                await self._crawl_queue.join()
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+            if progress.error:
+                raise progress.error
+
+            # Write the pages still buffered before the session's final state
+            await self._page_buffer.close()
+
+            if session.status == CrawlStatus.PAUSED:
+                # Keep the frontier so resume_crawl continues from here
+                await self._frontier.flush()
                 await self.db_manager.update_crawl_session(session)
+                self.logger.debug("Crawl paused", extra={
+                    "session_id": session.id,
+                    "queue_size": session.queue_size
+                })
+                return
 
             # Complete session
             session.complete_session()
             await self.db_manager.update_crawl_session(session)
+            await self._frontier.clear()
 
             self.logger.debug("Crawl completed", extra={
                 "session_id": session.id,
-                "pages_crawled": pages_crawled,
+                "pages_crawled": progress.pages_crawled,
                 "pages_discovered": len(self._visited_urls)
             })
 
@@ -430,21 +424,342 @@ class DocumentationCrawler:
                 "error": str(e)
             })
             session.fail_session(str(e))
+            try:
+                # Pages first, so processed URLs keep their page rows
+                await self._page_buffer.close()
+                await self._frontier.flush()
+            except Exception as flush_error:
+                self.logger.debug(f"Failed to save crawl frontier: {flush_error}")
             await self.db_manager.update_crawl_session(session)
 
         finally:
             self._is_running = False
             self._current_session = None
 
-    async def crawl_page(self, url: str) -> dict[str, Any]:
-        """Crawl a single page and extract content."""
+    async def _fetch_worker(
+        self,
+        project: Project,
+        session: CrawlSession,
+        progress: "_CrawlProgress",
+        max_pages: int | None,
+        progress_display: Any | None,
+        error_reporter: Any | None
+    ) -> None:
+        """Take URLs from the shared frontier and crawl them one at a time."""
+        while True:
+            url, depth, parent_url = await self._crawl_queue.get()
+            try:
+                if max_pages and progress.pages_crawled >= max_pages:
+                    if not progress.stopped:
+                        self.logger.info(f"Maximum pages reached: {progress.pages_crawled} >= {max_pages}")
+                    progress.stopped = True
+                # Once stopped, the remaining frontier is drained unprocessed
+                # (it stays queued in the database for resume_crawl)
+                if progress.stopped or self._stop_requested:
+                    continue
+                handled = await self._process_url(
+                    project, session, progress, url, depth, parent_url,
+                    progress_display, error_reporter
+                )
+                if handled:
+                    # A duplicate of a URL another worker is still fetching
+                    # stays pending until that worker has buffered its page
+                    await self._frontier.mark_done(url)
+            except Exception as e:
+                # Unexpected errors (e.g. database failures) fail the session
+                progress.error = progress.error or e
+                progress.stopped = True
+            finally:
+                self._crawl_queue.task_done()
+
+    async def _process_url(
+        self,
+        project: Project,
+        session: CrawlSession,
+        progress: "_CrawlProgress",
+        url: str,
+        depth: int,
+        parent_url: str | None,
+        progress_display: Any | None,
+        error_reporter: Any | None
+    ) -> bool:
+        """Fetch one URL, store its page and queue its internal links.
+
+        Returns:
+            False if the URL was already claimed by another worker (or an
+            earlier copy on the queue), True once this call has dealt with it
+        """
+        # Skip if already visited or claimed by another worker
+        if url in self._visited_urls:
+            self.logger.debug(f"Skipping already visited URL: {url}")
+            return False
+
+        # Skip if depth exceeded
+        if depth > project.crawl_depth:
+            self.logger.info(f"Skipping URL due to depth {depth} > {project.crawl_depth}: {url}")
+            return True
+
+        # Skip asset files - focus on documentation content
+        if not self._is_documentation_url(url):
+            self.logger.debug(f"Skipping asset URL during processing: {url}")
+            return True
+
+        # Claim the URL before the first await so no other worker fetches it
+        self._visited_urls.add(url)
+        self.logger.info(f"Processing URL: {url}, depth: {depth}, visited_urls: {len(self._visited_urls)}")
+
+        # Update progress with current depth and counts
+        if depth > progress.current_depth:
+            progress.current_depth = depth
+            # Update session current_depth in database
+            session.update_progress(
+                current_depth=depth,
+                current_url=url,
+                queue_size=self._crawl_queue.qsize()
+            )
+            self._page_buffer.update_session(session)
+
+        # Update progress display if available
+        if progress_display:
+            progress_display.update(
+                depth=depth,
+                pages=progress.pages_crawled,
+                errors=progress.pages_errors,
+                queue=self._crawl_queue.qsize(),
+                url=url
+            )
+
+        # Check robots.txt
+        self.logger.debug(f"Checking robots.txt for URL: {url}")
+        robots_allowed = await self.check_robots_allowed(url, session.user_agent)
+        self.logger.debug(f"Robots.txt check result for {url}: {robots_allowed}")
+        if not robots_allowed:
+            self.logger.debug(f"Robots.txt disallows URL: {url}")
+            return True
+        self.logger.debug(f"Robots.txt allows URL: {url}")
+
+        # Check if page already exists; its stored bodies are not needed
+        page = await self.db_manager.get_page_by_url(project.id, url, include_content=False)
+        revalidate = False
+        if page:
+            # Page already exists, skip if it's not in a retryable state
+            if page.status not in [PageStatus.DISCOVERED, PageStatus.FAILED, PageStatus.CRAWLING]:
+                if page.session_id == session.id:
+                    # Crawled before an interruption that lost its frontier
+                    # update: its links may not have been queued yet
+                    self.logger.debug(f"Page already processed, skipping: {url}")
+                    await self._queue_links(project, page, depth)
+                    return True
+                if not self._refresh:
+                    self.logger.debug(f"Page already processed, skipping: {url}")
+                    return True
+                # Refresh: ask the server whether the stored copy is still current
+                revalidate = True
+            # Update session_id for retry
+            page.session_id = session.id
+        else:
+            # New page; it is written with its crawl result
+            page = Page(
+                id=str(uuid.uuid4()),
+                project_id=project.id,
+                session_id=session.id,
+                url=url,
+                crawl_depth=depth,
+                parent_url=parent_url,
+                discovered_at=datetime.now(UTC)
+            )
+
+        if revalidate and self._unchanged_since_crawl(page):
+            # The sitemap's lastmod predates our copy: no request at all
+            crawl_result = {"url": url, "not_modified": True, "response_time_ms": 0}
+        elif revalidate:
+            # Wait for this host's next request slot
+            await self._apply_rate_limit(url, session.rate_limit)
+
+            # Conditional GET; the stored page stays as it is until a new copy arrives
+            crawl_result = await self.crawl_page(
+                url, etag=page.etag, last_modified=page.last_modified
+            )
+        else:
+            # Mark page as being crawled
+            page.mark_crawling()
+
+            # Wait for this host's next request slot
+            await self._apply_rate_limit(url, session.rate_limit)
+
+            # Crawl the page
+            crawl_result = await self.crawl_page(url)
+
+        if crawl_result and crawl_result.get("not_modified"):
+            # 304: no parsing, hashing or re-indexing; follow the stored links
+            page.mark_unchanged(crawl_result.get("response_time_ms", 0))
+            if page.content_hash:
+                self._content_hashes.add(page.content_hash)
+            await self._queue_links(project, page, depth)
+
+            progress.pages_crawled += 1
+            progress.pages_unchanged += 1
+            session.metadata["pages_unchanged"] = progress.pages_unchanged
+        elif crawl_result and not crawl_result.get("error"):
+            # Update page with content
+            page.update_content(
+                title=crawl_result.get("title"),
+                content_html=crawl_result.get("content_html"),
+                content_text=crawl_result.get("content_text"),
+                mime_type=crawl_result.get("mime_type", "text/html"),
+                charset=crawl_result.get("charset", "utf-8"),
+                headings=crawl_result.get("headings")
+            )
+            if not self.config.crawl_keep_html:
+                # size_bytes still records the fetched HTML size
+                page.content_html = None
+
+            fingerprint = crawl_result.get("simhash")
+            page.simhash = format_fingerprint(fingerprint) if fingerprint is not None else None
+
+            # Check for duplicate and near-duplicate content
+            near_duplicate = self._near_duplicate_of(url, fingerprint)
+            if page.content_hash in self._content_hashes:
+                page.mark_skipped("Duplicate content")
+            elif near_duplicate:
+                page.mark_skipped(f"Near-duplicate of {near_duplicate}")
+                progress.pages_near_duplicate += 1
+                session.metadata["pages_near_duplicate"] = progress.pages_near_duplicate
+            else:
+                self._content_hashes.add(page.content_hash)
+                if fingerprint is not None:
+                    self._near_duplicates.add(fingerprint, url)
+                page.mark_crawled(
+                    response_code=crawl_result.get("status_code", 200),
+                    response_time_ms=crawl_result.get("response_time_ms", 0)
+                )
+                page.etag = crawl_result.get("etag")
+                page.last_modified = crawl_result.get("last_modified")
+
+                # Text kept and left out by main-content extraction
+                progress.text_chars_kept += len(page.content_text or "")
+                progress.text_chars_dropped += crawl_result.get("text_dropped", 0)
+                session.metadata["text_chars_kept"] = progress.text_chars_kept
+                session.metadata["text_chars_dropped"] = progress.text_chars_dropped
+
+                # Extract and queue links
+                links = crawl_result.get("links", [])
+                page.outbound_links = links
+                page.categorize_links(urlparse(project.source_url).netloc)
+
+                # Queue internal links
+                await self._queue_links(project, page, depth)
+
+                progress.pages_crawled += 1
+
+                # Update progress display after successful crawl
+                if progress_display:
+                    progress_display.update(
+                        depth=depth,
+                        pages=progress.pages_crawled,
+                        errors=progress.pages_errors,
+                        queue=self._crawl_queue.qsize(),
+                        url=url
+                    )
+        else:
+            # Handle crawl error
+            error_msg = crawl_result.get("error") if crawl_result else "Unknown error"
+            page.mark_failed(error_msg)
+            progress.pages_errors += 1
+
+            if error_reporter:
+                error_reporter.add_error(url, error_msg, depth)
+
+            if session.increment_error_count():
+                self.logger.debug("Max errors reached, stopping crawl", extra={
+                    "session_id": session.id,
+                    "error_count": session.error_count
+                })
+                progress.stopped = True
+
+        # Buffer the page write
+        await self._page_buffer.add_page(page)
+
+        # Update session progress with current metrics
+        session.update_progress(
+            pages_discovered=len(self._visited_urls),
+            pages_crawled=progress.pages_crawled,
+            pages_failed=session.error_count,
+            current_depth=progress.current_depth,
+            current_url=url,
+            queue_size=self._crawl_queue.qsize()
+        )
+        self._page_buffer.update_session(session)
+        return True
+
+    def _near_duplicate_of(self, url: str, fingerprint: int | None) -> str | None:
+        """URL of an already crawled page whose text is nearly the same."""
+        if fingerprint is None or not self.config.crawl_near_duplicate_distance:
+            return None
+        # A refreshed page is not a duplicate of its own previous copy
+        return self._near_duplicates.find(fingerprint, exclude=url)
+
+    async def _queue_links(self, project: Project, page: Page, depth: int) -> None:
+        """Queue a crawled page's unvisited internal links one level deeper."""
+        url = page.url
+        self.logger.info(f"Found {len(page.internal_links)} internal links on {url} (current depth: {depth})")
+        queued_count = 0
+        for link in page.internal_links:
+            if link not in self._visited_urls:
+                # Skip asset files - focus on documentation content
+                if not self._is_documentation_url(link):
+                    self.logger.debug(f"Skipping asset URL: {link}")
+                    continue
+
+                new_depth = depth + 1
+                if new_depth <= project.crawl_depth:
+                    self.logger.debug(f"Queueing link: {link} at depth {new_depth}")
+                    await self._queue_url(link, new_depth, url)
+                    queued_count += 1
+                else:
+                    self.logger.debug(f"Skipping link (would be depth {new_depth} > {project.crawl_depth}): {link}")
+            else:
+                self.logger.debug(f"Skipping already visited link: {link}")
+
+        self.logger.info(f"Queued {queued_count} new links from {url}")
+
+    async def crawl_page(
+        self,
+        url: str,
+        etag: str | None = None,
+        last_modified: str | None = None
+    ) -> dict[str, Any]:
+        """Crawl a single page and extract content.
+
+        Args:
+            url: Page URL
+            etag: ETag of the stored copy, sent as If-None-Match
+            last_modified: Last-Modified of the stored copy, sent as If-Modified-Since
+
+        Returns:
+            Crawl result; ``not_modified`` is set when the server answers 304
+        """
         try:
             start_time = time.time()
 
+            headers = {}
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
             # Make HTTP request
-            response = await self._client.get(url)
+            response = await self._client.get(url, headers=headers or None)
             response_time_ms = int((time.time() - start_time) * 1000)
 
+            if response.status_code == 304:
+                return {
+                    "url": url,
+                    "not_modified": True,
+                    "status_code": 304,
+                    "response_time_ms": response_time_ms
+                }
+
             # Check content type
             content_type = response.headers.get("content-type", "").lower()
             if "text/html" not in content_type:
@@ -453,34 +768,29 @@ class DocumentationCrawler:
                     "error": f"Unsupported content type: {content_type}"
                 }
 
-            # Parse HTML
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Extract title
-            title = ""
-            if soup.title:
-                title = soup.title.string or ""
-
-            # Extract text content
-            text_content = self._extract_text(soup)
-
-            # Extract links
-            links = self.extract_links(response.text, url)
+            # Parse once for title, text, links and headings
+            parsed = self.html_parser.parse(response.text, url, main_content=self._main_content)
+            text_content = parsed.text
 
             # Calculate content hash
             content_hash = hashlib.sha256(text_content.encode()).hexdigest()
 
             return {
                 "url": url,
-                "title": title.strip(),
+                "title": parsed.title,
                 "content_html": response.text,
                 "content_text": text_content,
                 "content_hash": content_hash,
-                "links": links,
+                "links": parsed.links,
+                "headings": parsed.headings,
+                "text_dropped": parsed.text_dropped,
+                "simhash": simhash(text_content),
                 "status_code": response.status_code,
                 "response_time_ms": response_time_ms,
                 "mime_type": "text/html",
-                "charset": response.encoding or "utf-8"
+                "charset": response.encoding or "utf-8",
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified")
             }
 
         except httpx.TimeoutException:
@@ -495,62 +805,13 @@ class DocumentationCrawler:
             return {"url": url, "error": str(e)}
 
     def _extract_text(self, soup: BeautifulSoup) -> str:
-        """Extract clean text content from HTML."""
-        # Remove script and style elements
-        for element in soup(["script", "style", "meta", "link", "noscript"]):
-            element.decompose()
-
-        # Remove comments
-        for comment in soup.find_all(text=lambda text: isinstance(text, Comment)):
-            comment.extract()
-
-        # Get text
-        text = soup.get_text(separator=" ")
-
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = " ".join(chunk for chunk in chunks if chunk)
-
-        return text
+        """Extract clean text content from HTML (see ``html_parser.extract_text``)."""
+        return extract_text(soup)
 
     def extract_links(self, html_content: str, base_url: str) -> list[str]:
         """Extract all links from HTML content."""
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
-            links = []
-
-            for tag in soup.find_all(["a", "link"]):
-                href = tag.get("href")
-                if href:
-                    # Convert relative URLs to absolute
-                    absolute_url = urljoin(base_url, href)
-
-                    # Parse and clean URL
-                    parsed = urlparse(absolute_url)
-
-                    # Skip non-HTTP(S) URLs
-                    if parsed.scheme not in ["http", "https"]:
-                        continue
-
-                    # Remove fragment
-                    clean_url = urlunparse(
-                        (parsed.scheme, parsed.netloc, parsed.path,
-                         parsed.params, parsed.query, "")
-                    )
-
-                    links.append(clean_url)
-
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_links = []
-            for link in links:
-                if link not in seen:
-                    seen.add(link)
-                    unique_links.append(link)
-
-            return unique_links
-
+            return extract_links(self.html_parser.soup(html_content), base_url)
         except Exception as e:
             self.logger.debug("Failed to extract links", extra={
                 "base_url": base_url,
@@ -565,34 +826,12 @@ class DocumentationCrawler:
             robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
 
             # Check cache
-            if robots_url not in self._robots_cache:
-                # Fetch and parse robots.txt
-                rp = RobotFileParser()
-                rp.set_url(robots_url)
-
-                try:
-                    response = await self._client.get(robots_url, timeout=5.0)
-                    if response.status_code == 200:
-                        # Check if it's actually a robots.txt file (text/plain)
-                        content_type = response.headers.get("content-type", "").lower()
-                        if "text/plain" in content_type or response.text.startswith("User-agent:") or response.text.startswith("user-agent:"):
-                            # Parse robots.txt content
-                            rp.parse(response.text.splitlines())
-                        else:
-                            # Not a robots.txt file (probably HTML 404 page), allow all
-                            self.logger.debug(f"Response is not robots.txt (content-type: {content_type}), allowing all")
-                    elif response.status_code == 404:
-                        # No robots.txt exists, allow all
-                        self.logger.debug("No robots.txt found (404), allowing all")
-                    else:
-                        # Other status codes, be conservative and check
-                        self.logger.debug(f"Robots.txt returned status {response.status_code}, allowing all")
-                except Exception as e:
-                    # If robots.txt cannot be fetched, assume allowed
-                    self.logger.debug(f"Failed to fetch robots.txt from {robots_url}: {e}")
-                    pass  # RobotFileParser allows all by default when empty
-
-                self._robots_cache[robots_url] = rp
+            lock = self._robots_locks.setdefault(robots_url, asyncio.Lock())
+            async with lock:
+                if robots_url not in self._robots_cache:
+                    self._robots_cache[robots_url] = await self._fetch_robots(
+                        robots_url, user_agent
+                    )
 
             # Check if URL is allowed
             rp = self._robots_cache[robots_url]
@@ -609,18 +848,48 @@ class DocumentationCrawler:
             # Default to allowing if check fails
             return True
 
-    async def _apply_rate_limit(self, url: str, rate_limit: float) -> None:
-        """Apply rate limiting per domain."""
-        domain = urlparse(url).netloc
+    async def _fetch_robots(self, robots_url: str, user_agent: str) -> RobotFileParser:
+        """Fetch and parse robots.txt, registering its Crawl-delay with the scheduler."""
+        rp = RobotFileParser()
+        rp.set_url(robots_url)
 
-        if domain in self._domain_last_access:
-            elapsed = time.time() - self._domain_last_access[domain]
-            wait_time = (1.0 / rate_limit) - elapsed
+        try:
+            response = await self._client.get(robots_url, timeout=5.0)
+            if response.status_code == 200:
+                # Check if it's actually a robots.txt file (text/plain)
+                content_type = response.headers.get("content-type", "").lower()
+                if "text/plain" in content_type or response.text.startswith("User-agent:") or response.text.startswith("user-agent:"):
+                    # Parse robots.txt content
+                    rp.parse(response.text.splitlines())
+                else:
+                    # Not a robots.txt file (probably HTML 404 page), allow all
+                    self.logger.debug(f"Response is not robots.txt (content-type: {content_type}), allowing all")
+            elif response.status_code == 404:
+                # No robots.txt exists, allow all
+                self.logger.debug("No robots.txt found (404), allowing all")
+            else:
+                # Other status codes, be conservative and check
+                self.logger.debug(f"Robots.txt returned status {response.status_code}, allowing all")
+        except Exception as e:
+            # If robots.txt cannot be fetched, assume allowed
+            self.logger.debug(f"Failed to fetch robots.txt from {robots_url}: {e}")
+            pass  # RobotFileParser allows all by default when empty
+
+        if rp.entries or rp.default_entry:
+            self._scheduler.set_crawl_delay(
+                urlparse(robots_url).netloc, rp.crawl_delay(user_agent)
+            )
+        return rp
 
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
+    async def _apply_rate_limit(self, url: str, rate_limit: float) -> None:
+        """Wait for the URL host's next request slot.
 
-        self._domain_last_access[domain] = time.time()
+        Requests are spaced per host by the larger of ``1 / rate_limit`` and
+        the host's robots.txt Crawl-delay, so workers crawling different hosts
+        do not slow each other down.
+        """
+        self._scheduler.rate_limit = rate_limit
+        await self._scheduler.acquire(url)
 
     async def stop_crawl(self, session_id: str) -> bool:
         """Stop an active crawl session."""
@@ -641,18 +910,63 @@ class DocumentationCrawler:
             return True
         return False
 
-    async def resume_crawl(self, session_id: str) -> CrawlSession:
-        """Resume a paused crawl session."""
+    async def resume_crawl(
+        self,
+        session_id: str,
+        max_pages: int | None = None,
+        progress_display: Any | None = None,
+        error_reporter: Any | None = None,
+        concurrency: int | None = None
+    ) -> CrawlSession:
+        """Resume a paused or interrupted crawl session from its saved frontier.
+
+        Already processed URLs are not fetched again; the queue continues with
+        the URLs that were still pending when the session stopped.
+
+        Args:
+            session_id: Session to resume
+            max_pages: Stop once the session has crawled this many pages
+            progress_display: Optional display updated as pages are crawled
+            error_reporter: Optional collector of page errors
+            concurrency: Fetch workers (defaults to config.crawl_concurrency)
+
+        Returns:
+            The resumed crawl session
+        """
+        if self._is_running:
+            raise CrawlerError("Crawler is already running")
+
         session = await self.db_manager.get_crawl_session(session_id)
         if not session:
             raise CrawlerError(f"Session {session_id} not found")
 
+        # A RUNNING session that this crawler is not running was interrupted
+        if session.status == CrawlStatus.RUNNING:
+            session.pause_session()
         if session.status != CrawlStatus.PAUSED:
             raise CrawlerError(f"Session is not paused: {session.status}")
 
-        # TODO: Implement resume logic
-        # This would need to reconstruct the crawl state from the database
-        raise NotImplementedError("Resume crawl not fully implemented yet")
+        project = await self.db_manager.get_project(session.project_id)
+        if not project:
+            raise CrawlerError(f"Project {session.project_id} not found")
+
+        queued, visited = await self.db_manager.get_frontier(project.id, session.id)
+        if not queued and not visited:
+            raise CrawlerError(f"Session {session_id} has no saved frontier to resume")
+        content_hashes = await self.db_manager.get_session_content_hashes(project.id, session.id)
+
+        session.resume_session()
+        await self._launch(
+            project, session, queued, visited, content_hashes,
+            max_pages, progress_display, error_reporter, concurrency
+        )
+
+        self.logger.info("Crawl resumed", extra={
+            "session_id": session.id,
+            "queued": len(queued),
+            "visited": len(visited)
+        })
+        return session
 
     async def complete_crawl(self, session_id: str) -> CrawlSession:
         """Mark a crawl session as completed."""
@@ -677,6 +991,8 @@ class DocumentationCrawler:
         if not session:
             raise CrawlerError(f"Session {session_id} not found")
 
+        text_kept = session.metadata.get("text_chars_kept", 0)
+        text_dropped = session.metadata.get("text_chars_dropped", 0)
         return {
             "pages_crawled": session.pages_crawled,
             "pages_failed": session.pages_failed,
@@ -686,7 +1002,15 @@ class DocumentationCrawler:
                 session.total_size_bytes / session.pages_crawled
                 if session.pages_crawled > 0 else 0
             ),
-            "crawl_duration": session.get_duration()
+            "crawl_duration": session.get_duration(),
+            "content_extraction": session.metadata.get("content_extraction", ContentExtraction.FULL.value),
+            "pages_near_duplicate": session.metadata.get("pages_near_duplicate", 0),
+            "text_chars_kept": text_kept,
+            "text_chars_dropped": text_dropped,
+            "text_dropped_ratio": (
+                text_dropped / (text_kept + text_dropped)
+                if text_kept + text_dropped > 0 else 0.0
+            )
         }
 
     async def wait_for_completion(
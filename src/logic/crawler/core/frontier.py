@@ -0,0 +1,95 @@
+"""Durable crawl frontier backed by the project database.
+
+The crawl queue lives in memory, so on its own a paused or crashed crawl has
+to start over. The frontier records every queued URL (with its depth and
+parent) and every processed URL in the project's ``crawl_frontier`` table,
+which is enough to rebuild the queue and the visited set on resume.
+
+Writes are buffered and flushed in batches. A URL is always recorded as
+queued no later than in the same flush that marks it processed, so a crash
+can only lose the tail of the buffer: those URLs are processed again on
+resume, and pages already crawled are recognized from the pages table.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from src.services.database import DatabaseManager
+
+FrontierEntry = tuple[str, int, str | None]
+
+
+class CrawlFrontier:
+    """Buffered persistence of one crawl session's frontier."""
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        project_id: str,
+        session_id: str,
+        batch_size: int = 100,
+        before_flush: Callable[[], Awaitable[None]] | None = None,
+    ):
+        """Initialize crawl frontier.
+
+        Args:
+            db_manager: Database manager owning the project database
+            project_id: Project being crawled
+            session_id: Crawl session the frontier belongs to
+            batch_size: Buffered changes that trigger a flush
+            before_flush: Awaited before each write, e.g. to persist the
+                pages of URLs about to be marked processed
+        """
+        self.db_manager = db_manager
+        self.project_id = project_id
+        self.session_id = session_id
+        self.batch_size = batch_size
+        self.before_flush = before_flush
+        self._queued: list[FrontierEntry] = []
+        self._done: list[str] = []
+        self._lock = asyncio.Lock()
+
+    async def add(self, url: str, depth: int, parent_url: str | None) -> None:
+        """Record a URL put on the crawl queue."""
+        self._queued.append((url, depth, parent_url))
+        await self._maybe_flush()
+
+    async def mark_done(self, url: str) -> None:
+        """Record a URL taken off the queue and processed."""
+        self._done.append(url)
+        await self._maybe_flush()
+
+    async def flush(self) -> None:
+        """Write buffered changes in one transaction."""
+        async with self._lock:
+            # Swap before awaiting so workers keep buffering during the write
+            queued, self._queued = self._queued, []
+            done, self._done = self._done, []
+            if self.before_flush:
+                # Pages of the swapped URLs were buffered before they were
+                # marked done, so this writes them ahead of the marks
+                await self.before_flush()
+            if queued or done:
+                await self.db_manager.save_frontier(
+                    self.project_id, self.session_id, queued, done
+                )
+
+    async def load(self) -> tuple[list[FrontierEntry], set[str]]:
+        """Load the persisted frontier.
+
+        Returns:
+            Tuple of (entries still to process in queue order, processed URLs)
+        """
+        await self.flush()
+        return await self.db_manager.get_frontier(self.project_id, self.session_id)
+
+    async def clear(self) -> None:
+        """Drop the persisted frontier of a finished session."""
+        self._queued.clear()
+        self._done.clear()
+        await self.db_manager.clear_frontier(self.project_id, self.session_id)
+
+    async def _maybe_flush(self) -> None:
+        """Flush once enough changes are buffered."""
+        if len(self._queued) + len(self._done) >= self.batch_size:
+            await self.flush()
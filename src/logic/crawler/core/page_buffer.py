@@ -0,0 +1,101 @@
+"""Write-behind persistence of crawled pages and session progress.
+
+Saving every page change and session update as it happens costs several
+SQLite commits per URL, each waiting on the disk, and the fetch workers
+wait with them. The buffer keeps the latest state of changed pages and of
+the session in memory and writes them in one transaction once enough pages
+are buffered or the flush interval has passed.
+
+The crawl frontier flushes the buffer before it records URLs as processed,
+so a crash never leaves a URL marked done without its page row: buffered
+pages that are lost are simply crawled again on resume.
+"""
+
+import asyncio
+
+from src.core.lib_logger import get_logger
+from src.services.database import DatabaseManager
+
+from ..models.page import Page
+from ..models.session import CrawlSession
+
+logger = get_logger(__name__)
+
+
+class PageBuffer:
+    """Buffered page and session writes for one crawl."""
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        project_id: str,
+        batch_size: int = 50,
+        flush_interval: float = 1.0,
+    ):
+        """Initialize page buffer.
+
+        Args:
+            db_manager: Database manager owning the project database
+            project_id: Project being crawled
+            batch_size: Buffered pages that trigger a flush
+            flush_interval: Seconds between background flushes
+        """
+        self.db_manager = db_manager
+        self.project_id = project_id
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pages: dict[str, Page] = {}
+        self._session: CrawlSession | None = None
+        self._lock = asyncio.Lock()
+        self._timer: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start flushing in the background every ``flush_interval`` seconds."""
+        if self._timer is None:
+            self._timer = asyncio.create_task(self._flush_periodically())
+
+    async def close(self) -> None:
+        """Stop the background flushes and write what is left."""
+        if self._timer is not None:
+            self._timer.cancel()
+            await asyncio.gather(self._timer, return_exceptions=True)
+            self._timer = None
+        await self.flush()
+
+    async def add_page(self, page: Page) -> None:
+        """Record a new or changed page; its state at flush time is written."""
+        self._pages[page.id] = page
+        if len(self._pages) >= self.batch_size:
+            await self.flush()
+
+    def update_session(self, session: CrawlSession) -> None:
+        """Record that the session's progress changed."""
+        self._session = session
+
+    async def flush(self) -> None:
+        """Write buffered pages and session progress in one transaction."""
+        async with self._lock:
+            # Swap before awaiting so workers keep buffering during the write
+            pages, self._pages = self._pages, {}
+            session, self._session = self._session, None
+            if not pages and session is None:
+                return
+            try:
+                await self.db_manager.save_crawl_batch(
+                    self.project_id, list(pages.values()), session
+                )
+            except Exception:
+                # Keep the batch for the next flush; newer changes win
+                self._pages = {**pages, **self._pages}
+                self._session = self._session or session
+                raise
+
+    async def _flush_periodically(self) -> None:
+        """Flush on a timer so slow crawls still persist promptly."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                # The final flush in close() reports persistent failures
+                logger.debug(f"Background page flush failed: {e}")
@@ -0,0 +1,73 @@
+"""Per-host politeness scheduling for concurrent crawling.
+
+Fetch workers ask the scheduler for a slot before each request. Slots are
+handed out per host, spaced by the larger of ``1 / rate_limit`` and the
+host's robots.txt ``Crawl-delay``, so several workers can crawl different
+hosts at full speed while each host only sees the configured request rate.
+Reserving a slot is synchronous, so concurrent workers never share one.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from urllib.parse import urlparse
+
+
+class HostScheduler:
+    """Hand out request slots per host at the allowed rate."""
+
+    def __init__(
+        self,
+        rate_limit: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        """Initialize host scheduler.
+
+        Args:
+            rate_limit: Requests per second allowed per host
+            clock: Monotonic time source (injectable for tests)
+            sleep: Async sleep used to wait for a slot (injectable for tests)
+        """
+        if rate_limit <= 0:
+            raise ValueError(f"rate_limit must be positive, got {rate_limit}")
+        self.rate_limit = rate_limit
+        self._clock = clock
+        self._sleep = sleep
+        self._crawl_delays: dict[str, float] = {}
+        self._next_slot: dict[str, float] = {}
+
+    def set_crawl_delay(self, host: str, delay: float | None) -> None:
+        """Apply a host's robots.txt ``Crawl-delay`` (seconds)."""
+        if delay:
+            self._crawl_delays[host] = float(delay)
+        else:
+            self._crawl_delays.pop(host, None)
+
+    def interval(self, host: str) -> float:
+        """Seconds between requests to a host."""
+        return max(1.0 / self.rate_limit, self._crawl_delays.get(host, 0.0))
+
+    async def acquire(self, url: str) -> float:
+        """Wait for the next request slot of the URL's host.
+
+        Args:
+            url: URL about to be fetched
+
+        Returns:
+            Seconds waited
+        """
+        host = urlparse(url).netloc
+        now = self._clock()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self.interval(host)
+
+        wait = slot - now
+        if wait > 0:
+            await self._sleep(wait)
+        return wait
+
+    def clear(self) -> None:
+        """Forget all hosts."""
+        self._crawl_delays.clear()
+        self._next_slot.clear()
@@ -1,7 +1,7 @@
 """Page data model."""
 
 import hashlib
-from datetime import datetime, timezone
+from datetime import UTC, datetime, timezone
 from enum import Enum
 from typing import Any
 from urllib.parse import urlparse
@@ -33,6 +33,7 @@ class Page(BaseModel):
     content_html: str | None = Field(default=None, description="Raw HTML content")
     content_text: str | None = Field(default=None, description="Extracted text content")
     content_hash: str | None = Field(default=None, description="Content hash for deduplication")
+    simhash: str | None = Field(default=None, description="SimHash fingerprint (hex) for near-duplicate detection")
 
     # Metadata
     mime_type: str = Field(default="text/html", description="Content MIME type")
@@ -45,6 +46,8 @@ class Page(BaseModel):
     parent_url: str | None = Field(default=None, description="URL that linked to this page")
     response_code: int | None = Field(default=None, description="HTTP response code")
     response_time_ms: int | None = Field(default=None, description="Response time in milliseconds")
+    etag: str | None = Field(default=None, description="ETag validator of the stored content")
+    last_modified: str | None = Field(default=None, description="Last-Modified validator of the stored content")
 
     # Timestamps
     discovered_at: datetime = Field(default_factory=datetime.utcnow)
@@ -61,6 +64,9 @@ class Page(BaseModel):
     outbound_links: list[str] = Field(default_factory=list, description="URLs found on this page")
     internal_links: list[str] = Field(default_factory=list, description="Internal links found")
     external_links: list[str] = Field(default_factory=list, description="External links found")
+    headings: list[tuple[int, str]] = Field(
+        default_factory=list, description="(level, text) of the page's h1-h6 headings"
+    )
 
     # Metadata
     metadata: dict[str, Any] = Field(default_factory=dict)
@@ -99,7 +105,8 @@ class Page(BaseModel):
         content_html: str | None = None,
         content_text: str | None = None,
         mime_type: str | None = None,
-        charset: str | None = None
+        charset: str | None = None,
+        headings: list[tuple[int, str]] | None = None
     ) -> None:
         """Update page content."""
         if title is not None:
@@ -114,6 +121,8 @@ class Page(BaseModel):
             self.mime_type = mime_type
         if charset is not None:
             self.charset = charset
+        if headings is not None:
+            self.headings = headings
 
         self.status = PageStatus.PROCESSED
         self.processed_at = datetime.now(timezone.utc)
@@ -141,6 +150,23 @@ class Page(BaseModel):
             # This method just records the crawl metadata
             pass
 
+    def mark_unchanged(self, response_time_ms: int) -> None:
+        """Mark page as revalidated and unchanged.
+
+        Recorded as HTTP 304 whether the server answered a conditional GET
+        with 304 or the sitemap lastmod showed no change since the last
+        crawl. Content, hash and status are kept, so the page needs no
+        re-indexing.
+        """
+        self.response_code = 304
+        self.response_time_ms = response_time_ms
+        self.crawled_at = datetime.now(UTC)
+        self.error_message = None
+
+    def is_unchanged(self) -> bool:
+        """Check if the last crawl found the page unchanged."""
+        return self.response_code == 304
+
     def mark_indexed(self) -> None:
         """Mark page as indexed."""
         if self.status != PageStatus.PROCESSED:
@@ -211,6 +237,23 @@ class Page(BaseModel):
             return False
         return self.content_hash == other.content_hash
 
+    def to_document(self, project: str = ""):
+        """Build a RAG document from the crawled text and headings.
+
+        The document carries the headings found when the page was crawled,
+        so chunking does not parse ``content_html`` again.
+        """
+        from src.logic.rag.models.document import Document
+
+        return Document(
+            id=self.id,
+            content=self.content_text or "",
+            title=self.title or "",
+            url=self.url,
+            project=project,
+            hierarchy=self.headings,
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
         return {
@@ -223,6 +266,7 @@ class Page(BaseModel):
             "content_html": self.content_html,
             "content_text": self.content_text,
             "content_hash": self.content_hash,
+            "simhash": self.simhash,
             "mime_type": self.mime_type,
             "charset": self.charset,
             "language": self.language,
@@ -231,6 +275,8 @@ class Page(BaseModel):
             "parent_url": self.parent_url,
             "response_code": self.response_code,
             "response_time_ms": self.response_time_ms,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
             "discovered_at": self.discovered_at.isoformat(),
             "crawled_at": self.crawled_at.isoformat() if self.crawled_at else None,
             "processed_at": self.processed_at.isoformat() if self.processed_at else None,
@@ -241,6 +287,7 @@ class Page(BaseModel):
             "outbound_links": self.outbound_links,
             "internal_links": self.internal_links,
             "external_links": self.external_links,
+            "headings": self.headings,
             "metadata": self.metadata,
             "domain": self.get_domain(),
             "text_preview": self.get_text_preview()
@@ -0,0 +1,118 @@
+"""Site-level boilerplate detection by text block hashing.
+
+Documentation sites repeat navigation, footers, cookie banners and "Edit
+this page" blocks on every page. The detector hashes each text block (one
+line of extracted page text) once per page and counts on how many pages it
+occurs. Blocks found on more than ``threshold`` of a project's pages are
+boilerplate and are stripped before chunking, so the same text is not
+embedded once per page.
+"""
+
+import hashlib
+import re
+from collections import Counter
+from collections.abc import Iterable
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _block_key(block: str) -> bytes:
+    """Hash a normalized text block."""
+    normalized = _WHITESPACE.sub(" ", block).strip().lower()
+    return hashlib.blake2b(normalized.encode(), digest_size=8).digest()
+
+
+class BoilerplateDetector:
+    """Count text blocks across a project's pages and strip the recurring ones."""
+
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        min_pages: int = 5,
+        min_block_chars: int = 8,
+    ):
+        """Initialize boilerplate detector.
+
+        Args:
+            threshold: Fraction of pages a block must exceed to be boilerplate
+            min_pages: Pages to observe before anything is stripped
+            min_block_chars: Shorter blocks are never treated as boilerplate
+        """
+        if not 0.0 < threshold < 1.0:
+            raise ValueError(f"threshold must be between 0 and 1, got {threshold}")
+        self.threshold = threshold
+        self.min_pages = min_pages
+        self.min_block_chars = min_block_chars
+        self.page_count = 0
+        self._block_pages: Counter[bytes] = Counter()
+        self._boilerplate: frozenset[bytes] | None = None
+
+    @classmethod
+    def fit(cls, texts: Iterable[str], **kwargs) -> "BoilerplateDetector":
+        """Build a detector from the text of every page of a project.
+
+        Args:
+            texts: Extracted page texts
+            **kwargs: Detector settings (see ``__init__``)
+
+        Returns:
+            Detector that has observed all pages
+        """
+        detector = cls(**kwargs)
+        for text in texts:
+            detector.observe(text)
+        return detector
+
+    def observe(self, text: str) -> None:
+        """Count the blocks of one page.
+
+        Args:
+            text: Extracted page text, one block per line
+        """
+        keys = {
+            _block_key(block)
+            for block in text.splitlines()
+            if len(block.strip()) >= self.min_block_chars
+        }
+        self._block_pages.update(keys)
+        self.page_count += 1
+        self._boilerplate = None
+
+    @property
+    def boilerplate_count(self) -> int:
+        """Number of distinct blocks currently classed as boilerplate."""
+        return len(self._boilerplate_keys())
+
+    def is_boilerplate(self, block: str) -> bool:
+        """Check whether a block recurs on more than ``threshold`` of pages."""
+        if len(block.strip()) < self.min_block_chars:
+            return False
+        return _block_key(block) in self._boilerplate_keys()
+
+    def strip(self, text: str) -> tuple[str, int]:
+        """Remove boilerplate blocks from a page's text.
+
+        Args:
+            text: Extracted page text, one block per line
+
+        Returns:
+            Tuple of (remaining text, bytes removed)
+        """
+        if not self._boilerplate_keys():
+            return text, 0
+
+        kept = [block for block in text.splitlines() if not self.is_boilerplate(block)]
+        stripped = "\n".join(kept)
+        return stripped, len(text.encode()) - len(stripped.encode())
+
+    def _boilerplate_keys(self) -> frozenset[bytes]:
+        """Block hashes above the threshold (cached until the next observe)."""
+        if self._boilerplate is None:
+            if self.page_count < self.min_pages:
+                self._boilerplate = frozenset()
+            else:
+                cutoff = self.threshold * self.page_count
+                self._boilerplate = frozenset(
+                    key for key, pages in self._block_pages.items() if pages > cutoff
+                )
+        return self._boilerplate
@@ -0,0 +1,281 @@
+"""Single-pass HTML parsing for crawled pages.
+
+A page is parsed once and everything the crawler and the indexer need is
+taken from that one tree: title, links, heading hierarchy and block-per-line
+text. The lxml tree builder is used when lxml is installed (several times
+faster than ``html.parser``); otherwise the standard library parser is used.
+
+In ``main`` extraction mode the text and headings come from the page's main
+article region only, leaving out sidebars, tables of contents and menus.
+Links are always taken from the whole page so navigation still drives the
+crawl.
+"""
+
+import re
+from dataclasses import dataclass, field
+from urllib.parse import urljoin, urlparse, urlunparse
+
+from bs4 import BeautifulSoup
+from bs4.element import Comment, Tag
+
+try:
+    import lxml  # noqa: F401
+
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Elements whose text forms its own block (line) in extracted page text
+BLOCK_TAGS = [
+    "address",
+    "article",
+    "aside",
+    "blockquote",
+    "br",
+    "dd",
+    "div",
+    "dl",
+    "dt",
+    "fieldset",
+    "figcaption",
+    "figure",
+    "footer",
+    "form",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "header",
+    "hr",
+    "li",
+    "main",
+    "nav",
+    "ol",
+    "p",
+    "pre",
+    "section",
+    "table",
+    "td",
+    "th",
+    "tr",
+    "ul",
+]
+
+_HEADING = re.compile("^h[1-6]$")
+
+# Main content regions, most specific first: documentation themes (Sphinx,
+# Read the Docs, MkDocs Material, Docusaurus, VitePress, GitBook), then the
+# generic HTML5 and ARIA landmarks
+CONTENT_SELECTORS = [
+    "div.document div.body",
+    "div[itemprop=articleBody]",
+    "div.rst-content div[role=main]",
+    "article.md-content__inner",
+    "div.md-content",
+    "div.theme-doc-markdown",
+    "article div.markdown",
+    "div.vp-doc",
+    "div.markdown-section",
+    "main article",
+    "[role=main]",
+    "main",
+    "article",
+]
+
+# A region with less text than this is a false match (e.g. an empty <main>)
+MIN_CONTENT_CHARS = 100
+
+# Text-density fallback: paragraphs shorter than this are not scored, and
+# containers whose text is mostly link text (menus) are penalised
+_MIN_PARAGRAPH_CHARS = 25
+_DENSITY_TAGS = ["p", "pre", "blockquote", "td"]
+
+
+@dataclass
+class ParsedPage:
+    """Everything extracted from one parse of a page."""
+
+    title: str = ""
+    text: str = ""
+    links: list[str] = field(default_factory=list)
+    headings: list[tuple[int, str]] = field(default_factory=list)
+    # Characters of page text left out by main-content extraction
+    text_dropped: int = 0
+
+
+def default_backend() -> str:
+    """Fastest BeautifulSoup tree builder available."""
+    return "lxml" if LXML_AVAILABLE else "html.parser"
+
+
+class HtmlParser:
+    """Parse pages once with a pluggable BeautifulSoup backend."""
+
+    def __init__(self, backend: str | None = None):
+        """Initialize HTML parser.
+
+        Args:
+            backend: BeautifulSoup tree builder ("lxml" or "html.parser");
+                defaults to lxml when installed
+        """
+        self.backend = backend or default_backend()
+
+    def soup(self, html: str) -> BeautifulSoup:
+        """Parse HTML into a tree."""
+        return BeautifulSoup(html, self.backend)
+
+    def parse(self, html: str, base_url: str, main_content: bool = False) -> ParsedPage:
+        """Extract title, links, headings and text from one parse.
+
+        Args:
+            html: Page HTML
+            base_url: URL the page was fetched from (resolves relative links)
+            main_content: Take text and headings from the main content region
+                only (the whole page is used when none is found)
+
+        Returns:
+            Parsed page
+        """
+        soup = self.soup(html)
+        title = soup.title.string if soup.title and soup.title.string else ""
+        links = extract_links(soup, base_url)
+
+        region = find_main_content(soup) if main_content else None
+        if region is None:
+            headings = extract_headings(soup)
+            # Text extraction edits the tree, so it goes last
+            text = extract_text(soup)
+            return ParsedPage(
+                title=title.strip(), text=text, links=links, headings=headings
+            )
+
+        headings = extract_headings(region)
+        text = extract_text(region)
+        full_text = extract_text(soup)
+        return ParsedPage(
+            title=title.strip(),
+            text=text,
+            links=links,
+            headings=headings,
+            text_dropped=max(len(full_text) - len(text), 0),
+        )
+
+
+def find_main_content(soup: BeautifulSoup) -> Tag | None:
+    """Find the element holding the page's main content.
+
+    Known content selectors are tried first; otherwise the container with
+    the most paragraph text (discounted by its link density) is chosen.
+
+    Returns:
+        The content element, or None when no region stands out
+    """
+    for selector in CONTENT_SELECTORS:
+        region = soup.select_one(selector)
+        if region is not None and _text_length(region) >= MIN_CONTENT_CHARS:
+            return region
+    return _densest_container(soup)
+
+
+def _densest_container(soup: BeautifulSoup) -> Tag | None:
+    """Pick the container with the highest paragraph-text score."""
+    scores: dict[int, tuple[Tag, float]] = {}
+    for block in soup.find_all(_DENSITY_TAGS):
+        length = _text_length(block)
+        if length < _MIN_PARAGRAPH_CHARS:
+            continue
+        # Credit the parent fully and the grandparent half, so text spread
+        # over sibling sections still adds up in their shared container
+        parent = block.parent
+        grandparent = parent.parent if parent is not None else None
+        for ancestor, share in ((parent, 1.0), (grandparent, 0.5)):
+            if ancestor is None or ancestor.name in ("[document]", "html", "body"):
+                continue
+            _, score = scores.get(id(ancestor), (ancestor, 0.0))
+            scores[id(ancestor)] = (ancestor, score + length * share)
+
+    best, best_score = None, 0.0
+    for candidate, score in scores.values():
+        score *= 1 - _link_density(candidate)
+        if score > best_score:
+            best, best_score = candidate, score
+
+    if best is None or _text_length(best) < MIN_CONTENT_CHARS:
+        return None
+    return best
+
+
+def _text_length(element: Tag) -> int:
+    """Length of an element's visible text, whitespace collapsed."""
+    return len(" ".join(element.get_text(" ").split()))
+
+
+def _link_density(element: Tag) -> float:
+    """Share of an element's text that is link text."""
+    length = _text_length(element)
+    if not length:
+        return 1.0
+    link_length = sum(_text_length(link) for link in element.find_all("a"))
+    return min(link_length / length, 1.0)
+
+
+def extract_links(soup: BeautifulSoup, base_url: str) -> list[str]:
+    """Collect unique absolute HTTP(S) links without fragments, in page order."""
+    links: dict[str, None] = {}
+    for tag in soup.find_all(["a", "link"]):
+        href = tag.get("href")
+        if not href:
+            continue
+
+        # Convert relative URLs to absolute
+        parsed = urlparse(urljoin(base_url, href))
+
+        # Skip non-HTTP(S) URLs
+        if parsed.scheme not in ["http", "https"]:
+            continue
+
+        # Remove fragment
+        clean_url = urlunparse(
+            (parsed.scheme, parsed.netloc, parsed.path, parsed.params, parsed.query, "")
+        )
+        links.setdefault(clean_url)
+    return list(links)
+
+
+def extract_headings(soup: BeautifulSoup | Tag) -> list[tuple[int, str]]:
+    """Collect (level, text) of the h1-h6 headings in page order."""
+    headings = []
+    for heading in soup.find_all(_HEADING):
+        text = heading.get_text(strip=True)
+        if text:
+            headings.append((int(heading.name[1]), text))
+    return headings
+
+
+def extract_text(soup: BeautifulSoup | Tag) -> str:
+    """Extract clean text content, modifying the tree.
+
+    Each block-level element's text is put on its own line, so blocks
+    can be compared across pages (see ``BoilerplateDetector``).
+    """
+    # Remove script and style elements
+    for element in soup(["script", "style", "meta", "link", "noscript"]):
+        element.decompose()
+
+    # Remove comments
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        comment.extract()
+
+    # Break lines around block elements
+    for element in soup.find_all(BLOCK_TAGS):
+        element.insert_before("\n")
+        element.insert_after("\n")
+
+    # Get text
+    text = soup.get_text(separator=" ")
+
+    # Clean up whitespace within each block
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
@@ -0,0 +1,127 @@
+"""SimHash fingerprints for near-duplicate page detection.
+
+Content hashes only catch byte-identical text. Versioned copies of a page
+(``/v1/`` and ``/latest/``, ``?lang=`` variants) or pages that differ by a
+build timestamp have different hashes but nearly the same words, and a
+SimHash of their word shingles differs in only a few bits.
+
+``SimHashIndex`` finds a stored fingerprint within a Hamming distance of
+``k`` without comparing against every page: fingerprints are split into
+``k + 1`` bands, and two fingerprints at most ``k`` bits apart must agree on
+at least one band (pigeonhole), so only pages sharing a band are compared.
+"""
+
+import hashlib
+import re
+from collections import Counter
+
+FINGERPRINT_BITS = 64
+
+# Pages with fewer words give unstable fingerprints and are not fingerprinted
+MIN_WORDS = 20
+
+_SHINGLE_SIZE = 3
+_WORD = re.compile(r"\w+")
+
+
+def simhash(text: str) -> int | None:
+    """Compute the 64-bit SimHash of a text's word shingles.
+
+    Args:
+        text: Page text
+
+    Returns:
+        Fingerprint, or None when the text is too short
+    """
+    words = _WORD.findall(text.lower())
+    if len(words) < MIN_WORDS:
+        return None
+
+    shingles = Counter(
+        " ".join(words[i : i + _SHINGLE_SIZE])
+        for i in range(len(words) - _SHINGLE_SIZE + 1)
+    )
+    weights = [0] * FINGERPRINT_BITS
+    for shingle, count in shingles.items():
+        digest = int.from_bytes(
+            hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big"
+        )
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += count if digest >> bit & 1 else -count
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return (a ^ b).bit_count()
+
+
+def format_fingerprint(fingerprint: int) -> str:
+    """Fingerprint as the fixed-width hex string stored with a page."""
+    return f"{fingerprint:016x}"
+
+
+def parse_fingerprint(value: str) -> int:
+    """Fingerprint from its stored hex string."""
+    return int(value, 16)
+
+
+class SimHashIndex:
+    """Lookup of fingerprints within a Hamming distance."""
+
+    def __init__(self, max_distance: int = 3):
+        """Initialize SimHash index.
+
+        Args:
+            max_distance: Largest Hamming distance counted as a near-duplicate
+        """
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        # Band boundaries spreading the bits as evenly as possible
+        self._bands = [
+            (FINGERPRINT_BITS * i // bands, FINGERPRINT_BITS * (i + 1) // bands)
+            for i in range(bands)
+        ]
+        self._tables: list[dict[int, list[tuple[int, str]]]] = [{} for _ in self._bands]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, fingerprint: int, key: str) -> None:
+        """Index a fingerprint under a key (e.g. the page URL)."""
+        for table, band in zip(self._tables, self._keys(fingerprint), strict=True):
+            table.setdefault(band, []).append((fingerprint, key))
+        self._size += 1
+
+    def find(self, fingerprint: int, exclude: str | None = None) -> str | None:
+        """Find the key of the closest indexed fingerprint within range.
+
+        Args:
+            fingerprint: Fingerprint to look up
+            exclude: Key to ignore (the page itself when it is re-crawled)
+
+        Returns:
+            Key of the nearest match, or None
+        """
+        best_key, best_distance = None, self.max_distance + 1
+        for table, band in zip(self._tables, self._keys(fingerprint), strict=True):
+            for candidate, key in table.get(band, ()):
+                if key == exclude:
+                    continue
+                distance = hamming_distance(fingerprint, candidate)
+                if distance < best_distance:
+                    best_key, best_distance = key, distance
+        return best_key
+
+    def _keys(self, fingerprint: int) -> list[int]:
+        """Band values of a fingerprint."""
+        return [
+            fingerprint >> start & ((1 << (end - start)) - 1)
+            for start, end in self._bands
+        ]
@@ -0,0 +1,181 @@
+"""Sitemap discovery for crawl seeding and refresh planning.
+
+Sitemaps list a site's pages directly, so the crawler can queue deep pages
+without walking every link level, and their ``lastmod`` dates tell a refresh
+which stored pages changed since they were last crawled. Sitemap indexes
+are followed recursively; gzipped sitemaps and plain-text URL lists are
+supported as well.
+"""
+
+import gzip
+import xml.etree.ElementTree as ET
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import httpx
+
+from src.core.lib_logger import get_logger
+
+logger = get_logger(__name__)
+
+# Limits from the sitemaps.org protocol
+MAX_SITEMAP_URLS = 50_000
+MAX_SITEMAP_BYTES = 50 * 1024 * 1024
+
+
+@dataclass
+class SitemapEntry:
+    """A page listed in a sitemap."""
+
+    url: str
+    lastmod: datetime | None = None
+
+
+def parse_lastmod(value: str | None) -> datetime | None:
+    """Parse a W3C datetime ``lastmod`` value (date-only values are UTC midnight)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed
+
+
+def parse_sitemap(content: bytes) -> tuple[list[SitemapEntry], list[str]]:
+    """Parse a sitemap or sitemap index.
+
+    Args:
+        content: Raw sitemap body (gzip-compressed bodies are detected)
+
+    Returns:
+        Tuple of (page entries, child sitemap URLs)
+
+    Raises:
+        ValueError: If the content is not a sitemap
+    """
+    if content[:2] == b"\x1f\x8b":
+        content = gzip.decompress(content)
+
+    stripped = content.lstrip()
+    if not stripped.startswith(b"<"):
+        # Plain-text sitemap: one URL per line
+        lines = stripped.decode("utf-8", errors="replace").splitlines()
+        urls = [
+            line.strip()
+            for line in lines
+            if line.strip().startswith(("http://", "https://"))
+        ]
+        if not urls:
+            raise ValueError("Not a sitemap")
+        return [SitemapEntry(url) for url in urls], []
+
+    try:
+        root = ET.fromstring(stripped)
+    except ET.ParseError as e:
+        raise ValueError(f"Invalid sitemap XML: {e}") from e
+
+    tag = root.tag.rsplit("}", 1)[-1]
+    if tag == "sitemapindex":
+        children = [
+            loc.text.strip() for loc in root.findall("{*}sitemap/{*}loc") if loc.text
+        ]
+        return [], children
+    if tag != "urlset":
+        raise ValueError(f"Not a sitemap: <{tag}>")
+
+    entries = []
+    for url in root.findall("{*}url"):
+        loc = url.find("{*}loc")
+        if loc is None or not loc.text:
+            continue
+        lastmod = url.find("{*}lastmod")
+        entries.append(
+            SitemapEntry(
+                url=loc.text.strip(),
+                lastmod=parse_lastmod(lastmod.text if lastmod is not None else None),
+            )
+        )
+    return entries, []
+
+
+class SitemapReader:
+    """Fetch sitemaps, following sitemap indexes."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        before_request: Callable[[str], Awaitable[object]] | None = None,
+        max_sitemaps: int = 100,
+        max_urls: int = MAX_SITEMAP_URLS,
+    ):
+        """Initialize sitemap reader.
+
+        Args:
+            client: HTTP client used for the requests
+            before_request: Awaited with each sitemap URL before it is fetched
+                (the crawler's politeness scheduler)
+            max_sitemaps: Sitemap documents to fetch at most
+            max_urls: Page entries to return at most
+        """
+        self.client = client
+        self.before_request = before_request
+        self.max_sitemaps = max_sitemaps
+        self.max_urls = max_urls
+
+    async def read(self, sitemap_urls: list[str]) -> list[SitemapEntry]:
+        """Collect the page entries of sitemaps and their indexes.
+
+        Unreachable or invalid sitemaps are skipped.
+
+        Args:
+            sitemap_urls: Sitemap or sitemap index URLs
+
+        Returns:
+            Unique page entries in sitemap order
+        """
+        pending = list(dict.fromkeys(sitemap_urls))
+        fetched: set[str] = set()
+        entries: dict[str, SitemapEntry] = {}
+
+        while (
+            pending
+            and len(fetched) < self.max_sitemaps
+            and len(entries) < self.max_urls
+        ):
+            sitemap_url = pending.pop(0)
+            if sitemap_url in fetched:
+                continue
+            fetched.add(sitemap_url)
+
+            content = await self._fetch(sitemap_url)
+            if content is None:
+                continue
+            try:
+                page_entries, children = parse_sitemap(content)
+            except (ValueError, OSError, EOFError) as e:
+                logger.debug(f"Skipping sitemap {sitemap_url}: {e}")
+                continue
+
+            pending.extend(child for child in children if child not in fetched)
+            for entry in page_entries:
+                entries.setdefault(entry.url, entry)
+
+        return list(entries.values())[: self.max_urls]
+
+    async def _fetch(self, url: str) -> bytes | None:
+        """Fetch a sitemap body, or None when it is unavailable."""
+        try:
+            if self.before_request:
+                await self.before_request(url)
+            response = await self.client.get(url)
+        except httpx.HTTPError as e:
+            logger.debug(f"Failed to fetch sitemap {url}: {e}")
+            return None
+        if response.status_code != 200 or len(response.content) > MAX_SITEMAP_BYTES:
+            return None
+        return response.content
@@ -7,6 +7,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from src.services.chunk_store import chunk_store_path, release_collection
+
 from ..models.config import ProjectConfig
 from ..models.project import Project, ProjectStatus, ProjectType
 from .database_repository import ProjectDatabaseRepository
@@ -239,6 +241,12 @@ class ProjectManager:
             if project_dir.exists():
                 await self._remove_directory_recursive(project_dir)
 
+            # Drop the project's entries from the shared chunk store
+            try:
+                await release_collection(chunk_store_path(Path(self.data_directory)), name)
+            except Exception as e:
+                logger.warning(f"Failed to release shared chunk references of {name}: {e}")
+
             # Remove from registry
             await self._remove_project_from_registry(name)
 
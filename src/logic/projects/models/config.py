@@ -25,6 +25,7 @@ class ProjectConfig(BaseModel):
     user_agent: str | None = Field(default=None, description="User agent string for web requests")
     follow_redirects: bool | None = Field(default=None, description="Whether to follow HTTP redirects")
     respect_robots_txt: bool | None = Field(default=None, description="Whether to respect robots.txt")
+    content_extraction: str | None = Field(default=None, description="Page text kept: 'main' content or 'full' page")
 
     # Data-specific settings
     chunk_size: int | None = Field(default=None, description="Chunk size for document processing")
@@ -102,6 +103,14 @@ class ProjectConfig(BaseModel):
                 raise ValueError("rate_limit cannot exceed 100 requests per second")
         return v
 
+    @field_validator('content_extraction')
+    @classmethod
+    def validate_content_extraction(cls, v):
+        """Validate content extraction mode."""
+        if v is not None and v not in ('main', 'full'):
+            raise ValueError("content_extraction must be 'main' or 'full'")
+        return v
+
     @field_validator('chunk_size')
     @classmethod
     def validate_chunk_size(cls, v):
@@ -204,6 +213,7 @@ class ProjectConfig(BaseModel):
                 'user_agent': 'DocBro/1.0',
                 'follow_redirects': True,
                 'respect_robots_txt': True,
+                'content_extraction': 'main',
                 'concurrent_uploads': 3,
                 'retry_attempts': 3,
                 'timeout_seconds': 30
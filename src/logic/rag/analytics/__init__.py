@@ -1,6 +1,13 @@
 """RAG analytics and metrics."""
 
+from src.logic.rag.analytics.histogram import LogHistogram, WindowedHistogram
 from src.logic.rag.analytics.quality_metrics import RAGQualityMetrics
 from src.logic.rag.analytics.rag_metrics import MetricsSummary, RAGMetrics
 
-__all__ = ["RAGMetrics", "RAGQualityMetrics", "MetricsSummary"]
\ No newline at end of file
+__all__ = [
+    "RAGMetrics",
+    "RAGQualityMetrics",
+    "MetricsSummary",
+    "LogHistogram",
+    "WindowedHistogram",
+]
\ No newline at end of file
@@ -0,0 +1,228 @@
+"""Fixed-memory streaming histograms for RAG metrics.
+
+Values are counted in logarithmically spaced buckets, HDR-histogram style:
+bucket ``i`` covers ``[min_value * growth**i, min_value * growth**(i + 1))``,
+so every percentile is reported within ``growth - 1`` relative error no
+matter how many values were recorded. Only occupied buckets are stored and
+the bucket count is capped by the value range, so memory is bounded and a
+summary costs O(buckets) instead of sorting every sample.
+"""
+
+import math
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+
+# Percentiles reported by summary()
+SUMMARY_PERCENTILES = {"p50": 0.50, "p95": 0.95, "p99": 0.99}
+
+
+class LogHistogram:
+    """Streaming histogram with log-spaced buckets.
+
+    Values at or below ``min_value`` share the first bucket and values above
+    ``max_value`` share the last, so the number of buckets never exceeds
+    ``log(max_value / min_value) / log(growth) + 1``.
+    """
+
+    __slots__ = (
+        "min_value",
+        "max_value",
+        "growth",
+        "_log_growth",
+        "_max_index",
+        "_buckets",
+        "count",
+        "total",
+        "minimum",
+        "maximum",
+    )
+
+    def __init__(
+        self,
+        min_value: float = 0.01,
+        max_value: float = 3_600_000.0,
+        growth: float = 1.02,
+    ):
+        """Initialize histogram.
+
+        Args:
+            min_value: Smallest distinguishable value
+            max_value: Largest distinguishable value
+            growth: Ratio between consecutive bucket bounds (1.02 = 2% error)
+        """
+        self.min_value = min_value
+        self.max_value = max_value
+        self.growth = growth
+        self._log_growth = math.log(growth)
+        self._max_index = self._index(max_value)
+        self._buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def __len__(self) -> int:
+        return self.count
+
+    def record(self, value: float, count: int = 1) -> None:
+        """Record a value.
+
+        Args:
+            value: Observed value
+            count: Number of times it was observed
+        """
+        index = min(self._index(value), self._max_index)
+        self._buckets[index] = self._buckets.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def merge(self, other: "LogHistogram") -> None:
+        """Add another histogram with the same bucket layout into this one."""
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    def clear(self) -> None:
+        """Drop all recorded values."""
+        self._buckets.clear()
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    @property
+    def mean(self) -> float:
+        """Exact mean of recorded values (0.0 when empty)."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, quantile: float) -> float:
+        """Estimate the value at a quantile.
+
+        Args:
+            quantile: Quantile in [0, 1]
+
+        Returns:
+            Estimated value (0.0 when empty)
+        """
+        return self.percentiles([quantile])[0]
+
+    def percentiles(self, quantiles: Iterable[float]) -> list[float]:
+        """Estimate several quantiles in one pass over the buckets."""
+        quantiles = list(quantiles)
+        if not self.count:
+            return [0.0] * len(quantiles)
+
+        ranks = sorted(
+            (min(int(self.count * q), self.count - 1), position)
+            for position, q in enumerate(quantiles)
+        )
+        values = [0.0] * len(quantiles)
+        seen = 0
+        pending = iter(ranks)
+        rank, position = next(pending)
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            while rank < seen:
+                values[position] = self._bucket_value(index)
+                try:
+                    rank, position = next(pending)
+                except StopIteration:
+                    return values
+        return values
+
+    def summary(self) -> dict[str, float]:
+        """Count, mean and standard percentiles."""
+        summary = {"count": self.count, "avg": self.mean}
+        summary.update(
+            zip(
+                SUMMARY_PERCENTILES,
+                self.percentiles(SUMMARY_PERCENTILES.values()),
+                strict=True,
+            )
+        )
+        return summary
+
+    def _index(self, value: float) -> int:
+        """Bucket index for a value."""
+        if value <= self.min_value:
+            return 0
+        return int(math.log(value / self.min_value) / self._log_growth)
+
+    def _bucket_value(self, index: int) -> float:
+        """Representative value of a bucket, clamped to the observed range."""
+        value = self.min_value * self.growth ** (index + 0.5)
+        return min(max(value, self.minimum), self.maximum)
+
+
+class WindowedHistogram:
+    """Log histograms over sliding time windows.
+
+    Values are recorded into fixed time slots; a window summary merges the
+    slots that fall inside it. Slots older than the longest window are
+    discarded, so memory is bounded by the slot count times the buckets in
+    use per slot.
+    """
+
+    def __init__(
+        self,
+        windows: dict[str, float] | None = None,
+        slot_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+        **histogram_options: float,
+    ):
+        """Initialize windowed histogram.
+
+        Args:
+            windows: Window name to length in seconds (default 1m, 5m, 1h)
+            slot_seconds: Time resolution of the windows
+            clock: Monotonic time source in seconds
+            **histogram_options: Bucket layout passed to each LogHistogram
+        """
+        self.windows = windows or {"1m": 60.0, "5m": 300.0, "1h": 3600.0}
+        self.slot_seconds = slot_seconds
+        self._clock = clock
+        self._histogram_options = histogram_options
+        self._horizon = max(self.windows.values())
+        self._slots: deque[tuple[int, LogHistogram]] = deque()
+
+    def record(self, value: float) -> None:
+        """Record a value in the current slot."""
+        slot = int(self._clock() // self.slot_seconds)
+        if not self._slots or self._slots[-1][0] != slot:
+            self._slots.append((slot, LogHistogram(**self._histogram_options)))
+            self._expire(slot)
+        self._slots[-1][1].record(value)
+
+    def window(self, seconds: float) -> LogHistogram:
+        """Merge the slots recorded within the last ``seconds``."""
+        current = int(self._clock() // self.slot_seconds)
+        oldest = current - math.ceil(seconds / self.slot_seconds) + 1
+        merged = LogHistogram(**self._histogram_options)
+        for slot, histogram in reversed(self._slots):
+            if slot < oldest:
+                break
+            merged.merge(histogram)
+        return merged
+
+    def summaries(self) -> dict[str, dict[str, float]]:
+        """Summary of every configured window."""
+        return {
+            name: self.window(seconds).summary()
+            for name, seconds in self.windows.items()
+        }
+
+    def clear(self) -> None:
+        """Drop all slots."""
+        self._slots.clear()
+
+    def _expire(self, current: int) -> None:
+        """Discard slots that have left the longest window."""
+        oldest = current - math.ceil(self._horizon / self.slot_seconds) + 1
+        while self._slots and self._slots[0][0] < oldest:
+            self._slots.popleft()
@@ -1,17 +1,21 @@
 """RAG metrics tracking for performance monitoring.
 
 This module tracks search and indexing performance metrics including latency,
-cache hit rates, and strategy distribution.
+cache hit rates, and strategy distribution. Distributions are kept in
+fixed-memory streaming histograms, so a long-running server neither grows
+without bound nor sorts its whole history to report percentiles.
 """
 
 import time
 from collections import defaultdict
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from src.core.lib_logger import get_logger
+from src.logic.rag.analytics.histogram import LogHistogram, WindowedHistogram
 
 logger = get_logger(__name__)
 
@@ -28,6 +32,24 @@ class MetricsSummary(BaseModel):
     strategy_distribution: dict[str, int] = Field(
         description="Count of searches by strategy"
     )
+    deadline_exceeded: dict[str, int] = Field(
+        default_factory=dict,
+        description="Count of partial searches by the stage that ran out of time",
+    )
+    stage_latency_ms: dict[str, dict[str, float]] = Field(
+        default_factory=dict,
+        description="Per-stage latency (count, avg, p50, p95, p99) by search stage",
+    )
+    latency_windows: dict[str, dict[str, float]] = Field(
+        default_factory=dict,
+        description="Search latency (count, avg, p50, p95, p99) over the last 1m/5m/1h",
+    )
+    query_length: dict[str, float] = Field(
+        default_factory=dict, description="Query length distribution in characters"
+    )
+    result_count: dict[str, float] = Field(
+        default_factory=dict, description="Results-per-search distribution"
+    )
     # Quality metrics (optional, populated by RAGQualityMetrics)
     mrr_score: float | None = Field(default=None, description="Mean Reciprocal Rank")
     precision_at_5: float | None = Field(default=None, description="Precision at k=5")
@@ -39,15 +61,24 @@ class RAGMetrics:
     """Performance metrics tracker for RAG operations.
 
     Tracks search latency, cache performance, and strategy usage.
+    Percentiles are estimated from log-bucket histograms within 2% relative
+    error; averages and counts are exact.
     """
 
-    def __init__(self):
-        """Initialize metrics tracker."""
-        self._search_latencies: list[float] = []
-        self._indexing_latencies: list[float] = []
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """Initialize metrics tracker.
+
+        Args:
+            clock: Monotonic time source for the sliding latency windows
+        """
+        self._search_latencies = LogHistogram()
+        self._search_latency_windows = WindowedHistogram(clock=clock)
+        self._indexing_latencies = LogHistogram()
         self._strategy_counts: dict[str, int] = defaultdict(int)
-        self._query_lengths: list[int] = []
-        self._result_counts: list[int] = []
+        self._deadline_exceeded: dict[str, int] = defaultdict(int)
+        self._stage_latencies: dict[str, LogHistogram] = defaultdict(LogHistogram)
+        self._query_lengths = LogHistogram(min_value=1.0, max_value=1_000_000.0)
+        self._result_counts = LogHistogram(min_value=1.0, max_value=1_000_000.0)
         self._cache_hits = 0
         self._cache_misses = 0
         self._start_time = time.time()
@@ -69,10 +100,11 @@ class RAGMetrics:
             query: Search query string
             cache_hit: Whether embedding cache was hit
         """
-        self._search_latencies.append(latency_ms)
+        self._search_latencies.record(latency_ms)
+        self._search_latency_windows.record(latency_ms)
         self._strategy_counts[strategy] += 1
-        self._query_lengths.append(len(query))
-        self._result_counts.append(result_count)
+        self._query_lengths.record(len(query))
+        self._result_counts.record(result_count)
 
         if cache_hit:
             self._cache_hits += 1
@@ -84,6 +116,25 @@ class RAGMetrics:
             f"results={result_count}, query_len={len(query)}"
         )
 
+    def record_deadline_exceeded(self, stage: str) -> None:
+        """Record a search that returned partial results.
+
+        Args:
+            stage: Search stage that ran past the deadline
+        """
+        self._deadline_exceeded[stage] += 1
+        logger.debug(f"Search deadline exceeded during {stage}")
+
+    def record_stage_latency(self, stage: str, latency_ms: float) -> None:
+        """Record the duration of one search stage.
+
+        Args:
+            stage: Search stage (cache_lookup, embedding, vector_search,
+                decode, keyword, fuse, rerank)
+            latency_ms: Stage duration in milliseconds
+        """
+        self._stage_latencies[stage].record(latency_ms)
+
     def record_indexing(
         self, document_count: int, latency_ms: float, chunk_count: int
     ) -> None:
@@ -94,7 +145,7 @@ class RAGMetrics:
             latency_ms: Indexing latency in milliseconds
             chunk_count: Number of chunks created
         """
-        self._indexing_latencies.append(latency_ms)
+        self._indexing_latencies.record(latency_ms)
         logger.debug(
             f"Indexing recorded: docs={document_count}, "
             f"chunks={chunk_count}, latency={latency_ms}ms"
@@ -103,27 +154,13 @@ class RAGMetrics:
     def get_summary(self) -> MetricsSummary:
         """Get metrics summary.
 
+        Cost is proportional to the number of occupied histogram buckets,
+        not to the number of searches recorded.
+
         Returns:
             MetricsSummary with current metrics
         """
-        if not self._search_latencies:
-            return MetricsSummary(
-                searches_total=0,
-                avg_latency_ms=0.0,
-                p50_latency_ms=0.0,
-                p95_latency_ms=0.0,
-                p99_latency_ms=0.0,
-                cache_hit_rate=0.0,
-                strategy_distribution={},
-            )
-
-        sorted_latencies = sorted(self._search_latencies)
-        total_searches = len(sorted_latencies)
-
-        # Calculate percentiles
-        p50_idx = int(total_searches * 0.50)
-        p95_idx = int(total_searches * 0.95)
-        p99_idx = int(total_searches * 0.99)
+        latency = self._search_latencies.summary()
 
         # Calculate cache hit rate
         total_cache_ops = self._cache_hits + self._cache_misses
@@ -132,20 +169,31 @@ class RAGMetrics:
         )
 
         return MetricsSummary(
-            searches_total=total_searches,
-            avg_latency_ms=sum(self._search_latencies) / total_searches,
-            p50_latency_ms=sorted_latencies[p50_idx],
-            p95_latency_ms=sorted_latencies[min(p95_idx, total_searches - 1)],
-            p99_latency_ms=sorted_latencies[min(p99_idx, total_searches - 1)],
+            searches_total=latency["count"],
+            avg_latency_ms=latency["avg"],
+            p50_latency_ms=latency["p50"],
+            p95_latency_ms=latency["p95"],
+            p99_latency_ms=latency["p99"],
             cache_hit_rate=cache_hit_rate,
             strategy_distribution=dict(self._strategy_counts),
+            deadline_exceeded=dict(self._deadline_exceeded),
+            stage_latency_ms={
+                stage: histogram.summary()
+                for stage, histogram in self._stage_latencies.items()
+            },
+            latency_windows=self._search_latency_windows.summaries(),
+            query_length=self._query_lengths.summary(),
+            result_count=self._result_counts.summary(),
         )
 
     def reset(self) -> None:
         """Reset all metrics."""
         self._search_latencies.clear()
+        self._search_latency_windows.clear()
         self._indexing_latencies.clear()
         self._strategy_counts.clear()
+        self._deadline_exceeded.clear()
+        self._stage_latencies.clear()
         self._query_lengths.clear()
         self._result_counts.clear()
         self._cache_hits = 0
@@ -1,7 +1,15 @@
 """Core RAG services."""
 
+from src.logic.rag.core.chunking_executor import ChunkingExecutor
 from src.logic.rag.core.chunking_service import ChunkingService
+from src.logic.rag.core.indexing_pipeline import IndexingPipeline
 from src.logic.rag.core.reranking_service import RerankingService
 from src.logic.rag.core.search_service import RAGSearchService
 
-__all__ = ["ChunkingService", "RerankingService", "RAGSearchService"]
\ No newline at end of file
+__all__ = [
+    "ChunkingService",
+    "ChunkingExecutor",
+    "IndexingPipeline",
+    "RerankingService",
+    "RAGSearchService",
+]
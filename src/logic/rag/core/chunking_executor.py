@@ -0,0 +1,216 @@
+"""Process-pool chunking for the indexing pipeline.
+
+Chunking is CPU-bound (HTML hierarchy extraction, boundary search, header
+construction), so on the event loop it uses a single core. The executor
+spreads a window of documents over a ``ProcessPoolExecutor``: documents go
+out as plain dicts in tasks of ``chunk_task_size`` and chunks come back as
+dicts, which keeps pickling cheap.
+
+Small windows and the SEMANTIC strategy (which calls the embedding service)
+are chunked in-process, and a task the pool fails to run is retried
+in-process, so results never depend on the pool being healthy.
+"""
+
+import asyncio
+import importlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from src.core.lib_logger import get_logger
+from src.logic.rag.core.chunking_service import ChunkingService
+from src.logic.rag.models.chunk import Chunk
+from src.logic.rag.models.document import Document
+from src.logic.rag.models.strategy_config import ChunkStrategy, IndexingConfig
+
+logger = get_logger(__name__)
+
+# Chunking service of a worker process, created on its first task
+_worker_service: ChunkingService | None = None
+
+
+class ChunkingExecutor:
+    """Chunk batches of documents across worker processes."""
+
+    def __init__(
+        self,
+        chunking_service: ChunkingService,
+        config: IndexingConfig | None = None,
+    ):
+        """Initialize chunking executor.
+
+        Args:
+            chunking_service: Service used for in-process chunking
+            config: Worker count, task size and in-process threshold
+        """
+        self.chunking_service = chunking_service
+        self.config = config or IndexingConfig()
+        self.workers = self.config.chunk_workers or os.cpu_count() or 1
+        self._pool: ProcessPoolExecutor | None = None
+
+    @property
+    def window_size(self) -> int:
+        """Documents to gather before chunking them together."""
+        return self.workers * self.config.chunk_task_size
+
+    async def chunk_documents(
+        self,
+        documents: list[Document],
+        strategy: ChunkStrategy,
+        chunk_size: int,
+        overlap: int,
+    ) -> list[list[Chunk] | Exception]:
+        """Chunk documents, in worker processes when it pays off.
+
+        Args:
+            documents: Documents to chunk
+            strategy: Chunking strategy
+            chunk_size: Max chunk size
+            overlap: Overlap between chunks
+
+        Returns:
+            Chunks of each document, or the error it failed with, in input order
+        """
+        if not self._use_pool(documents, strategy):
+            return await self._chunk_in_process(
+                documents, strategy, chunk_size, overlap
+            )
+
+        task_size = self.config.chunk_task_size
+        batches = [
+            documents[i : i + task_size] for i in range(0, len(documents), task_size)
+        ]
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        outputs = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    pool,
+                    _chunk_task,
+                    [document.model_dump() for document in batch],
+                    strategy.value,
+                    chunk_size,
+                    overlap,
+                )
+                for batch in batches
+            ),
+            return_exceptions=True,
+        )
+
+        results: list[list[Chunk] | Exception] = []
+        for batch, output in zip(batches, outputs, strict=True):
+            if isinstance(output, BaseException):
+                logger.warning(
+                    f"Chunking process failed ({output!r}); chunking "
+                    f"{len(batch)} documents in-process"
+                )
+                self._discard_pool()
+                results.extend(
+                    await self._chunk_in_process(batch, strategy, chunk_size, overlap)
+                )
+                continue
+            results.extend(
+                (
+                    item
+                    if isinstance(item, Exception)
+                    else [Chunk.model_construct(**data) for data in item]
+                )
+                for item in output
+            )
+        return results
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._discard_pool()
+
+    def _use_pool(self, documents: list[Document], strategy: ChunkStrategy) -> bool:
+        """Check whether a window is worth sending to worker processes."""
+        if self.workers <= 1 or len(documents) <= 1:
+            return False
+        if strategy == ChunkStrategy.SEMANTIC:
+            # Needs the embedding service, which lives on this event loop
+            return False
+        total_chars = sum(len(document.content) for document in documents)
+        return total_chars >= self.config.parallel_chunking_min_chars
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Start the worker processes on first use."""
+        if self._pool is None:
+            # Import src.services first in each worker: under spawn/forkserver
+            # importing the RAG modules directly hits the services import cycle
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=importlib.import_module,
+                initargs=("src.services",),
+            )
+        return self._pool
+
+    def _discard_pool(self) -> None:
+        """Shut down the pool so the next window starts a fresh one."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def _chunk_in_process(
+        self,
+        documents: list[Document],
+        strategy: ChunkStrategy,
+        chunk_size: int,
+        overlap: int,
+    ) -> list[list[Chunk] | Exception]:
+        """Chunk documents one at a time on the event loop."""
+        results: list[list[Chunk] | Exception] = []
+        for document in documents:
+            try:
+                results.append(
+                    await self.chunking_service.chunk_document(
+                        document=document,
+                        strategy=strategy,
+                        chunk_size=chunk_size,
+                        overlap=overlap,
+                        add_context_headers=True,
+                    )
+                )
+            except Exception as e:
+                results.append(e)
+        return results
+
+
+def _chunk_task(
+    payloads: list[dict[str, Any]], strategy: str, chunk_size: int, overlap: int
+) -> list[list[dict[str, Any]] | Exception]:
+    """Chunk a batch of documents inside a worker process."""
+    global _worker_service
+    if _worker_service is None:
+        _worker_service = ChunkingService()
+    return asyncio.run(
+        _chunk_payloads(
+            _worker_service, payloads, ChunkStrategy(strategy), chunk_size, overlap
+        )
+    )
+
+
+async def _chunk_payloads(
+    service: ChunkingService,
+    payloads: list[dict[str, Any]],
+    strategy: ChunkStrategy,
+    chunk_size: int,
+    overlap: int,
+) -> list[list[dict[str, Any]] | Exception]:
+    """Chunk document dicts and return chunk dicts (errors as ValueError)."""
+    results: list[list[dict[str, Any]] | Exception] = []
+    for payload in payloads:
+        try:
+            chunks = await service.chunk_document(
+                document=Document.model_construct(**payload),
+                strategy=strategy,
+                chunk_size=chunk_size,
+                overlap=overlap,
+                add_context_headers=True,
+            )
+        except Exception as e:
+            # Plain ValueError so the error always pickles back to the parent
+            results.append(ValueError(str(e)))
+            continue
+        results.append([chunk.model_dump() for chunk in chunks])
+    return results
@@ -28,6 +28,7 @@ class ChunkingService:
         """
         self.embedding_service = embedding_service
         self._semantic_chunker = None
+        self._content_defined_chunker = None
 
     async def chunk_document(
         self,
@@ -41,7 +42,7 @@ class ChunkingService:
 
         Args:
             document: Document to chunk
-            strategy: Chunking strategy (CHARACTER or SEMANTIC)
+            strategy: Chunking strategy (CHARACTER, SEMANTIC or CONTENT_DEFINED)
             chunk_size: Maximum chunk size in characters
             overlap: Overlap between chunks for CHARACTER strategy
             add_context_headers: Whether to add contextual headers
@@ -61,10 +62,14 @@ class ChunkingService:
                 f"chunk_size must be between 100 and 5000, got {chunk_size}"
             )
 
-        # Extract hierarchy if we need context headers
+        # Extract hierarchy if we need context headers (crawled pages carry
+        # the headings from their crawl-time parse)
         hierarchy = []
-        if add_context_headers and "<" in document.content:
-            hierarchy = await self.extract_hierarchy(document.content)
+        if add_context_headers:
+            if document.hierarchy is not None:
+                hierarchy = list(document.hierarchy)
+            elif "<" in document.content:
+                hierarchy = await self.extract_hierarchy(document.content)
 
         # Apply chunking strategy
         if strategy == ChunkStrategy.CHARACTER:
@@ -76,6 +81,8 @@ class ChunkingService:
             chunks = await self._chunk_semantic_with_fallback(
                 document, chunk_size, overlap
             )
+        elif strategy == ChunkStrategy.CONTENT_DEFINED:
+            chunks = await self._chunk_content_defined(document, chunk_size)
         else:
             raise ValueError(f"Unknown chunking strategy: {strategy}")
 
@@ -147,6 +154,27 @@ class ChunkingService:
 
         return chunks
 
+    async def _chunk_content_defined(
+        self, document: Document, chunk_size: int
+    ) -> list[Chunk]:
+        """Content-defined chunking with stable, content-derived chunk ids.
+
+        Args:
+            document: Document to chunk
+            chunk_size: Maximum chunk size
+
+        Returns:
+            List of chunks
+        """
+        if not self._content_defined_chunker:
+            from src.logic.rag.strategies.content_defined_chunker import (
+                ContentDefinedChunker,
+            )
+
+            self._content_defined_chunker = ContentDefinedChunker()
+
+        return self._content_defined_chunker.chunk_document(document, chunk_size)
+
     async def extract_hierarchy(self, html_content: str) -> list[tuple[int, str]]:
         """Extract heading hierarchy from HTML content.
 
@@ -0,0 +1,508 @@
+"""Streaming indexing pipeline for RAG operations.
+
+Documents flow through three stages connected by bounded queues:
+
+    chunk (one producer) -> embed (N batching workers) -> upsert (one writer)
+
+The chunk stage reads documents in windows and hands each window to a
+ChunkingExecutor, which spreads large windows over worker processes.
+
+The bounded queues give backpressure, so memory stays proportional to the
+queue sizes rather than the corpus, and every upsert batch is committed as
+soon as it fills so a failure only loses the chunks still in flight.
+
+In incremental mode each chunk carries a fingerprint of its content and the
+embedding model. Chunks whose stored fingerprint matches are skipped before
+embedding, and stored chunks a document no longer produces are deleted.
+
+When a shared chunk store is given, chunks are looked up by content
+address before calling the embedding model and the vector is copied from a
+collection that already holds it; the upsert writer records the committed
+chunks of the collection in the store.
+
+When a boilerplate detector is given, blocks recurring across the project's
+pages are stripped from each document before chunking.
+
+When a heading index is given, the upsert writer keeps it in step with the
+collection: committed chunks are indexed under their title and section
+headings, and deleted chunks are dropped from it.
+"""
+
+import asyncio
+import math
+import time
+from collections.abc import AsyncIterable, Callable, Iterable
+from typing import Any
+
+from src.core.lib_logger import get_logger
+from src.logic.crawler.utils.boilerplate import BoilerplateDetector
+from src.logic.rag.core.chunking_executor import ChunkingExecutor
+from src.logic.rag.core.chunking_service import ChunkingService
+from src.logic.rag.models.chunk import Chunk
+from src.logic.rag.models.document import Document
+from src.logic.rag.models.indexing_stats import IndexingStats
+from src.logic.rag.models.strategy_config import ChunkStrategy, IndexingConfig
+from src.logic.rag.strategies.heading_index import HeadingIndex
+from src.logic.rag.utils.fingerprints import chunk_fingerprint, shared_chunk_key
+from src.logic.rag.utils.terms import term_set
+from src.services.chunk_store import ChunkStore
+from src.services.embeddings import EmbeddingService
+
+logger = get_logger(__name__)
+
+# Marks the end of a stage's output on a queue
+_DONE = object()
+
+ProgressCallback = Callable[[str, IndexingStats], None]
+
+
+class _Removal:
+    """Queue item asking the upsert writer to delete stale chunks."""
+
+    def __init__(self, chunk_ids: list[str]):
+        self.chunk_ids = chunk_ids
+
+
+class IndexingPipeline:
+    """Bounded-queue chunk/embed/upsert pipeline."""
+
+    def __init__(
+        self,
+        chunking_service: ChunkingService,
+        embedding_service: EmbeddingService,
+        vector_store: Any,
+        config: IndexingConfig | None = None,
+        heading_index: HeadingIndex | None = None,
+        boilerplate: BoilerplateDetector | None = None,
+        chunk_store: ChunkStore | None = None,
+    ):
+        """Initialize indexing pipeline.
+
+        Args:
+            chunking_service: Service used to split documents into chunks
+            embedding_service: Service used to embed chunk content
+            vector_store: Vector store receiving the embedded chunks
+            config: Queue, batch and concurrency settings
+            heading_index: Title/heading index updated alongside the store
+            boilerplate: Detector fitted on the project's pages; its
+                boilerplate blocks are stripped before chunking
+            chunk_store: Content-addressed chunk index shared across projects
+        """
+        self.chunking_service = chunking_service
+        self.embedding_service = embedding_service
+        self.vector_store = vector_store
+        self.config = config or IndexingConfig()
+        self.heading_index = heading_index
+        self.boilerplate = boilerplate
+        self.chunk_store = chunk_store
+        self.embedding_model = embedding_service.config.embedding_model
+
+    async def run(
+        self,
+        collection_name: str,
+        documents: Iterable[Document] | AsyncIterable[Document],
+        chunk_strategy: ChunkStrategy = ChunkStrategy.CHARACTER,
+        chunk_size: int = 1000,
+        overlap: int = 100,
+        progress_callback: ProgressCallback | None = None,
+        incremental: bool = True,
+    ) -> IndexingStats:
+        """Index a stream of documents.
+
+        Args:
+            collection_name: Target collection (must already exist)
+            documents: Documents to index, consumed lazily
+            chunk_strategy: Chunking strategy
+            chunk_size: Max chunk size
+            overlap: Overlap between chunks
+            progress_callback: Called as ``callback(stage, stats)`` after each
+                document is chunked, each batch is embedded and each upsert
+            incremental: Skip chunks whose stored fingerprint is unchanged and
+                delete chunks a document no longer produces
+
+        Returns:
+            IndexingStats for the run
+
+        Raises:
+            Exception: The first fatal error from any stage. Upsert batches
+                committed before the failure stay in the collection.
+        """
+        stats = IndexingStats(collection_name=collection_name)
+        chunk_queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.queue_size)
+        upsert_queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.queue_size)
+        start = time.perf_counter()
+
+        def report(stage: str) -> None:
+            stats.duration_ms = (time.perf_counter() - start) * 1000
+            if progress_callback:
+                progress_callback(stage, stats)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(
+                    self._chunk_stage(
+                        collection_name,
+                        documents,
+                        chunk_queue,
+                        upsert_queue,
+                        chunk_strategy,
+                        chunk_size,
+                        overlap,
+                        incremental,
+                        stats,
+                        report,
+                    )
+                )
+                for _ in range(self.config.embed_concurrency):
+                    group.create_task(
+                        self._embed_stage(chunk_queue, upsert_queue, stats, report)
+                    )
+                group.create_task(
+                    self._upsert_stage(collection_name, upsert_queue, stats, report)
+                )
+        except* Exception as group_error:
+            # Surface the first stage failure rather than the exception group
+            raise group_error.exceptions[0] from None
+        finally:
+            stats.duration_ms = (time.perf_counter() - start) * 1000
+
+        return stats
+
+    async def _chunk_stage(
+        self,
+        collection_name: str,
+        documents: Iterable[Document] | AsyncIterable[Document],
+        chunk_queue: asyncio.Queue,
+        upsert_queue: asyncio.Queue,
+        chunk_strategy: ChunkStrategy,
+        chunk_size: int,
+        overlap: int,
+        incremental: bool,
+        stats: IndexingStats,
+        report: Callable[[str], None],
+    ) -> None:
+        """Chunk windows of documents and feed the embed workers."""
+        executor = ChunkingExecutor(self.chunking_service, self.config)
+        try:
+            async for window in _windows(_iterate(documents), executor.window_size):
+                if self.boilerplate is not None:
+                    window = [
+                        self._strip_boilerplate(document, chunk_size, overlap, stats)
+                        for document in window
+                    ]
+                outcomes = await executor.chunk_documents(
+                    window, chunk_strategy, chunk_size, overlap
+                )
+                for document, chunks in zip(window, outcomes, strict=True):
+                    await self._queue_chunks(
+                        collection_name,
+                        document,
+                        chunks,
+                        chunk_queue,
+                        upsert_queue,
+                        incremental,
+                        stats,
+                    )
+                    report("chunk")
+        finally:
+            executor.close()
+
+        for _ in range(self.config.embed_concurrency):
+            await chunk_queue.put(_DONE)
+
+    def _strip_boilerplate(
+        self, document: Document, chunk_size: int, overlap: int, stats: IndexingStats
+    ) -> Document:
+        """Strip boilerplate blocks from a document and count what was saved."""
+        content, removed = self.boilerplate.strip(document.content)
+        if not removed or not content.strip():
+            # A page that is all boilerplate is indexed as-is
+            return document
+
+        stats.boilerplate_bytes_removed += removed
+        stats.boilerplate_chunks_saved += _estimate_chunks(
+            len(document.content), chunk_size, overlap
+        ) - _estimate_chunks(len(content), chunk_size, overlap)
+        return document.model_copy(update={"content": content})
+
+    async def _queue_chunks(
+        self,
+        collection_name: str,
+        document: Document,
+        chunks: list[Chunk] | Exception,
+        chunk_queue: asyncio.Queue,
+        upsert_queue: asyncio.Queue,
+        incremental: bool,
+        stats: IndexingStats,
+    ) -> None:
+        """Fingerprint a document's chunks and queue those needing embedding."""
+        stats.documents_total += 1
+        if isinstance(chunks, Exception):
+            stats.documents_failed += 1
+            logger.warning(f"Skipping document {document.id}: {chunks}")
+            return
+
+        stats.chunks_total += len(chunks)
+        pending = [
+            (chunk, chunk_fingerprint(chunk.content, self.embedding_model))
+            for chunk in chunks
+        ]
+
+        if incremental:
+            pending, stale_ids = await self._diff_chunks(
+                collection_name, document, pending, stats
+            )
+            if stale_ids:
+                await upsert_queue.put(_Removal(stale_ids))
+        else:
+            stats.chunks_added += len(pending)
+
+        for item in pending:
+            await chunk_queue.put(item)
+
+    async def _diff_chunks(
+        self,
+        collection_name: str,
+        document: Document,
+        pending: list[tuple[Chunk, str]],
+        stats: IndexingStats,
+    ) -> tuple[list[tuple[Chunk, str]], list[str]]:
+        """Compare a document's chunks against the stored fingerprints.
+
+        Returns:
+            Chunks that need embedding and IDs of stored chunks to delete
+        """
+        stored = await self.vector_store.get_chunk_fingerprints(
+            collection_name, document.id
+        )
+
+        changed = []
+        for chunk, fingerprint in pending:
+            if chunk.id not in stored:
+                stats.chunks_added += 1
+                changed.append((chunk, fingerprint))
+            elif stored[chunk.id] != fingerprint:
+                stats.chunks_updated += 1
+                changed.append((chunk, fingerprint))
+            else:
+                stats.chunks_unchanged += 1
+
+        current_ids = {chunk.id for chunk, _ in pending}
+        stale_ids = [chunk_id for chunk_id in stored if chunk_id not in current_ids]
+        return changed, stale_ids
+
+    async def _embed_stage(
+        self,
+        chunk_queue: asyncio.Queue,
+        upsert_queue: asyncio.Queue,
+        stats: IndexingStats,
+        report: Callable[[str], None],
+    ) -> None:
+        """Embed chunks in batches of whatever is queued, up to the batch size."""
+        done = False
+        while not done:
+            batch: list[tuple[Chunk, str]] = []
+            item = await chunk_queue.get()
+            while item is not _DONE:
+                batch.append(item)
+                if len(batch) >= self.config.embed_batch_size or chunk_queue.empty():
+                    break
+                item = chunk_queue.get_nowait()
+            done = item is _DONE
+
+            if batch:
+                for chunk, fingerprint, embedding in await self._embed_batch(
+                    batch, stats
+                ):
+                    await upsert_queue.put(
+                        self._to_vector_document(chunk, fingerprint, embedding)
+                    )
+                report("embed")
+
+        await upsert_queue.put(_DONE)
+
+    async def _embed_batch(
+        self, batch: list[tuple[Chunk, str]], stats: IndexingStats
+    ) -> list[tuple[Chunk, str, list[float]]]:
+        """Embed a batch, reusing vectors of chunks other collections hold."""
+        if self.chunk_store is None:
+            return await self._embed_with_model(batch, stats)
+
+        keys = [
+            shared_chunk_key(chunk.content, self.embedding_model) for chunk, _ in batch
+        ]
+        stored = await self._shared_embeddings(keys)
+        misses = [
+            item for item, key in zip(batch, keys, strict=True) if key not in stored
+        ]
+        embedded = await self._embed_with_model(misses, stats) if misses else []
+
+        stats.chunks_reused += len(batch) - len(misses)
+        new = {chunk.id: embedding for chunk, _, embedding in embedded}
+        results = []
+        for (chunk, fingerprint), key in zip(batch, keys, strict=True):
+            embedding = stored.get(key) or new.get(chunk.id)
+            if embedding is not None:
+                results.append((chunk, fingerprint, embedding))
+        return results
+
+    async def _shared_embeddings(self, keys: list[str]) -> dict[str, list[float]]:
+        """Read the vectors of chunk keys from collections that hold them."""
+        sources = await self.chunk_store.find_sources(keys)
+        documents = await asyncio.gather(
+            *(
+                self.vector_store.get_document(collection, chunk_id)
+                for collection, chunk_id in sources.values()
+            )
+        )
+        # A source deleted behind the store's back just means a fresh embedding
+        return {
+            key: list(document["embedding"])
+            for key, document in zip(sources, documents, strict=True)
+            if document is not None and document.get("embedding") is not None
+        }
+
+    async def _embed_with_model(
+        self, batch: list[tuple[Chunk, str]], stats: IndexingStats
+    ) -> list[tuple[Chunk, str, list[float]]]:
+        """Embed a batch, retrying chunk by chunk if the batch request fails."""
+        texts = [chunk.content for chunk, _ in batch]
+        try:
+            embeddings = await self.embedding_service.create_embeddings(
+                texts, batch_size=len(texts)
+            )
+        except Exception as e:
+            logger.warning(f"Batch embedding failed (size={len(batch)}): {e}")
+            embedded = []
+            for chunk, fingerprint in batch:
+                try:
+                    embedding = await self.embedding_service.create_embedding(
+                        chunk.content
+                    )
+                except Exception as chunk_error:
+                    stats.chunks_failed += 1
+                    logger.warning(f"Skipping chunk {chunk.id}: {chunk_error}")
+                    continue
+                embedded.append((chunk, fingerprint, embedding))
+            stats.chunks_embedded += len(embedded)
+            return embedded
+
+        stats.chunks_embedded += len(batch)
+        return [
+            (chunk, fingerprint, embedding)
+            for (chunk, fingerprint), embedding in zip(batch, embeddings, strict=True)
+        ]
+
+    async def _upsert_stage(
+        self,
+        collection_name: str,
+        upsert_queue: asyncio.Queue,
+        stats: IndexingStats,
+        report: Callable[[str], None],
+    ) -> None:
+        """Commit embedded chunks to the vector store in fixed-size batches."""
+        pending: list[dict[str, Any]] = []
+        producers = self.config.embed_concurrency
+
+        while producers:
+            item = await upsert_queue.get()
+            if item is _DONE:
+                producers -= 1
+            elif isinstance(item, _Removal):
+                stats.chunks_removed += await self.vector_store.delete_documents(
+                    collection_name, item.chunk_ids
+                )
+                if self.heading_index is not None:
+                    self.heading_index.remove(item.chunk_ids)
+                if self.chunk_store is not None:
+                    await self.chunk_store.remove_references(
+                        collection_name, item.chunk_ids
+                    )
+            else:
+                pending.append(item)
+
+            if pending and (
+                len(pending) >= self.config.upsert_batch_size or not producers
+            ):
+                stats.chunks_indexed += await self.vector_store.upsert_documents(
+                    collection_name, pending
+                )
+                stats.upsert_batches += 1
+                if self.chunk_store is not None:
+                    await self.chunk_store.add_references(
+                        collection_name,
+                        [
+                            (
+                                doc["id"],
+                                shared_chunk_key(
+                                    doc["metadata"]["content"], self.embedding_model
+                                ),
+                            )
+                            for doc in pending
+                        ],
+                    )
+                if self.heading_index is not None:
+                    for doc in pending:
+                        metadata = doc["metadata"]
+                        self.heading_index.add(
+                            doc["id"],
+                            metadata["title"],
+                            metadata["context_header"],
+                            metadata["chunk_index"],
+                        )
+                pending = []
+                report("upsert")
+
+    def _to_vector_document(
+        self, chunk: Chunk, fingerprint: str, embedding: list[float]
+    ) -> dict[str, Any]:
+        """Build the vector store payload for an embedded chunk."""
+        return {
+            "id": chunk.id,
+            "embedding": embedding,
+            "metadata": {
+                "title": chunk.title,
+                "content": chunk.content,
+                "url": chunk.url,
+                "project": chunk.project,
+                "chunk_index": chunk.chunk_index,
+                "parent_id": chunk.parent_id,
+                "context_header": chunk.context_header,
+                "content_hash": fingerprint,
+                "embedding_model": self.embedding_model,
+                # Pre-tokenized for reranking
+                "content_terms": sorted(term_set(chunk.content)),
+            },
+        }
+
+
+async def _iterate(
+    documents: Iterable[Document] | AsyncIterable[Document],
+):
+    """Iterate sync and async document sources uniformly."""
+    if isinstance(documents, AsyncIterable):
+        async for document in documents:
+            yield document
+    else:
+        for document in documents:
+            yield document
+
+
+def _estimate_chunks(length: int, chunk_size: int, overlap: int) -> int:
+    """Approximate chunk count of a text under fixed-size chunking."""
+    if length <= chunk_size:
+        return 1 if length else 0
+    step = max(chunk_size - overlap, 1)
+    return math.ceil((length - overlap) / step)
+
+
+async def _windows(documents: AsyncIterable[Document], size: int):
+    """Group a document stream into lists of up to ``size`` documents."""
+    window: list[Document] = []
+    async for document in documents:
+        window.append(document)
+        if len(window) >= size:
+            yield window
+            window = []
+    if window:
+        yield window
@@ -4,6 +4,11 @@ from datetime import datetime
 
 from src.logic.rag.models.search_result import RerankSignals, SearchResult
 from src.logic.rag.models.strategy_config import RerankWeights
+from src.logic.rag.utils.numpy_support import NUMPY_AVAILABLE, np
+from src.logic.rag.utils.terms import term_set
+
+# Freshness is neutral until results carry an indexed_at date
+_NEUTRAL_FRESHNESS = 0.5
 
 
 class RerankingService:
@@ -14,13 +19,24 @@ class RerankingService:
         query: str,
         results: list[SearchResult],
         weights: RerankWeights | None = None,
+        include_signals: bool = True,
     ) -> list[SearchResult]:
         """Rerank search results using multiple signals.
 
+        Signals are gathered in a single pass over the candidates with the
+        query tokenized once. Content term sets stored at index time
+        (``SearchResult.content_terms``) are reused, older chunks without
+        them are tokenized on the fly, and title matches are computed once
+        per distinct title. With numpy the weighted scores are one
+        matrix-vector product over the signal array followed by a stable
+        argsort; without it they are summed in Python.
+
         Args:
             query: Original search query
             results: List of search results to rerank
             weights: Optional custom signal weights
+            include_signals: Attach the per-signal breakdown to each result
+                as ``rerank_signals`` (only needed for explain output)
 
         Returns:
             Reranked results sorted by rerank_score
@@ -38,34 +54,76 @@ class RerankingService:
         if not weights.validate_sum():
             raise ValueError("Weights must sum to 1.0 (within 0.01 tolerance)")
 
-        # Calculate signals and rerank score for each result
-        reranked = []
-        for result in results:
-            signals = self.calculate_signals(query, result)
-
-            # Calculate weighted rerank score
-            rerank_score = (
-                signals.vector_score * weights.vector_score
-                + signals.term_overlap * weights.term_overlap
-                + signals.title_match * weights.title_match
-                + signals.freshness * weights.freshness
-            )
-
-            # Update result with reranking info
-            result.rerank_score = rerank_score
-            result.rerank_signals = {
-                "vector_score": signals.vector_score,
-                "term_overlap": signals.term_overlap,
-                "title_match": signals.title_match,
-                "freshness": signals.freshness,
-            }
-
-            reranked.append(result)
-
-        # Sort by rerank_score descending
-        reranked.sort(key=lambda r: r.rerank_score or 0.0, reverse=True)
+        vector_scores, term_overlaps, title_matches = self._batch_signals(
+            query, results
+        )
 
-        return reranked
+        if NUMPY_AVAILABLE:
+            signals = np.array(
+                [vector_scores, term_overlaps, title_matches], dtype=np.float64
+            ).T
+            signal_weights = np.array(
+                [weights.vector_score, weights.term_overlap, weights.title_match]
+            )
+            scores = signals @ signal_weights + _NEUTRAL_FRESHNESS * weights.freshness
+            # Stable sort keeps the original order between equal scores
+            order = np.argsort(-scores, kind="stable").tolist()
+            scores = scores.tolist()
+        else:
+            scores = [
+                vector * weights.vector_score
+                + overlap * weights.term_overlap
+                + title * weights.title_match
+                + _NEUTRAL_FRESHNESS * weights.freshness
+                for vector, overlap, title in zip(
+                    vector_scores, term_overlaps, title_matches, strict=True
+                )
+            ]
+            order = sorted(range(len(results)), key=lambda i: -scores[i])
+
+        for i, result in enumerate(results):
+            result.rerank_score = scores[i]
+            if include_signals:
+                result.rerank_signals = {
+                    "vector_score": vector_scores[i],
+                    "term_overlap": term_overlaps[i],
+                    "title_match": title_matches[i],
+                    "freshness": _NEUTRAL_FRESHNESS,
+                }
+
+        return [results[i] for i in order]
+
+    def _batch_signals(
+        self, query: str, results: list[SearchResult]
+    ) -> tuple[list[float], list[float], list[float]]:
+        """Compute vector, term overlap and title signals for every result."""
+        query_terms = term_set(query)
+        query_count = len(query_terms)
+        title_cache: dict[str, int] = {}
+
+        vector_scores = []
+        term_overlaps = []
+        title_matches = []
+        for result in results:
+            vector_scores.append(result.score)
+            if not query_count:
+                term_overlaps.append(0.0)
+                title_matches.append(0.0)
+                continue
+
+            content_terms = result.content_terms
+            if content_terms is None:
+                content_terms = term_set(result.content)
+            term_overlaps.append(len(query_terms & content_terms) / query_count)
+
+            # Results from one page share a title
+            title_hits = title_cache.get(result.title)
+            if title_hits is None:
+                title_hits = len(query_terms & term_set(result.title))
+                title_cache[result.title] = title_hits
+            title_matches.append(title_hits / query_count)
+
+        return vector_scores, term_overlaps, title_matches
 
     def calculate_signals(self, query: str, result: SearchResult) -> RerankSignals:
         """Calculate individual reranking signals for a result.
@@ -78,37 +136,24 @@ class RerankingService:
             RerankSignals with all signal values (0.0-1.0)
         """
         # Signal 1: Vector score (already normalized 0-1)
-        vector_score = result.score
-
         # Signal 2: Term overlap (fraction of query terms in content)
-        query_terms = set(query.lower().split())
-        content_terms = set(result.content.lower().split())
-        term_overlap = (
-            len(query_terms & content_terms) / max(len(query_terms), 1)
-            if query_terms
-            else 0.0
-        )
-
         # Signal 3: Title match (fraction of query terms in title)
-        title_terms = set(result.title.lower().split())
-        title_match = (
-            len(query_terms & title_terms) / max(len(query_terms), 1)
-            if query_terms
-            else 0.0
+        vector_scores, term_overlaps, title_matches = self._batch_signals(
+            query, [result]
         )
 
         # Signal 4: Freshness (temporal decay)
         # For now, we'll use a neutral value since we don't have indexed_at
         # In a real implementation, this would use result.indexed_at
-        freshness = 0.5  # Neutral value
+        freshness = _NEUTRAL_FRESHNESS
 
         # If the result has metadata with a date, we could use it:
         # days_old = (datetime.now() - result.indexed_at).days
         # freshness = max(0.0, 1.0 - days_old / 365.0)
 
         return RerankSignals(
-            vector_score=vector_score,
-            term_overlap=term_overlap,
-            title_match=title_match,
+            vector_score=vector_scores[0],
+            term_overlap=term_overlaps[0],
+            title_match=title_matches[0],
             freshness=freshness,
-        )
\ No newline at end of file
+        )
@@ -3,21 +3,36 @@
 import asyncio
 import hashlib
 import re
+from collections.abc import AsyncIterable, Iterable
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from src.core.config import DocBroConfig
 from src.core.lib_logger import get_component_logger
+from src.logic.crawler.utils.boilerplate import BoilerplateDetector
 from src.logic.rag.analytics.rag_metrics import RAGMetrics
 from src.logic.rag.analytics.quality_metrics import RAGQualityMetrics
 from src.logic.rag.core.chunking_service import ChunkingService
+from src.logic.rag.core.indexing_pipeline import IndexingPipeline, ProgressCallback
 from src.logic.rag.core.reranking_service import RerankingService
-from src.logic.rag.models.chunk import Chunk
+from src.logic.rag.models.indexing_stats import IndexingStats
 from src.logic.rag.models.document import Document
-from src.logic.rag.models.search_result import SearchResult
-from src.logic.rag.models.strategy_config import ChunkStrategy, SearchStrategy
+from src.logic.rag.models.search_result import SearchResponse, SearchResult
+from src.logic.rag.models.strategy_config import (
+    ChunkStrategy,
+    HeadingIndexConfig,
+    IndexingConfig,
+    PaginationConfig,
+    SearchStrategy,
+)
 from src.logic.rag.strategies.fusion_retrieval import FusionRetrieval
+from src.logic.rag.strategies.heading_index import HeadingIndex, HeadingMatch
+from src.logic.rag.strategies.mmr import MMRDiversifier
 from src.logic.rag.strategies.query_transformer import QueryTransformer
+from src.logic.rag.utils.candidate_cache import CandidateCache
+from src.logic.rag.utils.search_context import DeadlineExceeded, SearchContext
+from src.services.chunk_store import ChunkStore, chunk_store_path
 from src.services.embeddings import EmbeddingError, EmbeddingService
 from src.services.vector_store import VectorStoreError, VectorStoreService
 
@@ -37,6 +52,10 @@ class RAGSearchService:
         embedding_service: EmbeddingService,
         config: DocBroConfig | None = None,
         enable_metrics: bool = True,
+        indexing_config: IndexingConfig | None = None,
+        heading_config: HeadingIndexConfig | None = None,
+        pagination_config: PaginationConfig | None = None,
+        chunk_store: ChunkStore | None = None,
     ):
         """Initialize enhanced RAG search service.
 
@@ -45,6 +64,13 @@ class RAGSearchService:
             embedding_service: Embedding service
             config: DocBro configuration
             enable_metrics: Enable performance and quality metrics tracking
+            indexing_config: Indexing pipeline queue and concurrency settings
+            heading_config: Title/heading fast path settings
+            pagination_config: Cursor pagination oversampling and TTL settings
+            chunk_store: Chunk index shared across projects (defaults to
+                ``chunk_store.db`` in the data directory when
+                ``indexing_config.share_embeddings`` is set); closed by
+                ``cleanup``
         """
         self.vector_store = vector_store
         self.embedding_service = embedding_service
@@ -56,6 +82,7 @@ class RAGSearchService:
         self.reranking_service = RerankingService()
         self.query_transformer = QueryTransformer()
         self.fusion_retrieval = FusionRetrieval()
+        self.mmr = MMRDiversifier()
 
         # Initialize metrics (Phase 3)
         self.metrics = RAGMetrics() if enable_metrics else None
@@ -69,6 +96,24 @@ class RAGSearchService:
         self._query_cache: dict[str, tuple[list[SearchResult], datetime]] = {}
         self._cache_ttl = 300
 
+        # Indexing pipeline configuration and last run statistics
+        self.indexing_config = indexing_config or IndexingConfig()
+        self.last_indexing_stats: IndexingStats | None = None
+        if chunk_store is None and self.indexing_config.share_embeddings:
+            chunk_store = ChunkStore(chunk_store_path(self.config.data_dir))
+        self.chunk_store = chunk_store
+
+        # Per-collection title/heading indexes, loaded on first use
+        self.heading_config = heading_config or HeadingIndexConfig()
+        self._heading_indexes: dict[str, HeadingIndex] = {}
+
+        # Candidate lists behind pagination cursors
+        self.pagination_config = pagination_config or PaginationConfig()
+        self._candidates = CandidateCache(
+            ttl_seconds=self.pagination_config.cursor_ttl_seconds,
+            max_entries=self.pagination_config.max_cursors,
+        )
+
     async def search(
         self,
         query: str,
@@ -79,6 +124,11 @@ class RAGSearchService:
         filters: dict[str, Any] | None = None,
         transform_query: bool = False,
         rerank: bool = False,
+        deadline_ms: float | None = None,
+        explain: bool = False,
+        diversify: bool = False,
+        mmr_lambda: float | None = None,
+        paginate: bool = False,
     ) -> list[SearchResult]:
         """Execute search with specified strategy.
 
@@ -91,44 +141,167 @@ class RAGSearchService:
             filters: Metadata filters
             transform_query: Enable query transformation (Phase 2)
             rerank: Enable fast reranking
+            deadline_ms: Time budget for the whole search; when it runs out
+                the results gathered so far are returned
+            explain: Collect a per-stage latency breakdown (see
+                :meth:`search_detailed`)
+            diversify: Drop near-duplicate chunks with maximal marginal
+                relevance over the candidates' stored vectors
+            mmr_lambda: Relevance vs. diversity trade-off for ``diversify``
+                (1.0 = relevance only; config default if None)
+            paginate: Keep extra candidates server-side so later pages can be
+                read with :meth:`fetch_page` (the cursor is on the response
+                of :meth:`search_detailed`)
 
         Returns:
             List of SearchResult objects
         """
+        response = await self.search_detailed(
+            query,
+            collection_name,
+            limit=limit,
+            strategy=strategy,
+            score_threshold=score_threshold,
+            filters=filters,
+            transform_query=transform_query,
+            rerank=rerank,
+            deadline_ms=deadline_ms,
+            explain=explain,
+            diversify=diversify,
+            mmr_lambda=mmr_lambda,
+            paginate=paginate,
+        )
+        return response.results
+
+    async def search_detailed(
+        self,
+        query: str,
+        collection_name: str,
+        limit: int = 10,
+        strategy: SearchStrategy = SearchStrategy.SEMANTIC,
+        score_threshold: float | None = None,
+        filters: dict[str, Any] | None = None,
+        transform_query: bool = False,
+        rerank: bool = False,
+        deadline_ms: float | None = None,
+        explain: bool = False,
+        diversify: bool = False,
+        mmr_lambda: float | None = None,
+        paginate: bool = False,
+    ) -> SearchResponse:
+        """Execute search and report whether it completed within its deadline.
+
+        Takes the same arguments as :meth:`search`. Each stage (embedding,
+        vector search, keyword search, reranking) is bounded by the time left
+        in ``deadline_ms``. Strategies that combine several searches keep the
+        ones that finished; the response is then marked partial and names the
+        first stage that ran out of time. Partial results are not cached.
+
+        Every stage is timed and the durations feed the per-stage latency
+        histograms in the metrics summary. With ``explain=True`` the
+        breakdown for this search is also returned in ``response.explain``.
+
+        With ``diversify=True`` the strategy fetches ``candidate_multiplier``
+        times ``limit`` candidates together with their vectors, and MMR then
+        picks ``limit`` mutually dissimilar results after reranking.
+
+        Short, unfiltered queries are first looked up in the collection's
+        title/heading index. A query naming a heading exactly is answered
+        from the chunks under it without embedding the query; a query that
+        prefixes headings boosts the semantic hits under them. Chunks found
+        this way score 1.0 and are still subject to ``score_threshold``, but
+        ``strategy``, ``transform_query`` and ``rerank`` are bypassed.
+
+        With ``paginate=True`` the search ranks ``oversample`` pages of
+        candidates, returns the first page and keeps the rest for
+        ``cursor_ttl_seconds``; ``response.next_cursor`` is then passed to
+        :meth:`fetch_page` to read the following pages.
+
+        Returns:
+            SearchResponse with results and completion details
+        """
         if not query.strip():
             self.logger.warning("Empty query provided")
-            return []
+            return SearchResponse()
 
         start_time = datetime.now()
+        context = SearchContext(deadline_ms, explain=explain, with_vectors=diversify)
+        # Candidates ranked up front: one page, or several when paginating
+        pool_size = limit * self.pagination_config.oversample if paginate else limit
+        if diversify:
+            mmr_lambda = self.mmr.config.lambda_mult if mmr_lambda is None else mmr_lambda
+            fetch_limit = pool_size * self.mmr.config.candidate_multiplier
+        else:
+            mmr_lambda = None
+            fetch_limit = pool_size
 
         try:
             # Check cache
-            cache_key = self._get_cache_key(query, collection_name, limit, strategy)
-            if cache_key in self._query_cache:
-                cached_results, cached_time = self._query_cache[cache_key]
-                if (datetime.now() - cached_time).total_seconds() < self._cache_ttl:
-                    self.logger.debug(
-                        "Cache hit for query", extra={"query": query[:50]}
-                    )
-                    return cached_results
-
-            # PHASE 2: Query transformation
-            if transform_query:
-                results = await self._search_with_query_transformation(
-                    query, collection_name, limit, strategy, score_threshold, filters, rerank
+            with context.stage("cache_lookup"):
+                cache_key = self._get_cache_key(
+                    query, collection_name, pool_size, strategy, mmr_lambda
                 )
-            else:
-                # Execute search based on strategy (normal path)
-                results = await self._execute_search_strategy(
-                    query, collection_name, limit, strategy, score_threshold, filters
+                cached = self._query_cache.get(cache_key)
+                if cached and (
+                    (datetime.now() - cached[1]).total_seconds() >= self._cache_ttl
+                ):
+                    cached = None
+            if cached:
+                self.logger.debug(
+                    "Cache hit for query", extra={"query": query[:50]}
+                )
+                self._record_stage_latencies(context)
+                page, next_cursor = self._first_page(cached[0], limit, paginate)
+                return SearchResponse(
+                    results=page,
+                    took_ms=context.elapsed_ms(),
+                    explain=self._explain(context, strategy, True) if explain else None,
+                    next_cursor=next_cursor,
+                )
+
+            try:
+                heading_match = self._match_headings(
+                    query, collection_name, filters, fetch_limit, context
                 )
+                results = []
+                if heading_match.exact and self.heading_config.short_circuit:
+                    # Navigational query: answer from the chunks under the heading
+                    results = await self._heading_results(
+                        query, collection_name, heading_match.exact[:pool_size], context
+                    )
+                    if score_threshold is not None:
+                        results = [r for r in results if r.score >= score_threshold]
+
+                if not results:
+                    # PHASE 2: Query transformation
+                    if transform_query:
+                        results = await self._search_with_query_transformation(
+                            query, collection_name, fetch_limit, strategy,
+                            score_threshold, filters, rerank, context,
+                        )
+                    else:
+                        # Execute search based on strategy (normal path)
+                        results = await self._execute_search_strategy(
+                            query, collection_name, fetch_limit, strategy,
+                            score_threshold, filters, context,
+                        )
+
+                        # PHASE 1: Fast reranking
+                        if rerank and len(results) > 1:
+                            results = await self._rerank(query, results, context)
 
-                # PHASE 1: Fast reranking
-                if rerank and len(results) > 1:
-                    results = await self.reranking_service.rerank(query, results)
+                    if heading_match.prefix:
+                        results = self._boost_heading_prefix(results, heading_match)
 
-            # Cache results
-            self._query_cache[cache_key] = (results, datetime.now())
+                    if diversify:
+                        results = self._diversify(results, pool_size, mmr_lambda, context)
+            except DeadlineExceeded:
+                # Nothing finished in time
+                results = []
+
+            # Cache complete results only
+            if not context.partial:
+                self._query_cache[cache_key] = (results, datetime.now())
 
             took_ms = int((datetime.now() - start_time).total_seconds() * 1000)
             self.logger.info(
@@ -138,9 +311,21 @@ class RAGSearchService:
                     "strategy": strategy.value,
                     "results_count": len(results),
                     "took_ms": took_ms,
+                    "partial": context.partial,
                 },
             )
 
+            if context.partial:
+                self.logger.warning(
+                    "Search deadline exceeded",
+                    extra={
+                        "query": query[:50],
+                        "stage": context.exceeded_stage,
+                        "deadline_ms": deadline_ms,
+                        "results_count": len(results),
+                    },
+                )
+
             # PHASE 3: Record metrics
             if self.metrics:
                 cache_hit = cache_key in self._query_cache and (datetime.now() - self._query_cache[cache_key][1]).total_seconds() < self._cache_ttl
@@ -151,8 +336,19 @@ class RAGSearchService:
                     query=query,
                     cache_hit=cache_hit
                 )
-
-            return results
+                if context.partial:
+                    self.metrics.record_deadline_exceeded(context.exceeded_stage)
+            self._record_stage_latencies(context)
+
+            page, next_cursor = self._first_page(results, limit, paginate)
+            return SearchResponse(
+                results=page,
+                partial=context.partial,
+                exceeded_stage=context.exceeded_stage,
+                took_ms=context.elapsed_ms(),
+                explain=self._explain(context, strategy, False) if explain else None,
+                next_cursor=next_cursor,
+            )
 
         except Exception as e:
             self.logger.error(
@@ -161,6 +357,248 @@ class RAGSearchService:
             )
             raise RAGError(f"Search failed: {e}")
 
+    async def search_multi_project(
+        self,
+        query: str,
+        project_names: list[str],
+        limit: int = 10,
+        strategy: SearchStrategy | str = SearchStrategy.SEMANTIC,
+        rerank: bool = False,
+        deadline_ms: float | None = None,
+        explain: bool = False,
+        diversify: bool = False,
+        paginate: bool = False,
+    ) -> SearchResponse:
+        """Search several project collections concurrently and merge results.
+
+        Each project is searched with :meth:`search_detailed` under its own
+        deadline. Projects that fail are logged and skipped.
+
+        Args:
+            query: Search query string
+            project_names: Projects to search (collection name = project name)
+            limit: Maximum merged results to return
+            strategy: Search strategy enum or its value
+            rerank: Enable fast reranking
+            deadline_ms: Time budget for each project search
+            explain: Return the stage breakdown of each project search,
+                keyed by project name
+            diversify: Apply MMR diversification within each project
+            paginate: Keep the merged candidates for :meth:`fetch_page`
+
+        Returns:
+            SearchResponse with the best results across projects
+        """
+        strategy = SearchStrategy(strategy)
+        pool_size = limit * self.pagination_config.oversample if paginate else limit
+        responses = await asyncio.gather(
+            *(
+                self.search_detailed(
+                    query,
+                    project_name,
+                    limit=pool_size,
+                    strategy=strategy,
+                    rerank=rerank,
+                    deadline_ms=deadline_ms,
+                    explain=explain,
+                    diversify=diversify,
+                )
+                for project_name in project_names
+            ),
+            return_exceptions=True,
+        )
+
+        merged = SearchResponse(explain={} if explain else None)
+        for project_name, response in zip(project_names, responses, strict=True):
+            if isinstance(response, Exception):
+                self.logger.warning(
+                    f"Search failed for project {project_name}: {response}"
+                )
+                if explain:
+                    merged.explain[project_name] = {"error": str(response)}
+                continue
+            merged.results.extend(response.results)
+            merged.took_ms = max(merged.took_ms, response.took_ms)
+            if response.partial:
+                merged.partial = True
+                merged.exceeded_stage = merged.exceeded_stage or response.exceeded_stage
+            if explain:
+                merged.explain[project_name] = response.explain
+
+        merged.results.sort(key=lambda r: r.score, reverse=True)
+        merged.results, merged.next_cursor = self._first_page(
+            merged.results[:pool_size], limit, paginate
+        )
+        return merged
+
+    def fetch_page(self, cursor: str, limit: int | None = None) -> SearchResponse:
+        """Read the page a pagination cursor points at.
+
+        Pages are sliced from the candidates kept by the paginated search, so
+        no embedding or vector search is done.
+
+        Args:
+            cursor: ``next_cursor`` of a previous page
+            limit: Results per page (the original search limit if None)
+
+        Returns:
+            SearchResponse with the page and the cursor of the next one
+
+        Raises:
+            RAGError: If the cursor is malformed, expired or evicted
+        """
+        context = SearchContext()
+        with context.stage("cache_lookup"):
+            page = self._candidates.page(cursor, limit)
+        if page is None:
+            raise RAGError("Search cursor is invalid or has expired")
+        self._record_stage_latencies(context)
+        results, next_cursor = page
+        return SearchResponse(
+            results=results, took_ms=context.elapsed_ms(), next_cursor=next_cursor
+        )
+
+    def _first_page(
+        self, results: list[SearchResult], limit: int, paginate: bool
+    ) -> tuple[list[SearchResult], str | None]:
+        """Cut the first page and, when paginating, keep the rest behind a cursor."""
+        if not paginate:
+            return results[:limit], None
+        return self._candidates.paginate(results, limit)
+
+    def _diversify(
+        self,
+        results: list[SearchResult],
+        limit: int,
+        mmr_lambda: float,
+        context: SearchContext,
+    ) -> list[SearchResult]:
+        """Apply MMR and drop the candidate vectors, which are not returned."""
+        with context.stage("diversify"):
+            selected = self.mmr.diversify(results, limit, mmr_lambda)
+        for result in selected:
+            result.embedding = None
+        return selected
+
+    def _heading_index_path(self, collection_name: str) -> Path:
+        """Get the file a collection's heading index is persisted to."""
+        return self.config.cache_dir / "heading_index" / f"{collection_name}.json"
+
+    def _heading_index(self, collection_name: str) -> HeadingIndex:
+        """Get the heading index for a collection, loading it on first use.
+
+        The index is reloaded when its file changed since, e.g. after a
+        re-index by the CLI while the MCP server keeps running.
+        """
+        index = self._heading_indexes.get(collection_name)
+        if index is None or index.is_stale():
+            index = HeadingIndex.load(self._heading_index_path(collection_name))
+            self._heading_indexes[collection_name] = index
+        return index
+
+    def _match_headings(
+        self,
+        query: str,
+        collection_name: str,
+        filters: dict[str, Any] | None,
+        limit: int,
+        context: SearchContext,
+    ) -> HeadingMatch:
+        """Look up short, unfiltered queries in the collection's heading index."""
+        if (
+            not self.heading_config.enabled
+            or filters
+            or len(query.split()) > self.heading_config.max_query_words
+        ):
+            return HeadingMatch()
+        index = self._heading_index(collection_name)
+        if not index:
+            return HeadingMatch()
+        with context.stage("heading_lookup"):
+            return index.lookup(query, limit=limit)
+
+    async def _heading_results(
+        self,
+        query: str,
+        collection_name: str,
+        chunk_ids: list[str],
+        context: SearchContext,
+    ) -> list[SearchResult]:
+        """Fetch the chunks under an exactly matching heading."""
+        documents = await context.run(
+            "heading_fetch",
+            asyncio.gather(
+                *(
+                    self.vector_store.get_document(collection_name, chunk_id)
+                    for chunk_id in chunk_ids
+                )
+            ),
+        )
+        hits = [
+            {**document, "id": chunk_id, "score": 1.0, "embedding": None}
+            for chunk_id, document in zip(chunk_ids, documents, strict=True)
+            if document is not None
+        ]
+        with context.stage("decode"):
+            results = self._to_search_results(query, hits)
+        for result in results:
+            result.match_type = "heading"
+        return results
+
+    def _boost_heading_prefix(
+        self, results: list[SearchResult], heading_match: HeadingMatch
+    ) -> list[SearchResult]:
+        """Raise results under headings the query prefixes and re-sort."""
+        boost = self.heading_config.prefix_boost
+        boosted = False
+        for result in results:
+            confidence = heading_match.prefix.get(result.id)
+            if confidence is None:
+                continue
+            boosted = True
+            result.score = min(1.0, result.score + boost * confidence)
+            if result.rerank_score is not None:
+                result.rerank_score = min(1.0, result.rerank_score + boost * confidence)
+        if not boosted:
+            return results
+        return sorted(
+            results,
+            key=lambda r: r.rerank_score if r.rerank_score is not None else r.score,
+            reverse=True,
+        )
+
+    def _record_stage_latencies(self, context: SearchContext) -> None:
+        """Feed a finished search's stage spans into the latency histograms."""
+        if self.metrics:
+            for stage, duration_ms in context.spans:
+                self.metrics.record_stage_latency(stage, duration_ms)
+
+    def _explain(
+        self, context: SearchContext, strategy: SearchStrategy, cache_hit: bool
+    ) -> dict[str, Any]:
+        """Build the explain payload for a search."""
+        explanation = context.explain()
+        explanation["strategy"] = strategy.value
+        explanation["cache_hit"] = cache_hit
+        return explanation
+
+    async def _rerank(
+        self, query: str, results: list[SearchResult], context: SearchContext
+    ) -> list[SearchResult]:
+        """Rerank within the deadline, keeping the original order if out of time.
+
+        Per-result signal breakdowns are only attached in explain mode.
+        """
+        try:
+            return await context.run(
+                "rerank",
+                self.reranking_service.rerank(
+                    query, results, include_signals=context.explain_requested
+                ),
+            )
+        except DeadlineExceeded:
+            return results
+
     async def _execute_search_strategy(
         self,
         query: str,
@@ -169,6 +607,7 @@ class RAGSearchService:
         strategy: SearchStrategy,
         score_threshold: float | None,
         filters: dict[str, Any] | None,
+        context: SearchContext | None = None,
     ) -> list[SearchResult]:
         """Execute search with specified strategy (internal).
 
@@ -179,23 +618,29 @@ class RAGSearchService:
             strategy: Search strategy
             score_threshold: Min score
             filters: Metadata filters
+            context: Deadline context shared by the search stages
 
         Returns:
             List of search results
+
+        Raises:
+            DeadlineExceeded: If the deadline left nothing to return
         """
+        context = context or SearchContext()
+
         # Execute search based on strategy
         if strategy == SearchStrategy.SEMANTIC:
             results = await self._semantic_search(
-                query, collection_name, limit, score_threshold, filters
+                query, collection_name, limit, score_threshold, filters, context
             )
         elif strategy == SearchStrategy.HYBRID:
             results = await self._hybrid_search(
-                query, collection_name, limit, score_threshold, filters
+                query, collection_name, limit, score_threshold, filters, context
             )
         elif strategy == SearchStrategy.ADVANCED:
             # PHASE 1: Parallel sub-query execution
             results = await self._advanced_search_parallel(
-                query, collection_name, limit, score_threshold, filters
+                query, collection_name, limit, score_threshold, filters, context
             )
         elif strategy == SearchStrategy.FUSION:
             # PHASE 2: Fusion retrieval
@@ -204,6 +649,7 @@ class RAGSearchService:
                 collection_name=collection_name,
                 search_executor=self,
                 limit=limit,
+                context=context,
             )
         else:
             raise RAGError(f"Unknown search strategy: {strategy}")
@@ -219,6 +665,7 @@ class RAGSearchService:
         score_threshold: float | None,
         filters: dict[str, Any] | None,
         rerank: bool,
+        context: SearchContext | None = None,
     ) -> list[SearchResult]:
         """Execute search with query transformation (Phase 2).
 
@@ -233,10 +680,13 @@ class RAGSearchService:
             score_threshold: Min score
             filters: Metadata filters
             rerank: Enable reranking
+            context: Deadline context shared by the search stages
 
         Returns:
             Fused results from all query variations
         """
+        context = context or SearchContext()
+
         # Generate query variations
         query_variations = await self.query_transformer.transform_query(query)
 
@@ -248,7 +698,8 @@ class RAGSearchService:
         # Execute searches in parallel for all variations
         search_tasks = [
             self._execute_search_strategy(
-                variation, collection_name, limit, strategy, score_threshold, filters
+                variation, collection_name, limit, strategy, score_threshold,
+                filters, context,
             )
             for variation in query_variations
         ]
@@ -267,11 +718,12 @@ class RAGSearchService:
             all_results.extend(results)
 
         # Remove duplicates and fuse by document ID (simple RRF)
-        fused_results = self._fuse_results_simple(all_results, limit)
+        with context.stage("fuse"):
+            fused_results = self._fuse_results_simple(all_results, limit)
 
         # Apply reranking if requested
         if rerank and len(fused_results) > 1:
-            fused_results = await self.reranking_service.rerank(query, fused_results)
+            fused_results = await self._rerank(query, fused_results, context)
 
         return fused_results
 
@@ -314,44 +766,71 @@ class RAGSearchService:
         limit: int,
         score_threshold: float | None,
         filters: dict[str, Any] | None,
+        context: SearchContext | None = None,
+        stage: str | None = None,
     ) -> list[SearchResult]:
-        """Perform semantic vector search."""
+        """Perform semantic vector search.
+
+        ``stage`` overrides the stage names reported to the deadline context
+        (``embedding`` and ``vector_search`` by default).
+        """
+        context = context or SearchContext()
         try:
             # Create query embedding
-            query_embedding = await self.embedding_service.create_embedding(query)
+            query_embedding = await context.run(
+                stage or "embedding",
+                self.embedding_service.create_embedding(query),
+            )
 
             # Perform vector search
-            vector_results = await self.vector_store.search(
-                collection_name=collection_name,
-                query_embedding=query_embedding,
-                limit=limit,
-                score_threshold=score_threshold,
-                filter_conditions=filters,
+            search_kwargs: dict[str, Any] = {}
+            if context.with_vectors:
+                search_kwargs["with_vectors"] = True
+            vector_results = await context.run(
+                stage or "vector_search",
+                self.vector_store.search(
+                    collection_name=collection_name,
+                    query_embedding=query_embedding,
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    filter_conditions=filters,
+                    **search_kwargs,
+                ),
             )
 
             # Convert to SearchResult objects
-            results = []
-            for result in vector_results:
-                metadata = result.get("metadata", {})
-
-                search_result = SearchResult(
-                    id=result["id"],
-                    url=metadata.get("url", ""),
-                    title=metadata.get("title", ""),
-                    content=metadata.get("content", ""),
-                    score=result["score"],
-                    project=metadata.get("project", ""),
-                    match_type="semantic",
-                    query_terms=self._extract_query_terms(query),
-                    context_header=metadata.get("context_header"),
-                )
-                results.append(search_result)
-
-            return results
+            with context.stage("decode"):
+                return self._to_search_results(query, vector_results)
 
         except (VectorStoreError, EmbeddingError) as e:
             raise RAGError(f"Semantic search failed: {e}")
 
+    def _to_search_results(
+        self, query: str, vector_results: list[dict[str, Any]]
+    ) -> list[SearchResult]:
+        """Convert vector store hits to SearchResult objects."""
+        query_terms = self._extract_query_terms(query)
+        results = []
+        for result in vector_results:
+            metadata = result.get("metadata", {})
+
+            search_result = SearchResult(
+                id=result["id"],
+                url=metadata.get("url", ""),
+                title=metadata.get("title", ""),
+                content=metadata.get("content", ""),
+                score=result["score"],
+                project=metadata.get("project", ""),
+                match_type="semantic",
+                query_terms=list(query_terms),
+                context_header=metadata.get("context_header"),
+                content_terms=metadata.get("content_terms"),
+                embedding=result.get("embedding"),
+            )
+            results.append(search_result)
+
+        return results
+
     async def _hybrid_search(
         self,
         query: str,
@@ -359,28 +838,40 @@ class RAGSearchService:
         limit: int,
         score_threshold: float | None,
         filters: dict[str, Any] | None,
+        context: SearchContext | None = None,
     ) -> list[SearchResult]:
         """Perform hybrid semantic + keyword search."""
+        context = context or SearchContext()
         try:
             # Run both searches in parallel
             semantic_task = self._semantic_search(
-                query, collection_name, limit * 2, score_threshold, filters
+                query, collection_name, limit * 2, score_threshold, filters, context
             )
             keyword_task = self._keyword_search(
-                query, collection_name, limit * 2, filters
+                query, collection_name, limit * 2, filters, context
             )
 
             semantic_results, keyword_results = await asyncio.gather(
-                semantic_task, keyword_task
+                semantic_task, keyword_task, return_exceptions=True
             )
+            if isinstance(semantic_results, DeadlineExceeded):
+                # Keyword search swallows its own failures
+                if not keyword_results:
+                    raise semantic_results
+                semantic_results = []
+            elif isinstance(semantic_results, Exception):
+                raise semantic_results
 
             # Combine results
-            combined = self._combine_hybrid_results(
-                semantic_results, keyword_results, limit
-            )
+            with context.stage("fuse"):
+                combined = self._combine_hybrid_results(
+                    semantic_results, keyword_results, limit
+                )
 
             return combined
 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             raise RAGError(f"Hybrid search failed: {e}")
 
@@ -391,12 +882,14 @@ class RAGSearchService:
         limit: int,
         score_threshold: float | None,
         filters: dict[str, Any] | None,
+        context: SearchContext | None = None,
     ) -> list[SearchResult]:
         """PHASE 1: Advanced search with PARALLEL sub-query execution.
 
         This is the key Phase 1 improvement: replacing sequential sub-query
         processing with parallel execution using asyncio.gather.
         """
+        context = context or SearchContext()
         try:
             # Decompose complex queries
             sub_queries = self._decompose_query(query)
@@ -404,30 +897,45 @@ class RAGSearchService:
             if len(sub_queries) <= 1:
                 # Fall back to semantic search for simple queries
                 return await self._semantic_search(
-                    query, collection_name, limit, score_threshold, filters
+                    query, collection_name, limit, score_threshold, filters, context
                 )
 
             # PHASE 1 IMPROVEMENT: Parallel execution of sub-queries
             search_tasks = [
                 self._semantic_search(
-                    sub_query, collection_name, limit, score_threshold, filters
+                    sub_query, collection_name, limit, score_threshold, filters,
+                    context,
                 )
                 for sub_query in sub_queries
             ]
 
             # Execute all sub-queries in parallel
-            all_results_lists = await asyncio.gather(*search_tasks)
+            all_results_lists = await asyncio.gather(
+                *search_tasks, return_exceptions=True
+            )
 
-            # Flatten results
+            # Flatten results from the sub-queries that finished in time
             all_results = []
+            timed_out = None
             for results_list in all_results_lists:
+                if isinstance(results_list, DeadlineExceeded):
+                    timed_out = results_list
+                    continue
+                if isinstance(results_list, Exception):
+                    raise results_list
                 all_results.extend(results_list)
 
+            if timed_out and not all_results:
+                raise timed_out
+
             # Aggregate and rank
-            aggregated = self._aggregate_sub_results(query, all_results, limit)
+            with context.stage("fuse"):
+                aggregated = self._aggregate_sub_results(query, all_results, limit)
 
             return aggregated
 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             raise RAGError(f"Advanced search failed: {e}")
 
@@ -437,6 +945,7 @@ class RAGSearchService:
         collection_name: str,
         limit: int,
         filters: dict[str, Any] | None,
+        context: SearchContext | None = None,
     ) -> list[SearchResult]:
         """Simplified keyword search."""
         try:
@@ -444,7 +953,7 @@ class RAGSearchService:
 
             # Use semantic search with lower threshold
             results = await self._semantic_search(
-                query, collection_name, limit, 0.3, filters
+                query, collection_name, limit, 0.3, filters, context, stage="keyword"
             )
 
             # Filter for keyword matches
@@ -579,166 +1088,172 @@ class RAGSearchService:
         collection_name: str,
         limit: int,
         strategy: SearchStrategy,
+        mmr_lambda: float | None = None,
     ) -> str:
         """Generate cache key for query."""
-        content = f"{query}:{collection_name}:{limit}:{strategy.value}".encode()
+        content = f"{query}:{collection_name}:{limit}:{strategy.value}"
+        if mmr_lambda is not None:
+            content += f":mmr={mmr_lambda}"
+        content = content.encode()
         return hashlib.sha256(content).hexdigest()
 
     async def index_documents(
         self,
         collection_name: str,
-        documents: list[Document],
+        documents: Iterable[Document] | AsyncIterable[Document],
         chunk_strategy: ChunkStrategy = ChunkStrategy.CHARACTER,
         chunk_size: int = 1000,
         overlap: int = 100,
-        batch_size: int = 50,
+        batch_size: int | None = None,
+        progress_callback: ProgressCallback | None = None,
+        incremental: bool = True,
+        boilerplate: BoilerplateDetector | None = None,
+        strip_boilerplate: bool = True,
     ) -> int:
         """Index documents with chunking and contextual headers.
 
+        Documents are streamed through a bounded chunk -> embed -> upsert
+        pipeline, so memory stays flat and completed upsert batches survive
+        a later failure. Run statistics are kept in ``last_indexing_stats``.
+
+        In incremental mode, chunks whose content and embedding model match
+        what the collection already stores are skipped, and stored chunks a
+        document no longer produces are deleted.
+
+        Chunks already embedded for any project (same normalized content and
+        model) copy the vector from the collection holding them, found
+        through the shared chunk store.
+
+        Text blocks recurring across most of the documents (navigation,
+        footers) are stripped before chunking. For a list of documents the
+        detector is fitted on the documents themselves; streamed documents
+        can only be read once, so pass a detector fitted beforehand.
+
         Args:
             collection_name: Target collection
-            documents: Documents to index
+            documents: Documents to index (list, iterable or async iterable)
             chunk_strategy: Chunking strategy
             chunk_size: Max chunk size
             overlap: Overlap between chunks
-            batch_size: Embedding batch size
+            batch_size: Embedding batch size (defaults to the indexing config)
+            progress_callback: Optional ``callback(stage, stats)`` progress hook
+            incremental: Only embed and upsert new or changed chunks
+            boilerplate: Detector fitted on the project's pages; overrides
+                fitting on ``documents``
+            strip_boilerplate: Fit a detector on a list of documents when
+                none is given
 
         Returns:
             Total chunks indexed
         """
-        if not documents:
+        if isinstance(documents, list | tuple) and not documents:
             return 0
 
+        indexing_config = self.indexing_config
+        if batch_size is not None:
+            indexing_config = indexing_config.model_copy(
+                update={"embed_batch_size": batch_size}
+            )
+        fit_boilerplate = strip_boilerplate and isinstance(documents, list | tuple)
+        if boilerplate is None and fit_boilerplate:
+            boilerplate = BoilerplateDetector.fit(doc.content for doc in documents)
+
+        heading_index = self._heading_index(collection_name)
+        pipeline = IndexingPipeline(
+            self.chunking_service,
+            self.embedding_service,
+            self.vector_store,
+            indexing_config,
+            heading_index=heading_index,
+            boilerplate=boilerplate,
+            chunk_store=self.chunk_store,
+        )
+
         try:
-            # Ensure collection exists
+            # Ensure collection exists (a new collection has nothing to diff)
             if not await self.vector_store.collection_exists(collection_name):
                 await self.vector_store.create_collection(collection_name)
+                incremental = False
+            if not incremental:
+                heading_index.clear()
+                if self.chunk_store is not None:
+                    await self.chunk_store.remove_references(collection_name)
+
+            stats = await pipeline.run(
+                collection_name,
+                documents,
+                chunk_strategy=chunk_strategy,
+                chunk_size=chunk_size,
+                overlap=overlap,
+                progress_callback=progress_callback,
+                incremental=incremental,
+            )
+            self.last_indexing_stats = stats
+            heading_index.save()
 
-            # Chunk all documents with contextual headers
-            all_chunks: list[Chunk] = []
-            for doc in documents:
-                chunks = await self.chunking_service.chunk_document(
-                    document=doc,
-                    strategy=chunk_strategy,
-                    chunk_size=chunk_size,
-                    overlap=overlap,
-                    add_context_headers=True,  # PHASE 1: Always add headers
+            if self.metrics:
+                self.metrics.record_indexing(
+                    document_count=stats.documents_total,
+                    latency_ms=stats.duration_ms,
+                    chunk_count=stats.chunks_indexed,
                 )
-                all_chunks.extend(chunks)
-
-            # PHASE 3: Create embeddings with adaptive batching
-            processed_docs = []
-            current_batch_size = batch_size
-            success_streak = 0
-            failure_streak = 0
-            min_batch = 10
-            max_batch = 200
-
-            i = 0
-            while i < len(all_chunks):
-                batch = all_chunks[i : i + current_batch_size]
-                batch_start = datetime.now()
-
-                try:
-                    # Process batch
-                    for chunk in batch:
-                        embedding = await self.embedding_service.create_embedding(
-                            chunk.content
-                        )
-                        processed_doc = {
-                            "id": chunk.id,
-                            "embedding": embedding,
-                            "metadata": {
-                                "title": chunk.title,
-                                "content": chunk.content,
-                                "url": chunk.url,
-                                "project": chunk.project,
-                                "chunk_index": chunk.chunk_index,
-                                "parent_id": chunk.parent_id,
-                                "context_header": chunk.context_header,
-                            },
-                        }
-                        processed_docs.append(processed_doc)
-
-                    # Batch success
-                    batch_time = (datetime.now() - batch_start).total_seconds()
-                    self.logger.debug(
-                        f"Batch processed: size={len(batch)}, time={batch_time:.2f}s"
-                    )
-
-                    success_streak += 1
-                    failure_streak = 0
-
-                    # Increase batch size after 3 consecutive successes
-                    if success_streak >= 3 and current_batch_size < max_batch:
-                        old_size = current_batch_size
-                        current_batch_size = min(
-                            int(current_batch_size * 1.5), max_batch
-                        )
-                        self.logger.debug(
-                            f"Increasing batch size: {old_size} -> {current_batch_size}"
-                        )
-                        success_streak = 0
-
-                    i += len(batch)
-
-                except Exception as e:
-                    # Batch failure - reduce batch size
-                    self.logger.warning(
-                        f"Batch processing failed (size={current_batch_size}): {e}"
-                    )
-                    failure_streak += 1
-                    success_streak = 0
-
-                    # Decrease batch size after 2 consecutive failures
-                    if failure_streak >= 2 and current_batch_size > min_batch:
-                        old_size = current_batch_size
-                        current_batch_size = max(
-                            int(current_batch_size * 0.5), min_batch
-                        )
-                        self.logger.debug(
-                            f"Decreasing batch size: {old_size} -> {current_batch_size}"
-                        )
-                        failure_streak = 0
-
-                    # Retry with smaller batch or skip
-                    if current_batch_size >= min_batch:
-                        continue  # Retry same batch with new size
-                    else:
-                        # Skip this batch and move on
-                        i += len(batch)
-
-            # Batch insert all processed documents
-            indexed_count = await self.vector_store.upsert_documents(
-                collection_name, processed_docs
-            )
 
             self.logger.info(
                 "Documents indexed",
                 extra={
                     "collection_name": collection_name,
-                    "original_documents": len(documents),
-                    "chunks_indexed": indexed_count,
+                    "original_documents": stats.documents_total,
+                    "chunks_indexed": stats.chunks_indexed,
+                    "chunks_added": stats.chunks_added,
+                    "chunks_updated": stats.chunks_updated,
+                    "chunks_unchanged": stats.chunks_unchanged,
+                    "chunks_removed": stats.chunks_removed,
+                    "chunks_failed": stats.chunks_failed,
+                    "chunks_reused": stats.chunks_reused,
+                    "boilerplate_bytes_removed": stats.boilerplate_bytes_removed,
+                    "boilerplate_chunks_saved": stats.boilerplate_chunks_saved,
+                    "took_ms": int(stats.duration_ms),
                 },
             )
 
-            return indexed_count
+            return stats.chunks_indexed
 
         except Exception as e:
             self.logger.error(
                 "Failed to index documents",
                 extra={
                     "collection_name": collection_name,
-                    "documents_count": len(documents),
                     "error": str(e),
                 },
             )
             raise RAGError(f"Failed to index documents: {e}")
 
+    async def delete_collection(self, collection_name: str) -> bool:
+        """Delete a collection, its heading index and its shared chunk references.
+
+        Args:
+            collection_name: Collection of a deleted project or box
+
+        Returns:
+            True if the vector store deleted the collection
+        """
+        deleted = await self.vector_store.delete_collection(collection_name)
+        self._heading_indexes.pop(collection_name, None)
+        self._heading_index_path(collection_name).unlink(missing_ok=True)
+        if self.chunk_store is not None:
+            await self.chunk_store.remove_references(collection_name)
+        return deleted
+
+    async def cleanup(self) -> None:
+        """Close the shared chunk store."""
+        if self.chunk_store is not None:
+            await self.chunk_store.close()
+
     def clear_cache(self) -> int:
         """Clear query cache."""
         cache_size = len(self._query_cache)
         self._query_cache.clear()
+        self._candidates.clear()
         return cache_size
 
     def get_metrics_summary(self):
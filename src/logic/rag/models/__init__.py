@@ -2,25 +2,42 @@
 
 from src.logic.rag.models.chunk import Chunk
 from src.logic.rag.models.document import Document
-from src.logic.rag.models.search_result import SearchResult, RerankSignals
+from src.logic.rag.models.indexing_stats import IndexingStats
+from src.logic.rag.models.search_result import (
+    SearchResult,
+    SearchResponse,
+    RerankSignals,
+)
 from src.logic.rag.models.strategy_config import (
     SearchStrategy,
     ChunkStrategy,
     RerankWeights,
     SemanticChunkingConfig,
+    ContentDefinedChunkingConfig,
     QueryTransformConfig,
     FusionConfig,
+    MMRConfig,
+    HeadingIndexConfig,
+    PaginationConfig,
+    IndexingConfig,
 )
 
 __all__ = [
     "Chunk",
     "Document",
     "SearchResult",
+    "SearchResponse",
     "RerankSignals",
     "SearchStrategy",
     "ChunkStrategy",
     "RerankWeights",
     "SemanticChunkingConfig",
+    "ContentDefinedChunkingConfig",
     "QueryTransformConfig",
     "FusionConfig",
+    "MMRConfig",
+    "HeadingIndexConfig",
+    "PaginationConfig",
+    "IndexingConfig",
+    "IndexingStats",
 ]
\ No newline at end of file
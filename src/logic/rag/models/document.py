@@ -12,6 +12,10 @@ class Document(BaseModel):
     url: str = Field(default="", description="Source URL")
     project: str = Field(default="", description="Project name")
     metadata: dict[str, str] = Field(default_factory=dict, description="Additional metadata")
+    hierarchy: list[tuple[int, str]] | None = Field(
+        default=None,
+        description="Heading hierarchy extracted at crawl time (None: parse from content)",
+    )
 
     class Config:
         """Pydantic v2 configuration."""
@@ -0,0 +1,46 @@
+"""Indexing statistics model for RAG operations."""
+
+from pydantic import BaseModel, Field
+
+
+class IndexingStats(BaseModel):
+    """Progress and outcome counters for an indexing run."""
+
+    collection_name: str = Field(description="Target collection")
+    documents_total: int = Field(default=0, ge=0, description="Documents read")
+    documents_failed: int = Field(
+        default=0, ge=0, description="Documents that could not be chunked"
+    )
+    chunks_total: int = Field(default=0, ge=0, description="Chunks produced")
+    chunks_added: int = Field(default=0, ge=0, description="New chunks")
+    chunks_updated: int = Field(
+        default=0, ge=0, description="Stored chunks whose content changed"
+    )
+    chunks_unchanged: int = Field(
+        default=0, ge=0, description="Stored chunks skipped as unchanged"
+    )
+    chunks_removed: int = Field(
+        default=0, ge=0, description="Stale chunks deleted from the collection"
+    )
+    chunks_embedded: int = Field(default=0, ge=0, description="Chunks embedded")
+    chunks_reused: int = Field(
+        default=0,
+        ge=0,
+        description="Chunks whose embedding came from the shared chunk store",
+    )
+    chunks_failed: int = Field(
+        default=0, ge=0, description="Chunks skipped after embedding failures"
+    )
+    chunks_indexed: int = Field(
+        default=0, ge=0, description="Chunks committed to the vector store"
+    )
+    boilerplate_bytes_removed: int = Field(
+        default=0, ge=0, description="Bytes of cross-page boilerplate stripped"
+    )
+    boilerplate_chunks_saved: int = Field(
+        default=0,
+        ge=0,
+        description="Estimated chunks not produced because boilerplate was stripped",
+    )
+    upsert_batches: int = Field(default=0, ge=0, description="Upsert batches committed")
+    duration_ms: float = Field(default=0.0, ge=0.0, description="Wall-clock duration")
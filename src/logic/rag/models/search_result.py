@@ -51,6 +51,16 @@ class SearchResult(BaseModel):
     query_terms: list[str] = Field(
         default_factory=list, description="Query terms that matched"
     )
+    content_terms: frozenset[str] | None = Field(
+        default=None,
+        exclude=True,
+        description="Content term set stored at index time (used by reranking)",
+    )
+    embedding: list[float] | None = Field(
+        default=None,
+        exclude=True,
+        description="Chunk vector, fetched only for MMR diversification",
+    )
 
     class Config:
         """Pydantic v2 configuration."""
@@ -74,4 +84,28 @@ class SearchResult(BaseModel):
                 "context_header": "[Document: Docker Guide | Section: Getting Started]",
                 "query_terms": ["docker", "installation"],
             }
-        }
\ No newline at end of file
+        }
+
+
+class SearchResponse(BaseModel):
+    """Search results together with how the search completed."""
+
+    results: list[SearchResult] = Field(
+        default_factory=list, description="Ranked search results"
+    )
+    partial: bool = Field(
+        default=False,
+        description="True if the deadline cut a stage short and results are incomplete",
+    )
+    exceeded_stage: str | None = Field(
+        default=None, description="First stage that ran past the deadline"
+    )
+    took_ms: float = Field(default=0.0, ge=0.0, description="Search wall-clock time")
+    explain: dict[str, Any] | None = Field(
+        default=None,
+        description="Per-stage latency breakdown, present when explain was requested",
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Opaque cursor for the next page of a paginated search",
+    )
@@ -19,6 +19,7 @@ class ChunkStrategy(str, Enum):
 
     CHARACTER = "character"
     SEMANTIC = "semantic"
+    CONTENT_DEFINED = "content_defined"
 
 
 class RerankWeights(BaseModel):
@@ -55,6 +56,26 @@ class SemanticChunkingConfig(BaseModel):
     timeout: float = Field(
         default=5.0, gt=0.0, description="Timeout in seconds before fallback"
     )
+    embed_batch_size: int = Field(
+        default=64, ge=1, le=512, description="Sentences per embedding request"
+    )
+
+
+class ContentDefinedChunkingConfig(BaseModel):
+    """Configuration for content-defined chunking strategy."""
+
+    min_chunk_ratio: float = Field(
+        default=0.25,
+        ge=0.05,
+        le=0.9,
+        description="Minimum chunk size as a fraction of chunk_size",
+    )
+    window_size: int = Field(
+        default=64,
+        ge=16,
+        le=512,
+        description="Characters before an anchor hashed to pick boundaries",
+    )
 
 
 class QueryTransformConfig(BaseModel):
@@ -81,4 +102,98 @@ class FusionConfig(BaseModel):
     strategies: list[SearchStrategy] = Field(
         default_factory=lambda: [SearchStrategy.SEMANTIC, SearchStrategy.HYBRID],
         description="Strategies to fuse",
-    )
\ No newline at end of file
+    )
+
+
+class MMRConfig(BaseModel):
+    """Configuration for maximal marginal relevance diversification."""
+
+    lambda_mult: float = Field(
+        default=0.7,
+        ge=0.0,
+        le=1.0,
+        description="Relevance vs. diversity trade-off (1.0 = relevance only)",
+    )
+    candidate_multiplier: int = Field(
+        default=4,
+        ge=1,
+        le=20,
+        description="Candidates fetched per requested result before diversifying",
+    )
+
+
+class PaginationConfig(BaseModel):
+    """Configuration for cursor pagination over cached search candidates."""
+
+    oversample: int = Field(
+        default=5,
+        ge=1,
+        le=50,
+        description="Pages of candidates fetched up front for a paginated search",
+    )
+    cursor_ttl_seconds: int = Field(
+        default=300, ge=1, description="How long a cursor's candidates are kept"
+    )
+    max_cursors: int = Field(
+        default=256, ge=1, description="Candidate lists kept before the oldest is evicted"
+    )
+
+
+class HeadingIndexConfig(BaseModel):
+    """Configuration for the title/heading fast path."""
+
+    enabled: bool = Field(default=True, description="Consult the heading index")
+    max_query_words: int = Field(
+        default=6,
+        ge=1,
+        description="Longer queries are treated as non-navigational and skip the index",
+    )
+    short_circuit: bool = Field(
+        default=True,
+        description="Answer exact heading matches without running the semantic search",
+    )
+    prefix_boost: float = Field(
+        default=0.15,
+        ge=0.0,
+        le=1.0,
+        description="Score boost for semantic hits under a heading the query prefixes",
+    )
+
+
+class IndexingConfig(BaseModel):
+    """Configuration for the streaming indexing pipeline."""
+
+    queue_size: int = Field(
+        default=256,
+        ge=1,
+        description="Maximum chunks buffered between pipeline stages",
+    )
+    embed_batch_size: int = Field(
+        default=32, ge=1, le=512, description="Chunks per embedding request"
+    )
+    embed_concurrency: int = Field(
+        default=4, ge=1, le=32, description="Concurrent embedding workers"
+    )
+    upsert_batch_size: int = Field(
+        default=100,
+        ge=1,
+        description="Chunks committed to the vector store per upsert",
+    )
+    share_embeddings: bool = Field(
+        default=True,
+        description="Reuse embeddings of identical chunks across projects",
+    )
+    chunk_workers: int | None = Field(
+        default=None,
+        ge=1,
+        le=64,
+        description="Chunking processes (None = CPU count, 1 = chunk on the event loop)",
+    )
+    chunk_task_size: int = Field(
+        default=8, ge=1, description="Documents sent to a chunking process per task"
+    )
+    parallel_chunking_min_chars: int = Field(
+        default=200_000,
+        ge=0,
+        description="Smaller windows of documents are chunked in-process",
+    )
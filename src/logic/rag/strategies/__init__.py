@@ -1,7 +1,17 @@
 """RAG strategy implementations."""
 
+from src.logic.rag.strategies.content_defined_chunker import ContentDefinedChunker
 from src.logic.rag.strategies.fusion_retrieval import FusionRetrieval
+from src.logic.rag.strategies.heading_index import HeadingIndex
+from src.logic.rag.strategies.mmr import MMRDiversifier
 from src.logic.rag.strategies.query_transformer import QueryTransformer
 from src.logic.rag.strategies.semantic_chunker import SemanticChunker
 
-__all__ = ["SemanticChunker", "QueryTransformer", "FusionRetrieval"]
\ No newline at end of file
+__all__ = [
+    "SemanticChunker",
+    "ContentDefinedChunker",
+    "QueryTransformer",
+    "FusionRetrieval",
+    "MMRDiversifier",
+    "HeadingIndex",
+]
\ No newline at end of file
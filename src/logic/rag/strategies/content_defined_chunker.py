@@ -0,0 +1,240 @@
+"""Content-defined chunking strategy for RAG enhancement.
+
+Fixed-offset chunking shifts every later boundary when text is inserted near
+the top of a page, so every chunk downstream of an edit gets a new id and a
+new embedding. This module places boundaries the way content-defined
+chunking does for deduplicating storage: candidate cut points are paragraph,
+heading and sentence anchors, and whether an anchor becomes a boundary is
+decided by a hash of the window of text just before it. Boundaries therefore
+depend only on nearby content and re-synchronise shortly after an edit.
+Chunk ids are derived from the chunk text, so untouched chunks keep their ids.
+"""
+
+import hashlib
+import re
+import uuid
+
+from src.core.lib_logger import get_logger
+from src.logic.rag.models.chunk import Chunk
+from src.logic.rag.models.document import Document
+from src.logic.rag.models.strategy_config import ContentDefinedChunkingConfig
+
+logger = get_logger(__name__)
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+# Markdown heading at the start of a line
+_HEADING_LINE = re.compile(r"(?<![^\n])#{1,6}[ \t]+\S[^\n]*")
+
+# Namespace for content-derived chunk ids
+_CHUNK_NAMESPACE = uuid.UUID("9b2f4c1e-6d8a-5e3b-a0c7-4f1d2e8b6a90")
+
+# Chunk.content length bounds
+_MIN_CHUNK_CHARS = 10
+_MAX_CHUNK_CHARS = 5000
+
+_HASH_SPACE = 1 << 64
+
+
+class _Unit:
+    """A span of text between two anchors."""
+
+    __slots__ = ("start", "end", "is_heading")
+
+    def __init__(self, start: int, end: int, is_heading: bool = False):
+        self.start = start
+        self.end = end
+        self.is_heading = is_heading
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start
+
+
+class ContentDefinedChunker:
+    """Content-defined chunking with anchor-snapped, hash-selected boundaries.
+
+    Chunks are at most ``chunk_size`` characters and, apart from a document's
+    final chunk, at least ``min_chunk_ratio * chunk_size`` characters. With
+    the default ratio chunks average roughly half of ``chunk_size``.
+    """
+
+    def __init__(self, config: ContentDefinedChunkingConfig | None = None):
+        """Initialize content-defined chunker.
+
+        Args:
+            config: Optional configuration (uses defaults if None)
+        """
+        self.config = config or ContentDefinedChunkingConfig()
+
+    def chunk_document(self, document: Document, chunk_size: int = 1000) -> list[Chunk]:
+        """Chunk document at content-defined boundaries.
+
+        Args:
+            document: Document to chunk
+            chunk_size: Maximum chunk size in characters
+
+        Returns:
+            List of chunks with content-derived ids
+        """
+        content = document.content
+        spans = self.find_boundaries(content, chunk_size)
+
+        chunks: list[Chunk] = []
+        occurrences: dict[str, int] = {}
+        for chunk_index, (start, end) in enumerate(spans):
+            text = content[start:end].strip()
+            chunks.append(
+                Chunk(
+                    id=self._chunk_id(document.id, text, occurrences),
+                    content=text,
+                    title=document.title,
+                    url=document.url,
+                    project=document.project,
+                    chunk_index=chunk_index,
+                    parent_id=document.id,
+                    chunk_strategy="content_defined",
+                )
+            )
+
+        logger.debug(
+            f"Content-defined chunking created {len(chunks)} chunks for document {document.id}"
+        )
+        return chunks
+
+    def find_boundaries(self, content: str, chunk_size: int) -> list[tuple[int, int]]:
+        """Find chunk spans in content.
+
+        Args:
+            content: Text to chunk
+            chunk_size: Maximum chunk size in characters
+
+        Returns:
+            List of (start, end) character offsets
+        """
+        max_size = chunk_size
+        min_size = max(_MIN_CHUNK_CHARS, int(chunk_size * self.config.min_chunk_ratio))
+        # Expected distance from min_size to a hash-selected boundary
+        spread = max(1, (max_size - min_size) // 2)
+
+        spans: list[tuple[int, int]] = []
+        start: int | None = None
+        end = 0
+
+        for unit in self._units(content, max_size):
+            if start is not None:
+                current = end - start
+                if (unit.is_heading and current >= min_size) or (
+                    unit.end - start > max_size
+                ):
+                    spans.append((start, end))
+                    start = None
+
+            if start is None:
+                start = unit.start
+            end = unit.end
+
+            if end - start >= min_size and self._is_boundary(
+                content, end, unit, spread
+            ):
+                spans.append((start, end))
+                start = None
+
+        if start is not None:
+            spans.append((start, end))
+
+        return self._merge_short_tail(content, spans)
+
+    def _units(self, content: str, max_size: int):
+        """Split content into anchor-delimited units no longer than max_size."""
+        for para_start, para_end in _split_spans(
+            content, _PARAGRAPH_BREAK, 0, len(content)
+        ):
+            position = para_start
+            for heading in _HEADING_LINE.finditer(content, para_start, para_end):
+                yield from self._sentence_units(
+                    content, position, heading.start(), max_size
+                )
+                yield _Unit(heading.start(), heading.end(), is_heading=True)
+                position = heading.end()
+            yield from self._sentence_units(content, position, para_end, max_size)
+
+    def _sentence_units(self, content: str, start: int, end: int, max_size: int):
+        """Split a block into sentences, breaking oversized ones at spaces."""
+        for sent_start, sent_end in _split_spans(content, _SENTENCE_END, start, end):
+            while sent_end - sent_start > max_size:
+                cut = content.rfind(" ", sent_start + 1, sent_start + max_size)
+                if cut <= sent_start:
+                    cut = sent_start + max_size
+                yield _Unit(sent_start, cut)
+                sent_start = cut
+                while sent_start < sent_end and content[sent_start].isspace():
+                    sent_start += 1
+            if sent_end > sent_start:
+                yield _Unit(sent_start, sent_end)
+
+    def _is_boundary(
+        self, content: str, position: int, unit: _Unit, spread: int
+    ) -> bool:
+        """Decide whether the anchor at ``position`` becomes a boundary.
+
+        The window of text ending at the anchor is hashed, and the anchor is
+        accepted with probability proportional to the unit length so that
+        boundaries land roughly every ``spread`` characters past min_size
+        regardless of how long the document's sentences are.
+        """
+        window = content[max(0, position - self.config.window_size) : position]
+        digest = hashlib.blake2b(window.encode(), digest_size=8).digest()
+        probability = min(1.0, unit.length / spread)
+        return int.from_bytes(digest, "big") < probability * _HASH_SPACE
+
+    def _merge_short_tail(
+        self, content: str, spans: list[tuple[int, int]]
+    ) -> list[tuple[int, int]]:
+        """Drop empty spans and fold a too-short final span into its predecessor."""
+        spans = [(s, e) for s, e in spans if content[s:e].strip()]
+        if len(spans) > 1:
+            last_start, last_end = spans[-1]
+            prev_start, _ = spans[-2]
+            if (
+                len(content[last_start:last_end].strip()) < _MIN_CHUNK_CHARS
+                and last_end - prev_start <= _MAX_CHUNK_CHARS
+            ):
+                spans[-2:] = [(prev_start, last_end)]
+        return spans
+
+    def _chunk_id(
+        self, document_id: str, text: str, occurrences: dict[str, int]
+    ) -> str:
+        """Derive a chunk id from its parent document and text.
+
+        Identical chunks within one document are disambiguated by occurrence
+        order, which only depends on earlier copies of the same text.
+        """
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        occurrence = occurrences.get(digest, 0)
+        occurrences[digest] = occurrence + 1
+        name = f"{document_id}:{digest}:{occurrence}"
+        return str(uuid.uuid5(_CHUNK_NAMESPACE, name))
+
+
+def _split_spans(
+    content: str, pattern: re.Pattern, start: int, end: int
+) -> list[tuple[int, int]]:
+    """Split content[start:end] on pattern, returning whitespace-trimmed spans."""
+    spans = []
+    position = start
+    for match in pattern.finditer(content, start, end):
+        spans.append((position, match.start()))
+        position = match.end()
+    spans.append((position, end))
+
+    trimmed = []
+    for span_start, span_end in spans:
+        while span_start < span_end and content[span_start].isspace():
+            span_start += 1
+        while span_end > span_start and content[span_end - 1].isspace():
+            span_end -= 1
+        if span_end > span_start:
+            trimmed.append((span_start, span_end))
+    return trimmed
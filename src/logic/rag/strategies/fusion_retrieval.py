@@ -5,11 +5,13 @@ search strategies, improving recall by 15-25% and providing more robust results.
 """
 
 import asyncio
+from contextlib import nullcontext
 from typing import Any
 
 from src.core.lib_logger import get_logger
 from src.logic.rag.models.search_result import SearchResult
 from src.logic.rag.models.strategy_config import FusionConfig, SearchStrategy
+from src.logic.rag.utils.search_context import SearchContext
 
 logger = get_logger(__name__)
 
@@ -37,6 +39,7 @@ class FusionRetrieval:
         limit: int = 10,
         strategies: list[SearchStrategy] | None = None,
         rrf_k: int | None = None,
+        context: SearchContext | None = None,
     ) -> list[SearchResult]:
         """Fuse results from multiple search strategies.
 
@@ -47,6 +50,8 @@ class FusionRetrieval:
             limit: Max results to return
             strategies: List of strategies to fuse (default from config)
             rrf_k: RRF constant (default from config)
+            context: Deadline context; strategies that run out of time are
+                left out of the fusion
 
         Returns:
             Fused and ranked results
@@ -68,6 +73,7 @@ class FusionRetrieval:
                 strategy=strategy,
                 score_threshold=None,
                 filters=None,
+                context=context,
             )
             for strategy in strategies_to_use
         ]
@@ -91,12 +97,13 @@ class FusionRetrieval:
             logger.warning("All fusion strategies failed", extra={"query": query[:50]})
             return []
 
-        # Apply RRF fusion
-        fused = self.calculate_rrf_scores(strategy_results, k)
+        with context.stage("fuse") if context is not None else nullcontext():
+            # Apply RRF fusion
+            fused = self.calculate_rrf_scores(strategy_results, k)
 
-        # Sort by RRF score and limit
-        fused.sort(key=lambda r: r.score, reverse=True)
-        final_results = fused[:limit]
+            # Sort by RRF score and limit
+            fused.sort(key=lambda r: r.score, reverse=True)
+            final_results = fused[:limit]
 
         logger.info(
             f"Fusion complete: {len(final_results)} results",
@@ -0,0 +1,190 @@
+"""Title and heading inverted index for navigational queries.
+
+Queries such as "useEffect cleanup" or "Config.from_env" usually name a page
+title or section heading. This index maps normalized titles and headings to
+the chunks under them, so exact matches can be answered without embedding
+the query, and prefix matches can boost the semantic results.
+
+The index is built from the ``title`` and ``context_header`` metadata the
+indexing pipeline writes, and is persisted as JSON next to the collection.
+"""
+
+import bisect
+import json
+import re
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from src.core.lib_logger import get_logger
+from src.logic.rag.utils.contextual_headers import parse_header_sections
+
+logger = get_logger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+# Punctuation trimmed from heading ends ("Config.from_env()" -> "config.from_env")
+_EDGE_PUNCTUATION = "()[]{}:;,.!?'\"`#*-–— "
+
+
+def _mtime_ns(path: Path) -> int | None:
+    """Modification time of a file, or None if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def normalize_heading(text: str) -> str:
+    """Normalize a heading or query for matching."""
+    text = _WHITESPACE.sub(" ", text.lower()).strip(_EDGE_PUNCTUATION)
+    return text.removesuffix("()")
+
+
+class HeadingMatch(BaseModel):
+    """Chunks whose title or heading matches a query."""
+
+    exact: list[str] = Field(
+        default_factory=list, description="Chunk IDs under an exactly matching heading"
+    )
+    prefix: dict[str, float] = Field(
+        default_factory=dict,
+        description="Chunk ID to match confidence for headings the query prefixes",
+    )
+
+
+class HeadingIndex:
+    """Inverted index from normalized titles/headings to chunk IDs."""
+
+    def __init__(self, path: Path | None = None):
+        """Initialize heading index.
+
+        Args:
+            path: JSON file the index is saved to (None for in-memory only)
+        """
+        self.path = path
+        # heading -> {chunk_id: chunk_index}
+        self._entries: dict[str, dict[str, int]] = {}
+        self._chunk_keys: dict[str, set[str]] = {}
+        self._sorted_keys: list[str] | None = None
+        # File version this index matches, to notice writes by other processes
+        self.mtime_ns: int | None = None
+
+    def __len__(self) -> int:
+        return len(self._chunk_keys)
+
+    @classmethod
+    def load(cls, path: Path) -> "HeadingIndex":
+        """Load an index from disk, starting empty if the file is missing or corrupt."""
+        index = cls(path)
+        index.mtime_ns = _mtime_ns(path)
+        if index.mtime_ns is None:
+            return index
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable heading index {path}: {e}")
+            return index
+        for key, chunks in data.get("entries", {}).items():
+            index._entries[key] = chunks
+            for chunk_id in chunks:
+                index._chunk_keys.setdefault(chunk_id, set()).add(key)
+        return index
+
+    def save(self) -> None:
+        """Write the index to its path."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps({"entries": self._entries}))
+        temp_path.replace(self.path)
+        self.mtime_ns = _mtime_ns(self.path)
+
+    def is_stale(self) -> bool:
+        """Check whether the file changed since this index was loaded or saved."""
+        return self.path is not None and _mtime_ns(self.path) != self.mtime_ns
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+        self._chunk_keys.clear()
+        self._sorted_keys = None
+
+    def add(
+        self,
+        chunk_id: str,
+        title: str | None,
+        context_header: str | None,
+        chunk_index: int = 0,
+    ) -> None:
+        """Index a chunk under its document title and section headings.
+
+        Args:
+            chunk_id: Chunk identifier
+            title: Document title
+            context_header: Contextual header written by the chunking service
+            chunk_index: Position of the chunk in its document (orders hits)
+        """
+        self.remove([chunk_id])
+        keys = {
+            normalize_heading(text)
+            for text in [title or "", *parse_header_sections(context_header)]
+        }
+        keys.discard("")
+        for key in keys:
+            if key not in self._entries:
+                self._sorted_keys = None
+            self._entries.setdefault(key, {})[chunk_id] = chunk_index
+        if keys:
+            self._chunk_keys[chunk_id] = keys
+
+    def remove(self, chunk_ids: list[str]) -> None:
+        """Remove chunks from the index."""
+        for chunk_id in chunk_ids:
+            for key in self._chunk_keys.pop(chunk_id, ()):
+                chunks = self._entries.get(key)
+                if chunks is None:
+                    continue
+                chunks.pop(chunk_id, None)
+                if not chunks:
+                    del self._entries[key]
+                    self._sorted_keys = None
+
+    def lookup(
+        self, query: str, limit: int = 10, min_prefix_chars: int = 3
+    ) -> HeadingMatch:
+        """Find chunks under headings equal to, or starting with, the query.
+
+        Args:
+            query: Search query
+            limit: Maximum chunk IDs per match kind
+            min_prefix_chars: Shortest query used for prefix matching
+
+        Returns:
+            HeadingMatch with exact hits (in document order) and prefix hits
+        """
+        key = normalize_heading(query)
+        match = HeadingMatch()
+        if not key:
+            return match
+
+        exact = self._entries.get(key)
+        if exact:
+            match.exact = sorted(exact, key=exact.get)[:limit]
+
+        if len(key) < min_prefix_chars:
+            return match
+
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(self._entries)
+        start = bisect.bisect_right(self._sorted_keys, key)
+        for heading in self._sorted_keys[start:]:
+            if not heading.startswith(key) or len(match.prefix) >= limit:
+                break
+            confidence = len(key) / len(heading)
+            for chunk_id in sorted(
+                self._entries[heading], key=self._entries[heading].get
+            ):
+                if chunk_id not in match.prefix and len(match.prefix) < limit:
+                    match.prefix[chunk_id] = confidence
+        return match
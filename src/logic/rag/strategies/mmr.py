@@ -0,0 +1,138 @@
+"""Maximal marginal relevance (MMR) diversification for RAG search.
+
+Documentation sites repeat the same paragraphs across pages, so the top-k
+vector hits are often near-duplicates. MMR picks results greedily, trading
+each candidate's relevance against its similarity to what was already
+picked:
+
+    mmr(d) = lambda * relevance(d) - (1 - lambda) * max_sim(d, selected)
+
+The candidate similarity matrix is computed once from the vectors the store
+returned with the hits; each greedy step is then a vector update.
+"""
+
+import math
+
+from src.core.lib_logger import get_logger
+from src.logic.rag.models.search_result import SearchResult
+from src.logic.rag.models.strategy_config import MMRConfig
+from src.logic.rag.utils.numpy_support import NUMPY_AVAILABLE, np
+
+logger = get_logger(__name__)
+
+
+class MMRDiversifier:
+    """Select a diverse subset of search results with MMR."""
+
+    def __init__(self, config: MMRConfig | None = None):
+        """Initialize MMR diversifier.
+
+        Args:
+            config: Optional configuration (uses defaults if None)
+        """
+        self.config = config or MMRConfig()
+
+    def diversify(
+        self,
+        results: list[SearchResult],
+        limit: int,
+        lambda_mult: float | None = None,
+    ) -> list[SearchResult]:
+        """Pick up to ``limit`` relevant, mutually dissimilar results.
+
+        Relevance is the rerank score when present, otherwise the vector
+        score. Results without an embedding are treated as dissimilar to
+        everything.
+
+        Args:
+            results: Candidates ordered by relevance, with ``embedding`` set
+            limit: Number of results to return
+            lambda_mult: Relevance vs. diversity trade-off (config default if None)
+
+        Returns:
+            Selected results in selection order
+        """
+        if len(results) <= 1 or limit <= 0:
+            return results[:limit]
+
+        lambda_mult = self.config.lambda_mult if lambda_mult is None else lambda_mult
+        relevance = [
+            r.rerank_score if r.rerank_score is not None else r.score for r in results
+        ]
+        vectors = [r.embedding for r in results]
+
+        if NUMPY_AVAILABLE:
+            order = _select_numpy(vectors, relevance, limit, lambda_mult)
+        else:
+            order = _select_python(vectors, relevance, limit, lambda_mult)
+
+        logger.debug(f"MMR selected {len(order)} of {len(results)} candidates")
+        return [results[i] for i in order]
+
+
+def _select_numpy(
+    vectors: list[list[float] | None],
+    relevance: list[float],
+    limit: int,
+    lambda_mult: float,
+) -> list[int]:
+    """Greedy MMR over a precomputed cosine similarity matrix."""
+    dimension = max((len(v) for v in vectors if v), default=0)
+    matrix = np.zeros((len(vectors), dimension))
+    for i, vector in enumerate(vectors):
+        if vector and len(vector) == dimension:
+            matrix[i] = vector
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+    similarity = matrix @ matrix.T
+
+    relevance_arr = np.asarray(relevance, dtype=float)
+    # Similarity to the closest selected result (0 until something is selected)
+    max_similarity = np.zeros(len(vectors))
+    available = np.ones(len(vectors), dtype=bool)
+    selected: list[int] = []
+
+    for _ in range(min(limit, len(vectors))):
+        scores = lambda_mult * relevance_arr - (1 - lambda_mult) * max_similarity
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        available[best] = False
+        max_similarity = np.maximum(max_similarity, similarity[best])
+
+    return selected
+
+
+def _select_python(
+    vectors: list[list[float] | None],
+    relevance: list[float],
+    limit: int,
+    lambda_mult: float,
+) -> list[int]:
+    """Greedy MMR without NumPy."""
+    unit = []
+    for vector in vectors:
+        norm = math.sqrt(sum(x * x for x in vector)) if vector else 0.0
+        unit.append([x / norm for x in vector] if norm else None)
+
+    max_similarity = [0.0] * len(vectors)
+    remaining = list(range(len(vectors)))
+    selected: list[int] = []
+
+    while remaining and len(selected) < limit:
+        best = max(
+            remaining,
+            key=lambda i: lambda_mult * relevance[i]
+            - (1 - lambda_mult) * max_similarity[i],
+        )
+        selected.append(best)
+        remaining.remove(best)
+        if unit[best] is None:
+            continue
+        for i in remaining:
+            if unit[i] is not None and len(unit[i]) == len(unit[best]):
+                sim = sum(a * b for a, b in zip(unit[i], unit[best], strict=True))
+                max_similarity[i] = max(max_similarity[i], sim)
+
+    return selected
@@ -2,6 +2,10 @@
 
 This module implements semantic chunking that groups sentences by embedding similarity
 to preserve topic boundaries, improving retrieval accuracy by 15-25%.
+
+Sentences are embedded through the batched embedding endpoint, and the
+similarities of all adjacent pairs are computed in one pass (a row-wise dot
+product of the normalized embedding matrix when NumPy is available).
 """
 
 import asyncio
@@ -12,6 +16,7 @@ from src.core.lib_logger import get_logger
 from src.logic.rag.models.chunk import Chunk
 from src.logic.rag.models.document import Document
 from src.logic.rag.models.strategy_config import SemanticChunkingConfig
+from src.logic.rag.utils.numpy_support import NUMPY_AVAILABLE, np
 from src.services.embeddings import EmbeddingService
 
 logger = get_logger(__name__)
@@ -83,6 +88,7 @@ class SemanticChunker:
 
         # Generate embeddings for all sentences
         embeddings = await self._embed_sentences(sentences)
+        similarities = self._adjacent_similarities(embeddings)
 
         # Group sentences by similarity
         chunks: list[list[str]] = []
@@ -93,8 +99,8 @@ class SemanticChunker:
             sentence = sentences[i]
             sentence_len = len(sentence)
 
-            # Calculate similarity with previous sentence
-            similarity = self._cosine_similarity(embeddings[i - 1], embeddings[i])
+            # Similarity with previous sentence
+            similarity = similarities[i - 1]
 
             # Check if we should continue current chunk
             should_continue = (
@@ -118,7 +124,7 @@ class SemanticChunker:
         return chunks
 
     async def _embed_sentences(self, sentences: list[str]) -> list[list[float]]:
-        """Generate embeddings for sentences in parallel.
+        """Generate embeddings for sentences through the batch endpoint.
 
         Args:
             sentences: List of sentences
@@ -126,10 +132,34 @@ class SemanticChunker:
         Returns:
             List of embedding vectors
         """
-        # Embed sentences in parallel with batching
-        tasks = [self.embedding_service.create_embedding(s) for s in sentences]
-        embeddings = await asyncio.gather(*tasks)
-        return embeddings
+        return await self.embedding_service.create_embeddings(
+            sentences, batch_size=self.config.embed_batch_size
+        )
+
+    def _adjacent_similarities(self, embeddings: list[list[float]]) -> list[float]:
+        """Calculate cosine similarity of every adjacent embedding pair.
+
+        Args:
+            embeddings: Sentence embeddings in document order
+
+        Returns:
+            ``len(embeddings) - 1`` similarities; entry ``i`` compares
+            sentences ``i`` and ``i + 1``
+        """
+        if len(embeddings) < 2:
+            return []
+
+        dimension = len(embeddings[0])
+        if not NUMPY_AVAILABLE or any(len(e) != dimension for e in embeddings):
+            return [
+                self._cosine_similarity(embeddings[i], embeddings[i + 1])
+                for i in range(len(embeddings) - 1)
+            ]
+
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+        return np.einsum("ij,ij->i", matrix[:-1], matrix[1:]).tolist()
 
     def _cosine_similarity(self, vec1: list[float], vec2: list[float]) -> float:
         """Calculate cosine similarity between two vectors.
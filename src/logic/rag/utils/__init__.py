@@ -1,3 +1,15 @@
 """RAG utilities."""
 
-__all__ = []
\ No newline at end of file
+from src.logic.rag.utils.candidate_cache import CandidateCache
+from src.logic.rag.utils.fingerprints import chunk_fingerprint, shared_chunk_key
+from src.logic.rag.utils.search_context import DeadlineExceeded, SearchContext
+from src.logic.rag.utils.terms import term_set
+
+__all__ = [
+    "CandidateCache",
+    "chunk_fingerprint",
+    "DeadlineExceeded",
+    "SearchContext",
+    "shared_chunk_key",
+    "term_set",
+]
@@ -0,0 +1,121 @@
+"""Server-side candidate lists behind search pagination cursors.
+
+A paginated search fetches several pages of ranked candidates at once and
+keeps them here under a random token. The cursor handed to the client is
+``<token>:<offset>``; following it slices the stored list, so later pages
+cost neither an embedding call nor a vector search. Lists expire after a
+short TTL and the oldest are evicted once ``max_entries`` is reached.
+"""
+
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from src.logic.rag.models.search_result import SearchResult
+
+
+@dataclass
+class _CandidateList:
+    """Ranked candidates of one search."""
+
+    results: list[SearchResult]
+    page_size: int
+    created_at: float
+
+
+class CandidateCache:
+    """TTL- and size-bounded store of search candidates keyed by cursor token."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize candidate cache.
+
+        Args:
+            ttl_seconds: Lifetime of a stored candidate list
+            max_entries: Candidate lists kept before evicting the oldest
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, _CandidateList] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def paginate(
+        self, candidates: list[SearchResult], page_size: int
+    ) -> tuple[list[SearchResult], str | None]:
+        """Split off the first page and store the rest behind a cursor.
+
+        Args:
+            candidates: Ranked candidates of a search
+            page_size: Results per page
+
+        Returns:
+            Tuple of (first page, cursor for the next page or None)
+        """
+        if len(candidates) <= page_size:
+            return candidates, None
+
+        self._evict_expired()
+        while len(self._entries) >= self.max_entries:
+            self._entries.popitem(last=False)
+
+        token = secrets.token_urlsafe(12)
+        self._entries[token] = _CandidateList(candidates, page_size, self._clock())
+        return candidates[:page_size], f"{token}:{page_size}"
+
+    def page(
+        self, cursor: str, page_size: int | None = None
+    ) -> tuple[list[SearchResult], str | None] | None:
+        """Get the page a cursor points at.
+
+        Args:
+            cursor: Cursor returned with a previous page
+            page_size: Results per page (the original page size if None)
+
+        Returns:
+            Tuple of (page, next cursor or None), or None if the cursor is
+            malformed, expired or evicted
+        """
+        token, _, offset_text = cursor.rpartition(":")
+        if not token or not offset_text.isdigit():
+            return None
+
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+        if self._clock() - entry.created_at > self.ttl_seconds:
+            del self._entries[token]
+            return None
+
+        offset = int(offset_text)
+        end = offset + (page_size or entry.page_size)
+        next_cursor = f"{token}:{end}" if end < len(entry.results) else None
+        return entry.results[offset:end], next_cursor
+
+    def clear(self) -> int:
+        """Drop all candidate lists.
+
+        Returns:
+            Number of lists dropped
+        """
+        count = len(self._entries)
+        self._entries.clear()
+        return count
+
+    def _evict_expired(self) -> None:
+        """Drop lists older than the TTL (oldest first)."""
+        now = self._clock()
+        while self._entries:
+            token, entry = next(iter(self._entries.items()))
+            if now - entry.created_at <= self.ttl_seconds:
+                break
+            del self._entries[token]
@@ -29,6 +29,23 @@ def format_header(
     return "[" + " | ".join(parts) + "]"
 
 
+def parse_header_sections(header: str | None) -> list[str]:
+    """Extract the section headings from a header built by format_header.
+
+    Args:
+        header: Contextual header string
+
+    Returns:
+        Section headings, outermost first (empty if the header has none)
+    """
+    if not header:
+        return []
+    for part in header.strip("[]").split(" | "):
+        if part.startswith("Section: "):
+            return [heading for heading in part[len("Section: "):].split(" > ") if heading]
+    return []
+
+
 def add_contextual_header(
     chunk: Chunk, document: Document, hierarchy: list[tuple[int, str]] | None = None
 ) -> Chunk:
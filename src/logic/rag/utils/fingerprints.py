@@ -0,0 +1,42 @@
+"""Content fingerprints for incremental indexing."""
+
+import hashlib
+import re
+
+
+def chunk_fingerprint(content: str, embedding_model: str) -> str:
+    """Fingerprint chunk content together with the model that embeds it.
+
+    A chunk only needs re-embedding when its text or the embedding model
+    changes, so both feed the hash.
+
+    Args:
+        content: Chunk text as embedded (including any contextual header)
+        embedding_model: Embedding model identifier
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(f"{embedding_model}\0{content}".encode()).hexdigest()
+
+
+# Project segment of a contextual header ("| Project: docker-docs]")
+_PROJECT_SEGMENT = re.compile(r" \| Project: [^\]|]*(?=\])")
+
+
+def shared_chunk_key(content: str, embedding_model: str) -> str:
+    """Content address of a chunk for sharing embeddings across projects.
+
+    The same upstream page crawled into two projects yields chunks that
+    differ only in the ``Project:`` part of their contextual header, so
+    that part is dropped and whitespace is collapsed before hashing.
+
+    Args:
+        content: Chunk text as embedded (including any contextual header)
+        embedding_model: Embedding model identifier
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    normalized = " ".join(_PROJECT_SEGMENT.sub("", content).split())
+    return hashlib.sha256(f"{embedding_model}\0{normalized}".encode()).hexdigest()
@@ -0,0 +1,13 @@
+"""Optional numpy support for vector math in RAG strategies.
+
+Modules import ``np`` and ``NUMPY_AVAILABLE`` from here and keep a pure
+Python fallback for installs without numpy.
+"""
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
@@ -0,0 +1,133 @@
+"""Per-search state threaded through RAG search stages."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(Exception):
+    """A search stage ran past the search deadline."""
+
+    def __init__(self, stage: str):
+        super().__init__(f"Search deadline exceeded during {stage}")
+        self.stage = stage
+
+
+class SearchContext:
+    """Deadline budget and timing spans shared by every stage of one search.
+
+    Awaited stages run through :meth:`run`, which bounds them by the time
+    left in the budget. The first stage to run out of time is remembered so
+    callers can return whatever finished and report why the results are
+    partial. Synchronous stages are timed with :meth:`stage`. Every stage
+    appends a ``(name, duration_ms)`` span; stages that run concurrently
+    (e.g. the two halves of a hybrid search) overlap in time.
+    """
+
+    def __init__(
+        self,
+        deadline_ms: float | None = None,
+        explain: bool = False,
+        with_vectors: bool = False,
+    ):
+        """Initialize search context.
+
+        Args:
+            deadline_ms: Total time budget in milliseconds (None for no limit)
+            explain: Whether stages should keep detail for explain output
+            with_vectors: Whether vector searches should return hit embeddings
+        """
+        self.started_at = time.perf_counter()
+        self.deadline_ms = deadline_ms
+        self.explain_requested = explain
+        self.with_vectors = with_vectors
+        self._deadline = (
+            self.started_at + deadline_ms / 1000 if deadline_ms is not None else None
+        )
+        self.exceeded_stage: str | None = None
+        self.spans: list[tuple[str, float]] = []
+
+    @property
+    def partial(self) -> bool:
+        """Whether any stage was cut short by the deadline."""
+        return self.exceeded_stage is not None
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the search started."""
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def remaining(self) -> float | None:
+        """Seconds left in the budget (None when unbounded)."""
+        if self._deadline is None:
+            return None
+        return self._deadline - time.perf_counter()
+
+    async def run(self, stage: str, awaitable: Awaitable[T]) -> T:
+        """Await a stage within the remaining budget.
+
+        Args:
+            stage: Stage name recorded if the budget runs out
+            awaitable: Stage work
+
+        Returns:
+            The stage result
+
+        Raises:
+            DeadlineExceeded: If the budget is spent before the stage finishes
+        """
+        with self.stage(stage):
+            remaining = self.remaining()
+            if remaining is None:
+                return await awaitable
+
+            if remaining <= 0:
+                if asyncio.iscoroutine(awaitable):
+                    awaitable.close()
+                raise self._exceeded(stage)
+
+            try:
+                return await asyncio.wait_for(awaitable, timeout=remaining)
+            except TimeoutError:
+                raise self._exceeded(stage) from None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a block of work as a named stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans.append((name, (time.perf_counter() - start) * 1000))
+
+    def stage_totals(self) -> dict[str, float]:
+        """Total milliseconds spent per stage name."""
+        totals: dict[str, float] = {}
+        for name, duration_ms in self.spans:
+            totals[name] = totals.get(name, 0.0) + duration_ms
+        return totals
+
+    def explain(self) -> dict[str, Any]:
+        """Stage-level breakdown of this search."""
+        return {
+            "total_ms": round(self.elapsed_ms(), 3),
+            "deadline_ms": self.deadline_ms,
+            "partial": self.partial,
+            "exceeded_stage": self.exceeded_stage,
+            "stages": [
+                {"stage": name, "duration_ms": round(duration_ms, 3)}
+                for name, duration_ms in self.spans
+            ],
+            "stage_totals_ms": {
+                name: round(total, 3) for name, total in self.stage_totals().items()
+            },
+        }
+
+    def _exceeded(self, stage: str) -> DeadlineExceeded:
+        """Record the first stage to blow the budget."""
+        if self.exceeded_stage is None:
+            self.exceeded_stage = stage
+        return DeadlineExceeded(stage)
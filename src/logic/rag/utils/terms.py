@@ -0,0 +1,16 @@
+"""Term sets shared by indexing and reranking."""
+
+
+def term_set(text: str) -> frozenset[str]:
+    """Lowercased whitespace-delimited terms of a text.
+
+    Reranking compares query terms against these sets, so chunks store them
+    at index time and searches don't re-tokenize every candidate.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Set of distinct terms
+    """
+    return frozenset(text.lower().split())
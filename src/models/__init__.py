@@ -20,7 +20,7 @@ from .installation import (
 )
 from .installation_profile import InstallationProfile
 from .installation_state import InstallationState
-from .project import Project, ProjectStatus
+from .project import ContentExtraction, Project, ProjectStatus
 from .query_result import QueryResponse, QueryResult
 from .service_config import (
     ServiceConfiguration,
@@ -44,6 +44,7 @@ ShelfBox.model_rebuild()
 __all__ = [
     "Project",
     "ProjectStatus",
+    "ContentExtraction",
     "CrawlSession",
     "CrawlStatus",
     "Page",
@@ -18,6 +18,12 @@ class ProjectStatus(str, Enum):
     ARCHIVED = "archived"
 
 
+class ContentExtraction(str, Enum):
+    """Which part of a crawled page is kept as its text."""
+    FULL = "full"  # Whole page, navigation included
+    MAIN = "main"  # Main article region only
+
+
 class Project(BaseModel):
     """Project model representing a documentation crawling project."""
 
@@ -31,6 +37,9 @@ class Project(BaseModel):
     embedding_model: str = Field(default="mxbai-embed-large", description="Embedding model to use")
     chunk_size: int = Field(default=1000, ge=100, le=5000, description="Document chunk size")
     chunk_overlap: int = Field(default=100, ge=0, le=500, description="Chunk overlap size")
+    content_extraction: ContentExtraction | None = Field(
+        default=None, description="Page text extraction mode (None: global crawl_content_extraction)"
+    )
 
     # Timestamps
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -114,6 +123,7 @@ class Project(BaseModel):
             "embedding_model": self.embedding_model,
             "chunk_size": self.chunk_size,
             "chunk_overlap": self.chunk_overlap,
+            "content_extraction": self.content_extraction,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
             "last_crawl_at": self.last_crawl_at.isoformat() if self.last_crawl_at else None,
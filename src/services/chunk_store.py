@@ -0,0 +1,200 @@
+"""Content-addressed chunk index shared across projects.
+
+The same upstream documentation is often crawled into several boxes. Every
+chunk committed to a project collection is recorded here under its
+normalized content hash and embedding model (see ``shared_chunk_key``).
+Indexing a duplicate crawl looks each chunk up by that key and copies the
+vector from a collection that already holds it instead of calling the
+embedding model.
+
+Only references are stored; the vectors stay in the collections, which
+need their own copy for nearest-neighbour search. Sharing therefore costs
+one small row per chunk rather than a second copy of every embedding.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+CHUNK_STORE_FILENAME = "chunk_store.db"
+
+# Stay under SQLite's bound-parameter limit
+_LOOKUP_BATCH = 500
+
+
+class ChunkStoreError(Exception):
+    """Chunk store operation error."""
+
+    pass
+
+
+class ChunkStore:
+    """SQLite index of which collection chunks hold each content address."""
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize chunk store.
+
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = db_path
+        self._connection: aiosqlite.Connection | None = None
+
+    async def initialize(self) -> None:
+        """Open the database and ensure the schema exists."""
+        if self._connection is not None:
+            return
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = await aiosqlite.connect(str(self.db_path))
+            await self._connection.execute("PRAGMA journal_mode = WAL")
+            await self._connection.execute("PRAGMA synchronous = NORMAL")
+            await self._create_schema()
+        except Exception as e:
+            logger.error(f"Failed to initialize chunk store: {e}")
+            raise ChunkStoreError(f"Failed to initialize chunk store: {e}") from e
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        if self._connection:
+            await self._connection.close()
+            self._connection = None
+
+    async def _create_schema(self) -> None:
+        """Create the reference table."""
+        # Earlier stores kept a float32 copy of every vector
+        await self._connection.execute("DROP TABLE IF EXISTS chunk_embeddings")
+        await self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS chunk_refs (
+                collection TEXT NOT NULL,
+                chunk_id TEXT NOT NULL,
+                chunk_key TEXT NOT NULL,
+                PRIMARY KEY (collection, chunk_id)
+            )
+        """)
+        await self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_chunk_refs_key ON chunk_refs(chunk_key)"
+        )
+        await self._connection.commit()
+
+    async def find_sources(self, keys: list[str]) -> dict[str, tuple[str, str]]:
+        """Find a committed chunk holding the vector of each key.
+
+        Args:
+            keys: Chunk keys (the model is part of the key)
+
+        Returns:
+            Mapping of key to ``(collection, chunk_id)`` for the keys that
+            some collection references
+        """
+        await self.initialize()
+        found: dict[str, tuple[str, str]] = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), _LOOKUP_BATCH):
+            batch = unique[start : start + _LOOKUP_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            cursor = await self._connection.execute(
+                f"SELECT chunk_key, collection, chunk_id FROM chunk_refs "
+                f"WHERE chunk_key IN ({placeholders})",
+                batch,
+            )
+            for key, collection, chunk_id in await cursor.fetchall():
+                found.setdefault(key, (collection, chunk_id))
+        return found
+
+    async def add_references(
+        self, collection: str, references: list[tuple[str, str]]
+    ) -> None:
+        """Record that collection chunks hold the vectors of chunk keys.
+
+        Args:
+            collection: Project collection name
+            references: (chunk_id, chunk_key) pairs of committed chunks
+        """
+        if not references:
+            return
+        await self.initialize()
+        await self._connection.executemany(
+            "INSERT OR REPLACE INTO chunk_refs (collection, chunk_id, chunk_key) "
+            "VALUES (?, ?, ?)",
+            [(collection, chunk_id, key) for chunk_id, key in references],
+        )
+        await self._connection.commit()
+
+    async def remove_references(
+        self, collection: str, chunk_ids: list[str] | None = None
+    ) -> int:
+        """Drop a collection's references.
+
+        Args:
+            collection: Project collection name
+            chunk_ids: Chunks to drop (all of the collection's if None)
+
+        Returns:
+            Number of references dropped
+        """
+        await self.initialize()
+        if chunk_ids is None:
+            cursor = await self._connection.execute(
+                "DELETE FROM chunk_refs WHERE collection = ?", (collection,)
+            )
+        else:
+            cursor = await self._connection.executemany(
+                "DELETE FROM chunk_refs WHERE collection = ? AND chunk_id = ?",
+                [(collection, chunk_id) for chunk_id in chunk_ids],
+            )
+        await self._connection.commit()
+        return cursor.rowcount
+
+    async def get_statistics(self) -> dict[str, Any]:
+        """Summarize how much chunk content is shared.
+
+        Returns:
+            Reference, distinct chunk and shared chunk counts
+        """
+        await self.initialize()
+        cursor = await self._connection.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT chunk_key) FROM chunk_refs"
+        )
+        references, chunks = await cursor.fetchone()
+        cursor = await self._connection.execute("""
+            SELECT COUNT(*) FROM (
+                SELECT chunk_key FROM chunk_refs
+                GROUP BY chunk_key HAVING COUNT(DISTINCT collection) > 1
+            )
+        """)
+        (shared,) = await cursor.fetchone()
+        return {
+            "references": references,
+            "chunks": chunks,
+            "shared_chunks": shared,
+        }
+
+
+def chunk_store_path(data_dir: Path) -> Path:
+    """Location of the shared chunk store in a DocBro data directory."""
+    return data_dir / CHUNK_STORE_FILENAME
+
+
+async def release_collection(db_path: Path, collection: str) -> int:
+    """Drop a deleted collection's references.
+
+    Args:
+        db_path: Chunk store database file (nothing happens if it is missing)
+        collection: Deleted project or box collection
+
+    Returns:
+        Number of references dropped
+    """
+    if not db_path.exists():
+        return 0
+    store = ChunkStore(db_path)
+    try:
+        return await store.remove_references(collection)
+    finally:
+        await store.close()
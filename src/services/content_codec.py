@@ -0,0 +1,78 @@
+"""Compression of stored page bodies.
+
+Page text and HTML are written to the ``page_contents`` table compressed.
+zstd is used when the optional ``zstandard`` package is installed and zlib
+otherwise; each row records its codec, so databases written with either
+can be read as long as the codec is available.
+"""
+
+import zlib
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+ZSTD = "zstd"
+ZLIB = "zlib"
+
+_ZSTD_LEVEL = 3
+_ZLIB_LEVEL = 6
+
+
+class ContentCodecError(Exception):
+    """Stored content uses a codec that cannot be decoded here."""
+
+    pass
+
+
+def default_codec() -> str:
+    """Codec used for new rows."""
+    return ZSTD if ZSTD_AVAILABLE else ZLIB
+
+
+def compress(text: str | None, codec: str) -> bytes | None:
+    """Compress a page body.
+
+    Args:
+        text: Body to compress
+        codec: ``"zstd"`` or ``"zlib"``
+
+    Returns:
+        Compressed bytes, or None for a missing body
+    """
+    if text is None:
+        return None
+    data = text.encode("utf-8")
+    if codec == ZSTD:
+        return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(data)
+    return zlib.compress(data, _ZLIB_LEVEL)
+
+
+def decompress(data: bytes | None, codec: str) -> str | None:
+    """Decompress a stored page body.
+
+    Args:
+        data: Compressed bytes
+        codec: Codec recorded with the row
+
+    Returns:
+        Body text, or None for a missing body
+
+    Raises:
+        ContentCodecError: If the codec is unknown or not installed
+    """
+    if data is None:
+        return None
+    if codec == ZLIB:
+        return zlib.decompress(data).decode("utf-8")
+    if codec == ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise ContentCodecError(
+                "Page content is zstd-compressed; install 'zstandard' to read it"
+            )
+        return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
+    raise ContentCodecError(f"Unknown page content codec: {codec}")
@@ -3,6 +3,7 @@
 import json
 import sqlite3
 import uuid
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -12,6 +13,7 @@ import aiosqlite
 from src.core.config import DocBroConfig
 from src.core.lib_logger import get_component_logger
 from src.models import (
+    ContentExtraction,
     CrawlSession,
     CrawlStatus,
     Page,
@@ -21,6 +23,27 @@ from src.models import (
 )
 from src.models.schema_version import SchemaVersion
 from src.lib.exceptions import DatabaseSchemaError
+from src.services.chunk_store import chunk_store_path, release_collection
+from src.services.content_codec import compress, decompress, default_codec
+
+# Page columns without the bodies, which live compressed in page_contents
+_PAGE_COLUMNS = """
+    p.id, p.project_id, p.session_id, p.url, p.status, p.title,
+    p.content_hash, p.mime_type, p.charset, p.language,
+    p.size_bytes, p.crawl_depth, p.parent_url, p.response_code,
+    p.response_time_ms, p.discovered_at, p.crawled_at, p.processed_at,
+    p.indexed_at, p.error_message, p.retry_count, p.max_retries,
+    p.outbound_links, p.internal_links, p.external_links, p.metadata,
+    p.etag, p.last_modified, p.headings, p.simhash
+"""
+_CONTENT_COLUMNS = "c.codec, c.content_text, c.content_html"
+_CONTENT_JOIN = "LEFT JOIN page_contents c ON c.page_id = p.id"
+
+# Columns iter_project_pages can select, and those holding JSON
+PAGE_RECORD_COLUMNS = tuple(
+    column.strip().removeprefix("p.") for column in _PAGE_COLUMNS.split(",")
+) + ("content_text", "content_html")
+_JSON_PAGE_COLUMNS = {"outbound_links", "internal_links", "external_links", "metadata", "headings"}
 
 
 class DatabaseError(Exception):
@@ -43,6 +66,7 @@ class DatabaseManager:
         # Connection pool
         self._connection: aiosqlite.Connection | None = None  # Main DB connection
         self._project_connections: dict[str, aiosqlite.Connection] = {}  # Project-specific connections
+        self._project_names: dict[str, str] = {}  # Project ID -> name, for connection lookups
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -91,6 +115,7 @@ class DatabaseManager:
         for project_id, conn in self._project_connections.items():
             await conn.close()
         self._project_connections.clear()
+        self._project_names.clear()
 
         # Close main connection
         if self._connection:
@@ -282,8 +307,6 @@ class DatabaseManager:
             url TEXT NOT NULL,
             status TEXT NOT NULL DEFAULT 'discovered',
             title TEXT,
-            content_html TEXT,
-            content_text TEXT,
             content_hash TEXT,
             mime_type TEXT NOT NULL DEFAULT 'text/html',
             charset TEXT NOT NULL DEFAULT 'utf-8',
@@ -304,6 +327,31 @@ class DatabaseManager:
             internal_links TEXT,
             external_links TEXT,
             metadata TEXT,
+            etag TEXT,
+            last_modified TEXT,
+            headings TEXT,
+            simhash TEXT,
+            FOREIGN KEY (session_id) REFERENCES crawl_sessions (id) ON DELETE CASCADE
+        );
+
+        -- Compressed page bodies, read only when a caller needs them
+        CREATE TABLE IF NOT EXISTS page_contents (
+            page_id TEXT PRIMARY KEY,
+            codec TEXT NOT NULL,
+            content_text BLOB,
+            content_html BLOB,
+            FOREIGN KEY (page_id) REFERENCES pages (id) ON DELETE CASCADE
+        );
+
+        -- Crawl frontier: every URL a session queued, and whether it was processed
+        CREATE TABLE IF NOT EXISTS crawl_frontier (
+            session_id TEXT NOT NULL,
+            url TEXT NOT NULL,
+            depth INTEGER NOT NULL,
+            parent_url TEXT,
+            status TEXT NOT NULL DEFAULT 'queued',
+            seq INTEGER NOT NULL,
+            PRIMARY KEY (session_id, url),
             FOREIGN KEY (session_id) REFERENCES crawl_sessions (id) ON DELETE CASCADE
         );
 
@@ -315,12 +363,14 @@ class DatabaseManager:
         CREATE INDEX IF NOT EXISTS idx_pages_url ON pages (url);
         CREATE INDEX IF NOT EXISTS idx_pages_status ON pages (status);
         CREATE INDEX IF NOT EXISTS idx_pages_content_hash ON pages (content_hash);
+        CREATE INDEX IF NOT EXISTS idx_frontier_session_seq ON crawl_frontier (session_id, seq);
 
         -- Insert current schema version
-        INSERT OR REPLACE INTO schema_version (version) VALUES (2);
+        INSERT OR REPLACE INTO schema_version (version) VALUES (6);
         """
 
         await conn.executescript(project_schema_sql)
+        await self._migrate_project_schema(conn)
         await conn.commit()
 
         # Cache the connection
@@ -334,6 +384,71 @@ class DatabaseManager:
         return conn
 
 
+    async def _get_project_connection_by_id(self, project_id: str) -> aiosqlite.Connection:
+        """Get the database connection of a project by its ID.
+
+        Project names are cached by ID, so page and session writes do not
+        look the project up in the main database every time.
+
+        Raises:
+            DatabaseError: If the project does not exist
+        """
+        project_name = self._project_names.get(project_id)
+        if project_name is None:
+            project = await self.get_project(project_id)
+            if not project:
+                raise DatabaseError(f"Project {project_id} not found")
+            project_name = self._project_names[project_id] = project.name
+        return await self._get_project_connection(project_name)
+
+    async def _migrate_project_schema(self, conn: aiosqlite.Connection) -> None:
+        """Add columns introduced after a project database was created."""
+        cursor = await conn.execute("PRAGMA table_info(pages)")
+        columns = {row[1] for row in await cursor.fetchall()}
+
+        # Version 3: HTTP validators for conditional recrawls
+        for column in ("etag", "last_modified"):
+            if column not in columns:
+                await conn.execute(f"ALTER TABLE pages ADD COLUMN {column} TEXT")
+
+        # Version 4: heading hierarchy from the crawl-time parse
+        if "headings" not in columns:
+            await conn.execute("ALTER TABLE pages ADD COLUMN headings TEXT")
+
+        # Version 5: SimHash fingerprints for near-duplicate detection
+        if "simhash" not in columns:
+            await conn.execute("ALTER TABLE pages ADD COLUMN simhash TEXT")
+        await conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_pages_simhash ON pages (project_id, simhash)"
+        )
+
+        # Version 6: bodies move out of the pages table, compressed
+        if "content_text" in columns:
+            await self._move_page_contents(conn)
+
+    async def _move_page_contents(self, conn: aiosqlite.Connection) -> None:
+        """Compress the inline bodies of a pre-version-6 database into page_contents."""
+        codec = default_codec()
+        cursor = await conn.execute("""
+            SELECT id, content_text, content_html FROM pages
+            WHERE content_text IS NOT NULL OR content_html IS NOT NULL
+        """)
+        while rows := await cursor.fetchmany(500):
+            await conn.executemany("""
+                INSERT OR REPLACE INTO page_contents (page_id, codec, content_text, content_html)
+                VALUES (?, ?, ?, ?)
+            """, [
+                (page_id, codec, compress(text, codec), compress(html, codec))
+                for page_id, text, html in rows
+            ])
+        await cursor.close()
+
+        if sqlite3.sqlite_version_info >= (3, 35, 0):
+            await conn.execute("ALTER TABLE pages DROP COLUMN content_html")
+            await conn.execute("ALTER TABLE pages DROP COLUMN content_text")
+        else:
+            await conn.execute("UPDATE pages SET content_html = NULL, content_text = NULL")
+
     def _ensure_initialized(self) -> None:
         """Ensure database is initialized."""
         if not self._initialized:
@@ -350,7 +465,8 @@ class DatabaseManager:
         embedding_model: str = "mxbai-embed-large",
         chunk_size: int = 1000,
         chunk_overlap: int = 100,
-        metadata: dict[str, Any] | None = None
+        metadata: dict[str, Any] | None = None,
+        content_extraction: ContentExtraction | None = None
     ) -> Project:
         """Create a new project."""
         self._ensure_initialized()
@@ -366,6 +482,7 @@ class DatabaseManager:
             embedding_model=embedding_model,
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
+            content_extraction=content_extraction,
             created_at=now,
             updated_at=now,
             metadata=metadata or {}
@@ -379,6 +496,8 @@ class DatabaseManager:
                 "chunk_size": project.chunk_size,
                 "chunk_overlap": project.chunk_overlap
             }
+            if project.content_extraction is not None:
+                settings["content_extraction"] = project.content_extraction
 
             statistics = {
                 "total_pages": project.total_pages,
@@ -399,6 +518,7 @@ class DatabaseManager:
                 json.dumps(settings), json.dumps(statistics), json.dumps(project.metadata)
             ))
             await self._connection.commit()
+            self._project_names[project.id] = project.name
 
             self.logger.info("Project created", extra={
                 "project_id": project.id,
@@ -612,12 +732,16 @@ class DatabaseManager:
         """Delete project and all associated data."""
         self._ensure_initialized()
 
+        cursor = await self._connection.execute("SELECT name FROM projects WHERE id = ?", (project_id,))
+        row = await cursor.fetchone()
         cursor = await self._connection.execute("DELETE FROM projects WHERE id = ?", (project_id,))
         await self._connection.commit()
+        self._project_names.pop(project_id, None)
 
         deleted = cursor.rowcount > 0
         if deleted:
             self.logger.info("Project deleted", extra={"project_id": project_id})
+            await self._release_chunk_references(row[0])
 
         return deleted
 
@@ -635,11 +759,6 @@ class DatabaseManager:
         """Create a new crawl session."""
         self._ensure_initialized()
 
-        # Get project to find project name
-        project = await self.get_project(project_id)
-        if not project:
-            raise DatabaseError(f"Project {project_id} not found")
-
         session_id = str(uuid.uuid4())
         now = datetime.now(timezone.utc)
 
@@ -656,7 +775,7 @@ class DatabaseManager:
         )
 
         # Use project-specific database connection
-        project_conn = await self._get_project_connection(project.name)
+        project_conn = await self._get_project_connection_by_id(project_id)
         await project_conn.execute("""
             INSERT INTO crawl_sessions (
                 id, project_id, status, crawl_depth, current_depth, user_agent, rate_limit,
@@ -677,7 +796,7 @@ class DatabaseManager:
         self.logger.info("Crawl session created", extra={
             "session_id": session.id,
             "project_id": project_id,
-            "project_name": project.name
+            "project_name": self._project_names[project_id]
         })
 
         return session
@@ -742,6 +861,7 @@ class DatabaseManager:
             embedding_model=settings.get("embedding_model", "mxbai-embed-large"),
             chunk_size=settings.get("chunk_size", 500),
             chunk_overlap=settings.get("chunk_overlap", 50),
+            content_extraction=settings.get("content_extraction"),
             created_at=datetime.fromisoformat(created_at),
             updated_at=datetime.fromisoformat(updated_at),
             last_crawl_at=datetime.fromisoformat(last_crawl_at) if last_crawl_at else None,
@@ -791,21 +911,23 @@ class DatabaseManager:
         """Update crawl session."""
         self._ensure_initialized()
 
-        # Get project to find project name
-        project = await self.get_project(session.project_id)
-        if not project:
-            raise DatabaseError(f"Project {session.project_id} not found")
+        project_conn = await self._get_project_connection_by_id(session.project_id)
+        await project_conn.execute(*self._session_update(session))
+        await project_conn.commit()
 
-        # Use project-specific database connection
-        project_conn = await self._get_project_connection(project.name)
-        await project_conn.execute("""
+        return session
+
+    def _session_update(self, session: CrawlSession) -> tuple[str, tuple]:
+        """UPDATE statement and parameters saving a session's state."""
+        sql = """
             UPDATE crawl_sessions SET
                 status = ?, current_depth = ?, current_url = ?, started_at = ?, completed_at = ?, updated_at = ?,
                 pages_discovered = ?, pages_crawled = ?, pages_failed = ?,
                 pages_skipped = ?, total_size_bytes = ?, queue_size = ?, error_message = ?,
                 error_count = ?, metadata = ?
             WHERE id = ?
-        """, (
+        """
+        params = (
             session.status.value, session.current_depth, session.current_url,
             session.started_at.isoformat() if session.started_at else None,
             session.completed_at.isoformat() if session.completed_at else None,
@@ -813,10 +935,8 @@ class DatabaseManager:
             session.pages_discovered, session.pages_crawled, session.pages_failed,
             session.pages_skipped, session.total_size_bytes, session.queue_size, session.error_message,
             session.error_count, json.dumps(session.metadata), session.id
-        ))
-        await project_conn.commit()
-
-        return session
+        )
+        return sql, params
 
     async def get_project_sessions(
         self,
@@ -827,13 +947,7 @@ class DatabaseManager:
         """Get sessions for a project."""
         self._ensure_initialized()
 
-        # Get project to find project name
-        project = await self.get_project(project_id)
-        if not project:
-            raise DatabaseError(f"Project {project_id} not found")
-
-        # Use project-specific database connection
-        project_conn = await self._get_project_connection(project.name)
+        project_conn = await self._get_project_connection_by_id(project_id)
 
         sql = """
             SELECT id, project_id, status, crawl_depth, current_depth, current_url, user_agent, rate_limit,
@@ -860,13 +974,7 @@ class DatabaseManager:
         """Clean up incomplete crawl sessions and optionally reset pages for fresh crawl."""
         self._ensure_initialized()
 
-        # Get project to find project name
-        project = await self.get_project(project_id)
-        if not project:
-            raise DatabaseError(f"Project {project_id} not found")
-
-        # Use project-specific database connection
-        project_conn = await self._get_project_connection(project.name)
+        project_conn = await self._get_project_connection_by_id(project_id)
 
         # Find incomplete sessions (running, paused, or created)
         incomplete_statuses = [CrawlStatus.RUNNING.value, CrawlStatus.PAUSED.value, CrawlStatus.CREATED.value]
@@ -902,11 +1010,14 @@ class DatabaseManager:
                     UPDATE pages
                     SET status = ?, session_id = NULL,
                         crawled_at = NULL, response_code = NULL, response_time_ms = NULL,
-                        content_html = NULL, content_text = NULL, content_hash = NULL,
-                        outbound_links = NULL, internal_links = NULL, external_links = NULL,
-                        updated_at = ?
+                        content_hash = NULL, outbound_links = NULL, internal_links = NULL,
+                        external_links = NULL, headings = NULL, simhash = NULL, updated_at = ?
                     WHERE project_id = ?
                 """, (PageStatus.DISCOVERED.value, datetime.now(timezone.utc).isoformat(), project_id))
+                await project_conn.execute("""
+                    DELETE FROM page_contents
+                    WHERE page_id IN (SELECT id FROM pages WHERE project_id = ?)
+                """, (project_id,))
 
         await project_conn.commit()
 
@@ -922,6 +1033,98 @@ class DatabaseManager:
             "pages_reset": pages_reset
         }
 
+    # Crawl frontier operations
+
+    async def save_frontier(
+        self,
+        project_id: str,
+        session_id: str,
+        queued: list[tuple[str, int, str | None]],
+        done: list[str]
+    ) -> None:
+        """Record queued and processed frontier URLs in one transaction.
+
+        Args:
+            project_id: Project ID
+            session_id: Crawl session ID
+            queued: (url, depth, parent_url) entries added to the frontier;
+                URLs already recorded keep their first entry
+            done: URLs that have been processed
+        """
+        self._ensure_initialized()
+
+        project_conn = await self._get_project_connection_by_id(project_id)
+        if queued:
+            cursor = await project_conn.execute(
+                "SELECT COALESCE(MAX(seq), 0) FROM crawl_frontier WHERE session_id = ?",
+                (session_id,)
+            )
+            (last_seq,) = await cursor.fetchone()
+            await project_conn.executemany("""
+                INSERT OR IGNORE INTO crawl_frontier (session_id, url, depth, parent_url, status, seq)
+                VALUES (?, ?, ?, ?, 'queued', ?)
+            """, [
+                (session_id, url, depth, parent_url, last_seq + i)
+                for i, (url, depth, parent_url) in enumerate(queued, start=1)
+            ])
+        if done:
+            await project_conn.executemany(
+                "UPDATE crawl_frontier SET status = 'done' WHERE session_id = ? AND url = ?",
+                [(session_id, url) for url in done]
+            )
+        await project_conn.commit()
+
+    async def get_frontier(
+        self, project_id: str, session_id: str
+    ) -> tuple[list[tuple[str, int, str | None]], set[str]]:
+        """Load a session's frontier.
+
+        Args:
+            project_id: Project ID
+            session_id: Crawl session ID
+
+        Returns:
+            Tuple of (queued (url, depth, parent_url) entries in queue order,
+            processed URLs)
+        """
+        self._ensure_initialized()
+
+        project_conn = await self._get_project_connection_by_id(project_id)
+        cursor = await project_conn.execute("""
+            SELECT url, depth, parent_url, status FROM crawl_frontier
+            WHERE session_id = ? ORDER BY seq
+        """, (session_id,))
+
+        queued: list[tuple[str, int, str | None]] = []
+        done: set[str] = set()
+        for url, depth, parent_url, status in await cursor.fetchall():
+            if status == "done":
+                done.add(url)
+            else:
+                queued.append((url, depth, parent_url))
+        return queued, done
+
+    async def clear_frontier(self, project_id: str, session_id: str) -> None:
+        """Delete a session's frontier once it can no longer be resumed."""
+        self._ensure_initialized()
+
+        project_conn = await self._get_project_connection_by_id(project_id)
+        await project_conn.execute(
+            "DELETE FROM crawl_frontier WHERE session_id = ?", (session_id,)
+        )
+        await project_conn.commit()
+
+    async def get_session_content_hashes(self, project_id: str, session_id: str) -> set[str]:
+        """Get the content hashes of the pages a session crawled."""
+        self._ensure_initialized()
+
+        project_conn = await self._get_project_connection_by_id(project_id)
+        cursor = await project_conn.execute("""
+            SELECT DISTINCT content_hash FROM pages
+            WHERE session_id = ? AND content_hash IS NOT NULL
+        """, (session_id,))
+        return {row[0] for row in await cursor.fetchall()}
+
     # Page operations
 
     async def create_page(
@@ -935,11 +1138,6 @@ class DatabaseManager:
         """Create a new page record."""
         self._ensure_initialized()
 
-        # Get project to find project name
-        project = await self.get_project(project_id)
-        if not project:
-            raise DatabaseError(f"Project {project_id} not found")
-
         page_id = str(uuid.uuid4())
         now = datetime.now(timezone.utc)
 
@@ -954,7 +1152,7 @@ class DatabaseManager:
         )
 
         # Use project-specific database connection
-        project_conn = await self._get_project_connection(project.name)
+        project_conn = await self._get_project_connection_by_id(project_id)
         await project_conn.execute("""
             INSERT INTO pages (
                 id, project_id, session_id, url, status, crawl_depth,
@@ -969,22 +1167,21 @@ class DatabaseManager:
 
         return page
 
-    async def get_page(self, page_id: str) -> Page | None:
-        """Get page by ID from any project database."""
+    async def get_page(self, page_id: str, include_content: bool = True) -> Page | None:
+        """Get page by ID from any project database.
+
+        Args:
+            page_id: Page ID
+            include_content: Also load the page's text and HTML
+        """
         self._ensure_initialized()
 
         # First, try to find which project this page belongs to
         # Check all project databases
         for project_name, project_conn in self._project_connections.items():
-            cursor = await project_conn.execute("""
-                SELECT id, project_id, session_id, url, status, title, content_html,
-                       content_text, content_hash, mime_type, charset, language,
-                       size_bytes, crawl_depth, parent_url, response_code,
-                       response_time_ms, discovered_at, crawled_at, processed_at,
-                       indexed_at, error_message, retry_count, max_retries,
-                       outbound_links, internal_links, external_links, metadata
-                FROM pages WHERE id = ?
-            """, (page_id,))
+            cursor = await project_conn.execute(
+                self._page_select(include_content) + " WHERE p.id = ?", (page_id,)
+            )
 
             row = await cursor.fetchone()
             if row:
@@ -996,15 +1193,9 @@ class DatabaseManager:
 
         for project_id, project_name in projects:
             project_conn = await self._get_project_connection(project_name)
-            cursor = await project_conn.execute("""
-                SELECT id, project_id, session_id, url, status, title, content_html,
-                       content_text, content_hash, mime_type, charset, language,
-                       size_bytes, crawl_depth, parent_url, response_code,
-                       response_time_ms, discovered_at, crawled_at, processed_at,
-                       indexed_at, error_message, retry_count, max_retries,
-                       outbound_links, internal_links, external_links, metadata
-                FROM pages WHERE id = ?
-            """, (page_id,))
+            cursor = await project_conn.execute(
+                self._page_select(include_content) + " WHERE p.id = ?", (page_id,)
+            )
 
             row = await cursor.fetchone()
             if row:
@@ -1013,27 +1204,25 @@ class DatabaseManager:
         return None
 
     async def update_page(self, page: Page) -> Page:
-        """Update page record."""
-        self._ensure_initialized()
+        """Update page record.
 
-        # Get project to find project name
-        project = await self.get_project(page.project_id)
-        if not project:
-            raise DatabaseError(f"Project {page.project_id} not found")
+        Stored text and HTML are replaced only when the page carries them,
+        so a page loaded without its content can be updated safely.
+        """
+        self._ensure_initialized()
 
-        # Use project-specific database connection
-        project_conn = await self._get_project_connection(project.name)
+        project_conn = await self._get_project_connection_by_id(page.project_id)
         await project_conn.execute("""
             UPDATE pages SET
-                status = ?, title = ?, content_html = ?, content_text = ?,
-                content_hash = ?, mime_type = ?, charset = ?, language = ?,
-                size_bytes = ?, response_code = ?, response_time_ms = ?,
-                crawled_at = ?, processed_at = ?, indexed_at = ?,
-                error_message = ?, retry_count = ?, outbound_links = ?,
-                internal_links = ?, external_links = ?, metadata = ?
+                status = ?, title = ?, content_hash = ?, mime_type = ?,
+                charset = ?, language = ?, size_bytes = ?, response_code = ?,
+                response_time_ms = ?, crawled_at = ?, processed_at = ?,
+                indexed_at = ?, error_message = ?, retry_count = ?,
+                outbound_links = ?, internal_links = ?, external_links = ?,
+                metadata = ?, etag = ?, last_modified = ?, headings = ?, simhash = ?
             WHERE id = ?
         """, (
-            page.status.value, page.title, page.content_html, page.content_text,
+            PageStatus(page.status).value, page.title,
             page.content_hash, page.mime_type, page.charset, page.language,
             page.size_bytes, page.response_code, page.response_time_ms,
             page.crawled_at.isoformat() if page.crawled_at else None,
@@ -1044,32 +1233,162 @@ class DatabaseManager:
             json.dumps(page.internal_links),
             json.dumps(page.external_links),
             json.dumps(page.metadata),
+            page.etag, page.last_modified,
+            json.dumps(page.headings), page.simhash,
             page.id
         ))
+        await self._save_page_contents(project_conn, [page])
         await project_conn.commit()
 
         return page
 
-    async def get_page_by_url(self, project_id: str, url: str) -> Page | None:
-        """Get page by URL for a specific project."""
+    async def save_crawl_batch(
+        self,
+        project_id: str,
+        pages: list[Page],
+        session: CrawlSession | None = None
+    ) -> None:
+        """Insert or update pages and a session's progress in one transaction.
+
+        Args:
+            project_id: Project the pages belong to
+            pages: Pages to write in their current state (new or existing)
+            session: Crawl session to update along with them
+        """
         self._ensure_initialized()
 
-        # Get project to find project name
-        project = await self.get_project(project_id)
-        if not project:
-            raise DatabaseError(f"Project {project_id} not found")
+        project_conn = await self._get_project_connection_by_id(project_id)
+        if pages:
+            await project_conn.executemany("""
+                INSERT INTO pages (
+                    id, project_id, session_id, url, status, title,
+                    content_hash, mime_type, charset, language,
+                    size_bytes, crawl_depth, parent_url, response_code,
+                    response_time_ms, discovered_at, crawled_at, processed_at,
+                    indexed_at, error_message, retry_count, max_retries,
+                    outbound_links, internal_links, external_links, metadata,
+                    etag, last_modified, headings, simhash
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET
+                    session_id = excluded.session_id, status = excluded.status,
+                    title = excluded.title, content_hash = excluded.content_hash,
+                    mime_type = excluded.mime_type, charset = excluded.charset,
+                    language = excluded.language, size_bytes = excluded.size_bytes,
+                    response_code = excluded.response_code,
+                    response_time_ms = excluded.response_time_ms,
+                    crawled_at = excluded.crawled_at, processed_at = excluded.processed_at,
+                    indexed_at = excluded.indexed_at, error_message = excluded.error_message,
+                    retry_count = excluded.retry_count, outbound_links = excluded.outbound_links,
+                    internal_links = excluded.internal_links,
+                    external_links = excluded.external_links, metadata = excluded.metadata,
+                    etag = excluded.etag, last_modified = excluded.last_modified,
+                    headings = excluded.headings, simhash = excluded.simhash
+            """, [self._page_row(page) for page in pages])
+            await self._save_page_contents(project_conn, pages)
+        if session is not None:
+            await project_conn.execute(*self._session_update(session))
+        await project_conn.commit()
 
-        # Use project-specific database connection
-        project_conn = await self._get_project_connection(project.name)
+    def _page_row(self, page: Page) -> tuple:
+        """Page values in pages table column order."""
+        return (
+            page.id, page.project_id, page.session_id, page.url,
+            PageStatus(page.status).value, page.title,
+            page.content_hash, page.mime_type, page.charset, page.language,
+            page.size_bytes, page.crawl_depth, page.parent_url,
+            page.response_code, page.response_time_ms,
+            page.discovered_at.isoformat(),
+            page.crawled_at.isoformat() if page.crawled_at else None,
+            page.processed_at.isoformat() if page.processed_at else None,
+            page.indexed_at.isoformat() if page.indexed_at else None,
+            page.error_message, page.retry_count, page.max_retries,
+            json.dumps(page.outbound_links),
+            json.dumps(page.internal_links),
+            json.dumps(page.external_links),
+            json.dumps(page.metadata),
+            page.etag, page.last_modified,
+            json.dumps(page.headings), page.simhash
+        )
+
+    async def _save_page_contents(self, conn: aiosqlite.Connection, pages: list[Page]) -> None:
+        """Compress and store the bodies of pages that carry them (no commit)."""
+        codec = default_codec()
+        rows = [
+            (page.id, codec, compress(page.content_text, codec), compress(page.content_html, codec))
+            for page in pages
+            if page.content_text is not None or page.content_html is not None
+        ]
+        if rows:
+            await conn.executemany("""
+                INSERT OR REPLACE INTO page_contents (page_id, codec, content_text, content_html)
+                VALUES (?, ?, ?, ?)
+            """, rows)
+
+    async def get_page_content(
+        self,
+        project_id: str,
+        page_id: str,
+        include_html: bool = False
+    ) -> tuple[str | None, str | None]:
+        """Load one page's stored bodies.
+
+        Args:
+            project_id: Project the page belongs to
+            page_id: Page ID
+            include_html: Also decompress the raw HTML
+
+        Returns:
+            Tuple of (text, HTML); HTML is None unless requested
+        """
+        self._ensure_initialized()
+
+        project_conn = await self._get_project_connection_by_id(project_id)
+        column = "content_html" if include_html else "NULL"
+        cursor = await project_conn.execute(f"""
+            SELECT codec, content_text, {column} FROM page_contents WHERE page_id = ?
+        """, (page_id,))
+        row = await cursor.fetchone()
+        if not row:
+            return None, None
+
+        codec, text, html = row
+        return decompress(text, codec), decompress(html, codec)
+
+    async def get_project_simhashes(self, project_id: str) -> list[tuple[str, str]]:
+        """Get the (url, simhash) pairs of a project's fingerprinted pages.
+
+        Pages skipped as duplicates are left out: they are copies of pages
+        that are already included.
+        """
+        self._ensure_initialized()
+
+        project_conn = await self._get_project_connection_by_id(project_id)
         cursor = await project_conn.execute("""
-            SELECT id, project_id, session_id, url, status, title, content_html,
-                   content_text, content_hash, mime_type, charset, language,
-                   size_bytes, crawl_depth, parent_url, response_code,
-                   response_time_ms, discovered_at, crawled_at, processed_at,
-                   indexed_at, error_message, retry_count, max_retries,
-                   outbound_links, internal_links, external_links, metadata
-            FROM pages WHERE project_id = ? AND url = ?
-        """, (project_id, url))
+            SELECT url, simhash FROM pages
+            WHERE project_id = ? AND simhash IS NOT NULL AND status != ?
+        """, (project_id, PageStatus.SKIPPED.value))
+        return [(url, simhash) for url, simhash in await cursor.fetchall()]
+
+    async def get_page_by_url(
+        self,
+        project_id: str,
+        url: str,
+        include_content: bool = True
+    ) -> Page | None:
+        """Get page by URL for a specific project.
+
+        Args:
+            project_id: Project ID
+            url: Page URL
+            include_content: Also load the page's text and HTML
+        """
+        self._ensure_initialized()
+
+        project_conn = await self._get_project_connection_by_id(project_id)
+        cursor = await project_conn.execute(
+            self._page_select(include_content) + " WHERE p.project_id = ? AND p.url = ?",
+            (project_id, url)
+        )
 
         row = await cursor.fetchone()
         if not row:
@@ -1081,35 +1400,26 @@ class DatabaseManager:
         self,
         project_id: str,
         status: PageStatus | None = None,
-        limit: int | None = None
+        limit: int | None = None,
+        include_content: bool = False
     ) -> list[Page]:
-        """Get pages for a project."""
-        self._ensure_initialized()
+        """Get pages for a project.
 
-        # Get project to find project name
-        project = await self.get_project(project_id)
-        if not project:
-            raise DatabaseError(f"Project {project_id} not found")
+        Bodies are left out by default; load them per page with
+        ``get_page_content`` or pass ``include_content=True``.
+        """
+        self._ensure_initialized()
 
-        # Use project-specific database connection
-        project_conn = await self._get_project_connection(project.name)
+        project_conn = await self._get_project_connection_by_id(project_id)
 
-        sql = """
-            SELECT id, project_id, session_id, url, status, title, content_html,
-                   content_text, content_hash, mime_type, charset, language,
-                   size_bytes, crawl_depth, parent_url, response_code,
-                   response_time_ms, discovered_at, crawled_at, processed_at,
-                   indexed_at, error_message, retry_count, max_retries,
-                   outbound_links, internal_links, external_links, metadata
-            FROM pages WHERE project_id = ?
-        """
+        sql = self._page_select(include_content) + " WHERE p.project_id = ?"
         params = [project_id]
 
         if status:
-            sql += " AND status = ?"
+            sql += " AND p.status = ?"
             params.append(status.value)
 
-        sql += " ORDER BY discovered_at"
+        sql += " ORDER BY p.discovered_at"
 
         if limit:
             sql += " LIMIT ?"
@@ -1120,31 +1430,108 @@ class DatabaseManager:
 
         return [self._page_from_row(row) for row in rows]
 
+    async def iter_project_pages(
+        self,
+        project_id: str,
+        columns: Sequence[str] = ("id", "url", "title", "status"),
+        status: PageStatus | None = None,
+        batch_size: int = 500
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream a project's pages as lightweight records.
+
+        Rows are read in batches ordered by page ID, each batch starting
+        after the last ID of the previous one, so a whole project is walked
+        in constant memory and pages written meanwhile do not shift the
+        batches. Bodies are decompressed only when requested as columns.
+
+        Args:
+            project_id: Project ID
+            columns: Columns to select, from ``PAGE_RECORD_COLUMNS``
+            status: Only pages with this status
+            batch_size: Rows fetched per query
+
+        Yields:
+            Dicts of the requested columns; JSON columns are decoded and
+            timestamps are ISO strings as stored
+
+        Raises:
+            DatabaseError: If a column is unknown
+        """
+        self._ensure_initialized()
+
+        unknown = [column for column in columns if column not in PAGE_RECORD_COLUMNS]
+        if unknown:
+            raise DatabaseError(f"Unknown page columns: {', '.join(unknown)}")
+
+        bodies = [column for column in columns if column in ("content_text", "content_html")]
+        fields = [f"p.{column}" for column in columns if column not in bodies]
+        if bodies:
+            fields += ["c.codec"] + [f"c.{column}" for column in bodies]
+        # The ID is the pagination key even when not requested
+        sql = f"SELECT p.id, {', '.join(fields)} FROM pages p"
+        if bodies:
+            sql += f" {_CONTENT_JOIN}"
+        sql += " WHERE p.project_id = ? AND p.id > ?"
+        if status:
+            sql += " AND p.status = ?"
+        sql += " ORDER BY p.id LIMIT ?"
+        names = [column for column in columns if column not in bodies]
+
+        project_conn = await self._get_project_connection_by_id(project_id)
+        last_id = ""
+        while True:
+            params = [project_id, last_id]
+            if status:
+                params.append(status.value)
+            params.append(batch_size)
+
+            cursor = await project_conn.execute(sql, params)
+            rows = await cursor.fetchall()
+            for row in rows:
+                record = dict(zip(names, row[1:len(names) + 1], strict=True))
+                for column in _JSON_PAGE_COLUMNS.intersection(record):
+                    record[column] = json.loads(record[column]) if record[column] else None
+                if bodies:
+                    codec, *data = row[len(names) + 1:]
+                    for column, value in zip(bodies, data, strict=True):
+                        record[column] = decompress(value, codec)
+                yield {column: record[column] for column in columns}
+
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1][0]
+
     async def get_pages_by_hash(self, content_hash: str) -> list[Page]:
         """Get pages with matching content hash."""
         self._ensure_initialized()
 
-        cursor = await self._connection.execute("""
-            SELECT id, project_id, session_id, url, status, title, content_html,
-                   content_text, content_hash, mime_type, charset, language,
-                   size_bytes, crawl_depth, parent_url, response_code,
-                   response_time_ms, discovered_at, crawled_at, processed_at,
-                   indexed_at, error_message, retry_count, max_retries,
-                   outbound_links, internal_links, external_links, metadata
-            FROM pages WHERE content_hash = ?
-        """, (content_hash,))
+        cursor = await self._connection.execute(
+            self._page_select(False) + " WHERE p.content_hash = ?", (content_hash,)
+        )
 
         rows = await cursor.fetchall()
         return [self._page_from_row(row) for row in rows]
 
+    def _page_select(self, include_content: bool) -> str:
+        """SELECT over pages, joined with the bodies when requested."""
+        if include_content:
+            return f"SELECT {_PAGE_COLUMNS}, {_CONTENT_COLUMNS} FROM pages p {_CONTENT_JOIN}"
+        return f"SELECT {_PAGE_COLUMNS} FROM pages p"
+
     def _page_from_row(self, row: tuple) -> Page:
-        """Create Page from database row."""
-        (id, project_id, session_id, url, status, title, content_html,
-         content_text, content_hash, mime_type, charset, language,
+        """Create Page from database row, with bodies if they were selected."""
+        (id, project_id, session_id, url, status, title,
+         content_hash, mime_type, charset, language,
          size_bytes, crawl_depth, parent_url, response_code,
          response_time_ms, discovered_at, crawled_at, processed_at,
          indexed_at, error_message, retry_count, max_retries,
-         outbound_links, internal_links, external_links, metadata) = row
+         outbound_links, internal_links, external_links, metadata,
+         etag, last_modified, headings, simhash) = row[:30]
+
+        content_text = content_html = None
+        if len(row) > 30:
+            codec, text, html = row[30:]
+            content_text, content_html = decompress(text, codec), decompress(html, codec)
 
         return Page(
             id=id,
@@ -1174,7 +1561,11 @@ class DatabaseManager:
             outbound_links=json.loads(outbound_links) if outbound_links else [],
             internal_links=json.loads(internal_links) if internal_links else [],
             external_links=json.loads(external_links) if external_links else [],
-            metadata=json.loads(metadata) if metadata else {}
+            metadata=json.loads(metadata) if metadata else {},
+            etag=etag,
+            last_modified=last_modified,
+            headings=[tuple(heading) for heading in json.loads(headings)] if headings else [],
+            simhash=simhash
         )
 
     # Statistics and utility operations
@@ -1504,8 +1895,26 @@ class DatabaseManager:
         await self._connection.commit()
 
         self.logger.info("Deleted box", extra={"box_id": box_id})
+        await self._release_chunk_references(box['name'])
         return True
 
+    async def _release_chunk_references(self, collection: str) -> None:
+        """Drop a deleted collection's entries from the shared chunk store."""
+        try:
+            released = await release_collection(chunk_store_path(self.config.data_dir), collection)
+        except Exception as e:
+            # Leftover references only cost a fresh embedding when reused
+            self.logger.warning("Could not release shared chunk references", extra={
+                "collection": collection,
+                "error": str(e)
+            })
+            return
+        if released:
+            self.logger.info("Released shared chunk references", extra={
+                "collection": collection,
+                "references_deleted": released
+            })
+
     # Shelf-Box relationship operations
 
     async def add_box_to_shelf(self, shelf_id: str, box_id: str, position: int = None) -> bool:
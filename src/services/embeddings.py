@@ -39,6 +39,9 @@ class EmbeddingService:
         # Model information
         self.model_info = {}
 
+        # Batch endpoint (/api/embed) support, disabled on first 404
+        self._batch_endpoint_supported = True
+
     async def initialize(self) -> None:
         """Initialize embedding service and verify models."""
         if self._initialized:
@@ -283,35 +286,44 @@ class EmbeddingService:
         batch_size: int = 10,
         use_cache: bool = True
     ) -> list[list[float]]:
-        """Create embeddings for multiple texts."""
+        """Create embeddings for multiple texts.
+
+        Cached texts are served from the LRU cache; the remaining texts are
+        sent to Ollama's batch endpoint (``/api/embed``) in groups of
+        ``batch_size``. Servers without the batch endpoint fall back to
+        concurrent single-text requests.
+        """
         self._ensure_initialized()
 
         if not texts:
             return []
 
+        # Same check create_embedding makes per text; previously it failed
+        # mid-run after earlier batches were embedded, now before any request
+        if any(not text.strip() for text in texts):
+            raise EmbeddingError("Empty text provided for embedding")
+
         model = model or self.config.embedding_model
-        embeddings = []
+        embeddings: list[list[float] | None] = [None] * len(texts)
 
-        # Process in batches to avoid overwhelming the service
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            batch_tasks = []
+        # Resolve cache hits first, deduplicating the misses
+        pending: dict[str, list[int]] = {}
+        for index, text in enumerate(texts):
+            if use_cache:
+                cache_key = self._get_cache_key(text, model)
+                if cache_key in self._cache:
+                    self._cache_hits += 1
+                    self._cache.move_to_end(cache_key)
+                    embeddings[index] = self._cache[cache_key]
+                    continue
+            pending.setdefault(text, []).append(index)
 
-            for text in batch:
-                task = self.create_embedding(text, model, use_cache)
-                batch_tasks.append(task)
+        missing = list(pending)
+        for i in range(0, len(missing), batch_size):
+            batch = missing[i:i + batch_size]
 
-            # Process batch concurrently
             try:
-                batch_embeddings = await asyncio.gather(*batch_tasks)
-                embeddings.extend(batch_embeddings)
-
-                self.logger.debug("Batch embeddings created", extra={
-                    "batch_size": len(batch),
-                    "total_processed": len(embeddings),
-                    "total_texts": len(texts)
-                })
-
+                batch_embeddings = await self._embed_batch(batch, model)
             except Exception as e:
                 self.logger.error("Failed to create batch embeddings", extra={
                     "batch_start": i,
@@ -320,14 +332,67 @@ class EmbeddingService:
                 })
                 raise
 
+            for text, embedding in zip(batch, batch_embeddings, strict=True):
+                if use_cache:
+                    self._cache_embedding(self._get_cache_key(text, model), embedding)
+                for index in pending[text]:
+                    embeddings[index] = embedding
+
+            self.logger.debug("Batch embeddings created", extra={
+                "batch_size": len(batch),
+                "total_processed": i + len(batch),
+                "total_texts": len(missing)
+            })
+
         self.logger.info("All embeddings created", extra={
             "total_texts": len(texts),
             "total_embeddings": len(embeddings),
+            "embedded": len(missing),
             "model": model
         })
 
         return embeddings
 
+    async def _embed_batch(self, texts: list[str], model: str) -> list[list[float]]:
+        """Embed a batch of texts with a single Ollama request."""
+        if self._batch_endpoint_supported:
+            try:
+                response = await self._client.post(
+                    f"{self.config.ollama_url}/api/embed",
+                    json={"model": model, "input": texts},
+                    timeout=httpx.Timeout(120.0)
+                )
+            except httpx.RequestError as e:
+                raise EmbeddingError(f"Network error creating embeddings: {e}") from e
+
+            if response.status_code == 404 and "model" not in response.text.lower():
+                # Older Ollama releases only expose /api/embeddings
+                self._batch_endpoint_supported = False
+                self.logger.info("Batch embedding endpoint unavailable, using single requests")
+            elif response.status_code != 200:
+                raise EmbeddingError(
+                    f"Batch embedding request failed: {response.status_code} - {response.text}"
+                )
+            else:
+                batch_embeddings = response.json().get("embeddings") or []
+                if len(batch_embeddings) != len(texts):
+                    raise EmbeddingError(
+                        f"Expected {len(texts)} embeddings from Ollama, got {len(batch_embeddings)}"
+                    )
+                self._cache_misses += len(texts)
+                return batch_embeddings
+
+        return await asyncio.gather(*[
+            self.create_embedding(text, model, use_cache=False) for text in texts
+        ])
+
+    def _cache_embedding(self, cache_key: str, embedding: list[float]) -> None:
+        """Store an embedding in the LRU cache, evicting the oldest entry if full."""
+        if len(self._cache) >= self._cache_max_size:
+            self._cache.popitem(last=False)
+            self._cache_evictions += 1
+        self._cache[cache_key] = embedding
+
     async def get_embedding_dimension(self, model: str | None = None) -> int:
         """Get embedding dimension for a model."""
         self._ensure_initialized()
@@ -30,7 +30,7 @@ from src.services.decision_handler import (
 from src.services.embeddings import EmbeddingService
 from src.services.installation_start import InstallationStartService
 from src.services.installation_status import InstallationStatusService
-from src.logic.rag.core.search_service import RAGSearchService
+from src.logic.rag.core.search_service import RAGError, RAGSearchService
 from src.services.service_endpoints import create_service_endpoints_router
 from src.services.vector_store_factory import VectorStoreFactory
 
@@ -90,6 +90,8 @@ class MCPServer:
 
     async def cleanup_services(self) -> None:
         """Clean up all backend services."""
+        if self.rag_service:
+            await self.rag_service.cleanup()
         if self.embedding_service:
             await self.embedding_service.cleanup()
         if self.vector_store:
@@ -242,7 +244,8 @@ class MCPServer:
             try:
                 # Extract parameters
                 query = search_request.get("query")
-                if not query:
+                cursor = search_request.get("cursor")
+                if not query and not cursor:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail="Query parameter is required"
@@ -251,43 +254,63 @@ class MCPServer:
                 projects = search_request.get("projects", [])
                 limit = min(search_request.get("limit", 10), 100)
                 strategy = search_request.get("strategy", "semantic")
+                explain = bool(search_request.get("explain", False))
+                deadline_ms = search_request.get("deadline_ms")
+                diversify = bool(search_request.get("diversify", False))
+                paginate = bool(search_request.get("paginate", False))
 
-                # Perform search
-                if projects:
-                    # Search specific projects
-                    results = await self.rag_service.search_multi_project(
-                        query=query,
-                        project_names=projects,
-                        limit=limit,
-                        strategy=strategy
-                    )
+                if cursor:
+                    # Next page from the candidates kept by the first search
+                    try:
+                        # Without a limit, pages keep the original search limit
+                        response = self.rag_service.fetch_page(
+                            cursor, limit if "limit" in search_request else None
+                        )
+                    except RAGError as e:
+                        raise HTTPException(
+                            status_code=status.HTTP_410_GONE,
+                            detail=str(e)
+                        ) from e
                 else:
-                    # Search all projects
-                    all_projects = await self.db_manager.list_projects()
-                    project_names = [p.name for p in all_projects]
-                    results = await self.rag_service.search_multi_project(
+                    if not projects:
+                        # Search all projects
+                        all_projects = await self.db_manager.list_projects()
+                        projects = [p.name for p in all_projects]
+
+                    # Perform search
+                    response = await self.rag_service.search_multi_project(
                         query=query,
-                        project_names=project_names,
+                        project_names=projects,
                         limit=limit,
-                        strategy=strategy
+                        strategy=strategy,
+                        deadline_ms=deadline_ms,
+                        explain=explain,
+                        diversify=diversify,
+                        paginate=paginate,
                     )
 
                 # Format response
-                return {
+                result = {
                     "query": query,
                     "results": [
                         {
-                            "id": r.get("id"),
-                            "url": r.get("url"),
-                            "title": r.get("title"),
-                            "content": r.get("content", "")[:500],  # Limit content length
-                            "score": r.get("score"),
-                            "project": r.get("project")
+                            "id": r.id,
+                            "url": r.url,
+                            "title": r.title,
+                            "content": r.content[:500],  # Limit content length
+                            "score": r.score,
+                            "project": r.project
                         }
-                        for r in results
+                        for r in response.results
                     ],
-                    "total": len(results)
+                    "total": len(response.results),
+                    "partial": response.partial,
+                    "exceeded_stage": response.exceeded_stage,
+                    "next_cursor": response.next_cursor,
                 }
+                if explain:
+                    result["explain"] = response.explain
+                return result
 
             except HTTPException:
                 raise
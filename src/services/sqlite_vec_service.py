@@ -83,6 +83,9 @@ class SQLiteVecService:
         self.connections: dict[str, aiosqlite.Connection] = {}
         self.initialized = False
 
+        # Collections known to have the parent_id metadata index
+        self._parent_indexed: set[str] = set()
+
         # Create SQLite-vec configuration
         self.vec_config = SQLiteVecConfiguration(
             enabled=True,
@@ -231,6 +234,10 @@ class SQLiteVecService:
         await conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_documents_page_url ON documents(page_url)"
         )
+        await conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_documents_parent_id "
+            "ON documents(json_extract(metadata, '$.parent_id'))"
+        )
 
         await conn.commit()
         logger.info(f"Created collection: {name} with {vector_size} dimensions")
@@ -245,88 +252,124 @@ class SQLiteVecService:
         """Insert or update a document with its embedding."""
         conn = await self._get_connection(collection)
 
+        # Start transaction
+        await conn.execute("BEGIN TRANSACTION")
+
+        try:
+            await self._write_document(conn, doc_id, embedding, metadata)
+            await conn.execute("COMMIT")
+        except Exception:
+            await conn.execute("ROLLBACK")
+            raise
+
+    async def _write_document(
+        self,
+        conn: aiosqlite.Connection,
+        doc_id: str,
+        embedding: list[float],
+        metadata: dict[str, Any],
+    ) -> None:
+        """Write one document row and its vector inside the caller's transaction."""
         # Convert embedding to JSON string for vec0
         embedding_str = json.dumps(embedding)
 
         # Convert metadata to JSON
         metadata_str = json.dumps(metadata)
 
-        # Start transaction
-        await conn.execute("BEGIN TRANSACTION")
+        # Check if document exists
+        cursor = await conn.execute(
+            "SELECT rowid FROM documents WHERE doc_id = ?", (doc_id,)
+        )
+        existing = await cursor.fetchone()
 
-        try:
-            # Check if document exists
+        if existing:
+            # Update existing document
+            rowid = existing[0]
+
+            # Update metadata
+            await conn.execute(
+                """
+                UPDATE documents SET
+                    chunk_index = ?,
+                    page_url = ?,
+                    metadata = ?,
+                    created_at = datetime('now')
+                WHERE rowid = ?
+                """,
+                (
+                    metadata.get("chunk_index", 0),
+                    metadata.get("page_url", ""),
+                    metadata_str,
+                    rowid,
+                ),
+            )
+
+            # Update vector (delete and re-insert with same rowid)
+            await conn.execute(
+                "DELETE FROM vectors WHERE rowid = ?", (rowid,)
+            )
+            await conn.execute(
+                "INSERT INTO vectors (rowid, content_embedding) VALUES (?, ?)",
+                (rowid, embedding_str),
+            )
+        else:
+            # Insert new document - first metadata
             cursor = await conn.execute(
-                "SELECT rowid FROM documents WHERE doc_id = ?", (doc_id,)
+                """
+                INSERT INTO documents (doc_id, chunk_index, page_url, metadata)
+                VALUES (?, ?, ?, ?)
+                """,
+                (
+                    doc_id,
+                    metadata.get("chunk_index", 0),
+                    metadata.get("page_url", ""),
+                    metadata_str,
+                ),
             )
-            existing = await cursor.fetchone()
-
-            if existing:
-                # Update existing document
-                rowid = existing[0]
-
-                # Update metadata
-                await conn.execute(
-                    """
-                    UPDATE documents SET
-                        chunk_index = ?,
-                        page_url = ?,
-                        metadata = ?,
-                        created_at = datetime('now')
-                    WHERE rowid = ?
-                    """,
-                    (
-                        metadata.get("chunk_index", 0),
-                        metadata.get("page_url", ""),
-                        metadata_str,
-                        rowid,
-                    ),
-                )
-
-                # Update vector (delete and re-insert with same rowid)
-                await conn.execute(
-                    "DELETE FROM vectors WHERE rowid = ?", (rowid,)
-                )
-                await conn.execute(
-                    "INSERT INTO vectors (rowid, content_embedding) VALUES (?, ?)",
-                    (rowid, embedding_str),
-                )
-            else:
-                # Insert new document - first metadata
-                cursor = await conn.execute(
-                    """
-                    INSERT INTO documents (doc_id, chunk_index, page_url, metadata)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (
-                        doc_id,
-                        metadata.get("chunk_index", 0),
-                        metadata.get("page_url", ""),
-                        metadata_str,
-                    ),
-                )
-                rowid = cursor.lastrowid
-
-                # Insert vector with the same rowid
-                await conn.execute(
-                    "INSERT INTO vectors (rowid, content_embedding) VALUES (?, ?)",
-                    (rowid, embedding_str),
-                )
+            rowid = cursor.lastrowid
 
-            await conn.execute("COMMIT")
-        except Exception:
-            await conn.execute("ROLLBACK")
-            raise
+            # Insert vector with the same rowid
+            await conn.execute(
+                "INSERT INTO vectors (rowid, content_embedding) VALUES (?, ?)",
+                (rowid, embedding_str),
+            )
 
     async def search(
-        self, collection: str, query_embedding: list[float], limit: int = 10
+        self,
+        collection: str | None = None,
+        query_embedding: list[float] | None = None,
+        limit: int = 10,
+        score_threshold: float | None = None,
+        filter_conditions: dict[str, Any] | None = None,
+        with_vectors: bool = False,
+        collection_name: str | None = None,
     ) -> list[dict[str, Any]]:
-        """Search for similar documents."""
+        """Search for similar documents.
+
+        Accepts the same keyword arguments as ``VectorStoreService.search``
+        (``collection_name`` is an alias for ``collection``). Metadata filters
+        are applied to the ``limit`` nearest neighbours, so filtered searches
+        may return fewer hits.
+
+        Returns:
+            Hits with ``id`` (and legacy ``doc_id``), ``score`` and
+            ``metadata``; plus ``embedding`` when ``with_vectors`` is set
+        """
+        collection = collection or collection_name
         conn = await self._get_connection(collection)
 
         # Convert query embedding to JSON
         query_str = json.dumps(query_embedding)
 
+        vector_column = (
+            ", vec_to_json(v.content_embedding)" if with_vectors else ""
+        )
+        conditions = ""
+        params: list[Any] = [query_str]
+        for key, value in (filter_conditions or {}).items():
+            conditions += " AND json_extract(d.metadata, ?) = ?"
+            params.extend([f"$.{key}", value])
+
         # Perform KNN search with join to get metadata
         # Note: vec0 requires k parameter in WHERE clause for KNN queries
         cursor = await conn.execute(
@@ -334,28 +377,32 @@ class SQLiteVecService:
             SELECT
                 d.doc_id,
                 v.distance,
-                d.metadata
+                d.metadata{vector_column}
             FROM vectors v
             JOIN documents d ON v.rowid = d.rowid
-            WHERE v.content_embedding MATCH ? AND k = {int(limit)}
+            WHERE v.content_embedding MATCH ? AND k = {int(limit)}{conditions}
             ORDER BY v.distance
             """,
-            (query_str,),
+            params,
         )
 
         results = []
         async for row in cursor:
-            doc_id, distance, metadata_str = row
+            doc_id, distance, metadata_str = row[:3]
             # Convert distance to similarity score (1 - normalized_distance)
             score = max(0.0, 1.0 - (distance / 2.0))  # Assuming cosine distance
+            if score_threshold is not None and score < score_threshold:
+                continue
 
-            results.append(
-                {
-                    "doc_id": doc_id,
-                    "score": score,
-                    "metadata": json.loads(metadata_str) if metadata_str else {},
-                }
-            )
+            result = {
+                "id": doc_id,
+                "doc_id": doc_id,
+                "score": score,
+                "metadata": json.loads(metadata_str) if metadata_str else {},
+            }
+            if with_vectors:
+                result["embedding"] = json.loads(row[3])
+            results.append(result)
 
         return results
 
@@ -473,17 +520,26 @@ class SQLiteVecService:
         documents: list[dict[str, Any]],
         batch_size: int = 100
     ) -> int:
-        """Upsert multiple documents with batching."""
+        """Upsert multiple documents, committing one transaction per batch."""
+        conn = await self._get_connection(collection_name)
         upserted_count = 0
         try:
-            for doc in documents:
-                await self.upsert_document(
-                    collection_name,
-                    doc["id"],
-                    doc["embedding"],
-                    doc.get("metadata", {})
-                )
-                upserted_count += 1
+            for i in range(0, len(documents), batch_size):
+                batch = documents[i:i + batch_size]
+                await conn.execute("BEGIN TRANSACTION")
+                try:
+                    for doc in batch:
+                        await self._write_document(
+                            conn,
+                            doc["id"],
+                            doc["embedding"],
+                            doc.get("metadata", {})
+                        )
+                    await conn.execute("COMMIT")
+                except Exception:
+                    await conn.execute("ROLLBACK")
+                    raise
+                upserted_count += len(batch)
         except Exception as e:
             logger.error(f"Failed to upsert documents: {e}")
             raise
@@ -499,7 +555,7 @@ class SQLiteVecService:
             conn = await self._get_connection(collection_name)
             cursor = await conn.execute(
                 """
-                SELECT v.content_embedding, d.metadata
+                SELECT vec_to_json(v.content_embedding), d.metadata
                 FROM documents d
                 JOIN vectors v ON v.rowid = d.rowid
                 WHERE d.doc_id = ?
@@ -518,6 +574,33 @@ class SQLiteVecService:
             logger.error(f"Failed to get document {document_id}: {e}")
         return None
 
+    async def get_chunk_fingerprints(
+        self,
+        collection_name: str,
+        parent_id: str
+    ) -> dict[str, str | None]:
+        """Get stored content hashes for all chunks of a parent document."""
+        conn = await self._get_connection(collection_name)
+
+        if collection_name not in self._parent_indexed:
+            # Collections created before incremental indexing lack the index
+            await conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_documents_parent_id "
+                "ON documents(json_extract(metadata, '$.parent_id'))"
+            )
+            await conn.commit()
+            self._parent_indexed.add(collection_name)
+
+        cursor = await conn.execute(
+            """
+            SELECT doc_id, json_extract(metadata, '$.content_hash')
+            FROM documents
+            WHERE json_extract(metadata, '$.parent_id') = ?
+            """,
+            (parent_id,)
+        )
+        return {doc_id: content_hash async for doc_id, content_hash in cursor}
+
     async def delete_documents(
         self,
         collection_name: str,
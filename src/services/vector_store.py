@@ -124,6 +124,10 @@ class VectorStoreService:
                 )
             )
 
+            # Index parent_id so incremental re-indexing can look up a
+            # document's stored chunks without a full scan
+            await self.create_index(collection_name, "parent_id")
+
             self.logger.info("Collection created", extra={
                 "collection_name": collection_name,
                 "vector_size": vector_size,
@@ -342,9 +346,13 @@ class VectorStoreService:
         query_embedding: list[float],
         limit: int = 10,
         score_threshold: float | None = None,
-        filter_conditions: dict[str, Any] | None = None
+        filter_conditions: dict[str, Any] | None = None,
+        with_vectors: bool = False
     ) -> list[dict[str, Any]]:
-        """Search for similar documents."""
+        """Search for similar documents.
+
+        With ``with_vectors`` each hit also carries its stored ``embedding``.
+        """
         self._ensure_initialized()
 
         try:
@@ -372,6 +380,8 @@ class VectorStoreService:
                 search_kwargs["query_filter"] = query_filter
             if score_threshold is not None:
                 search_kwargs["score_threshold"] = score_threshold
+            if with_vectors:
+                search_kwargs["with_vectors"] = True
 
             search_result = await asyncio.get_event_loop().run_in_executor(
                 None,
@@ -386,6 +396,8 @@ class VectorStoreService:
                     "score": point.score,
                     "metadata": point.payload or {}
                 }
+                if with_vectors:
+                    result["embedding"] = point.vector
                 results.append(result)
 
             self.logger.debug("Search completed", extra={
@@ -413,12 +425,12 @@ class VectorStoreService:
         self._ensure_initialized()
 
         try:
-            # Retrieve point
+            # Retrieve point with its vector (reused for shared chunks)
             points = await asyncio.get_event_loop().run_in_executor(
                 None,
-                self._client.retrieve,
-                collection_name,
-                [document_id]
+                lambda: self._client.retrieve(
+                    collection_name, [document_id], with_vectors=True
+                )
             )
 
             if not points:
@@ -450,10 +462,11 @@ class VectorStoreService:
         try:
             await asyncio.get_event_loop().run_in_executor(
                 None,
-                self._client.delete,
-                collection_name,
-                points_selector=qdrant_models.PointIdsList(
-                    points=[document_id]
+                lambda: self._client.delete(
+                    collection_name,
+                    points_selector=qdrant_models.PointIdsList(
+                        points=[document_id]
+                    )
                 )
             )
 
@@ -483,10 +496,11 @@ class VectorStoreService:
         try:
             await asyncio.get_event_loop().run_in_executor(
                 None,
-                self._client.delete,
-                collection_name,
-                points_selector=qdrant_models.PointIdsList(
-                    points=document_ids
+                lambda: self._client.delete(
+                    collection_name,
+                    points_selector=qdrant_models.PointIdsList(
+                        points=document_ids
+                    )
                 )
             )
 
@@ -505,6 +519,55 @@ class VectorStoreService:
             })
             return 0
 
+    async def get_chunk_fingerprints(
+        self,
+        collection_name: str,
+        parent_id: str
+    ) -> dict[str, str | None]:
+        """Get stored content hashes for all chunks of a parent document.
+
+        Returns:
+            Mapping of chunk ID to its ``content_hash`` payload (None if absent)
+        """
+        self._ensure_initialized()
+
+        scroll_filter = qdrant_models.Filter(
+            must=[
+                qdrant_models.FieldCondition(
+                    key="parent_id",
+                    match=qdrant_models.MatchValue(value=parent_id)
+                )
+            ]
+        )
+
+        try:
+            fingerprints: dict[str, str | None] = {}
+            offset = None
+            while True:
+                points, offset = await asyncio.get_event_loop().run_in_executor(
+                    None,
+                    lambda offset=offset: self._client.scroll(
+                        collection_name=collection_name,
+                        scroll_filter=scroll_filter,
+                        limit=256,
+                        offset=offset,
+                        with_payload=["content_hash"],
+                        with_vectors=False
+                    )
+                )
+                for point in points:
+                    fingerprints[str(point.id)] = (point.payload or {}).get("content_hash")
+                if offset is None:
+                    return fingerprints
+
+        except Exception as e:
+            self.logger.error("Failed to get chunk fingerprints", extra={
+                "collection_name": collection_name,
+                "parent_id": parent_id,
+                "error": str(e)
+            })
+            raise VectorStoreError(f"Failed to get chunk fingerprints from {collection_name}: {e}") from e
+
     # Collection statistics and information
 
     async def get_collection_info(self, collection_name: str) -> dict[str, Any]:
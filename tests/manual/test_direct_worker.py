@@ -5,6 +5,8 @@ import asyncio
 import logging
 from src.services.database import DatabaseManager
 from src.logic.crawler.core.crawler import DocumentationCrawler
+from src.logic.crawler.core.frontier import CrawlFrontier
+from src.logic.crawler.core.page_buffer import PageBuffer
 from src.lib.config import DocBroConfig
 
 logging.basicConfig(level=logging.DEBUG)
@@ -42,8 +44,12 @@ async def test_worker():
         crawler._stop_requested = False
         crawler._visited_urls.clear()
         crawler._content_hashes.clear()
-        crawler._domain_last_access.clear()
+        crawler._scheduler.clear()
         crawler._robots_cache.clear()
+        crawler._page_buffer = PageBuffer(db_manager, project.id)
+        crawler._frontier = CrawlFrontier(
+            db_manager, project.id, session.id, before_flush=crawler._page_buffer.flush
+        )
 
         # Create queue and add URL
         crawler._crawl_queue = asyncio.Queue()
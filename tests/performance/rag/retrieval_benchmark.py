@@ -0,0 +1,528 @@
+"""Retrieval benchmark: ingest rate, QPS, latency percentiles and recall@k.
+
+Generates a synthetic corpus with a deterministic feature-hashing embedder,
+ingests it into each vector store provider and runs every search strategy
+through RAGSearchService. Recall@k is measured against exact brute-force
+cosine search over the same vectors. Results are written as JSON, and a
+previous results file can be passed as a baseline to flag regressions.
+
+Usage:
+    python -m tests.performance.rag.retrieval_benchmark \\
+        --sizes 10000 100000 1000000 --providers sqlite_vec qdrant \\
+        --output bench.json --baseline previous.json
+
+Providers that cannot start (missing sqlite-vec extension, no Qdrant
+server) are reported as skipped. The ``exact`` provider is an in-memory
+brute-force store that needs neither; it checks the harness itself and
+shows how much time the real stores add.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import platform
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+
+from src.core.config import DocBroConfig
+from src.models.vector_store_types import VectorStoreProvider
+
+# src.services must load before src.logic.rag to avoid a circular import
+from src.services.vector_store_factory import VectorStoreFactory  # isort: skip
+from src.logic.rag.core.search_service import RAGSearchService  # isort: skip
+from src.logic.rag.models.strategy_config import SearchStrategy  # isort: skip
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+DEFAULT_PROVIDERS = [provider.value for provider in VectorStoreProvider]
+EXACT_PROVIDER = "exact"
+
+_ID_NAMESPACE = uuid.UUID("5d0c3f7a-2b8e-4c61-9f3d-7a1e6b2c8d40")
+
+
+class HashingEmbedder:
+    """Deterministic bag-of-words embedder.
+
+    Each token maps to a fixed pseudo-random vector seeded by its hash, and a
+    text embeds to the normalized sum of its token vectors. Texts sharing
+    words land close together, so nearest-neighbour structure is realistic
+    enough for recall measurements, and no model server is needed.
+    Implements the parts of EmbeddingService the search service uses.
+    """
+
+    def __init__(self, dimension: int = 64):
+        self.dimension = dimension
+        self.config = SimpleNamespace(embedding_model=f"hashing-{dimension}")
+        self._token_vectors: dict[str, np.ndarray] = {}
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed text as a unit float32 vector."""
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        for token in text.lower().split():
+            token_vector = self._token_vectors.get(token)
+            if token_vector is None:
+                seed = int.from_bytes(
+                    hashlib.blake2b(token.encode(), digest_size=8).digest(), "big"
+                )
+                token_vector = (
+                    np.random.default_rng(seed)
+                    .standard_normal(self.dimension)
+                    .astype(np.float32)
+                )
+                self._token_vectors[token] = token_vector
+            vector += token_vector
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    async def create_embedding(
+        self, text: str, model: str | None = None, use_cache: bool = True
+    ) -> list[float]:
+        return self.embed(text).tolist()
+
+    async def create_embeddings(
+        self,
+        texts: list[str],
+        model: str | None = None,
+        batch_size: int = 10,
+        use_cache: bool = True,
+    ) -> list[list[float]]:
+        return [self.embed(text).tolist() for text in texts]
+
+
+class ExactVectorStore:
+    """In-memory brute-force vector store (recall 1.0 by construction)."""
+
+    def __init__(self):
+        self._collections: dict[str, dict[str, Any]] = {}
+
+    async def initialize(self) -> None:
+        pass
+
+    async def cleanup(self) -> None:
+        self._collections.clear()
+
+    async def create_collection(self, name: str, vector_size: int = 64) -> None:
+        self._collections[name] = {
+            "ids": [], "metadata": [], "blocks": [], "matrix": None,
+        }
+
+    async def collection_exists(self, collection_name: str) -> bool:
+        return collection_name in self._collections
+
+    async def delete_collection(self, collection_name: str) -> bool:
+        return self._collections.pop(collection_name, None) is not None
+
+    async def upsert_documents(
+        self, collection_name: str, documents: list[dict[str, Any]], batch_size: int = 100
+    ) -> int:
+        collection = self._collections[collection_name]
+        collection["ids"].extend(doc["id"] for doc in documents)
+        collection["metadata"].extend(doc.get("metadata", {}) for doc in documents)
+        collection["blocks"].append(
+            np.asarray([doc["embedding"] for doc in documents], dtype=np.float32)
+        )
+        collection["matrix"] = None
+        return len(documents)
+
+    async def search(
+        self,
+        collection_name: str,
+        query_embedding: list[float],
+        limit: int = 10,
+        score_threshold: float | None = None,
+        filter_conditions: dict[str, Any] | None = None,
+        with_vectors: bool = False,
+    ) -> list[dict[str, Any]]:
+        collection = self._collections[collection_name]
+        if collection["matrix"] is None:
+            collection["matrix"] = np.concatenate(collection["blocks"])
+            collection["blocks"] = [collection["matrix"]]
+        query = np.asarray(query_embedding, dtype=np.float32)
+        scores = collection["matrix"] @ query
+        top = _top_k(scores, limit)
+        results = []
+        for index in top:
+            score = float(max(0.0, min(1.0, scores[index])))
+            if score_threshold is not None and score < score_threshold:
+                continue
+            result = {
+                "id": collection["ids"][index],
+                "score": score,
+                "metadata": collection["metadata"][index],
+            }
+            if with_vectors:
+                result["embedding"] = collection["matrix"][index].tolist()
+            results.append(result)
+        return results
+
+
+def generate_corpus(
+    size: int,
+    seed: int = 0,
+    topics: int = 200,
+    topic_words: int = 100,
+    shared_words: int = 5000,
+    words_per_chunk: int = 24,
+    topic_share: float = 0.6,
+) -> tuple[list[str], np.ndarray]:
+    """Generate synthetic chunk texts.
+
+    Each chunk draws most of its words from one topic's vocabulary and the
+    rest from a shared vocabulary, giving clustered embeddings.
+
+    Returns:
+        Chunk texts and the topic of each chunk
+    """
+    rng = np.random.default_rng(seed)
+    chunk_topics = rng.integers(0, topics, size)
+    from_topic = rng.random((size, words_per_chunk)) < topic_share
+    topic_word = rng.integers(0, topic_words, (size, words_per_chunk))
+    shared_word = rng.integers(0, shared_words, (size, words_per_chunk))
+
+    texts = []
+    for i in range(size):
+        words = [
+            f"t{chunk_topics[i]}w{topic_word[i, j]}" if from_topic[i, j]
+            else f"s{shared_word[i, j]}"
+            for j in range(words_per_chunk)
+        ]
+        texts.append(" ".join(words))
+    return texts, chunk_topics
+
+
+def generate_queries(
+    texts: list[str], count: int, seed: int = 1, words: int = 6
+) -> list[str]:
+    """Build queries from random word subsets of random chunks."""
+    rng = np.random.default_rng(seed)
+    queries = []
+    for index in rng.choice(len(texts), size=min(count, len(texts)), replace=False):
+        chunk_words = texts[index].split()
+        picked = rng.choice(len(chunk_words), size=min(words, len(chunk_words)), replace=False)
+        queries.append(" ".join(chunk_words[i] for i in sorted(picked)))
+    return queries
+
+
+def exact_neighbours(
+    corpus_vectors: np.ndarray, query_vectors: np.ndarray, k: int, block: int = 256
+) -> list[list[int]]:
+    """Exact cosine top-k for each query (vectors are unit length)."""
+    neighbours = []
+    for start in range(0, len(query_vectors), block):
+        scores = query_vectors[start:start + block] @ corpus_vectors.T
+        neighbours.extend(_top_k(row, k).tolist() for row in scores)
+    return neighbours
+
+
+def percentile(sorted_values: list[float], quantile: float) -> float:
+    """Nearest-rank percentile of pre-sorted values."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(int(len(sorted_values) * quantile), len(sorted_values) - 1)]
+
+
+async def open_store(provider: str, data_dir: Path) -> Any:
+    """Create and initialize the vector store for a provider."""
+    if provider == EXACT_PROVIDER:
+        store = ExactVectorStore()
+    else:
+        config = DocBroConfig(data_dir=data_dir)
+        store = VectorStoreFactory.create_vector_store(
+            config, VectorStoreProvider(provider)
+        )
+    await store.initialize()
+    return store
+
+
+async def ingest(
+    store: Any,
+    collection: str,
+    texts: list[str],
+    chunk_topics: np.ndarray,
+    embedder: HashingEmbedder,
+    batch_size: int = 1000,
+) -> tuple[dict[str, float], list[str], np.ndarray]:
+    """Embed and upsert the corpus.
+
+    Returns:
+        Ingest stats, chunk ids and the corpus vectors (for ground truth)
+    """
+    ids = [str(uuid.uuid5(_ID_NAMESPACE, f"chunk:{i}")) for i in range(len(texts))]
+    vectors = np.zeros((len(texts), embedder.dimension), dtype=np.float32)
+
+    start = time.perf_counter()
+    for offset in range(0, len(texts), batch_size):
+        batch = texts[offset:offset + batch_size]
+        embeddings = await embedder.create_embeddings(batch)
+        vectors[offset:offset + len(batch)] = embeddings
+        await store.upsert_documents(
+            collection,
+            [
+                {
+                    "id": ids[offset + i],
+                    "embedding": embedding,
+                    "metadata": {
+                        "content": text,
+                        "title": f"Topic {chunk_topics[offset + i]}",
+                        "url": f"https://bench.local/{offset + i}",
+                        "project": collection,
+                        "chunk_index": offset + i,
+                        "parent_id": ids[offset + i],
+                    },
+                }
+                for i, (text, embedding) in enumerate(zip(batch, embeddings, strict=True))
+            ],
+        )
+    seconds = time.perf_counter() - start
+
+    return (
+        {
+            "chunks": len(texts),
+            "seconds": round(seconds, 3),
+            "chunks_per_second": round(len(texts) / seconds, 1) if seconds else 0.0,
+        },
+        ids,
+        vectors,
+    )
+
+
+async def measure_strategy(
+    service: RAGSearchService,
+    collection: str,
+    queries: list[str],
+    truth: list[set[str]],
+    strategy: SearchStrategy,
+    k: int,
+    concurrency: int,
+) -> dict[str, float]:
+    """Measure latency, throughput and recall@k for one strategy."""
+    latencies = []
+    recalls = []
+    for query, expected in zip(queries, truth, strict=True):
+        start = time.perf_counter()
+        results = await service.search(query, collection, limit=k, strategy=strategy)
+        latencies.append((time.perf_counter() - start) * 1000)
+        recalls.append(len({r.id for r in results} & expected) / k)
+
+    # Throughput under concurrent load, without the query cache
+    service.clear_cache()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(query: str) -> None:
+        async with semaphore:
+            await service.search(query, collection, limit=k, strategy=strategy)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run(query) for query in queries))
+    wall = time.perf_counter() - start
+    service.clear_cache()
+
+    latencies.sort()
+    return {
+        "queries": len(queries),
+        "qps": round(len(queries) / wall, 1) if wall else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "recall_at_k": round(sum(recalls) / len(recalls), 4) if recalls else 0.0,
+    }
+
+
+async def run_benchmark(
+    sizes: list[int] | None = None,
+    providers: list[str] | None = None,
+    strategies: list[SearchStrategy] | None = None,
+    query_count: int = 200,
+    k: int = 10,
+    dimension: int = 64,
+    concurrency: int = 8,
+    seed: int = 0,
+    data_dir: Path | None = None,
+) -> dict[str, Any]:
+    """Run the benchmark matrix and return JSON-serializable results."""
+    sizes = sizes or DEFAULT_SIZES
+    providers = providers or DEFAULT_PROVIDERS
+    strategies = strategies or list(SearchStrategy)
+    embedder = HashingEmbedder(dimension)
+
+    report: dict[str, Any] = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "dimension": dimension,
+            "k": k,
+            "queries": query_count,
+            "concurrency": concurrency,
+        },
+        "results": [],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = data_dir or Path(tmp)
+        for size in sizes:
+            texts, chunk_topics = generate_corpus(size, seed=seed)
+            queries = generate_queries(texts, query_count, seed=seed + 1)
+            query_vectors = np.stack([embedder.embed(query) for query in queries])
+
+            for provider in providers:
+                entry: dict[str, Any] = {"provider": provider, "size": size}
+                report["results"].append(entry)
+                collection = f"bench_{size}"
+                try:
+                    store = await open_store(provider, base_dir / provider)
+                except Exception as e:
+                    entry.update(status="skipped", reason=str(e))
+                    continue
+
+                try:
+                    await store.create_collection(collection, vector_size=dimension)
+                    entry["ingest"], ids, vectors = await ingest(
+                        store, collection, texts, chunk_topics, embedder
+                    )
+                    truth = [
+                        {ids[i] for i in row}
+                        for row in exact_neighbours(vectors, query_vectors, k)
+                    ]
+
+                    service = RAGSearchService(
+                        vector_store=store, embedding_service=embedder
+                    )
+                    entry["strategies"] = {}
+                    for strategy in strategies:
+                        entry["strategies"][strategy.value] = await measure_strategy(
+                            service, collection, queries, truth, strategy, k, concurrency
+                        )
+                    entry["status"] = "ok"
+                except Exception as e:
+                    entry.update(status="error", reason=str(e))
+                finally:
+                    try:
+                        await store.delete_collection(collection)
+                    finally:
+                        await store.cleanup()
+
+    return report
+
+
+def compare_reports(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    latency_tolerance: float = 0.25,
+    throughput_tolerance: float = 0.25,
+    recall_tolerance: float = 0.01,
+) -> list[str]:
+    """List regressions of ``current`` against ``baseline``.
+
+    Only (provider, size, strategy) cells present and successful in both
+    reports are compared.
+    """
+
+    def cells(report: dict[str, Any]) -> dict[tuple, dict[str, Any]]:
+        found = {}
+        for entry in report.get("results", []):
+            if entry.get("status") != "ok":
+                continue
+            found[(entry["provider"], entry["size"], "ingest")] = entry["ingest"]
+            for strategy, stats in entry.get("strategies", {}).items():
+                found[(entry["provider"], entry["size"], strategy)] = stats
+        return found
+
+    before = cells(baseline)
+    after = cells(current)
+    regressions = []
+    for key in sorted(before.keys() & after.keys(), key=str):
+        old, new = before[key], after[key]
+        label = "/".join(str(part) for part in key)
+        if "chunks_per_second" in old:
+            checks = [("chunks_per_second", throughput_tolerance, True)]
+        else:
+            checks = [
+                ("qps", throughput_tolerance, True),
+                ("p50_ms", latency_tolerance, False),
+                ("p95_ms", latency_tolerance, False),
+                ("p99_ms", latency_tolerance, False),
+            ]
+            if new["recall_at_k"] < old["recall_at_k"] - recall_tolerance:
+                regressions.append(
+                    f"{label}: recall_at_k {old['recall_at_k']} -> {new['recall_at_k']}"
+                )
+        for metric, tolerance, higher_is_better in checks:
+            if not old[metric]:
+                continue
+            change = (new[metric] - old[metric]) / old[metric]
+            if (higher_is_better and change < -tolerance) or (
+                not higher_is_better and change > tolerance
+            ):
+                regressions.append(f"{label}: {metric} {old[metric]} -> {new[metric]}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--providers", nargs="+", default=DEFAULT_PROVIDERS,
+        choices=DEFAULT_PROVIDERS + [EXACT_PROVIDER],
+    )
+    parser.add_argument(
+        "--strategies", nargs="+", default=[s.value for s in SearchStrategy],
+        choices=[s.value for s in SearchStrategy],
+    )
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--dimension", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write JSON results here")
+    parser.add_argument("--baseline", type=Path, help="Previous results to compare against")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(
+        run_benchmark(
+            sizes=args.sizes,
+            providers=args.providers,
+            strategies=[SearchStrategy(s) for s in args.strategies],
+            query_count=args.queries,
+            k=args.k,
+            dimension=args.dimension,
+            concurrency=args.concurrency,
+            seed=args.seed,
+        )
+    )
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output)
+    else:
+        print(output)
+
+    if args.baseline:
+        regressions = compare_reports(json.loads(args.baseline.read_text()), report)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first."""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.zeros(0, dtype=int)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top], kind="stable")]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Smoke run of the retrieval benchmark harness on a small corpus.
+
+The full matrix (10k/100k/1M chunks, every provider) is run from the command
+line: ``python -m tests.performance.rag.retrieval_benchmark``.
+"""
+
+import copy
+import json
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from tests.performance.rag.retrieval_benchmark import (  # noqa: E402
+    HashingEmbedder,
+    compare_reports,
+    generate_corpus,
+    run_benchmark,
+)
+
+
+def test_embedder_is_deterministic():
+    """Embeddings depend only on the text."""
+    first = HashingEmbedder(32).embed("docker networking guide")
+    second = HashingEmbedder(32).embed("docker networking guide")
+
+    assert first.tolist() == second.tolist()
+    assert generate_corpus(50, seed=3)[0] == generate_corpus(50, seed=3)[0]
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_benchmark_reports_every_strategy():
+    """The exact provider yields full semantic recall and JSON output."""
+    report = await run_benchmark(
+        sizes=[2000], providers=["exact"], query_count=20, k=5
+    )
+
+    entry = report["results"][0]
+    assert entry["status"] == "ok"
+    assert entry["ingest"]["chunks_per_second"] > 0
+    assert set(entry["strategies"]) == {"semantic", "hybrid", "advanced", "fusion"}
+    assert entry["strategies"]["semantic"]["recall_at_k"] == 1.0
+    for stats in entry["strategies"].values():
+        assert stats["qps"] > 0
+        assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
+    json.dumps(report)
+
+
+def test_compare_flags_regressions():
+    """Recall drops and latency increases beyond tolerance are reported."""
+    baseline = {
+        "results": [
+            {
+                "provider": "exact",
+                "size": 1000,
+                "status": "ok",
+                "ingest": {"chunks_per_second": 1000.0},
+                "strategies": {
+                    "semantic": {
+                        "qps": 100.0, "p50_ms": 1.0, "p95_ms": 2.0,
+                        "p99_ms": 3.0, "recall_at_k": 0.95,
+                    }
+                },
+            }
+        ]
+    }
+    current = copy.deepcopy(baseline)
+    semantic = current["results"][0]["strategies"]["semantic"]
+    semantic["recall_at_k"] = 0.90
+    semantic["p95_ms"] = 4.0
+
+    assert compare_reports(baseline, baseline) == []
+    regressions = compare_reports(baseline, current)
+    assert any("recall_at_k" in r for r in regressions)
+    assert any("p95_ms" in r for r in regressions)
+    assert len(regressions) == 2
@@ -0,0 +1,112 @@
+"""Unit tests for batch reranking."""
+
+import pytest
+
+from src.logic.rag.core import reranking_service as reranking_module
+from src.logic.rag.core.reranking_service import RerankingService
+from src.logic.rag.models.search_result import SearchResult
+from src.logic.rag.models.strategy_config import RerankWeights
+from src.logic.rag.utils.terms import term_set
+
+
+def make_results(count: int = 20) -> list[SearchResult]:
+    """Create candidates with varying scores, content and titles."""
+    topics = ["docker networking", "kubernetes pods", "docker volumes", "python typing"]
+    return [
+        SearchResult(
+            id=f"r{i}",
+            url=f"https://example.com/{i}",
+            title=topics[i % 4].title(),
+            content=f"Guide to {topics[(i * 3) % 4]} with examples number {i}",
+            score=round(0.4 + (i % 7) * 0.08, 2),
+            project="docs",
+            match_type="semantic",
+        )
+        for i in range(count)
+    ]
+
+
+def reference_order(query: str, results: list[SearchResult]) -> list[tuple[str, float]]:
+    """Score candidates one at a time with the original per-result formula."""
+    weights = RerankWeights()
+    query_terms = set(query.lower().split())
+    scored = []
+    for result in results:
+        term_overlap = len(query_terms & set(result.content.lower().split()))
+        title_match = len(query_terms & set(result.title.lower().split()))
+        score = (
+            result.score * weights.vector_score
+            + term_overlap / len(query_terms) * weights.term_overlap
+            + title_match / len(query_terms) * weights.title_match
+            + 0.5 * weights.freshness
+        )
+        scored.append((result.id, score))
+    scored.sort(key=lambda item: item[1], reverse=True)
+    return scored
+
+
+class TestBatchRerank:
+    """Test the batch rerank path against per-result scoring."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("numpy_available", [True, False])
+    async def test_matches_per_result_scoring(self, monkeypatch, numpy_available):
+        """Batch scores and order match scoring each result on its own."""
+        if numpy_available and not reranking_module.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(reranking_module, "NUMPY_AVAILABLE", numpy_available)
+        query = "docker networking"
+        expected = reference_order(query, make_results())
+
+        reranked = await RerankingService().rerank(query, make_results())
+
+        assert [r.id for r in reranked] == [doc_id for doc_id, _ in expected]
+        for result, (_, score) in zip(reranked, expected, strict=True):
+            assert result.rerank_score == pytest.approx(score)
+
+    @pytest.mark.asyncio
+    async def test_hand_checked_scores(self):
+        """Scores of a small candidate set match hand-computed values."""
+        results = make_results(2)
+        # r0: "Docker Networking" / "Guide to docker networking ..." / 0.4
+        # r1: "Kubernetes Pods" / "Guide to python typing ..." / 0.48
+        reranked = await RerankingService().rerank("docker networking", results)
+
+        weights = RerankWeights()
+        assert [r.id for r in reranked] == ["r0", "r1"]
+        assert reranked[0].rerank_score == pytest.approx(
+            0.4 * weights.vector_score
+            + weights.term_overlap
+            + weights.title_match
+            + 0.5 * weights.freshness
+        )
+        assert reranked[1].rerank_score == pytest.approx(
+            0.48 * weights.vector_score + 0.5 * weights.freshness
+        )
+
+    @pytest.mark.asyncio
+    async def test_signals_only_when_requested(self):
+        """Signal dicts are skipped unless explain output needs them."""
+        reranked = await RerankingService().rerank(
+            "docker", make_results(4), include_signals=False
+        )
+
+        assert all(r.rerank_signals is None for r in reranked)
+        assert all(r.rerank_score is not None for r in reranked)
+
+    @pytest.mark.asyncio
+    async def test_uses_stored_term_sets(self):
+        """Pre-tokenized content terms take precedence over re-tokenizing."""
+        result = make_results(1)[0]
+        result.content_terms = term_set("kubernetes scheduling")
+
+        reranked = await RerankingService().rerank("kubernetes", [result])
+
+        assert reranked[0].rerank_signals["term_overlap"] == 1.0
+
+    def test_content_terms_not_serialized(self):
+        """Stored term sets stay out of API responses."""
+        result = make_results(1)[0]
+        result.content_terms = term_set("a b")
+
+        assert "content_terms" not in result.model_dump()
@@ -0,0 +1,86 @@
+"""Unit tests for process-pool chunking."""
+
+import pytest
+
+from src.logic.rag.core.chunking_executor import ChunkingExecutor
+from src.logic.rag.core.chunking_service import ChunkingService
+from src.logic.rag.models.document import Document
+from src.logic.rag.models.strategy_config import ChunkStrategy, IndexingConfig
+
+
+def make_documents(count: int) -> list[Document]:
+    """Create HTML documents with headings."""
+    return [
+        Document(
+            id=f"doc-{i}",
+            content=f"<h1>Guide {i}</h1><h2>Networking</h2>"
+            + f"Containers {i} talk over bridge networks. " * 60,
+            title=f"Guide {i}",
+            url=f"https://example.com/{i}",
+            project="docs",
+        )
+        for i in range(count)
+    ]
+
+
+def pooled_config(**overrides) -> IndexingConfig:
+    """Config that always sends windows to two worker processes."""
+    return IndexingConfig(
+        chunk_workers=2, chunk_task_size=2, parallel_chunking_min_chars=0, **overrides
+    )
+
+
+class TestChunkingExecutor:
+    """Test chunking across worker processes."""
+
+    @pytest.mark.asyncio
+    async def test_pool_matches_in_process_chunking(self):
+        """Worker processes produce the same chunks, in document order."""
+        documents = make_documents(5)
+        executor = ChunkingExecutor(ChunkingService(), pooled_config())
+        try:
+            pooled = await executor.chunk_documents(
+                documents, ChunkStrategy.CHARACTER, 500, 50
+            )
+        finally:
+            executor.close()
+
+        service = ChunkingService()
+        for document, chunks in zip(documents, pooled, strict=True):
+            expected = await service.chunk_document(
+                document, ChunkStrategy.CHARACTER, 500, 50
+            )
+            assert [c.id for c in chunks] == [c.id for c in expected]
+            assert [c.content for c in chunks] == [c.content for c in expected]
+            assert chunks[0].context_header == expected[0].context_header
+
+    @pytest.mark.asyncio
+    async def test_failed_documents_are_reported_per_document(self):
+        """A bad document yields its error without failing the window."""
+        documents = make_documents(3)
+        documents[1].content = "   "
+        executor = ChunkingExecutor(ChunkingService(), pooled_config())
+        try:
+            outcomes = await executor.chunk_documents(
+                documents, ChunkStrategy.CHARACTER, 500, 50
+            )
+        finally:
+            executor.close()
+
+        assert isinstance(outcomes[1], ValueError)
+        assert outcomes[0] and outcomes[2]
+
+    def test_small_and_semantic_windows_stay_in_process(self):
+        """The pool is skipped where it cannot help."""
+        documents = make_documents(4)
+        executor = ChunkingExecutor(
+            ChunkingService(), IndexingConfig(chunk_workers=4)
+        )
+
+        assert not executor._use_pool(documents, ChunkStrategy.CHARACTER)
+        assert not ChunkingExecutor(ChunkingService(), pooled_config())._use_pool(
+            documents, ChunkStrategy.SEMANTIC
+        )
+        assert ChunkingExecutor(ChunkingService(), pooled_config())._use_pool(
+            documents, ChunkStrategy.CHARACTER
+        )
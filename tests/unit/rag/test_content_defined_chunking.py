@@ -0,0 +1,122 @@
+"""Unit tests for content-defined chunking."""
+
+import random
+
+import pytest
+
+from src.logic.rag.core.chunking_service import ChunkingService
+from src.logic.rag.models.document import Document
+from src.logic.rag.models.strategy_config import ChunkStrategy
+from src.logic.rag.strategies.content_defined_chunker import ContentDefinedChunker
+
+WORDS = (
+    "docker container image volume network build compose service port "
+    "layer cache registry tag push pull run exec logs"
+).split()
+
+
+def make_paragraphs(count: int, seed: int = 7) -> list[str]:
+    """Generate deterministic pseudo-prose paragraphs."""
+    rnd = random.Random(seed)
+
+    def sentence() -> str:
+        words = [rnd.choice(WORDS) for _ in range(rnd.randint(5, 25))]
+        return " ".join(words).capitalize() + "."
+
+    return [
+        " ".join(sentence() for _ in range(rnd.randint(2, 6))) for _ in range(count)
+    ]
+
+
+def chunk(content: str, chunk_size: int = 1000):
+    """Chunk content as a single document."""
+    return ContentDefinedChunker().chunk_document(
+        Document(id="doc-1", content=content), chunk_size
+    )
+
+
+class TestContentDefinedChunker:
+    """Test boundary stability and size bounds."""
+
+    def test_chunks_respect_size_bounds(self):
+        """Chunks never exceed chunk_size and only the last may be short."""
+        chunks = chunk("\n\n".join(make_paragraphs(60)), chunk_size=800)
+
+        assert len(chunks) > 5
+        assert all(len(c.content) <= 800 for c in chunks)
+        assert all(len(c.content) >= 200 for c in chunks[:-1])
+        assert [c.chunk_index for c in chunks] == list(range(len(chunks)))
+
+    def test_insertion_only_invalidates_nearby_chunks(self):
+        """Inserting a paragraph near the top keeps later chunk ids stable."""
+        paragraphs = make_paragraphs(60)
+        original = chunk("\n\n".join(paragraphs))
+        edited = chunk(
+            "\n\n".join(
+                paragraphs[:3]
+                + ["A brand new paragraph inserted near the top of the page."]
+                + paragraphs[3:]
+            )
+        )
+
+        original_ids = {c.id for c in original}
+        edited_ids = {c.id for c in edited}
+        assert len(original_ids - edited_ids) <= 2
+        assert original[-1].id == edited[-1].id
+
+    def test_boundaries_resync_in_single_line_text(self):
+        """Crawled text without paragraph breaks still re-synchronises."""
+        paragraphs = make_paragraphs(60)
+        text = " ".join(paragraphs)
+        edited = text.replace(paragraphs[2], paragraphs[2] + " Extra sentence added.")
+
+        original_ids = {c.id for c in chunk(text)}
+        edited_ids = {c.id for c in chunk(edited)}
+
+        assert len(original_ids - edited_ids) <= 2
+
+    def test_headings_start_new_chunks(self):
+        """A heading begins a new chunk once the current one reaches min size."""
+        paragraphs = make_paragraphs(30)
+        for index in (5, 12, 20):
+            paragraphs[index] = f"## Section {index}"
+
+        chunks = chunk("\n\n".join(paragraphs), chunk_size=1000)
+
+        for index in (5, 12, 20):
+            heading = f"## Section {index}"
+            (owner,) = [c for c in chunks if heading in c.content]
+            assert owner.content.index(heading) < 250
+
+    def test_duplicate_chunks_get_distinct_ids(self):
+        """Repeated text within a document does not collide."""
+        paragraph = "The same boilerplate paragraph repeats on this page. " * 8
+        chunks = chunk("\n\n".join([paragraph] * 4), chunk_size=500)
+
+        assert len({c.id for c in chunks}) == len(chunks)
+
+
+class TestContentDefinedStrategy:
+    """Test ChunkingService integration."""
+
+    @pytest.mark.asyncio
+    async def test_chunking_service_dispatch(self):
+        """CONTENT_DEFINED strategy yields deterministic, headered chunks."""
+        service = ChunkingService()
+        document = Document(
+            id="doc-1",
+            content="\n\n".join(make_paragraphs(20)),
+            title="Guide",
+            project="docs",
+        )
+
+        first = await service.chunk_document(
+            document, ChunkStrategy.CONTENT_DEFINED, chunk_size=1000
+        )
+        second = await service.chunk_document(
+            document, ChunkStrategy.CONTENT_DEFINED, chunk_size=1000
+        )
+
+        assert [c.id for c in first] == [c.id for c in second]
+        assert all(c.chunk_strategy == "content_defined" for c in first)
+        assert all(c.context_header for c in first)
@@ -0,0 +1,150 @@
+"""Unit tests for the title/heading index fast path."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.config import DocBroConfig
+from src.logic.rag.core.search_service import RAGSearchService
+from src.logic.rag.strategies.heading_index import HeadingIndex, normalize_heading
+from src.logic.rag.utils.contextual_headers import parse_header_sections
+
+
+def make_index(path=None) -> HeadingIndex:
+    """Create an index over two small documents."""
+    index = HeadingIndex(path)
+    index.add("hooks-0", "React Hooks", "Document: React Hooks | Section: useEffect", 0)
+    index.add("hooks-1", "React Hooks", "Document: React Hooks | Section: useEffect > Cleanup", 1)
+    index.add("config-0", "Configuration", "Document: Configuration | Section: Config.from_env()", 0)
+    return index
+
+
+class TestHeadingIndex:
+    """Test heading index lookups and persistence."""
+
+    def test_parse_header_sections(self):
+        """Section paths are split into individual headings."""
+        header = "Document: Guide | Section: Install > Linux | Topics: apt"
+
+        assert parse_header_sections(header) == ["Install", "Linux"]
+        assert parse_header_sections(None) == []
+        assert normalize_heading("  Config.from_env() ") == "config.from_env"
+
+    def test_exact_match_in_document_order(self):
+        """An exact title match returns its chunks ordered by position."""
+        match = make_index().lookup("react hooks")
+
+        assert match.exact == ["hooks-0", "hooks-1"]
+
+    def test_prefix_match_confidence(self):
+        """Headings the query prefixes are returned with partial confidence."""
+        match = make_index().lookup("Config")
+
+        assert match.exact == []
+        assert set(match.prefix) == {"config-0"}
+        assert 0 < match.prefix["config-0"] < 1
+
+    def test_remove_drops_chunks(self):
+        """Removed chunks no longer match."""
+        index = make_index()
+        index.remove(["hooks-1"])
+
+        assert index.lookup("useeffect").exact == ["hooks-0"]
+        assert index.lookup("cleanup").exact == []
+
+    def test_save_and_load(self, tmp_path):
+        """A saved index loads back with the same entries."""
+        path = tmp_path / "docs.json"
+        make_index(path).save()
+
+        loaded = HeadingIndex.load(path)
+
+        assert len(loaded) == 3
+        assert loaded.lookup("Config.from_env").exact == ["config-0"]
+
+    def test_service_reloads_index_written_elsewhere(self, tmp_path):
+        """A re-index by another process replaces the cached index."""
+        service = RAGSearchService(
+            vector_store=MagicMock(),
+            embedding_service=MagicMock(),
+            config=DocBroConfig(data_dir=tmp_path),
+        )
+        assert len(service._heading_index("docs")) == 0
+
+        # Another process (e.g. the CLI) writes the collection's index
+        make_index(service._heading_index_path("docs")).save()
+
+        cached = service._heading_index("docs")
+        assert cached.lookup("react hooks").exact == ["hooks-0", "hooks-1"]
+        assert service._heading_index("docs") is cached
+
+
+class TestSearchHeadingFastPath:
+    """Test the heading lookup stage in RAGSearchService."""
+
+    def make_service(self, tmp_path):
+        """Create a search service with a populated heading index."""
+        chunks = {
+            "hooks-0": {"content": "useEffect runs after render", "title": "React Hooks"},
+            "hooks-1": {"content": "Return a cleanup function", "title": "React Hooks"},
+            "config-0": {"content": "Read settings from env", "title": "Configuration"},
+        }
+        embedding_service = MagicMock()
+
+        async def create_embedding(text):
+            return [0.1, 0.2]
+
+        async def get_document(collection_name, document_id):
+            return {"id": document_id, "embedding": [0.1, 0.2], "metadata": chunks[document_id]}
+
+        async def search(collection_name, query_embedding, limit, score_threshold,
+                         filter_conditions):
+            return [
+                {"id": "hooks-0", "score": 0.80, "metadata": chunks["hooks-0"]},
+                {"id": "config-0", "score": 0.75, "metadata": chunks["config-0"]},
+            ]
+
+        embedding_service.create_embedding = MagicMock(side_effect=create_embedding)
+        vector_store = MagicMock()
+        vector_store.get_document = get_document
+        vector_store.search = search
+        service = RAGSearchService(
+            vector_store=vector_store,
+            embedding_service=embedding_service,
+            config=DocBroConfig(data_dir=tmp_path),
+        )
+        service._heading_indexes["docs"] = make_index()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_exact_heading_skips_embedding(self, tmp_path):
+        """An exact heading query is answered without embedding the query."""
+        service = self.make_service(tmp_path)
+
+        response = await service.search_detailed("Cleanup", "docs", explain=True)
+
+        assert [r.id for r in response.results] == ["hooks-1"]
+        assert response.results[0].match_type == "heading"
+        service.embedding_service.create_embedding.assert_not_called()
+        assert "heading_lookup" in response.explain["stage_totals_ms"]
+
+    @pytest.mark.asyncio
+    async def test_exact_heading_respects_score_threshold(self, tmp_path):
+        """Heading hits below the threshold fall back to the normal search."""
+        service = self.make_service(tmp_path)
+
+        results = await service.search("Cleanup", "docs", score_threshold=1.5)
+
+        assert all(r.match_type != "heading" for r in results)
+        service.embedding_service.create_embedding.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_prefix_match_boosts_semantic_results(self, tmp_path):
+        """Results under a prefixed heading move up in the semantic ranking."""
+        service = self.make_service(tmp_path)
+
+        results = await service.search("config", "docs")
+
+        assert [r.id for r in results] == ["config-0", "hooks-0"]
+        assert results[0].match_type == "semantic"
+        service.embedding_service.create_embedding.assert_called_once()
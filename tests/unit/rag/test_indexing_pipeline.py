@@ -0,0 +1,473 @@
+"""Unit tests for the streaming indexing pipeline."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from src.core.config import DocBroConfig
+from src.logic.crawler.utils.boilerplate import BoilerplateDetector
+from src.logic.rag.core.chunking_service import ChunkingService
+from src.logic.rag.core.indexing_pipeline import IndexingPipeline
+from src.logic.rag.core.search_service import RAGError, RAGSearchService
+from src.logic.rag.models.document import Document
+from src.logic.rag.models.strategy_config import ChunkStrategy, IndexingConfig
+from src.services.chunk_store import ChunkStore, chunk_store_path, release_collection
+
+
+def make_documents(count: int) -> list[Document]:
+    """Create documents that each produce several chunks."""
+    return [
+        Document(
+            id=f"doc-{i}",
+            content=f"Document {i} explains container networking in detail. " * 40,
+            title=f"Doc {i}",
+            url=f"https://example.com/{i}",
+            project="test-project",
+        )
+        for i in range(count)
+    ]
+
+
+def make_embedding_service(model: str = "test-model") -> MagicMock:
+    """Embedding service returning one vector per text."""
+    service = MagicMock()
+    service.config.embedding_model = model
+    service.create_embeddings = AsyncMock(
+        side_effect=lambda texts, batch_size=10: [[0.1, 0.2, 0.3] for _ in texts]
+    )
+    service.create_embedding = AsyncMock(return_value=[0.1, 0.2, 0.3])
+    return service
+
+
+class InMemoryVectorStore:
+    """Vector store keeping documents in a dict and recording upsert batches."""
+
+    def __init__(self):
+        self.documents: dict[str, dict] = {}
+        self.batches: list[list[dict]] = []
+        self.collection_exists = AsyncMock(return_value=True)
+        self.create_collection = AsyncMock()
+
+    async def upsert_documents(self, collection_name, documents):
+        self.batches.append(list(documents))
+        for doc in documents:
+            self.documents[doc["id"]] = doc
+        return len(documents)
+
+    async def get_chunk_fingerprints(self, collection_name, parent_id):
+        return {
+            doc_id: doc["metadata"].get("content_hash")
+            for doc_id, doc in self.documents.items()
+            if doc["metadata"]["parent_id"] == parent_id
+        }
+
+    async def delete_documents(self, collection_name, document_ids):
+        for doc_id in document_ids:
+            self.documents.pop(doc_id, None)
+        return len(document_ids)
+
+    async def get_document(self, collection_name, document_id):
+        return self.documents.get(document_id)
+
+
+def make_vector_store() -> InMemoryVectorStore:
+    """Create an empty in-memory vector store."""
+    return InMemoryVectorStore()
+
+
+class TestIndexingPipeline:
+    """Test chunk/embed/upsert pipeline behavior."""
+
+    @pytest.mark.asyncio
+    async def test_indexes_all_chunks_in_batches(self):
+        """Every chunk is embedded in batches and committed in upsert batches."""
+        embedding_service = make_embedding_service()
+        store = make_vector_store()
+        config = IndexingConfig(
+            queue_size=4, embed_batch_size=3, embed_concurrency=2, upsert_batch_size=5
+        )
+        pipeline = IndexingPipeline(
+            ChunkingService(), embedding_service, store, config
+        )
+
+        stats = await pipeline.run("docs", make_documents(6), chunk_size=500)
+
+        upserted_ids = [doc["id"] for batch in store.batches for doc in batch]
+        assert stats.documents_total == 6
+        assert stats.chunks_total == len(upserted_ids) == stats.chunks_indexed
+        assert len(set(upserted_ids)) == len(upserted_ids)
+        assert all(len(batch) <= 5 for batch in store.batches)
+        assert stats.upsert_batches == len(store.batches)
+        for call in embedding_service.create_embeddings.await_args_list:
+            assert len(call.args[0]) <= 3
+
+    @pytest.mark.asyncio
+    async def test_accepts_async_iterables(self):
+        """Documents can be streamed from an async generator."""
+
+        async def stream():
+            for document in make_documents(3):
+                yield document
+
+        pipeline = IndexingPipeline(
+            ChunkingService(), make_embedding_service(), make_vector_store()
+        )
+        stats = await pipeline.run("docs", stream(), chunk_size=500)
+
+        assert stats.documents_total == 3
+        assert stats.chunks_indexed == stats.chunks_total > 0
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_falls_back_to_single_chunks(self):
+        """A failed batch is retried per chunk and only bad chunks are skipped."""
+        embedding_service = make_embedding_service()
+        embedding_service.create_embeddings.side_effect = RuntimeError("batch down")
+        embedding_service.create_embedding.side_effect = [
+            RuntimeError("bad chunk")
+        ] + [[0.1, 0.2, 0.3]] * 100
+        pipeline = IndexingPipeline(
+            ChunkingService(),
+            embedding_service,
+            make_vector_store(),
+            IndexingConfig(embed_concurrency=1),
+        )
+
+        stats = await pipeline.run("docs", make_documents(1), chunk_size=500)
+
+        assert stats.chunks_failed == 1
+        assert stats.chunks_indexed == stats.chunks_total - 1
+
+    @pytest.mark.asyncio
+    async def test_upsert_failure_keeps_committed_batches(self):
+        """Batches committed before a store failure are reported as indexed."""
+        store = make_vector_store()
+        calls = 0
+
+        async def flaky_upsert(collection_name, documents):
+            nonlocal calls
+            calls += 1
+            if calls > 1:
+                raise RuntimeError("disk full")
+            return len(documents)
+
+        store.upsert_documents = flaky_upsert
+        progress = []
+        pipeline = IndexingPipeline(
+            ChunkingService(),
+            make_embedding_service(),
+            store,
+            IndexingConfig(upsert_batch_size=2),
+        )
+
+        with pytest.raises(RuntimeError, match="disk full"):
+            await pipeline.run(
+                "docs",
+                make_documents(4),
+                chunk_size=500,
+                progress_callback=lambda stage, stats: progress.append(
+                    (stage, stats.chunks_indexed)
+                ),
+            )
+
+        assert ("upsert", 2) in progress
+
+    @pytest.mark.asyncio
+    async def test_search_service_delegates_to_pipeline(self, tmp_path):
+        """index_documents returns the committed chunk count and keeps stats."""
+        service = RAGSearchService(
+            vector_store=make_vector_store(),
+            embedding_service=make_embedding_service(),
+            config=DocBroConfig(data_dir=tmp_path),
+        )
+
+        indexed = await service.index_documents(
+            "docs", make_documents(2), chunk_strategy=ChunkStrategy.CHARACTER,
+            chunk_size=500,
+        )
+
+        assert indexed == service.last_indexing_stats.chunks_indexed > 0
+        assert service.metrics._indexing_latencies
+        assert service._heading_index_path("docs").exists()
+        assert len(service._heading_index("docs").lookup("doc 1").exact) > 0
+        await service.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_search_service_wraps_failures(self, tmp_path):
+        """Pipeline failures surface as RAGError."""
+        store = make_vector_store()
+        store.upsert_documents = AsyncMock(side_effect=RuntimeError("store offline"))
+        service = RAGSearchService(
+            vector_store=store,
+            embedding_service=make_embedding_service(),
+            config=DocBroConfig(data_dir=tmp_path),
+        )
+
+        with pytest.raises(RAGError):
+            await service.index_documents("docs", make_documents(1), chunk_size=500)
+        await service.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_boilerplate_is_stripped_before_chunking(self):
+        """Blocks shared by every page are not chunked and the saving is reported."""
+        footer = "Copyright Example Corp. Edit this page on GitHub. " * 30
+        documents = [
+            Document(
+                id=f"doc-{i}",
+                content=f"Document {i} explains container networking. " * 20
+                + "\n" + footer,
+                title=f"Doc {i}",
+            )
+            for i in range(6)
+        ]
+        detector = BoilerplateDetector.fit(doc.content for doc in documents)
+        store = make_vector_store()
+        pipeline = IndexingPipeline(
+            ChunkingService(), make_embedding_service(), store, boilerplate=detector
+        )
+
+        stats = await pipeline.run("docs", documents, chunk_size=500)
+
+        contents = [doc["metadata"]["content"] for batch in store.batches for doc in batch]
+        assert not any("Copyright Example Corp" in content for content in contents)
+        assert stats.boilerplate_bytes_removed == 6 * (len(footer) + 1)
+        assert stats.boilerplate_chunks_saved > 0
+
+    @pytest.mark.asyncio
+    async def test_search_service_fits_boilerplate_on_documents(self, tmp_path):
+        """index_documents strips blocks shared across a list of documents."""
+        footer = "Copyright Example Corp. Edit this page on GitHub."
+        documents = [
+            Document(
+                id=f"doc-{i}",
+                content=f"Document {i} explains container networking. " * 20
+                + "\n" + footer,
+                title=f"Doc {i}",
+            )
+            for i in range(6)
+        ]
+        service = RAGSearchService(
+            vector_store=make_vector_store(),
+            embedding_service=make_embedding_service(),
+            config=DocBroConfig(data_dir=tmp_path),
+        )
+
+        await service.index_documents("docs", documents, chunk_size=500)
+        assert service.last_indexing_stats.boilerplate_bytes_removed == 6 * (len(footer) + 1)
+
+        await service.index_documents(
+            "docs", documents, chunk_size=500, strip_boilerplate=False
+        )
+        assert service.last_indexing_stats.boilerplate_bytes_removed == 0
+        await service.cleanup()
+
+
+class TestIncrementalIndexing:
+    """Test fingerprint diffing between indexing runs."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_documents_are_not_re_embedded(self):
+        """A second run over the same documents embeds nothing."""
+        store = make_vector_store()
+        embedding_service = make_embedding_service()
+        pipeline = IndexingPipeline(ChunkingService(), embedding_service, store)
+        first = await pipeline.run("docs", make_documents(3), chunk_size=500)
+        embedding_service.create_embeddings.reset_mock()
+
+        second = await pipeline.run("docs", make_documents(3), chunk_size=500)
+
+        assert first.chunks_added == first.chunks_total
+        assert second.chunks_unchanged == second.chunks_total
+        assert second.chunks_added == second.chunks_updated == 0
+        assert second.chunks_indexed == 0
+        embedding_service.create_embeddings.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_changed_and_shrunk_documents(self):
+        """Edited chunks are updated and chunks no longer produced are removed."""
+        store = make_vector_store()
+        pipeline = IndexingPipeline(
+            ChunkingService(), make_embedding_service(), store
+        )
+        original = make_documents(2)
+        await pipeline.run("docs", original, chunk_size=500)
+        before = len(store.documents)
+
+        edited = original[0].model_copy(
+            update={"content": "Short replacement text for the first document."}
+        )
+        stats = await pipeline.run("docs", [edited, original[1]], chunk_size=500)
+
+        assert stats.chunks_updated == 1
+        assert stats.chunks_removed == before // 2 - 1
+        assert stats.chunks_unchanged == before // 2
+        assert len(store.documents) == before - stats.chunks_removed
+
+    @pytest.mark.asyncio
+    async def test_model_change_invalidates_fingerprints(self):
+        """Switching embedding model re-embeds every chunk."""
+        store = make_vector_store()
+        await IndexingPipeline(
+            ChunkingService(), make_embedding_service("model-a"), store
+        ).run("docs", make_documents(1), chunk_size=500)
+
+        stats = await IndexingPipeline(
+            ChunkingService(), make_embedding_service("model-b"), store
+        ).run("docs", make_documents(1), chunk_size=500)
+
+        assert stats.chunks_updated == stats.chunks_total
+        assert all(
+            doc["metadata"]["embedding_model"] == "model-b"
+            for doc in store.documents.values()
+        )
+
+
+class TestSharedChunkStore:
+    """Test embedding reuse across project collections."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_project_costs_no_embeddings(self, tmp_path):
+        """A second project with the same pages copies every stored vector."""
+        chunk_store = ChunkStore(tmp_path / "chunk_store.db")
+        embedding_service = make_embedding_service()
+        store = make_vector_store()
+        pipeline = IndexingPipeline(
+            ChunkingService(), embedding_service, store, chunk_store=chunk_store
+        )
+        first = await pipeline.run("python-a", make_documents(3), chunk_size=500)
+        for doc in store.documents.values():
+            doc["embedding"] = [0.4, 0.5, 0.6]
+        embedding_service.create_embeddings.reset_mock()
+
+        copies = [
+            doc.model_copy(update={"id": f"copy-{doc.id}", "project": "other-box"})
+            for doc in make_documents(3)
+        ]
+        second = await pipeline.run("python-b", copies, chunk_size=500)
+
+        embedding_service.create_embeddings.assert_not_called()
+        assert second.chunks_reused == second.chunks_indexed == first.chunks_indexed
+        copied = [doc for doc in store.documents.values() if doc["id"].startswith("copy-")]
+        assert all(doc["embedding"] == [0.4, 0.5, 0.6] for doc in copied)
+        stats = await chunk_store.get_statistics()
+        assert stats["references"] == 2 * first.chunks_indexed
+        assert stats["shared_chunks"] == stats["chunks"]
+        await chunk_store.close()
+
+    @pytest.mark.asyncio
+    async def test_missing_source_is_embedded(self, tmp_path):
+        """A reference to a chunk the vector store lost falls back to the model."""
+        chunk_store = ChunkStore(tmp_path / "chunk_store.db")
+        embedding_service = make_embedding_service()
+        store = make_vector_store()
+        pipeline = IndexingPipeline(
+            ChunkingService(), embedding_service, store, chunk_store=chunk_store
+        )
+        await pipeline.run("python-a", make_documents(1), chunk_size=500)
+        store.documents.clear()
+        embedding_service.create_embeddings.reset_mock()
+
+        stats = await pipeline.run("python-b", make_documents(1), chunk_size=500)
+
+        assert stats.chunks_reused == 0
+        assert stats.chunks_embedded == stats.chunks_indexed
+        embedding_service.create_embeddings.assert_called()
+        await chunk_store.close()
+
+    @pytest.mark.asyncio
+    async def test_references_follow_the_collection(self, tmp_path):
+        """Full re-indexes and collection deletes drop the collection's references."""
+        chunk_store = ChunkStore(tmp_path / "chunk_store.db")
+        store = make_vector_store()
+        store.delete_collection = AsyncMock(return_value=True)
+        service = RAGSearchService(
+            vector_store=store,
+            embedding_service=make_embedding_service(),
+            config=DocBroConfig(data_dir=tmp_path),
+            chunk_store=chunk_store,
+        )
+        await service.index_documents("docs", make_documents(3), chunk_size=500)
+
+        changed = [
+            doc.model_copy(update={"content": doc.content.replace("networking", "storage")})
+            for doc in make_documents(3)
+        ]
+        await service.index_documents("docs", changed, chunk_size=500, incremental=False)
+        stats = await chunk_store.get_statistics()
+        assert stats["references"] == service.last_indexing_stats.chunks_indexed
+
+        assert await service.delete_collection("docs")
+        assert (await chunk_store.get_statistics())["references"] == 0
+
+        await service.cleanup()
+        assert chunk_store._connection is None
+
+    @pytest.mark.asyncio
+    async def test_release_collection(self, tmp_path):
+        """Deleting a project releases its references without creating a store."""
+        db_path = chunk_store_path(tmp_path)
+        assert await release_collection(db_path, "docs") == 0
+        assert not db_path.exists()
+
+        chunk_store = ChunkStore(db_path)
+        await chunk_store.add_references("docs", [("c1", "a"), ("c2", "b")])
+        await chunk_store.add_references("other", [("c1", "b")])
+        await chunk_store.close()
+
+        assert await release_collection(db_path, "docs") == 2
+        chunk_store = ChunkStore(db_path)
+        assert await chunk_store.find_sources(["a", "b"]) == {"b": ("other", "c1")}
+        await chunk_store.close()
+
+
+class TestBatchedEmbeddings:
+    """Test EmbeddingService batch endpoint usage."""
+
+    def make_service(self, handler):
+        from src.services.embeddings import EmbeddingService
+
+        service = EmbeddingService()
+        service._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        service._initialized = True
+        return service
+
+    @pytest.mark.asyncio
+    async def test_misses_sent_in_one_request(self):
+        """Uncached texts are embedded with a single /api/embed call."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            texts = json.loads(request.content)["input"]
+            return httpx.Response(
+                200, json={"embeddings": [[float(len(t))] for t in texts]}
+            )
+
+        service = self.make_service(handler)
+        service._cache[service._get_cache_key("cached", service.config.embedding_model)] = [9.0]
+
+        embeddings = await service.create_embeddings(
+            ["alpha", "cached", "be", "alpha"], batch_size=10
+        )
+
+        assert embeddings == [[5.0], [9.0], [2.0], [5.0]]
+        assert len(requests) == 1
+        assert requests[0].url.path == "/api/embed"
+        assert json.loads(requests[0].content)["input"] == ["alpha", "be"]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_batch_endpoint_missing(self):
+        """Servers without /api/embed get single-text requests."""
+
+        def handler(request):
+            if request.url.path == "/api/embed":
+                return httpx.Response(404, text="404 page not found")
+            return httpx.Response(200, json={"embedding": [1.0, 2.0]})
+
+        service = self.make_service(handler)
+
+        embeddings = await service.create_embeddings(["one", "two"])
+
+        assert embeddings == [[1.0, 2.0], [1.0, 2.0]]
+        assert service._batch_endpoint_supported is False
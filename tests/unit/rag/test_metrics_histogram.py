@@ -0,0 +1,113 @@
+"""Unit tests for streaming metrics histograms."""
+
+import random
+
+import pytest
+
+from src.logic.rag.analytics.histogram import LogHistogram, WindowedHistogram
+from src.logic.rag.analytics.rag_metrics import RAGMetrics
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLogHistogram:
+    """Test log-bucket percentile estimation."""
+
+    def test_percentiles_within_relative_error(self):
+        """Estimates stay within the bucket growth of the exact percentile."""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(3, 1) for _ in range(20_000)]
+        histogram = LogHistogram()
+        for value in values:
+            histogram.record(value)
+
+        exact = sorted(values)
+        for quantile in (0.5, 0.95, 0.99):
+            expected = exact[int(len(exact) * quantile)]
+            assert histogram.percentile(quantile) == pytest.approx(expected, rel=0.02)
+        assert histogram.mean == pytest.approx(sum(values) / len(values))
+
+    def test_memory_is_bounded(self):
+        """Bucket count depends on the value range, not the sample count."""
+        histogram = LogHistogram()
+        for i in range(100_000):
+            histogram.record(1 + i % 500)
+
+        assert len(histogram) == 100_000
+        assert len(histogram._buckets) < 400
+
+    def test_single_value_is_exact(self):
+        """Representative values are clamped to the observed range."""
+        histogram = LogHistogram()
+        histogram.record(42.0, count=3)
+
+        assert histogram.summary() == {
+            "count": 3, "avg": 42.0, "p50": 42.0, "p95": 42.0, "p99": 42.0,
+        }
+
+    def test_empty_summary(self):
+        """An empty histogram reports zeros."""
+        assert LogHistogram().summary()["p99"] == 0.0
+
+
+class TestWindowedHistogram:
+    """Test sliding-window aggregation."""
+
+    def test_windows_expire_old_slots(self):
+        """Values leave each window once it slides past them."""
+        clock = FakeClock()
+        windows = WindowedHistogram(clock=clock)
+        windows.record(10.0)
+        clock.now = 120
+        windows.record(20.0)
+
+        assert windows.window(60).count == 1
+        assert windows.window(300).count == 2
+
+        clock.now = 4000
+        windows.record(30.0)
+        assert windows.window(3600).count == 1
+        assert len(windows._slots) == 1
+
+
+class TestRAGMetrics:
+    """Test RAGMetrics summaries on top of the histograms."""
+
+    def test_summary_reports_windows_and_sizes(self):
+        """Summary includes windowed latency and size distributions."""
+        clock = FakeClock()
+        metrics = RAGMetrics(clock=clock)
+        for latency in range(1, 101):
+            metrics.record_search("semantic", float(latency), 5, "docker networking")
+        clock.now = 600
+        metrics.record_search("hybrid", 1000.0, 2, "k8s")
+
+        summary = metrics.get_summary()
+
+        assert summary.searches_total == 101
+        assert summary.p50_latency_ms == pytest.approx(51, rel=0.02)
+        assert summary.latency_windows["1m"]["count"] == 1
+        assert summary.latency_windows["1h"]["count"] == 101
+        assert summary.query_length["p50"] == pytest.approx(17, rel=0.02)
+        assert summary.strategy_distribution == {"semantic": 100, "hybrid": 1}
+
+    def test_reset_clears_histograms(self):
+        """Reset empties every distribution."""
+        metrics = RAGMetrics()
+        metrics.record_search("semantic", 12.0, 3, "query")
+        metrics.record_stage_latency("embedding", 4.0)
+
+        metrics.reset()
+        summary = metrics.get_summary()
+
+        assert summary.searches_total == 0
+        assert summary.stage_latency_ms == {}
+        assert summary.latency_windows["1m"]["count"] == 0
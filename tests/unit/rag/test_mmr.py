@@ -0,0 +1,103 @@
+"""Unit tests for MMR diversification."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.logic.rag.core.search_service import RAGSearchService
+from src.logic.rag.models.search_result import SearchResult
+from src.logic.rag.strategies import mmr as mmr_module
+from src.logic.rag.strategies.mmr import MMRDiversifier
+
+# Three near-identical copies of one paragraph and two distinct chunks
+CANDIDATES = [
+    ("dup-a", 0.95, [1.0, 0.0, 0.0]),
+    ("dup-b", 0.94, [0.99, 0.01, 0.0]),
+    ("dup-c", 0.93, [0.98, 0.02, 0.0]),
+    ("other-1", 0.80, [0.0, 1.0, 0.0]),
+    ("other-2", 0.75, [0.0, 0.0, 1.0]),
+]
+
+
+def make_results() -> list[SearchResult]:
+    """Create candidates with embeddings attached."""
+    return [
+        SearchResult(
+            id=doc_id,
+            url=f"https://example.com/{doc_id}",
+            title="Docs",
+            content=f"content {doc_id}",
+            score=score,
+            project="docs",
+            match_type="semantic",
+            embedding=vector,
+        )
+        for doc_id, score, vector in CANDIDATES
+    ]
+
+
+class TestMMRDiversifier:
+    """Test greedy MMR selection."""
+
+    @pytest.mark.parametrize("numpy_available", [True, False])
+    def test_skips_near_duplicates(self, monkeypatch, numpy_available):
+        """Distinct chunks are picked over copies of the top hit."""
+        if numpy_available and not mmr_module.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(mmr_module, "NUMPY_AVAILABLE", numpy_available)
+
+        selected = MMRDiversifier().diversify(make_results(), limit=3)
+
+        assert [r.id for r in selected] == ["dup-a", "other-1", "other-2"]
+
+    def test_lambda_one_keeps_relevance_order(self):
+        """With lambda 1.0 MMR is plain top-k."""
+        selected = MMRDiversifier().diversify(make_results(), limit=3, lambda_mult=1.0)
+
+        assert [r.id for r in selected] == ["dup-a", "dup-b", "dup-c"]
+
+    def test_missing_vectors_are_tolerated(self):
+        """Results without embeddings are treated as dissimilar."""
+        results = make_results()
+        results[1].embedding = None
+
+        selected = MMRDiversifier().diversify(results, limit=2)
+
+        assert [r.id for r in selected] == ["dup-a", "dup-b"]
+
+
+class TestSearchDiversify:
+    """Test the diversify option on RAGSearchService.search."""
+
+    @pytest.mark.asyncio
+    async def test_search_fetches_vectors_and_diversifies(self):
+        """The store is asked for extra candidates with their vectors."""
+        calls = []
+
+        async def create_embedding(text):
+            return [1.0, 0.0, 0.0]
+
+        async def search(collection_name, query_embedding, limit, score_threshold,
+                         filter_conditions, with_vectors=False):
+            calls.append((limit, with_vectors))
+            return [
+                {
+                    "id": doc_id,
+                    "score": score,
+                    "metadata": {"content": doc_id, "title": "Docs"},
+                    "embedding": vector,
+                }
+                for doc_id, score, vector in CANDIDATES[:limit]
+            ]
+
+        embedding_service = MagicMock()
+        embedding_service.create_embedding = create_embedding
+        vector_store = MagicMock()
+        vector_store.search = search
+        service = RAGSearchService(vector_store=vector_store, embedding_service=embedding_service)
+
+        results = await service.search("docs", "docs", limit=2, diversify=True)
+
+        assert calls == [(2 * service.mmr.config.candidate_multiplier, True)]
+        assert [r.id for r in results] == ["dup-a", "other-1"]
+        assert all(r.embedding is None for r in results)
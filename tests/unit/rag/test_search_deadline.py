@@ -0,0 +1,128 @@
+"""Unit tests for search deadline budgets."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.logic.rag.core.search_service import RAGSearchService
+from src.logic.rag.models.strategy_config import SearchStrategy
+from src.logic.rag.utils.search_context import DeadlineExceeded, SearchContext
+
+
+def make_service(embed_delay: float = 0.0, search_delay: float = 0.0) -> RAGSearchService:
+    """Create a search service over slow fake backends."""
+
+    async def create_embedding(text):
+        await asyncio.sleep(embed_delay)
+        return [0.1, 0.2, 0.3]
+
+    async def search(collection_name, query_embedding, limit, score_threshold, filter_conditions):
+        await asyncio.sleep(search_delay)
+        return [
+            {
+                "id": f"chunk-{i}",
+                "score": 0.9 - i * 0.1,
+                "metadata": {"content": "docker networking guide", "title": "Docker"},
+            }
+            for i in range(3)
+        ]
+
+    embedding_service = MagicMock()
+    embedding_service.create_embedding = create_embedding
+    vector_store = MagicMock()
+    vector_store.search = search
+    return RAGSearchService(vector_store=vector_store, embedding_service=embedding_service)
+
+
+class TestSearchContext:
+    """Test the deadline context itself."""
+
+    @pytest.mark.asyncio
+    async def test_unbounded_context_runs_stage(self):
+        """Without a deadline stages run to completion."""
+        context = SearchContext()
+        assert await context.run("embedding", asyncio.sleep(0, result=5)) == 5
+        assert context.remaining() is None
+        assert not context.partial
+
+    @pytest.mark.asyncio
+    async def test_records_first_stage_to_exceed(self):
+        """The first stage past the budget is remembered."""
+        context = SearchContext(deadline_ms=10)
+
+        with pytest.raises(DeadlineExceeded):
+            await context.run("embedding", asyncio.sleep(1))
+        with pytest.raises(DeadlineExceeded):
+            await context.run("rerank", asyncio.sleep(0))
+
+        assert context.exceeded_stage == "embedding"
+
+
+class TestSearchDeadline:
+    """Test deadline propagation through RAGSearchService."""
+
+    @pytest.mark.asyncio
+    async def test_fast_search_is_complete(self):
+        """A search within budget is not partial."""
+        service = make_service()
+
+        response = await service.search_detailed("docker networking", "docs", deadline_ms=1000)
+
+        assert not response.partial
+        assert len(response.results) == 3
+
+    @pytest.mark.asyncio
+    async def test_slow_embedding_returns_empty_partial(self):
+        """A stalled embedding call returns promptly with nothing."""
+        service = make_service(embed_delay=5)
+
+        response = await service.search_detailed("docker networking", "docs", deadline_ms=50)
+
+        assert response.partial
+        assert response.exceeded_stage == "embedding"
+        assert response.results == []
+        assert response.took_ms < 1000
+        assert service.get_metrics_summary().deadline_exceeded == {"embedding": 1}
+
+    @pytest.mark.asyncio
+    async def test_slow_vector_search_is_reported(self):
+        """The vector stage is named when it blows the budget."""
+        service = make_service(search_delay=5)
+
+        results = await service.search("docker networking", "docs", deadline_ms=50)
+
+        assert results == []
+        assert service.metrics._deadline_exceeded["vector_search"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fusion_keeps_finished_strategies(self):
+        """Fusion returns the strategies that finished before the deadline."""
+        service = make_service()
+        original = service._execute_search_strategy
+
+        async def slow_hybrid(query, collection_name, limit, strategy, *args, **kwargs):
+            if strategy == SearchStrategy.HYBRID:
+                context = kwargs["context"]
+                await context.run("keyword", asyncio.sleep(5))
+            return await original(query, collection_name, limit, strategy, *args, **kwargs)
+
+        service._execute_search_strategy = slow_hybrid
+
+        response = await service.search_detailed(
+            "docker networking", "docs", strategy=SearchStrategy.FUSION, deadline_ms=100
+        )
+
+        assert response.partial
+        assert response.exceeded_stage == "keyword"
+        assert len(response.results) == 3
+        assert all(r.match_type == "fusion" for r in response.results)
+
+    @pytest.mark.asyncio
+    async def test_partial_results_are_not_cached(self):
+        """A partial response is retried rather than served from cache."""
+        service = make_service(embed_delay=5)
+
+        await service.search("docker networking", "docs", deadline_ms=20)
+
+        assert service._query_cache == {}
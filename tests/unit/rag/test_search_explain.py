@@ -0,0 +1,143 @@
+"""Unit tests for per-stage search timing and explain mode."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.logic.rag.core.search_service import RAGSearchService
+from src.logic.rag.models.strategy_config import SearchStrategy
+from src.logic.rag.utils.search_context import SearchContext
+
+
+def make_service(fail_collection: str | None = None) -> RAGSearchService:
+    """Create a search service over in-memory fake backends."""
+
+    async def create_embedding(text):
+        return [0.1, 0.2, 0.3]
+
+    async def search(collection_name, query_embedding, limit, score_threshold, filter_conditions):
+        if collection_name == fail_collection:
+            raise RuntimeError("collection missing")
+        return [
+            {
+                "id": f"{collection_name}-{i}",
+                "score": (0.9 if collection_name == "docs" else 0.85) - i * 0.1,
+                "metadata": {
+                    "content": "docker networking guide",
+                    "title": "Docker",
+                    "project": collection_name,
+                },
+            }
+            for i in range(3)
+        ]
+
+    embedding_service = MagicMock()
+    embedding_service.create_embedding = create_embedding
+    vector_store = MagicMock()
+    vector_store.search = search
+    return RAGSearchService(vector_store=vector_store, embedding_service=embedding_service)
+
+
+class TestStageSpans:
+    """Test stage timing on the search context."""
+
+    @pytest.mark.asyncio
+    async def test_run_and_stage_record_spans(self):
+        """Awaited and synchronous stages both append spans."""
+        context = SearchContext()
+
+        await context.run("embedding", _noop())
+        with context.stage("fuse"):
+            pass
+        with context.stage("fuse"):
+            pass
+
+        assert [name for name, _ in context.spans] == ["embedding", "fuse", "fuse"]
+        assert set(context.stage_totals()) == {"embedding", "fuse"}
+
+
+class TestExplainMode:
+    """Test explain output and stage histograms in RAGSearchService."""
+
+    @pytest.mark.asyncio
+    async def test_explain_lists_semantic_stages(self):
+        """A semantic search reports cache, embedding, vector and decode stages."""
+        service = make_service()
+
+        response = await service.search_detailed("docker networking", "docs", explain=True)
+
+        stages = [span["stage"] for span in response.explain["stages"]]
+        assert stages == ["cache_lookup", "embedding", "vector_search", "decode"]
+        assert response.explain["strategy"] == "semantic"
+        assert response.explain["cache_hit"] is False
+        assert response.explain["total_ms"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_explain_is_off_by_default(self):
+        """Responses carry no breakdown unless asked."""
+        service = make_service()
+
+        response = await service.search_detailed("docker networking", "docs")
+
+        assert response.explain is None
+
+    @pytest.mark.asyncio
+    async def test_hybrid_rerank_stages_feed_metrics(self):
+        """Hybrid search with reranking records keyword, fuse and rerank stages."""
+        service = make_service()
+
+        response = await service.search_detailed(
+            "docker networking", "docs", strategy=SearchStrategy.HYBRID,
+            rerank=True, explain=True,
+        )
+
+        totals = response.explain["stage_totals_ms"]
+        assert {"keyword", "fuse", "rerank"} <= set(totals)
+        assert all(r.rerank_signals is not None for r in response.results)
+        stage_latency = service.get_metrics_summary().stage_latency_ms
+        assert stage_latency["rerank"]["count"] == 1
+        assert stage_latency["fuse"]["p95"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_is_explained(self):
+        """A cached search only spends time in the cache lookup."""
+        service = make_service()
+        await service.search("docker networking", "docs")
+
+        response = await service.search_detailed("docker networking", "docs", explain=True)
+
+        assert response.explain["cache_hit"] is True
+        assert [span["stage"] for span in response.explain["stages"]] == ["cache_lookup"]
+
+
+class TestMultiProjectSearch:
+    """Test merged search across project collections."""
+
+    @pytest.mark.asyncio
+    async def test_merges_projects_by_score(self):
+        """Results from every project are merged and limited."""
+        service = make_service()
+
+        response = await service.search_multi_project(
+            "docker networking", ["docs", "api"], limit=4, strategy="semantic",
+            explain=True,
+        )
+
+        assert [r.id for r in response.results] == ["docs-0", "api-0", "docs-1", "api-1"]
+        assert set(response.explain) == {"docs", "api"}
+
+    @pytest.mark.asyncio
+    async def test_failed_project_is_skipped(self):
+        """A failing project does not fail the whole search."""
+        service = make_service(fail_collection="api")
+
+        response = await service.search_multi_project(
+            "docker networking", ["docs", "api"], explain=True
+        )
+
+        assert {r.project for r in response.results} == {"docs"}
+        assert "error" in response.explain["api"]
+
+
+async def _noop() -> None:
+    return None
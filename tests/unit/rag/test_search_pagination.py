@@ -0,0 +1,111 @@
+"""Unit tests for cursor pagination over cached search candidates."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.logic.rag.core.search_service import RAGError, RAGSearchService
+from src.logic.rag.models.search_result import SearchResult
+from src.logic.rag.utils.candidate_cache import CandidateCache
+
+
+def make_results(count: int) -> list[SearchResult]:
+    """Create ranked results."""
+    return [
+        SearchResult(
+            id=f"chunk-{i}",
+            url=f"https://example.com/{i}",
+            title="Docs",
+            content=f"content {i}",
+            score=1.0 - i * 0.01,
+            project="docs",
+            match_type="semantic",
+        )
+        for i in range(count)
+    ]
+
+
+class TestCandidateCache:
+    """Test candidate storage behind cursors."""
+
+    def test_pages_follow_cursor(self):
+        """Cursors walk the stored candidates page by page."""
+        cache = CandidateCache()
+
+        first, cursor = cache.paginate(make_results(25), 10)
+        second, cursor = cache.page(cursor)
+        third, cursor = cache.page(cursor)
+
+        assert [r.id for r in first][-1] == "chunk-9"
+        assert [r.id for r in second] == [f"chunk-{i}" for i in range(10, 20)]
+        assert len(third) == 5
+        assert cursor is None
+
+    def test_single_page_has_no_cursor(self):
+        """Nothing is stored when every candidate fits on the first page."""
+        cache = CandidateCache()
+
+        page, cursor = cache.paginate(make_results(3), 10)
+
+        assert len(page) == 3
+        assert cursor is None
+        assert len(cache) == 0
+
+    def test_expired_and_evicted_cursors(self):
+        """Cursors stop working after the TTL or once evicted."""
+        now = [0.0]
+        cache = CandidateCache(ttl_seconds=60, max_entries=1, clock=lambda: now[0])
+        _, first_cursor = cache.paginate(make_results(20), 10)
+        _, second_cursor = cache.paginate(make_results(20), 10)
+
+        assert cache.page(first_cursor) is None
+        assert cache.page(second_cursor) is not None
+        now[0] = 61.0
+        assert cache.page(second_cursor) is None
+        assert cache.page("not-a-cursor") is None
+
+
+class TestSearchPagination:
+    """Test paginate/fetch_page on RAGSearchService."""
+
+    @pytest.mark.asyncio
+    async def test_follow_up_pages_skip_backends(self):
+        """Only the first page embeds the query and queries the store."""
+        calls = []
+
+        async def create_embedding(text):
+            calls.append("embed")
+            return [0.1, 0.2]
+
+        async def search(collection_name, query_embedding, limit, score_threshold,
+                         filter_conditions):
+            calls.append(("search", limit))
+            return [
+                {
+                    "id": f"chunk-{i}",
+                    "score": 0.9 - i * 0.01,
+                    "metadata": {"content": f"chunk {i}", "title": "Docs"},
+                }
+                for i in range(limit)
+            ]
+
+        embedding_service = MagicMock()
+        embedding_service.create_embedding = create_embedding
+        vector_store = MagicMock()
+        vector_store.search = search
+        service = RAGSearchService(vector_store=vector_store, embedding_service=embedding_service)
+        oversample = service.pagination_config.oversample
+
+        first = await service.search_detailed(
+            "docker networking", "docs", limit=3, paginate=True
+        )
+        second = service.fetch_page(first.next_cursor)
+
+        assert calls == ["embed", ("search", 3 * oversample)]
+        assert [r.id for r in first.results] == ["chunk-0", "chunk-1", "chunk-2"]
+        assert [r.id for r in second.results] == ["chunk-3", "chunk-4", "chunk-5"]
+        assert second.next_cursor is not None
+
+        service.clear_cache()
+        with pytest.raises(RAGError):
+            service.fetch_page(second.next_cursor)
@@ -0,0 +1,57 @@
+"""Unit tests for batched, vectorized semantic chunking."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.logic.rag.strategies import semantic_chunker as chunker_module
+from src.logic.rag.strategies.semantic_chunker import SemanticChunker
+
+# Two topics: sentences 0-1 point one way, 2-3 another
+SENTENCES = [
+    "Docker images are built from layers.",
+    "Each layer caches a build step.",
+    "Kubernetes schedules pods onto nodes.",
+    "The scheduler weighs node resources.",
+]
+EMBEDDINGS = [[1.0, 0.1], [0.9, 0.2], [0.1, 1.0], [0.2, 0.9]]
+
+
+def make_chunker() -> SemanticChunker:
+    """Create a chunker whose embedding service answers in one batch."""
+    embedding_service = MagicMock()
+    embedding_service.create_embeddings = AsyncMock(return_value=EMBEDDINGS)
+    embedding_service.create_embedding = AsyncMock()
+    return SemanticChunker(embedding_service)
+
+
+class TestSemanticChunker:
+    """Test sentence grouping by adjacent similarity."""
+
+    @pytest.mark.asyncio
+    async def test_sentences_are_embedded_in_one_batch(self):
+        """The batch endpoint replaces per-sentence embedding calls."""
+        chunker = make_chunker()
+
+        groups = await chunker.chunk_by_similarity(SENTENCES, similarity_threshold=0.8)
+
+        assert groups == [SENTENCES[:2], SENTENCES[2:]]
+        chunker.embedding_service.create_embeddings.assert_awaited_once()
+        chunker.embedding_service.create_embedding.assert_not_called()
+
+    @pytest.mark.parametrize("numpy_available", [True, False])
+    def test_adjacent_similarities(self, monkeypatch, numpy_available):
+        """Vectorized and pure-Python similarities agree."""
+        if numpy_available and not chunker_module.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(chunker_module, "NUMPY_AVAILABLE", numpy_available)
+        chunker = make_chunker()
+
+        similarities = chunker._adjacent_similarities(EMBEDDINGS + [[0.0, 0.0]])
+
+        expected = [
+            chunker._cosine_similarity(EMBEDDINGS[i], EMBEDDINGS[i + 1])
+            for i in range(len(EMBEDDINGS) - 1)
+        ]
+        assert similarities[:-1] == pytest.approx(expected, abs=1e-6)
+        assert similarities[-1] == 0.0
@@ -0,0 +1,68 @@
+"""Unit tests for cross-page boilerplate detection."""
+
+import pytest
+from bs4 import BeautifulSoup
+
+from src.logic.crawler.utils.boilerplate import BoilerplateDetector
+
+NAV = "Home | Guides | API Reference"
+FOOTER = "Edit this page on GitHub"
+
+
+def make_page(i: int, with_nav: bool = True) -> str:
+    """Create page text with shared navigation and a unique body."""
+    blocks = [NAV] if with_nav else []
+    blocks += [f"Page {i} explains topic number {i} in depth.", FOOTER]
+    return "\n".join(blocks)
+
+
+class TestBoilerplateDetector:
+    """Test block counting and stripping."""
+
+    def test_recurring_blocks_are_stripped(self):
+        """Blocks on more than the threshold of pages are removed."""
+        detector = BoilerplateDetector.fit(make_page(i) for i in range(10))
+
+        text, removed = detector.strip(make_page(3))
+
+        assert text == "Page 3 explains topic number 3 in depth."
+        assert removed == len(NAV) + len(FOOTER) + 2
+        assert detector.boilerplate_count == 2
+
+    def test_threshold_is_respected(self):
+        """A block on half the pages is kept at a 0.5 threshold."""
+        detector = BoilerplateDetector.fit(
+            make_page(i, with_nav=i % 2 == 0) for i in range(10)
+        )
+
+        assert not detector.is_boilerplate(NAV)
+        assert detector.is_boilerplate(FOOTER)
+
+    def test_nothing_stripped_before_min_pages(self):
+        """Small samples are left untouched."""
+        detector = BoilerplateDetector.fit(make_page(i) for i in range(3))
+
+        assert detector.strip(make_page(1)) == (make_page(1), 0)
+
+    def test_invalid_threshold(self):
+        """Thresholds outside (0, 1) are rejected."""
+        with pytest.raises(ValueError):
+            BoilerplateDetector(threshold=1.0)
+
+
+class TestBlockExtraction:
+    """Test the crawler's block-per-line text extraction."""
+
+    def test_blocks_on_separate_lines(self):
+        """Block elements become lines; inline elements stay in their block."""
+        from src.logic.crawler.core.crawler import DocumentationCrawler
+
+        html = (
+            "<nav><a href='/'>Home</a> <a href='/guide'>Guide</a></nav>"
+            "<p>Use <code>docker run</code> to   start.</p>"
+            "<footer>Edit this page</footer><script>var x;</script>"
+        )
+
+        text = DocumentationCrawler._extract_text(None, BeautifulSoup(html, "html.parser"))
+
+        assert text.splitlines() == ["Home Guide", "Use docker run to start.", "Edit this page"]
@@ -0,0 +1,128 @@
+"""Unit tests for conditional GET recrawls with ETag and Last-Modified."""
+
+import asyncio
+from pathlib import Path
+
+import aiosqlite
+import httpx
+import pytest
+import pytest_asyncio
+
+from src.core.config import DocBroConfig
+from src.logic.crawler.core.crawler import DocumentationCrawler
+from src.models import PageStatus
+from src.services.database import DatabaseManager
+
+BASE = "https://docs.example.com"
+LAST_MODIFIED = "Wed, 01 Jul 2026 10:00:00 GMT"
+
+
+@pytest_asyncio.fixture
+async def db_manager(tmp_path, monkeypatch):
+    """Database manager in a temporary data dir."""
+    # Project databases live under the home directory
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    manager = DatabaseManager(DocBroConfig(data_dir=tmp_path))
+    await manager.initialize()
+    yield manager
+    await manager.cleanup()
+
+
+class MockSite:
+    """Site serving versioned pages that honours conditional requests."""
+
+    def __init__(self):
+        self.versions = {"/": 1, "/guide": 1, "/api": 1}
+        self.statuses: list[tuple[str, int]] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path not in self.versions:
+            return httpx.Response(404)
+        etag = f'"{path}-v{self.versions[path]}"'
+        if request.headers.get("if-none-match") == etag:
+            self.statuses.append((path, 304))
+            return httpx.Response(304)
+        self.statuses.append((path, 200))
+        links = "".join(f'<a href="{p}">{p}</a>' for p in self.versions)
+        body = f"<p>{path} version {self.versions[path]}</p>{links}"
+        return httpx.Response(
+            200, text=f"<html><body>{body}</body></html>",
+            headers={"content-type": "text/html", "etag": etag, "last-modified": LAST_MODIFIED},
+        )
+
+    async def crawl(self, db_manager, project_id: str, refresh: bool):
+        """Run one crawl against the site and wait for it to finish."""
+        crawler = DocumentationCrawler(db_manager, db_manager.config)
+        crawler._client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        session = await crawler.start_crawl(project_id, rate_limit=10.0, refresh=refresh)
+        await asyncio.wait_for(crawler._crawl_task, timeout=10)
+        await crawler.cleanup()
+        return await db_manager.get_crawl_session(session.id)
+
+
+class TestConditionalRecrawl:
+    """Test revalidation of stored pages."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_only_downloads_changed_pages(self, db_manager):
+        """Unchanged pages answer 304 and keep their content."""
+        project = await db_manager.create_project(name="docs", source_url=f"{BASE}/", crawl_depth=1)
+        site = MockSite()
+        await site.crawl(db_manager, project.id, refresh=False)
+
+        stored = await db_manager.get_page_by_url(project.id, f"{BASE}/guide")
+        assert stored.etag == '"/guide-v1"'
+        assert stored.last_modified == LAST_MODIFIED
+
+        site.versions["/api"] = 2
+        site.statuses.clear()
+        session = await site.crawl(db_manager, project.id, refresh=True)
+
+        assert sorted(site.statuses) == [("/", 304), ("/api", 200), ("/guide", 304)]
+        assert session.pages_crawled == 3
+        assert session.metadata["pages_unchanged"] == 2
+
+        guide = await db_manager.get_page_by_url(project.id, f"{BASE}/guide")
+        assert guide.is_unchanged()
+        assert guide.status == PageStatus.PROCESSED
+        assert guide.content_hash == stored.content_hash
+
+        api = await db_manager.get_page_by_url(project.id, f"{BASE}/api")
+        assert not api.is_unchanged()
+        assert "version 2" in api.content_text
+        assert api.etag == '"/api-v2"'
+
+    @pytest.mark.asyncio
+    async def test_recrawl_without_refresh_skips_stored_pages(self, db_manager):
+        """Without refresh, known pages are not requested again."""
+        project = await db_manager.create_project(name="docs", source_url=f"{BASE}/", crawl_depth=1)
+        site = MockSite()
+        await site.crawl(db_manager, project.id, refresh=False)
+        site.statuses.clear()
+
+        await site.crawl(db_manager, project.id, refresh=False)
+
+        assert site.statuses == []
+
+    @pytest.mark.asyncio
+    async def test_old_project_database_gains_validator_columns(self, tmp_path, monkeypatch):
+        """Project databases created before validators are migrated on open."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        config = DocBroConfig(data_dir=tmp_path)
+        manager = DatabaseManager(config)
+        db_path = manager._get_project_db_path("legacy")
+        async with aiosqlite.connect(str(db_path)) as conn:
+            # Indexed columns of the version 2 pages table
+            await conn.execute(
+                "CREATE TABLE pages (id TEXT PRIMARY KEY, project_id TEXT, session_id TEXT, "
+                "url TEXT, status TEXT, content_hash TEXT)"
+            )
+            await conn.commit()
+
+        conn = await manager._get_project_connection("legacy")
+        cursor = await conn.execute("PRAGMA table_info(pages)")
+        columns = {row[1] for row in await cursor.fetchall()}
+        await manager.cleanup()
+
+        assert {"etag", "last_modified", "headings", "simhash"} <= columns
@@ -0,0 +1,157 @@
+"""Unit tests for the durable crawl frontier and resume_crawl."""
+
+import asyncio
+from collections import Counter
+from pathlib import Path
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from src.core.config import DocBroConfig
+from src.logic.crawler.core.crawler import CrawlerError, DocumentationCrawler
+from src.logic.crawler.core.frontier import CrawlFrontier
+from src.models import CrawlStatus
+from src.services.database import DatabaseManager
+
+PAGES = [f"/page{i}" for i in range(6)]
+
+
+@pytest_asyncio.fixture
+async def db_manager(tmp_path, monkeypatch):
+    """Database manager in a temporary data dir."""
+    # Project databases live under the home directory
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    manager = DatabaseManager(DocBroConfig(data_dir=tmp_path))
+    await manager.initialize()
+    yield manager
+    await manager.cleanup()
+
+
+def make_crawler(db_manager, requests: Counter, pause_at: str | None = None):
+    """Create a crawler for a mock site whose index links to every page."""
+    crawler = DocumentationCrawler(db_manager, db_manager.config)
+    index = "".join(f'<a href="{path}">{path}</a>' for path in PAGES)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path in ("/robots.txt", "/sitemap.xml"):
+            return httpx.Response(404)
+        requests[path] += 1
+        if path == pause_at:
+            await crawler.pause_crawl(crawler._current_session.id)
+        return httpx.Response(
+            200, text=f"<html><body><p>Content of {path}</p>{index}</body></html>",
+            headers={"content-type": "text/html"},
+        )
+
+    crawler._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return crawler
+
+
+class TestCrawlFrontier:
+    """Test frontier persistence and resuming."""
+
+    @pytest.mark.asyncio
+    async def test_flush_records_queue_and_visited(self, db_manager):
+        """Buffered entries are written in order and marked when processed."""
+        project = await db_manager.create_project(name="docs", source_url="https://docs.example.com/")
+        session = await db_manager.create_crawl_session(project.id, crawl_depth=2)
+        frontier = CrawlFrontier(db_manager, project.id, session.id, batch_size=3)
+
+        await frontier.add("https://docs.example.com/", 0, None)
+        await frontier.add("https://docs.example.com/a", 1, "https://docs.example.com/")
+        assert await db_manager.get_frontier(project.id, session.id) == ([], set())
+
+        await frontier.mark_done("https://docs.example.com/")  # third change flushes
+        await frontier.add("https://docs.example.com/b", 1, "https://docs.example.com/")
+
+        queued, done = await frontier.load()
+        assert queued == [
+            ("https://docs.example.com/a", 1, "https://docs.example.com/"),
+            ("https://docs.example.com/b", 1, "https://docs.example.com/"),
+        ]
+        assert done == {"https://docs.example.com/"}
+
+    @pytest.mark.asyncio
+    async def test_pause_then_resume_fetches_each_page_once(self, db_manager):
+        """A resumed crawl continues with the pending URLs only."""
+        project = await db_manager.create_project(
+            name="docs", source_url="https://docs.example.com/", crawl_depth=1
+        )
+        requests: Counter[str] = Counter()
+
+        crawler = make_crawler(db_manager, requests, pause_at="/page2")
+        session = await crawler.start_crawl(project.id, rate_limit=10.0, concurrency=1)
+        await asyncio.wait_for(crawler._crawl_task, timeout=10)
+        await crawler.cleanup()
+
+        paused = await db_manager.get_crawl_session(session.id)
+        assert paused.status == CrawlStatus.PAUSED
+        assert set(requests) == {"/", "/page0", "/page1", "/page2"}
+
+        # A fresh crawler, as after a restart, picks up the saved frontier
+        resumer = make_crawler(db_manager, requests)
+        await resumer.resume_crawl(session.id, concurrency=2)
+        await asyncio.wait_for(resumer._crawl_task, timeout=10)
+        await resumer.cleanup()
+
+        finished = await db_manager.get_crawl_session(session.id)
+        assert finished.status == CrawlStatus.COMPLETED
+        assert finished.pages_crawled == len(PAGES) + 1
+        assert set(requests) == {"/", *PAGES}
+        assert all(count == 1 for count in requests.values())
+        assert await db_manager.get_frontier(project.id, session.id) == ([], set())
+
+    @pytest.mark.asyncio
+    async def test_duplicate_of_in_flight_url_stays_pending(self, db_manager):
+        """A second queued copy of a URL still being fetched is not marked done."""
+        project = await db_manager.create_project(
+            name="docs", source_url="https://docs.example.com/", crawl_depth=2
+        )
+        crawler = DocumentationCrawler(db_manager, db_manager.config)
+        fetching, release = asyncio.Event(), asyncio.Event()
+        links = {"/": ["/a", "/b", "/c"], "/a": ["/c"], "/b": ["/c"], "/c": []}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            if path not in links:
+                return httpx.Response(404)
+            if path == "/c":
+                fetching.set()
+                await release.wait()
+            anchors = "".join(f'<a href="{link}">{link}</a>' for link in links[path])
+            return httpx.Response(
+                200, text=f"<html><body><p>Content of {path}</p>{anchors}</body></html>",
+                headers={"content-type": "text/html"},
+            )
+
+        crawler._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        session = await crawler.start_crawl(project.id, rate_limit=10.0, concurrency=2)
+        await asyncio.wait_for(fetching.wait(), timeout=10)
+        # Let the other worker drain the queued copies of /c
+        while not crawler._crawl_queue.empty():
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+
+        # A crash now must not leave /c done without a page
+        await crawler._frontier.flush()
+        _, done = await db_manager.get_frontier(project.id, session.id)
+        assert "https://docs.example.com/c" not in done
+
+        release.set()
+        await asyncio.wait_for(crawler._crawl_task, timeout=10)
+        await crawler.cleanup()
+        assert await db_manager.get_page_by_url(project.id, "https://docs.example.com/c")
+
+    @pytest.mark.asyncio
+    async def test_completed_session_cannot_resume(self, db_manager):
+        """Only paused or interrupted sessions resume."""
+        project = await db_manager.create_project(name="docs", source_url="https://docs.example.com/")
+        session = await db_manager.create_crawl_session(project.id, crawl_depth=1)
+        session.start_session()
+        session.complete_session()
+        await db_manager.update_crawl_session(session)
+
+        with pytest.raises(CrawlerError):
+            await DocumentationCrawler(db_manager, db_manager.config).resume_crawl(session.id)
@@ -0,0 +1,132 @@
+"""Unit tests for the per-host crawl scheduler and concurrent crawling."""
+
+import asyncio
+from collections import Counter
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.core.config import DocBroConfig
+from src.logic.crawler.core.scheduler import HostScheduler
+
+
+class FakeClock:
+    """Clock that only advances when the scheduler sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TestHostScheduler:
+    """Test slot spacing per host."""
+
+    @pytest.mark.asyncio
+    async def test_same_host_requests_are_spaced(self):
+        """Concurrent acquires for one host get consecutive slots."""
+        scheduler = HostScheduler(rate_limit=2.0, clock=lambda: 0.0, sleep=FakeClock().sleep)
+
+        waits = await asyncio.gather(
+            *(scheduler.acquire(f"https://docs.example.com/{i}") for i in range(3))
+        )
+
+        assert sorted(waits) == [0.0, 0.5, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_hosts_are_independent(self):
+        """One host's backlog does not delay another host."""
+        clock = FakeClock()
+        scheduler = HostScheduler(rate_limit=1.0, clock=clock, sleep=clock.sleep)
+
+        await scheduler.acquire("https://a.example.com/1")
+        assert await scheduler.acquire("https://b.example.com/1") == 0.0
+        assert await scheduler.acquire("https://a.example.com/2") == 1.0
+
+    @pytest.mark.asyncio
+    async def test_crawl_delay_overrides_faster_rate(self):
+        """A robots.txt Crawl-delay longer than the rate interval wins."""
+        clock = FakeClock()
+        scheduler = HostScheduler(rate_limit=10.0, clock=clock, sleep=clock.sleep)
+        scheduler.set_crawl_delay("docs.example.com", 3)
+
+        await scheduler.acquire("https://docs.example.com/a")
+
+        assert await scheduler.acquire("https://docs.example.com/b") == 3.0
+        assert scheduler.interval("other.example.com") == pytest.approx(0.1)
+
+
+class TestConcurrentCrawl:
+    """Test the crawler's fetch workers against a mock site."""
+
+    @pytest.mark.asyncio
+    async def test_workers_crawl_each_page_once(self, tmp_path, monkeypatch):
+        """All linked pages are crawled exactly once and the session completes."""
+        # Project databases live under the home directory
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        from src.logic.crawler.core.crawler import DocumentationCrawler
+        from src.models import CrawlStatus
+        from src.services.database import DatabaseManager
+
+        pages = [f"/page{i}" for i in range(6)]
+        index = "".join(f'<a href="{path}">{path}</a>' for path in pages)
+        requests: Counter[str] = Counter()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests[request.url.path] += 1
+            if request.url.path in ("/robots.txt", "/sitemap.xml"):
+                return httpx.Response(404)
+            body = index if request.url.path == "/" else f"<p>Content of {request.url.path}</p>"
+            # Every page links back to the index and its neighbours
+            body += index
+            return httpx.Response(
+                200, text=f"<html><body>{body}</body></html>",
+                headers={"content-type": "text/html"},
+            )
+
+        config = DocBroConfig(data_dir=tmp_path)
+        db_manager = DatabaseManager(config)
+        await db_manager.initialize()
+        try:
+            project = await db_manager.create_project(
+                name="mock-docs", source_url="https://docs.example.com/", crawl_depth=2
+            )
+            crawler = DocumentationCrawler(db_manager, config)
+            crawler._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+            session = await crawler.start_crawl(project.id, rate_limit=10.0, concurrency=4)
+            await asyncio.wait_for(crawler._crawl_task, timeout=10)
+            session = await db_manager.get_crawl_session(session.id)
+
+            assert session.status == CrawlStatus.COMPLETED
+            assert set(requests) == {"/robots.txt", "/sitemap.xml", "/", *pages}
+            assert all(count == 1 for count in requests.values())
+            await crawler.cleanup()
+        finally:
+            await db_manager.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_robots_crawl_delay_reaches_scheduler(self):
+        """A host's Crawl-delay is applied once its robots.txt is read."""
+        from unittest.mock import MagicMock
+
+        from src.logic.crawler.core.crawler import DocumentationCrawler
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, text="User-agent: *\nCrawl-delay: 2\n",
+                headers={"content-type": "text/plain"},
+            )
+
+        crawler = DocumentationCrawler(MagicMock(), DocBroConfig(rate_limit=5.0))
+        crawler._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        assert await crawler.check_robots_allowed("https://slow.example.com/a", "DocBro/1.0")
+        assert crawler._scheduler.interval("slow.example.com") == 2.0
+        assert crawler._scheduler.interval("fast.example.com") == pytest.approx(0.2)
+        await crawler.cleanup()
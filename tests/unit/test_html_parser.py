@@ -0,0 +1,175 @@
+"""Unit tests for the single-pass HTML parser and stored page headings."""
+
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from src.core.config import DocBroConfig
+from src.logic.crawler.core.crawler import DocumentationCrawler
+from src.logic.crawler.utils.html_parser import (
+    HtmlParser,
+    default_backend,
+    find_main_content,
+)
+from src.logic.rag.core.chunking_service import ChunkingService
+from src.logic.rag.models.strategy_config import ChunkStrategy
+from src.models import ContentExtraction
+from src.services.database import DatabaseManager
+
+BASE = "https://docs.example.com"
+PAGE = """
+<html><head><title> Install Guide </title><style>p {}</style></head>
+<body>
+  <h1>Install</h1><p>Download the <a href="/download#linux">package</a>.</p>
+  <h2>Linux</h2><p>Run the <a href="/download">installer</a>.</p>
+  <h3></h3><a href="mailto:team@example.com">Mail</a>
+  <!-- build 42 -->
+</body></html>
+"""
+
+
+class TestHtmlParser:
+    """Test one-parse extraction."""
+
+    @pytest.mark.parametrize("backend", [None, "html.parser"])
+    def test_parse_yields_all_fields(self, backend):
+        """Title, text, links and headings come from one parse."""
+        parser = HtmlParser(backend)
+        parsed = parser.parse(PAGE, f"{BASE}/guide/")
+
+        assert parser.backend == (backend or default_backend())
+        assert parsed.title == "Install Guide"
+        assert parsed.headings == [(1, "Install"), (2, "Linux")]
+        assert parsed.links == [f"{BASE}/download"]
+        assert parsed.text.splitlines() == [
+            "Install Guide", "Install", "Download the package .", "Linux", "Run the installer .", "Mail",
+        ]
+
+SENTENCE = "Configure the build cache before running the compiler on large projects. "
+SPHINX_PAGE = f"""
+<html><body>
+  <div class="sphinxsidebar"><h3>Table of Contents</h3>
+    <ul><li><a href="/install">Install</a></li><li><a href="/usage">Usage</a></li></ul></div>
+  <div class="document"><div class="body">
+    <h1>Caching</h1><p>{SENTENCE * 3}</p><h2>Limits</h2><p>{SENTENCE}</p>
+  </div></div>
+  <div class="footer">Copyright 2026 Example Project</div>
+</body></html>
+"""
+
+
+class TestMainContent:
+    """Test main-content extraction."""
+
+    def test_theme_region_keeps_article_text(self):
+        """Sidebars and footers are dropped; links still come from the whole page."""
+        parsed = HtmlParser().parse(SPHINX_PAGE, f"{BASE}/cache", main_content=True)
+
+        assert parsed.headings == [(1, "Caching"), (2, "Limits")]
+        assert "Table of Contents" not in parsed.text
+        assert "Copyright" not in parsed.text
+        assert parsed.text.startswith("Caching\n")
+        assert parsed.links == [f"{BASE}/install", f"{BASE}/usage"]
+        assert parsed.text_dropped == len("Table of Contents\nInstall\nUsage\nCopyright 2026 Example Project\n")
+
+    def test_density_fallback(self):
+        """Without landmarks, the container with the most prose wins over menus."""
+        menu = "".join(f'<div><a href="/p{i}">Link number {i} in the menu</a></div>' for i in range(20))
+        html = (
+            f'<html><body><div id="menu">{menu}</div>'
+            f'<div id="text"><div><p>{SENTENCE * 2}</p><p>{SENTENCE}</p></div></div></body></html>'
+        )
+
+        region = find_main_content(HtmlParser().soup(html))
+
+        assert region is not None and region.get("id") != "menu"
+        assert "menu" not in region.get_text()
+
+    def test_full_page_when_no_region(self):
+        """Short pages without a main region keep all their text."""
+        parsed = HtmlParser().parse("<p>Short page</p>", BASE, main_content=True)
+
+        assert parsed.text == "Short page"
+        assert parsed.text_dropped == 0
+
+
+@pytest_asyncio.fixture
+async def db_manager(tmp_path, monkeypatch):
+    """Database manager in a temporary data dir."""
+    # Project databases live under the home directory
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    manager = DatabaseManager(DocBroConfig(data_dir=tmp_path))
+    await manager.initialize()
+    yield manager
+    await manager.cleanup()
+
+
+class TestStoredHeadings:
+    """Test that indexing reuses the crawl-time parse."""
+
+    @pytest.mark.asyncio
+    async def test_headings_stored_and_used_for_chunk_headers(self, db_manager, monkeypatch):
+        """Crawled headings round-trip and chunking does not re-parse HTML."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path in ("/robots.txt", "/sitemap.xml"):
+                return httpx.Response(404)
+            return httpx.Response(200, text=PAGE, headers={"content-type": "text/html"})
+
+        project = await db_manager.create_project(name="docs", source_url=f"{BASE}/", crawl_depth=1)
+        crawler = DocumentationCrawler(db_manager, db_manager.config)
+        crawler._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        await crawler.start_crawl(project.id, rate_limit=10.0)
+        await asyncio.wait_for(crawler._crawl_task, timeout=10)
+        await crawler.cleanup()
+
+        page = await db_manager.get_page_by_url(project.id, f"{BASE}/")
+        assert page.headings == [(1, "Install"), (2, "Linux")]
+
+        service = ChunkingService()
+
+        async def no_parse(html_content):
+            raise AssertionError("content re-parsed")
+
+        monkeypatch.setattr(service, "extract_hierarchy", no_parse)
+        chunks = await service.chunk_document(
+            page.to_document("docs"), ChunkStrategy.CHARACTER, chunk_size=500
+        )
+
+        assert chunks[0].hierarchy == [(1, "Install"), (2, "Linux")]
+        assert chunks[0].context_header == "[Document: Install Guide | Section: Install > Linux | Project: docs]"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", [None, ContentExtraction.FULL])
+    async def test_extraction_mode_per_project(self, db_manager, mode):
+        """Projects default to main content; crawl stats report the dropped text."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path in ("/robots.txt", "/sitemap.xml"):
+                return httpx.Response(404)
+            return httpx.Response(200, text=SPHINX_PAGE, headers={"content-type": "text/html"})
+
+        project = await db_manager.create_project(
+            name="docs", source_url=f"{BASE}/", crawl_depth=1, content_extraction=mode
+        )
+        assert (await db_manager.get_project(project.id)).content_extraction == mode
+
+        crawler = DocumentationCrawler(db_manager, db_manager.config)
+        crawler._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        session = await crawler.start_crawl(project.id, rate_limit=10.0)
+        await asyncio.wait_for(crawler._crawl_task, timeout=10)
+        stats = await crawler.get_crawl_statistics(session.id)
+        await crawler.cleanup()
+
+        page = await db_manager.get_page_by_url(project.id, f"{BASE}/")
+        if mode is None:
+            assert stats["content_extraction"] == "main"
+            assert "Table of Contents" not in page.content_text
+            assert stats["text_chars_dropped"] > 0
+            assert stats["text_chars_kept"] == len(page.content_text)
+            assert 0 < stats["text_dropped_ratio"] < 1
+        else:
+            assert stats["content_extraction"] == "full"
+            assert "Table of Contents" in page.content_text
+            assert stats["text_chars_dropped"] == 0
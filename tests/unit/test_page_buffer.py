@@ -0,0 +1,136 @@
+"""Unit tests for write-behind page persistence."""
+
+import asyncio
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from src.core.config import DocBroConfig
+from src.logic.crawler.core.crawler import DocumentationCrawler
+from src.logic.crawler.core.frontier import CrawlFrontier
+from src.logic.crawler.core.page_buffer import PageBuffer
+from src.models import Page, PageStatus
+from src.services.database import DatabaseManager
+
+BASE = "https://docs.example.com"
+
+
+@pytest_asyncio.fixture
+async def db_manager(tmp_path, monkeypatch):
+    """Database manager in a temporary data dir."""
+    # Project databases live under the home directory
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    manager = DatabaseManager(DocBroConfig(data_dir=tmp_path))
+    await manager.initialize()
+    yield manager
+    await manager.cleanup()
+
+
+def make_page(project_id: str, session_id: str, path: str) -> Page:
+    """Create an unsaved page."""
+    return Page(
+        id=f"page{path.replace('/', '-')}",
+        project_id=project_id,
+        session_id=session_id,
+        url=f"{BASE}{path}",
+        crawl_depth=1,
+        discovered_at=datetime.now(UTC),
+    )
+
+
+class TestPageBuffer:
+    """Test buffered page and session writes."""
+
+    @pytest.mark.asyncio
+    async def test_pages_written_in_batches(self, db_manager):
+        """Nothing is written until the batch fills; the latest state wins."""
+        project = await db_manager.create_project(name="docs", source_url=f"{BASE}/")
+        session = await db_manager.create_crawl_session(project.id, crawl_depth=2)
+        buffer = PageBuffer(db_manager, project.id, batch_size=3)
+
+        first = make_page(project.id, session.id, "/a")
+        await buffer.add_page(first)
+        await buffer.add_page(make_page(project.id, session.id, "/b"))
+        first.update_content(title="A", content_text="Page A")
+        await buffer.add_page(first)
+        session.update_progress(pages_crawled=2)
+        buffer.update_session(session)
+        assert await db_manager.get_page_by_url(project.id, f"{BASE}/a") is None
+
+        await buffer.add_page(make_page(project.id, session.id, "/c"))
+
+        stored = await db_manager.get_page_by_url(project.id, f"{BASE}/a")
+        assert stored.title == "A"
+        assert stored.status == PageStatus.PROCESSED
+        assert (await db_manager.get_crawl_session(session.id)).pages_crawled == 2
+
+        # Updating a written page goes through the same upsert
+        first.mark_failed("gone")
+        await buffer.add_page(first)
+        await buffer.close()
+        assert (await db_manager.get_page_by_url(project.id, f"{BASE}/a")).error_message == "gone"
+
+    @pytest.mark.asyncio
+    async def test_frontier_marks_follow_page_rows(self, db_manager):
+        """A URL is never recorded as processed before its page is stored."""
+        project = await db_manager.create_project(name="docs", source_url=f"{BASE}/")
+        session = await db_manager.create_crawl_session(project.id, crawl_depth=2)
+        buffer = PageBuffer(db_manager, project.id)
+        frontier = CrawlFrontier(
+            db_manager, project.id, session.id, batch_size=2, before_flush=buffer.flush
+        )
+
+        await frontier.add(f"{BASE}/a", 1, None)
+        await buffer.add_page(make_page(project.id, session.id, "/a"))
+        await frontier.mark_done(f"{BASE}/a")  # second change flushes
+
+        _, done = await db_manager.get_frontier(project.id, session.id)
+        assert done == {f"{BASE}/a"}
+        assert await db_manager.get_page_by_url(project.id, f"{BASE}/a") is not None
+
+    @pytest.mark.asyncio
+    async def test_crawl_writes_pages_without_per_page_commits(self, db_manager, monkeypatch):
+        """Crawled pages reach the database through batches only."""
+        paths = ["/", "/a", "/b", "/c"]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path not in paths:
+                return httpx.Response(404)
+            links = "".join(f'<a href="{path}">{path}</a>' for path in paths)
+            return httpx.Response(
+                200, text=f"<html><body><p>Page {request.url.path}</p>{links}</body></html>",
+                headers={"content-type": "text/html"},
+            )
+
+        project = await db_manager.create_project(name="docs", source_url=f"{BASE}/", crawl_depth=1)
+
+        async def unexpected(*args, **kwargs):
+            raise AssertionError("per-page write")
+
+        project_lookups = 0
+        get_project = db_manager.get_project
+
+        async def counting_get_project(project_id):
+            nonlocal project_lookups
+            project_lookups += 1
+            return await get_project(project_id)
+
+        monkeypatch.setattr(db_manager, "create_page", unexpected)
+        monkeypatch.setattr(db_manager, "update_page", unexpected)
+        monkeypatch.setattr(db_manager, "get_project", counting_get_project)
+
+        crawler = DocumentationCrawler(db_manager, db_manager.config)
+        crawler._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        session = await crawler.start_crawl(project.id, rate_limit=10.0)
+        await asyncio.wait_for(crawler._crawl_task, timeout=10)
+        await crawler.cleanup()
+
+        stored = await db_manager.get_project_pages(project.id)
+        assert sorted(page.url for page in stored) == [f"{BASE}{path}" for path in paths]
+        finished = await db_manager.get_crawl_session(session.id)
+        assert finished.pages_crawled == len(paths)
+        # Only start_crawl loads the project; writes use the cached connection
+        assert project_lookups == 1
@@ -0,0 +1,194 @@
+"""Unit tests for compressed page bodies and streamed page reads."""
+
+import asyncio
+from datetime import UTC, datetime
+from pathlib import Path
+
+import aiosqlite
+import httpx
+import pytest
+import pytest_asyncio
+
+from src.core.config import DocBroConfig
+from src.logic.crawler.core.crawler import DocumentationCrawler
+from src.models import Page, PageStatus
+from src.services import content_codec
+from src.services.content_codec import ContentCodecError
+from src.services.database import DatabaseError, DatabaseManager
+
+BASE = "https://docs.example.com"
+TEXT = "Configure the retry policy for each queue. " * 200
+HTML = f"<html><body><p>{TEXT}</p></body></html>"
+
+
+@pytest_asyncio.fixture
+async def db_manager(tmp_path, monkeypatch):
+    """Database manager in a temporary data dir."""
+    # Project databases live under the home directory
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    manager = DatabaseManager(DocBroConfig(data_dir=tmp_path))
+    await manager.initialize()
+    yield manager
+    await manager.cleanup()
+
+
+def make_page(project_id: str, session_id: str) -> Page:
+    """Create a crawled page with text and HTML."""
+    page = Page(
+        id="page-guide",
+        project_id=project_id,
+        session_id=session_id,
+        url=f"{BASE}/guide",
+        crawl_depth=1,
+        discovered_at=datetime.now(UTC),
+    )
+    page.update_content(title="Guide", content_html=HTML, content_text=TEXT)
+    return page
+
+
+class TestPageContents:
+    """Test bodies stored apart from page rows."""
+
+    @pytest.mark.asyncio
+    async def test_bodies_stored_compressed_and_loaded_on_demand(self, db_manager):
+        """Listings skip the bodies; single lookups and get_page_content load them."""
+        project = await db_manager.create_project(name="docs", source_url=f"{BASE}/")
+        session = await db_manager.create_crawl_session(project.id, crawl_depth=2)
+        page = make_page(project.id, session.id)
+        await db_manager.save_crawl_batch(project.id, [page])
+
+        conn = await db_manager._get_project_connection("docs")
+        cursor = await conn.execute("SELECT content_text, content_html FROM page_contents")
+        stored_text, stored_html = await cursor.fetchone()
+        assert len(stored_text) < len(TEXT) / 10
+        assert len(stored_html) < len(HTML) / 10
+
+        [listed] = await db_manager.get_project_pages(project.id)
+        assert listed.title == "Guide"
+        assert listed.content_text is None and listed.content_html is None
+
+        assert await db_manager.get_page_content(project.id, page.id) == (TEXT, None)
+        assert await db_manager.get_page_content(project.id, page.id, include_html=True) == (TEXT, HTML)
+        loaded = await db_manager.get_page_by_url(project.id, page.url)
+        assert loaded.content_text == TEXT
+        assert loaded.content_html == HTML
+
+        # Saving a page loaded without bodies leaves the stored bodies alone
+        listed.mark_failed("timeout")
+        await db_manager.update_page(listed)
+        assert await db_manager.get_page_content(project.id, page.id) == (TEXT, None)
+
+    @pytest.mark.asyncio
+    async def test_old_project_database_moves_bodies(self, tmp_path, monkeypatch):
+        """Inline bodies of an old database are compressed into page_contents."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        manager = DatabaseManager(DocBroConfig(data_dir=tmp_path))
+        db_path = manager._get_project_db_path("legacy")
+        async with aiosqlite.connect(str(db_path)) as conn:
+            # Indexed columns of the version 5 pages table, with inline bodies
+            await conn.execute(
+                "CREATE TABLE pages (id TEXT PRIMARY KEY, project_id TEXT, session_id TEXT, "
+                "url TEXT, status TEXT, content_hash TEXT, simhash TEXT, "
+                "content_html TEXT, content_text TEXT)"
+            )
+            await conn.execute(
+                "INSERT INTO pages (id, url, content_html, content_text) VALUES ('p1', 'https://x/', ?, ?)",
+                (HTML, TEXT),
+            )
+            await conn.commit()
+
+        try:
+            conn = await manager._get_project_connection("legacy")
+            cursor = await conn.execute("PRAGMA table_info(pages)")
+            columns = {row[1] for row in await cursor.fetchall()}
+            cursor = await conn.execute("SELECT codec, content_text, content_html FROM page_contents")
+            codec, text, html = await cursor.fetchone()
+        finally:
+            await manager.cleanup()
+
+        assert not {"content_html", "content_text"} & columns
+        assert content_codec.decompress(text, codec) == TEXT
+        assert content_codec.decompress(html, codec) == HTML
+
+    @pytest.mark.asyncio
+    async def test_crawl_without_html_retention(self, db_manager):
+        """With crawl_keep_html off only the text is stored."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path != "/":
+                return httpx.Response(404)
+            return httpx.Response(200, text=HTML, headers={"content-type": "text/html"})
+
+        project = await db_manager.create_project(name="docs", source_url=f"{BASE}/", crawl_depth=1)
+        config = db_manager.config.model_copy(update={"crawl_keep_html": False})
+        crawler = DocumentationCrawler(db_manager, config)
+        crawler._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        await crawler.start_crawl(project.id, rate_limit=10.0)
+        await asyncio.wait_for(crawler._crawl_task, timeout=10)
+        await crawler.cleanup()
+
+        page = await db_manager.get_page_by_url(project.id, f"{BASE}/")
+        assert page.content_text.startswith("Configure the retry policy")
+        assert page.content_html is None
+        assert page.size_bytes == len(HTML)
+
+
+class TestContentCodec:
+    """Test body compression codecs."""
+
+    def test_zlib_round_trip(self):
+        """zlib rows decode everywhere."""
+        data = content_codec.compress(TEXT, content_codec.ZLIB)
+        assert content_codec.decompress(data, content_codec.ZLIB) == TEXT
+        assert content_codec.compress(None, content_codec.ZLIB) is None
+
+    def test_unreadable_codec(self):
+        """Unknown codecs and zstd without zstandard raise ContentCodecError."""
+        with pytest.raises(ContentCodecError):
+            content_codec.decompress(b"data", "brotli")
+        if not content_codec.ZSTD_AVAILABLE:
+            with pytest.raises(ContentCodecError):
+                content_codec.decompress(b"data", content_codec.ZSTD)
+
+
+class TestIterProjectPages:
+    """Test streaming page records."""
+
+    @pytest.mark.asyncio
+    async def test_walks_project_in_batches(self, db_manager):
+        """Every page is yielded once, with only the requested columns."""
+        project = await db_manager.create_project(name="docs", source_url=f"{BASE}/")
+        session = await db_manager.create_crawl_session(project.id, crawl_depth=2)
+        pages = []
+        for i in range(7):
+            page = make_page(project.id, session.id)
+            page.id, page.url = f"page-{i}", f"{BASE}/guide/{i}"
+            page.outbound_links = [f"{BASE}/guide/{i + 1}"]
+            if i % 2:
+                page.mark_failed("timeout")
+            pages.append(page)
+        await db_manager.save_crawl_batch(project.id, pages)
+
+        records = [
+            record async for record in db_manager.iter_project_pages(
+                project.id, columns=("url", "outbound_links"), batch_size=3
+            )
+        ]
+        assert records == [
+            {"url": f"{BASE}/guide/{i}", "outbound_links": [f"{BASE}/guide/{i + 1}"]}
+            for i in range(7)
+        ]
+
+        failed = [
+            record async for record in db_manager.iter_project_pages(
+                project.id, columns=("id", "content_text"), status=PageStatus.FAILED, batch_size=2
+            )
+        ]
+        assert failed == [{"id": f"page-{i}", "content_text": TEXT} for i in (1, 3, 5)]
+
+    @pytest.mark.asyncio
+    async def test_unknown_column(self, db_manager):
+        """Columns outside PAGE_RECORD_COLUMNS are rejected."""
+        project = await db_manager.create_project(name="docs", source_url=f"{BASE}/")
+        with pytest.raises(DatabaseError):
+            async for _ in db_manager.iter_project_pages(project.id, columns=("url; DROP TABLE pages",)):
+                pass
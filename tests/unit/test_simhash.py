@@ -0,0 +1,138 @@
+"""Unit tests for SimHash near-duplicate detection."""
+
+import asyncio
+import random
+from pathlib import Path
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from src.core.config import DocBroConfig
+from src.logic.crawler.core.crawler import DocumentationCrawler
+from src.logic.crawler.utils.simhash import SimHashIndex, hamming_distance, simhash
+from src.models import PageStatus
+from src.services.database import DatabaseManager
+
+BASE = "https://docs.example.com"
+# A reference page whose versions differ only in the footer
+GUIDE = (
+    "Queue configuration reference. "
+    + " ".join(
+        f"The option queue_{i}_limit sets how many jobs queue {i} may hold "
+        "before new jobs are rejected."
+        for i in range(40)
+    )
+    + " Version {version}, built {built}."
+)
+OTHER = (
+    "Authentication uses short lived tokens signed by the identity service. "
+    "Clients refresh tokens before expiry and send them in the authorization "
+    "header; expired tokens are rejected with a clear error message. Rotate "
+    "signing keys every ninety days and publish the public keys for clients."
+)
+
+
+class TestSimHash:
+    """Test fingerprints and the banded index."""
+
+    def test_near_duplicates_are_close(self):
+        """Pages differing by a version and timestamp are a few bits apart."""
+        v1 = simhash(GUIDE.format(version="1.4", built="2026-01-02 10:00"))
+        latest = simhash(GUIDE.format(version="2.0", built="2026-09-30 18:45"))
+
+        assert hamming_distance(v1, latest) <= 3
+        assert hamming_distance(v1, simhash(OTHER)) > 16
+        assert simhash("Too short to fingerprint") is None
+
+    def test_index_finds_within_distance(self):
+        """Every fingerprint up to k bits away is found; farther ones are not."""
+        rng = random.Random(0)
+        index = SimHashIndex(max_distance=3)
+        stored = [rng.getrandbits(64) for _ in range(200)]
+        for i, fingerprint in enumerate(stored):
+            index.add(fingerprint, f"page{i}")
+
+        for i, fingerprint in enumerate(stored[:50]):
+            flipped = fingerprint
+            for bit in rng.sample(range(64), 3):
+                flipped ^= 1 << bit
+            assert index.find(flipped) == f"page{i}"
+            assert index.find(fingerprint, exclude=f"page{i}") is None
+
+        far = stored[0] ^ 0b11111
+        assert index.find(far) is None
+        assert len(index) == 200
+
+
+@pytest_asyncio.fixture
+async def db_manager(tmp_path, monkeypatch):
+    """Database manager in a temporary data dir."""
+    # Project databases live under the home directory
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    manager = DatabaseManager(DocBroConfig(data_dir=tmp_path))
+    await manager.initialize()
+    yield manager
+    await manager.cleanup()
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    """Site with two versions of one guide and an unrelated page."""
+    pages = {
+        "/": '<a href="/v1/guide">v1</a> <a href="/latest/guide">latest</a> <a href="/auth">auth</a>',
+        "/v1/guide": GUIDE.format(version="1.4", built="2026-01-02 10:00"),
+        "/latest/guide": GUIDE.format(version="2.0", built="2026-09-30 18:45"),
+        "/auth": OTHER,
+    }
+    body = pages.get(request.url.path)
+    if body is None:
+        return httpx.Response(404)
+    return httpx.Response(
+        200, text=f"<html><body><p>{body}</p></body></html>", headers={"content-type": "text/html"}
+    )
+
+
+async def crawl(db_manager, project_id: str, config: DocBroConfig) -> dict:
+    """Crawl the site with one worker and return the crawl statistics."""
+    crawler = DocumentationCrawler(db_manager, config)
+    crawler._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    session = await crawler.start_crawl(project_id, rate_limit=10.0, concurrency=1)
+    await asyncio.wait_for(crawler._crawl_task, timeout=10)
+    stats = await crawler.get_crawl_statistics(session.id)
+    await crawler.cleanup()
+    return stats
+
+
+class TestNearDuplicateCrawl:
+    """Test near-duplicate skipping during a crawl."""
+
+    @pytest.mark.asyncio
+    async def test_versioned_copy_is_skipped(self, db_manager):
+        """The second version of a page is stored as a skipped near-duplicate."""
+        project = await db_manager.create_project(name="docs", source_url=f"{BASE}/", crawl_depth=2)
+        stats = await crawl(db_manager, project.id, db_manager.config)
+
+        v1 = await db_manager.get_page_by_url(project.id, f"{BASE}/v1/guide")
+        latest = await db_manager.get_page_by_url(project.id, f"{BASE}/latest/guide")
+        auth = await db_manager.get_page_by_url(project.id, f"{BASE}/auth")
+        assert v1.status == PageStatus.PROCESSED
+        assert latest.status == PageStatus.SKIPPED
+        assert latest.error_message == f"Near-duplicate of {BASE}/v1/guide"
+        assert latest.simhash and v1.simhash
+        assert auth.status == PageStatus.PROCESSED
+        assert stats["pages_near_duplicate"] == 1
+        assert await db_manager.get_project_simhashes(project.id) == [
+            (f"{BASE}/v1/guide", v1.simhash), (f"{BASE}/auth", auth.simhash),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_distance_zero_disables(self, db_manager):
+        """With detection off, only byte-identical text is skipped."""
+        project = await db_manager.create_project(name="docs", source_url=f"{BASE}/", crawl_depth=2)
+        config = db_manager.config.model_copy(update={"crawl_near_duplicate_distance": 0})
+
+        stats = await crawl(db_manager, project.id, config)
+
+        latest = await db_manager.get_page_by_url(project.id, f"{BASE}/latest/guide")
+        assert latest.status == PageStatus.PROCESSED
+        assert stats["pages_near_duplicate"] == 0
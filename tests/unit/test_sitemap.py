@@ -0,0 +1,141 @@
+"""Unit tests for sitemap parsing, seeding and lastmod refresh planning."""
+
+import asyncio
+import gzip
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from src.core.config import DocBroConfig
+from src.logic.crawler.core.crawler import DocumentationCrawler
+from src.logic.crawler.utils.sitemap import SitemapReader, parse_lastmod, parse_sitemap
+from src.services.database import DatabaseManager
+
+BASE = "https://docs.example.com"
+NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+def urlset(*entries: tuple[str, str | None]) -> str:
+    """Build a urlset sitemap from (path, lastmod) pairs."""
+    urls = "".join(
+        f"<url><loc>{BASE}{path}</loc>" + (f"<lastmod>{lastmod}</lastmod>" if lastmod else "") + "</url>"
+        for path, lastmod in entries
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><urlset {NS}>{urls}</urlset>'
+
+
+class TestParseSitemap:
+    """Test sitemap document parsing."""
+
+    def test_urlset_with_lastmod(self):
+        """Entries carry their lastmod as aware datetimes."""
+        entries, children = parse_sitemap(
+            urlset(("/a", "2026-07-01"), ("/b", "2026-07-02T10:30:00+02:00"), ("/c", None)).encode()
+        )
+
+        assert children == []
+        assert [entry.url for entry in entries] == [f"{BASE}/a", f"{BASE}/b", f"{BASE}/c"]
+        assert entries[0].lastmod == datetime(2026, 7, 1, tzinfo=UTC)
+        assert entries[1].lastmod == datetime(2026, 7, 2, 8, 30, tzinfo=UTC)
+        assert entries[2].lastmod is None
+
+    def test_sitemap_index_and_gzip(self):
+        """Indexes list child sitemaps; gzipped bodies are detected."""
+        index = (
+            f"<sitemapindex {NS}><sitemap><loc>{BASE}/sitemap-docs.xml.gz</loc></sitemap></sitemapindex>"
+        )
+
+        entries, children = parse_sitemap(gzip.compress(index.encode()))
+
+        assert entries == []
+        assert children == [f"{BASE}/sitemap-docs.xml.gz"]
+
+    def test_invalid_content(self):
+        """HTML and garbage are rejected."""
+        with pytest.raises(ValueError):
+            parse_sitemap(b"<html><body>Not found</body></html>")
+        assert parse_lastmod("yesterday") is None
+
+    @pytest.mark.asyncio
+    async def test_reader_follows_index(self):
+        """The reader fetches child sitemaps and de-duplicates entries."""
+        bodies = {
+            "/sitemap.xml": f"<sitemapindex {NS}><sitemap><loc>{BASE}/one.xml</loc></sitemap>"
+                            f"<sitemap><loc>{BASE}/two.xml</loc></sitemap></sitemapindex>",
+            "/one.xml": urlset(("/a", None), ("/b", None)),
+            "/two.xml": urlset(("/b", None), ("/c", None)),
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = bodies.get(request.url.path)
+            return httpx.Response(200, text=body) if body else httpx.Response(404)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            entries = await SitemapReader(client).read([f"{BASE}/sitemap.xml", f"{BASE}/missing.xml"])
+
+        assert [entry.url for entry in entries] == [f"{BASE}/a", f"{BASE}/b", f"{BASE}/c"]
+
+
+@pytest_asyncio.fixture
+async def db_manager(tmp_path, monkeypatch):
+    """Database manager in a temporary data dir."""
+    # Project databases live under the home directory
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    manager = DatabaseManager(DocBroConfig(data_dir=tmp_path))
+    await manager.initialize()
+    yield manager
+    await manager.cleanup()
+
+
+class TestSitemapCrawl:
+    """Test sitemap seeding and lastmod-based refreshes."""
+
+    @pytest.mark.asyncio
+    async def test_sitemap_seeds_pages_and_plans_refresh(self, db_manager):
+        """Unlinked pages are found; refreshes only request changed pages."""
+        sitemap = {"body": urlset(("/deep/page", "2020-01-01"), ("/guide", "2020-01-01"))}
+        requested: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            requested.append(path)
+            if path == "/robots.txt":
+                return httpx.Response(
+                    200, text=f"User-agent: *\nAllow: /\nSitemap: {BASE}/sitemap.xml\n",
+                    headers={"content-type": "text/plain"},
+                )
+            if path == "/sitemap.xml":
+                return httpx.Response(200, text=sitemap["body"])
+            # The start page links to nothing
+            return httpx.Response(
+                200, text=f"<html><body><p>{path}</p></body></html>",
+                headers={"content-type": "text/html"},
+            )
+
+        async def crawl(refresh: bool):
+            crawler = DocumentationCrawler(db_manager, db_manager.config)
+            crawler._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            session = await crawler.start_crawl(project.id, rate_limit=10.0, refresh=refresh)
+            await asyncio.wait_for(crawler._crawl_task, timeout=10)
+            await crawler.cleanup()
+            return await db_manager.get_crawl_session(session.id)
+
+        project = await db_manager.create_project(name="docs", source_url=f"{BASE}/", crawl_depth=1)
+        session = await crawl(refresh=False)
+
+        assert session.metadata["sitemap_urls"] == 2
+        assert {"/", "/deep/page", "/guide"} <= set(requested)
+
+        # Only /guide changed after the first crawl
+        sitemap["body"] = urlset(("/deep/page", "2020-01-01"), ("/guide", "2999-01-01"))
+        requested.clear()
+        session = await crawl(refresh=True)
+
+        pages = [path for path in requested if path not in ("/robots.txt", "/sitemap.xml")]
+        assert sorted(pages) == ["/", "/guide"]
+        assert session.metadata["pages_unchanged"] == 1
+        deep = await db_manager.get_page_by_url(project.id, f"{BASE}/deep/page")
+        assert deep.is_unchanged()